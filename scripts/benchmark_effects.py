@@ -0,0 +1,125 @@
+"""Compare the FFmpeg and numpy camera effect engines.
+
+Renders the same image through every camera effect with both engines
+(zoompan/crop filters vs. crop windows resampled in Python and piped to
+the encoder) using identical encoder settings, and reports wall time and
+how close the frames are (PSNR of the numpy frames against the FFmpeg
+frames; above ~35 dB the difference is not visible). The jittery shakes
+draw a different random sequence in each engine, so their PSNR is low by
+design; compare their timings only.
+
+Requires ffmpeg on PATH.
+
+Usage:
+    python scripts/benchmark_effects.py outputs/<job>/images/scene_01.png
+    python scripts/benchmark_effects.py --duration 8 --effects zoom_in shake scene.png
+"""
+
+import argparse
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add src to path
+sys.path.append(str(Path(__file__).resolve().parent.parent / "src"))
+
+from gossiptoon.core.constants import CameraEffectType
+from gossiptoon.video.effects.camera import CameraEffect, CameraEffectConfig
+from gossiptoon.video.ffmpeg_builder import FFmpegBuilder, VideoSegment
+from gossiptoon.video.frame_renderer import FrameRenderer
+from gossiptoon.video.image_prep import prepare_image, prepared_size
+
+
+def render_ffmpeg(builder: FFmpegBuilder, segment: VideoSegment, output: Path) -> float:
+    """Render with FFmpeg filters; returns wall time."""
+    command = builder.build_segment_command(segment, output, preset="veryfast")
+    started = time.perf_counter()
+    subprocess.run(command.to_list(), check=True, capture_output=True)
+    return time.perf_counter() - started
+
+
+def render_numpy(
+    builder: FFmpegBuilder, renderer: FrameRenderer, segment: VideoSegment, output: Path
+) -> float:
+    """Render with the frame renderer piped to FFmpeg; returns wall time."""
+    command = builder.build_segment_command(segment, output, raw_frames=True, preset="veryfast")
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        command.to_list(), stdin=subprocess.PIPE, stderr=subprocess.DEVNULL
+    )
+    for frame in renderer.iter_frames(segment):
+        process.stdin.write(frame)
+    process.stdin.close()
+    if process.wait() != 0:
+        raise RuntimeError(f"ffmpeg failed on {output.name}")
+    return time.perf_counter() - started
+
+
+def decode(path: Path, width: int, height: int) -> np.ndarray:
+    """Decode a clip to RGB frames."""
+    result = subprocess.run(
+        ["ffmpeg", "-v", "error", "-i", str(path), "-f", "rawvideo", "-pix_fmt", "rgb24", "-"],
+        check=True,
+        capture_output=True,
+    )
+    return np.frombuffer(result.stdout, dtype=np.uint8).reshape(-1, height, width, 3)
+
+
+def psnr(reference: np.ndarray, candidate: np.ndarray) -> tuple[float, float]:
+    """(mean, minimum) per-frame PSNR in dB over the common frames."""
+    count = min(len(reference), len(candidate))
+    diff = reference[:count].astype(np.float64) - candidate[:count].astype(np.float64)
+    mse = np.maximum((diff**2).mean(axis=(1, 2, 3)), 1e-10)
+    values = 10 * np.log10(255.0**2 / mse)
+    return float(values.mean()), float(values.min())
+
+
+def main() -> None:
+    effect_names = [e.value for e in CameraEffectType]
+    moving = [
+        "zoom_in", "zoom_out", "pan_left", "pan_right", "pan_up", "pan_down",
+        "shake", "shake_slow", "shake_fast",
+    ]
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("image", type=Path, help="Scene image")
+    parser.add_argument("--duration", type=float, default=5.0, help="Segment length (seconds)")
+    parser.add_argument("--fps", type=int, default=30)
+    parser.add_argument("--size", default="1080x1920", help="Output resolution")
+    parser.add_argument("--effects", nargs="+", default=moving, choices=effect_names)
+    args = parser.parse_args()
+
+    width, height = map(int, args.size.split("x"))
+    builder = FFmpegBuilder(fps=args.fps, output_width=width, output_height=height)
+    renderer = FrameRenderer(width, height, args.fps)
+
+    print(f"{args.image.name}: {args.duration:.1f}s at {args.fps} fps, {width}x{height}\n")
+    print(f"{'effect':<14}{'ffmpeg s':>10}{'numpy s':>10}{'speedup':>9}{'PSNR':>9}{'min':>8}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+        for name in args.effects:
+            effect = CameraEffect(CameraEffectConfig(effect_type=CameraEffectType(name)))
+            image_size = prepared_size(width, height, effect.get_input_scale())
+            image = prepare_image(args.image, *image_size, tmp_dir)
+            segment = VideoSegment(image_path=image, duration=args.duration, effects=[effect])
+
+            ffmpeg_clip = tmp_dir / f"{name}_ffmpeg.mp4"
+            numpy_clip = tmp_dir / f"{name}_numpy.mp4"
+            ffmpeg_seconds = render_ffmpeg(builder, segment, ffmpeg_clip)
+            numpy_seconds = render_numpy(builder, renderer, segment, numpy_clip)
+
+            mean_db, min_db = psnr(
+                decode(ffmpeg_clip, width, height), decode(numpy_clip, width, height)
+            )
+            print(
+                f"{name:<14}{ffmpeg_seconds:>10.2f}{numpy_seconds:>10.2f}"
+                f"{ffmpeg_seconds / numpy_seconds:>8.1f}x{mean_db:>8.1f}{min_db:>8.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""Compare timestamp backends on sample TTS chunks.
+
+Runs each backend over the same audio chunks and reports wall time and
+word timing error against a reference backend (openai-whisper by default).
+Text for the energy backend is read from a ``.txt`` file next to each
+audio file; chunks without one are skipped for that backend.
+
+Usage:
+    python scripts/benchmark_timestamps.py outputs/<job>/audio/*.wav
+    python scripts/benchmark_timestamps.py --model small --backends faster-whisper energy *.wav
+"""
+
+import argparse
+import re
+import sys
+import time
+from difflib import SequenceMatcher
+from pathlib import Path
+
+# Add src to path
+sys.path.append(str(Path(__file__).resolve().parent.parent / "src"))
+
+from gossiptoon.audio.timestamp_backends import SAMPLE_RATE, create_timestamp_backend
+from gossiptoon.audio.whisper import _transcribe_batch
+from gossiptoon.core.constants import TIMESTAMP_BACKENDS
+from gossiptoon.models.audio import WordTimestamp
+
+
+def normalize(word: str) -> str:
+    return re.sub(r"[^\w']", "", word.lower())
+
+
+def timing_error(
+    reference: list[WordTimestamp], candidate: list[WordTimestamp]
+) -> tuple[int, float, float]:
+    """Match words by text and measure boundary error.
+
+    Returns:
+        (matched words, mean |start error|, mean |end error|) in seconds
+    """
+    matcher = SequenceMatcher(
+        a=[normalize(w.word) for w in reference],
+        b=[normalize(w.word) for w in candidate],
+        autojunk=False,
+    )
+    start_errors = []
+    end_errors = []
+    for block in matcher.get_matching_blocks():
+        for offset in range(block.size):
+            ref = reference[block.a + offset]
+            cand = candidate[block.b + offset]
+            start_errors.append(abs(ref.start - cand.start))
+            end_errors.append(abs(ref.end - cand.end))
+
+    if not start_errors:
+        return 0, float("nan"), float("nan")
+    return (
+        len(start_errors),
+        sum(start_errors) / len(start_errors),
+        sum(end_errors) / len(end_errors),
+    )
+
+
+def run_backend(name: str, model: str, paths: list[Path], texts: list):
+    """Time one backend over all chunks (model load reported separately)."""
+    backend = create_timestamp_backend(name, model)
+
+    started = time.perf_counter()
+    backend.load()
+    load_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    results = _transcribe_batch(backend, [str(p) for p in paths], "en", texts)
+    run_seconds = time.perf_counter() - started
+    return results, load_seconds, run_seconds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("audio", nargs="+", type=Path, help="Audio chunks")
+    parser.add_argument("--model", default="base", help="Model size for model-based backends")
+    parser.add_argument("--reference", default="whisper", choices=TIMESTAMP_BACKENDS)
+    parser.add_argument(
+        "--backends", nargs="+", default=TIMESTAMP_BACKENDS, choices=TIMESTAMP_BACKENDS
+    )
+    args = parser.parse_args()
+
+    paths = [p for p in args.audio if p.exists()]
+    texts = [
+        p.with_suffix(".txt").read_text().strip() if p.with_suffix(".txt").exists() else None
+        for p in paths
+    ]
+    decoder = create_timestamp_backend("energy", args.model)
+    durations = [len(decoder.load_audio(str(p))) / SAMPLE_RATE for p in paths]
+    print(f"{len(paths)} chunks, {sum(durations):.1f}s of audio\n")
+
+    reference, _, _ = run_backend(args.reference, args.model, paths, texts)
+
+    print(
+        f"{'backend':<16}{'load s':>8}{'run s':>8}{'RTF':>8}"
+        f"{'words':>8}{'start err':>11}{'end err':>9}"
+    )
+    for name in args.backends:
+        if name == "energy" and any(text is None for text in texts):
+            usable = [i for i, text in enumerate(texts) if text is not None]
+            if not usable:
+                print(f"{name:<16}skipped (no .txt transcripts)")
+                continue
+        else:
+            usable = list(range(len(paths)))
+
+        try:
+            results, load_seconds, run_seconds = run_backend(
+                name, args.model, [paths[i] for i in usable], [texts[i] for i in usable]
+            )
+        except Exception as e:
+            print(f"{name:<16}failed: {e}")
+            continue
+
+        matched = 0
+        start_total = 0.0
+        end_total = 0.0
+        for i, words in zip(usable, results):
+            count, start_err, end_err = timing_error(reference[i], words)
+            if count:
+                matched += count
+                start_total += start_err * count
+                end_total += end_err * count
+
+        audio_seconds = sum(durations[i] for i in usable)
+        rtf = run_seconds / audio_seconds if audio_seconds else float("nan")
+        start_err = start_total / matched if matched else float("nan")
+        end_err = end_total / matched if matched else float("nan")
+        print(
+            f"{name:<16}{load_seconds:>8.2f}{run_seconds:>8.2f}{rtf:>8.3f}"
+            f"{matched:>8}{start_err:>10.3f}s{end_err:>8.3f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
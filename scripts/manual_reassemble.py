@@ -27,12 +27,17 @@ async def reassemble(project_id: str):
     config.set_job_context(project_id)
     
     # 3. Load Checkpoint
-    checkpoint_manager = CheckpointManager(config.checkpoints_dir)
-    print(f"DEBUG: Checkpoint Dir: {config.checkpoints_dir}")
-    print(f"DEBUG: Checkpoint Path: {checkpoint_manager._get_checkpoint_path(project_id)}")
-    
-    if not checkpoint_manager.checkpoint_exists(project_id):
-        logger.error(f"Checkpoint not found for {project_id}")
+    checkpoint_manager = CheckpointManager(
+        config.checkpoints_dir,
+        backend=config.app.checkpoint_backend,
+        shared_dir=config.shared_checkpoints_dir,
+    )
+    store_path = checkpoint_manager._get_checkpoint_path(project_id)
+    found = checkpoint_manager.checkpoint_exists(project_id)
+    logger.debug(f"Checkpoint for {project_id} in {store_path}: {'found' if found else 'missing'}")
+
+    if not found:
+        logger.error(f"Checkpoint not found for {project_id} in {store_path}")
         return
 
     checkpoint = checkpoint_manager.load_checkpoint(project_id)
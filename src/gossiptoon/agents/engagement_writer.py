@@ -13,6 +13,10 @@ from langchain_google_genai import ChatGoogleGenerativeAI, HarmBlockThreshold, H
 
 from gossiptoon.models.engagement import EngagementProject, EngagementHook, EngagementStyle
 from gossiptoon.models.script import Script
+from gossiptoon.utils.rate_limiter import (
+    get_langchain_rate_limiter,
+    get_token_usage_callback,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -70,6 +74,8 @@ to maximize viewer engagement (comments, shares, retention).
 
         llm = ChatGoogleGenerativeAI(
             model="gemini-2.5-flash",
+            rate_limiter=get_langchain_rate_limiter("gemini_llm", "gemini-2.5-flash"),
+            callbacks=[get_token_usage_callback("gemini_llm", "gemini-2.5-flash")],
             temperature=0.8,  # Higher for creative hooks
             google_api_key=api_key,
             safety_settings=safety_settings,
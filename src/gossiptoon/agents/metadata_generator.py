@@ -11,6 +11,10 @@ from gossiptoon.models.metadata import YouTubeMetadata
 from gossiptoon.models.script import Script
 from gossiptoon.models.story import Story
 from gossiptoon.utils.llm_debugger import LLMDebugger
+from gossiptoon.utils.rate_limiter import (
+    get_langchain_rate_limiter,
+    get_token_usage_callback,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -83,6 +87,8 @@ Generate:
         self.config = config
         self.llm = ChatGoogleGenerativeAI(
             model="gemini-2.5-flash",
+            rate_limiter=get_langchain_rate_limiter("gemini_llm", "gemini-2.5-flash"),
+            callbacks=[get_token_usage_callback("gemini_llm", "gemini-2.5-flash")],
             google_api_key=config.api.google_api_key,
             temperature=0.8,  # High creativity for catchy titles
             max_retries=3,
@@ -11,6 +11,10 @@ from gossiptoon.core.exceptions import ScriptGenerationError
 from gossiptoon.models.script import Script
 from gossiptoon.models.story import Story
 from gossiptoon.utils.llm_debugger import LLMDebugger
+from gossiptoon.utils.rate_limiter import (
+    get_langchain_rate_limiter,
+    get_token_usage_callback,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -184,6 +188,8 @@ Generate a complete script scaffold with perfect structure, ready for ScriptWrit
         # Low temperature for deterministic structural output
         self.llm = ChatGoogleGenerativeAI(
             model=config.llm.scene_structurer_model,
+            rate_limiter=get_langchain_rate_limiter("gemini_llm", config.llm.scene_structurer_model),
+            callbacks=[get_token_usage_callback("gemini_llm", config.llm.scene_structurer_model)],
             temperature=config.llm.scene_structurer_temperature,
             google_api_key=config.api.google_api_key,
             safety_settings=safety_settings,
@@ -11,6 +11,10 @@ from gossiptoon.core.config import ConfigManager
 from gossiptoon.models.story import Story
 from gossiptoon.models.script import Script, Scene, Act, ActType, EmotionTone, CameraEffectType
 from gossiptoon.utils.llm_debugger import LLMDebugger
+from gossiptoon.utils.rate_limiter import (
+    get_langchain_rate_limiter,
+    get_token_usage_callback,
+)
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
@@ -131,6 +135,8 @@ Your job is to take a DRAFT SCRIPT and format it into a strict JSON structure fo
         self.config = config
         self.llm = ChatGoogleGenerativeAI(
             model=config.llm.script_evaluator_model,
+            rate_limiter=get_langchain_rate_limiter("gemini_llm", config.llm.script_evaluator_model),
+            callbacks=[get_token_usage_callback("gemini_llm", config.llm.script_evaluator_model)],
             google_api_key=self.config.api.google_api_key,
             temperature=config.llm.script_evaluator_temperature,
             convert_system_message_to_human=True,
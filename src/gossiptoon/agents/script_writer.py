@@ -17,6 +17,10 @@ from gossiptoon.models.story import Story
 from gossiptoon.utils.retry import retry_with_backoff
 from gossiptoon.utils.llm_debugger import LLMDebugger
 from gossiptoon.agents.script_evaluator import ScriptEvaluator
+from gossiptoon.utils.rate_limiter import (
+    get_langchain_rate_limiter,
+    get_token_usage_callback,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -377,6 +381,8 @@ Generate scenes with:
         # Revert to Gemini 2.0 Flash Exp as per WEBTOON_ENGINE.md
         self.llm = ChatGoogleGenerativeAI(
             model=config.llm.script_writer_model,
+            rate_limiter=get_langchain_rate_limiter("gemini_llm", config.llm.script_writer_model),
+            callbacks=[get_token_usage_callback("gemini_llm", config.llm.script_writer_model)],
             temperature=config.llm.script_writer_temperature,
             google_api_key=config.api.google_api_key,
             safety_settings=safety_settings,
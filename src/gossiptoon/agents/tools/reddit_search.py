@@ -1,5 +1,6 @@
 """Reddit search tool for finding viral stories."""
 
+import asyncio
 import logging
 from datetime import datetime, timedelta
 from typing import Any, Optional
@@ -7,10 +8,14 @@ from typing import Any, Optional
 from pydantic import BaseModel, Field
 
 from gossiptoon.core.exceptions import RedditAPIError
+from gossiptoon.utils.client_pool import get_dedicated_executor, get_pooled_client
 from gossiptoon.utils.retry import retry_with_backoff
 
 logger = logging.getLogger(__name__)
 
+# PRAW is synchronous and not thread-safe: all calls go through one worker thread
+PRAW_EXECUTOR_NAME = "praw"
+
 
 class RedditPost(BaseModel):
     """Reddit post data."""
@@ -83,16 +88,33 @@ class RedditSearchTool:
         try:
             import praw
 
-            self._reddit = praw.Reddit(
-                client_id=self.client_id,
-                client_secret=self.client_secret,
-                user_agent=self.user_agent,
+            self._reddit = get_pooled_client(
+                "praw",
+                (self.client_id, self.client_secret, self.user_agent),
+                lambda: praw.Reddit(
+                    client_id=self.client_id,
+                    client_secret=self.client_secret,
+                    user_agent=self.user_agent,
+                ),
             )
             logger.info("Reddit API client initialized")
             return self._reddit
         except Exception as e:
             raise RedditAPIError(f"Failed to initialize Reddit API: {e}") from e
 
+    async def _run_praw(self, func: Any, *args: Any) -> Any:
+        """Run blocking PRAW work on the dedicated PRAW thread.
+
+        Args:
+            func: Callable doing the PRAW calls
+            *args: Positional arguments for func
+
+        Returns:
+            Result of func
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(get_dedicated_executor(PRAW_EXECUTOR_NAME), func, *args)
+
     @retry_with_backoff(max_retries=3, exceptions=(RedditAPIError,))
     async def fetch_post_by_url(self, url: str) -> RedditPost:
         """Fetch a specific Reddit post by URL.
@@ -109,30 +131,34 @@ class RedditSearchTool:
         reddit = self._init_reddit()
 
         try:
-            submission = reddit.submission(url=url)
-
-            # Get the post content
-            content = submission.selftext if submission.selftext else ""
-
-            post = RedditPost(
-                post_id=submission.id,
-                title=submission.title,
-                content=content,
-                subreddit=submission.subreddit.display_name,
-                author=str(submission.author) if submission.author else "[deleted]",
-                upvotes=submission.score,
-                num_comments=submission.num_comments,
-                created_utc=datetime.fromtimestamp(submission.created_utc),
-                url=url,
-                flair=submission.link_flair_text,
-            )
-
+            post = await self._run_praw(self._fetch_post_sync, reddit, url)
             logger.info(f"Fetched post: {post.title[:50]}... from r/{post.subreddit}")
             return post
 
         except Exception as e:
             raise RedditAPIError(f"Failed to fetch Reddit post from URL: {e}") from e
 
+    @staticmethod
+    def _fetch_post_sync(reddit: Any, url: str) -> RedditPost:
+        """Fetch and convert a submission (blocking, PRAW thread only)."""
+        submission = reddit.submission(url=url)
+
+        # Get the post content
+        content = submission.selftext if submission.selftext else ""
+
+        return RedditPost(
+            post_id=submission.id,
+            title=submission.title,
+            content=content,
+            subreddit=submission.subreddit.display_name,
+            author=str(submission.author) if submission.author else "[deleted]",
+            upvotes=submission.score,
+            num_comments=submission.num_comments,
+            created_utc=datetime.fromtimestamp(submission.created_utc),
+            url=url,
+            flair=submission.link_flair_text,
+        )
+
     @retry_with_backoff(max_retries=3, exceptions=(RedditAPIError,))
     async def search_subreddit(
         self,
@@ -157,46 +183,60 @@ class RedditSearchTool:
         """
         try:
             reddit = self._init_reddit()
-            subreddit_obj = reddit.subreddit(subreddit)
-
-            posts = []
-            if sort == "hot":
-                submissions = subreddit_obj.hot(limit=limit)
-            elif sort == "new":
-                submissions = subreddit_obj.new(limit=limit)
-            elif sort == "top":
-                submissions = subreddit_obj.top(time_filter=time_filter, limit=limit)
-            elif sort == "rising":
-                submissions = subreddit_obj.rising(limit=limit)
-            else:
-                raise ValueError(f"Invalid sort method: {sort}")
-
-            for submission in submissions:
-                # Skip stickied posts and very short posts
-                if submission.stickied or len(submission.selftext) < 100:
-                    continue
-
-                posts.append(
-                    RedditPost(
-                        post_id=submission.id,
-                        title=submission.title,
-                        content=submission.selftext,
-                        subreddit=submission.subreddit.display_name,
-                        author=str(submission.author) if submission.author else "[deleted]",
-                        upvotes=submission.score,
-                        num_comments=submission.num_comments,
-                        created_utc=datetime.fromtimestamp(submission.created_utc),
-                        url=f"https://reddit.com{submission.permalink}",
-                        flair=submission.link_flair_text,
-                    )
-                )
-
+            posts = await self._run_praw(
+                self._search_subreddit_sync, reddit, subreddit, time_filter, limit, sort
+            )
             logger.info(f"Found {len(posts)} posts in r/{subreddit}")
             return posts
 
         except Exception as e:
             raise RedditAPIError(f"Reddit search failed: {e}") from e
 
+    @staticmethod
+    def _search_subreddit_sync(
+        reddit: Any,
+        subreddit: str,
+        time_filter: str,
+        limit: int,
+        sort: str,
+    ) -> list[RedditPost]:
+        """List and convert subreddit submissions (blocking, PRAW thread only)."""
+        subreddit_obj = reddit.subreddit(subreddit)
+
+        posts = []
+        if sort == "hot":
+            submissions = subreddit_obj.hot(limit=limit)
+        elif sort == "new":
+            submissions = subreddit_obj.new(limit=limit)
+        elif sort == "top":
+            submissions = subreddit_obj.top(time_filter=time_filter, limit=limit)
+        elif sort == "rising":
+            submissions = subreddit_obj.rising(limit=limit)
+        else:
+            raise ValueError(f"Invalid sort method: {sort}")
+
+        for submission in submissions:
+            # Skip stickied posts and very short posts
+            if submission.stickied or len(submission.selftext) < 100:
+                continue
+
+            posts.append(
+                RedditPost(
+                    post_id=submission.id,
+                    title=submission.title,
+                    content=submission.selftext,
+                    subreddit=submission.subreddit.display_name,
+                    author=str(submission.author) if submission.author else "[deleted]",
+                    upvotes=submission.score,
+                    num_comments=submission.num_comments,
+                    created_utc=datetime.fromtimestamp(submission.created_utc),
+                    url=f"https://reddit.com{submission.permalink}",
+                    flair=submission.link_flair_text,
+                )
+            )
+
+        return posts
+
     async def search_multiple_subreddits(
         self,
         subreddits: Optional[list[str]] = None,
@@ -216,19 +256,29 @@ class RedditSearchTool:
         if subreddits is None:
             subreddits = self.DEFAULT_SUBREDDITS
 
-        all_posts = []
-        for subreddit in subreddits:
-            try:
-                posts = await self.search_subreddit(
+        # Requests are issued together; PRAW itself still runs them one at a
+        # time on its own thread, but the event loop is never blocked
+        results = await asyncio.gather(
+            *(
+                self.search_subreddit(
                     subreddit=subreddit,
                     time_filter=time_filter,
                     limit=limit_per_subreddit,
                     sort="top",
                 )
-                all_posts.extend(posts)
-            except RedditAPIError as e:
-                logger.warning(f"Failed to search r/{subreddit}: {e}")
+                for subreddit in subreddits
+            ),
+            return_exceptions=True,
+        )
+
+        all_posts = []
+        for subreddit, result in zip(subreddits, results):
+            if isinstance(result, RedditAPIError):
+                logger.warning(f"Failed to search r/{subreddit}: {result}")
                 continue
+            if isinstance(result, BaseException):
+                raise result
+            all_posts.extend(result)
 
         # Sort by upvotes
         all_posts.sort(key=lambda p: p.upvotes, reverse=True)
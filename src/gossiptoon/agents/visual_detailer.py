@@ -13,6 +13,10 @@ from gossiptoon.models.script import Script, Scene
 from gossiptoon.models.story import Story
 from gossiptoon.utils.retry import retry_with_backoff
 from gossiptoon.utils.llm_debugger import LLMDebugger
+from gossiptoon.utils.rate_limiter import (
+    get_langchain_rate_limiter,
+    get_token_usage_callback,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -55,6 +59,8 @@ class VisualDetailerAgent:
         # Use Gemini for speed and visual understanding
         self.llm = ChatGoogleGenerativeAI(
             model=config.llm.visual_detailer_model,
+            rate_limiter=get_langchain_rate_limiter("gemini_llm", config.llm.visual_detailer_model),
+            callbacks=[get_token_usage_callback("gemini_llm", config.llm.visual_detailer_model)],
             temperature=config.llm.visual_detailer_temperature,
             google_api_key=config.api.google_api_key,
             safety_settings=safety_settings,
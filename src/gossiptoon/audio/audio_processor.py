@@ -1,13 +1,20 @@
 """Audio processing utilities for concatenation and normalization."""
 
+import asyncio
 import logging
 from pathlib import Path
 from typing import Optional
 
+from gossiptoon.audio.pcm import PCMAudio
+from gossiptoon.audio.probe import probe_duration, probe_durations
 from gossiptoon.core.exceptions import AudioGenerationError
 
 logger = logging.getLogger(__name__)
 
+# Largest loudness correction applied to a single segment (dB); beyond this
+# the segment is probably mostly silence or noise
+MAX_SEGMENT_GAIN_DB = 12.0
+
 
 class AudioProcessor:
     """Utility class for audio processing operations."""
@@ -78,6 +85,98 @@ class AudioProcessor:
             logger.error(f"Audio concatenation failed: {e}")
             raise AudioGenerationError(f"Failed to concatenate audio: {e}") from e
 
+    async def render_master(
+        self,
+        audio_paths: list[Path],
+        output_path: Path,
+        crossfade_ms: int = 0,
+        speed_factor: float = 1.0,
+        target_dbfs: Optional[float] = -20.0,
+        target_lufs: Optional[float] = None,
+    ) -> Path:
+        """Build the master track in memory and write it once, losslessly.
+
+        Each segment is decoded once; concatenation, tempo change and
+        normalization run on PCM samples, and the result is written as
+        WAV or FLAC (chosen by ``output_path`` suffix).
+
+        With ``target_lufs`` every segment is first brought to that
+        integrated loudness (so voices match across the joins) and the
+        mix is then normalized to it (EBU R128), all on the decoded
+        samples.
+
+        Args:
+            audio_paths: Segment audio files in order
+            output_path: Master file (.wav or .flac)
+            crossfade_ms: Crossfade at each join in milliseconds
+            speed_factor: Tempo multiplier (pitch preserved)
+            target_dbfs: Target RMS level (used without ``target_lufs``; None: no
+                normalization)
+            target_lufs: Target integrated loudness in LUFS
+
+        Returns:
+            Path to master audio file
+
+        Raises:
+            AudioGenerationError: If any step fails
+        """
+        if not audio_paths:
+            raise AudioGenerationError("No audio segments to render")
+
+        def render() -> Path:
+            clips = PCMAudio.load_many(audio_paths)
+            if target_lufs is not None:
+                clips = self._match_loudness(clips, audio_paths, target_lufs)
+
+            master = PCMAudio.concatenate(clips, crossfade_seconds=crossfade_ms / 1000)
+            if speed_factor != 1.0:
+                logger.info(f"Changing audio speed: {speed_factor}x")
+                master = master.change_tempo(speed_factor)
+
+            if target_lufs is not None:
+                master, before = master.normalize_loudness(target_lufs)
+                logger.info(
+                    f"Audio normalized: {before:.1f} LUFS -> {master.loudness:.1f} LUFS "
+                    f"(target {target_lufs:.1f})"
+                )
+            elif target_dbfs is not None:
+                before = master.dbfs
+                master = master.normalize(target_dbfs)
+                logger.info(f"Audio normalized: {before:.1f} dBFS -> {target_dbfs:.1f} dBFS")
+            return master.write(output_path)
+
+        try:
+            logger.info(f"Rendering master audio from {len(audio_paths)} segments")
+            return await asyncio.to_thread(render)
+        except AudioGenerationError:
+            raise
+        except Exception as e:
+            logger.error(f"Master audio rendering failed: {e}")
+            raise AudioGenerationError(f"Failed to render master audio: {e}") from e
+
+    @staticmethod
+    def _match_loudness(
+        clips: list[PCMAudio], audio_paths: list[Path], target_lufs: float
+    ) -> list[PCMAudio]:
+        """Bring each segment to the target loudness before concatenation.
+
+        Args:
+            clips: Decoded segments
+            audio_paths: Their files (for logging)
+            target_lufs: Target integrated loudness
+
+        Returns:
+            Gain-adjusted segments (silent ones unchanged)
+        """
+        matched = []
+        for clip, path in zip(clips, audio_paths):
+            adjusted, measured = clip.normalize_loudness(
+                target_lufs, max_gain_db=MAX_SEGMENT_GAIN_DB
+            )
+            logger.debug(f"{path.name}: {measured:.1f} LUFS")
+            matched.append(adjusted)
+        return matched
+
     async def _concatenate_with_ffmpeg(
         self, audio_paths: list[Path], output_path: Path
     ) -> Path:
@@ -178,7 +277,10 @@ class AudioProcessor:
             raise AudioGenerationError(f"Failed to normalize audio: {e}") from e
 
     def get_audio_duration(self, audio_path: Path) -> float:
-        """Get duration of audio file.
+        """Get duration of audio file without decoding it.
+
+        WAV headers are read directly and other formats go through ffprobe;
+        results are cached by path and modification time (see audio.probe).
 
         Args:
             audio_path: Path to audio file
@@ -189,52 +291,21 @@ class AudioProcessor:
         Raises:
             AudioGenerationError: If reading fails
         """
-        if not self._pydub_available:
-            return self._get_duration_with_ffmpeg(audio_path)
+        return probe_duration(audio_path)
 
-        try:
-            from pydub import AudioSegment
-
-            audio = AudioSegment.from_file(audio_path)
-            duration = len(audio) / 1000.0  # Convert ms to seconds
-
-            return duration
-
-        except Exception as e:
-            logger.error(f"Failed to get audio duration: {e}")
-            raise AudioGenerationError(f"Failed to get duration: {e}") from e
-
-    def _get_duration_with_ffmpeg(self, audio_path: Path) -> float:
-        """Get audio duration using FFmpeg.
+    def get_audio_durations(self, audio_paths: list[Path]) -> list[float]:
+        """Get durations of several audio files, probing them concurrently.
 
         Args:
-            audio_path: Path to audio file
+            audio_paths: Paths to audio files
 
         Returns:
-            Duration in seconds
-        """
-        import subprocess
+            Durations in seconds, in the same order
 
-        try:
-            cmd = [
-                "ffprobe",
-                "-v",
-                "error",
-                "-show_entries",
-                "format=duration",
-                "-of",
-                "default=noprint_wrappers=1:nokey=1",
-                str(audio_path),
-            ]
-
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            duration = float(result.stdout.strip())
-
-            return duration
-
-        except Exception as e:
-            logger.error(f"FFprobe duration check failed: {e}")
-            raise AudioGenerationError(f"Failed to get duration: {e}") from e
+        Raises:
+            AudioGenerationError: If reading any file fails
+        """
+        return probe_durations(audio_paths)
 
     async def change_speed(self, audio_path: Path, speed_factor: float) -> Path:
         """Change audio speed using FFmpeg atempo filter (preserves pitch).
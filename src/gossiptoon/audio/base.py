@@ -1,9 +1,11 @@
 """Base interfaces for audio generation (modular TTS providers)."""
 
 from abc import ABC, abstractmethod
+from contextlib import aclosing
 from pathlib import Path
-from typing import Optional
+from typing import AsyncIterator, Optional
 
+from gossiptoon.audio.streaming import AudioStreamFormat, StreamedAudio, StreamingAudioWriter
 from gossiptoon.core.constants import EmotionTone
 
 
@@ -13,6 +15,12 @@ class TTSClient(ABC):
     This allows easy swapping between ElevenLabs, Google TTS, Azure TTS, etc.
     """
 
+    # Provider name (part of the TTS cache key)
+    provider_name: str = "tts"
+
+    # Format of stream_speech chunks (None if the provider cannot stream)
+    stream_format: Optional[AudioStreamFormat] = None
+
     @abstractmethod
     async def generate_speech(
         self,
@@ -37,6 +45,60 @@ class TTSClient(ABC):
         """
         pass
 
+    def stream_speech(
+        self,
+        text: str,
+        voice_id: str,
+        emotion: Optional[EmotionTone] = None,
+        style_instruction: Optional[str] = None,
+    ) -> AsyncIterator[bytes]:
+        """Stream synthesized audio as it is produced.
+
+        Args:
+            text: Text to convert to speech
+            voice_id: Voice identifier (provider-specific)
+            emotion: Optional emotion tone for expressive TTS
+            style_instruction: Optional free-form style (providers that support it)
+
+        Returns:
+            Async iterator of audio chunks in ``stream_format``
+
+        Raises:
+            NotImplementedError: If the provider cannot stream
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support streaming")
+
+    async def stream_to_file(
+        self,
+        text: str,
+        voice_id: str,
+        output_path: Path,
+        emotion: Optional[EmotionTone] = None,
+        style_instruction: Optional[str] = None,
+    ) -> StreamedAudio:
+        """Stream speech straight to a file, measuring it on the way.
+
+        Chunks are written as they arrive, so the clip is never held in
+        memory and its duration and loudness are known once the stream ends.
+
+        Args:
+            text: Text to convert to speech
+            voice_id: Voice identifier (provider-specific)
+            output_path: Output file
+            emotion: Optional emotion tone for expressive TTS
+            style_instruction: Optional free-form style (providers that support it)
+
+        Returns:
+            Written file with its measurements
+        """
+        stream = self.stream_speech(text, voice_id, emotion, style_instruction)
+        # aclosing: a failed write still ends the provider stream (and its rate limit slot)
+        async with aclosing(stream):
+            with StreamingAudioWriter(output_path, self.stream_format) as writer:
+                async for chunk in stream:
+                    writer.write(chunk)
+                return writer.finish()
+
     @abstractmethod
     def get_available_voices(self) -> list[dict[str, str]]:
         """Get list of available voices.
@@ -58,3 +120,22 @@ class TTSClient(ABC):
             Estimated duration in seconds
         """
         pass
+
+    def get_model_name(self) -> str:
+        """Get model identifier (part of the TTS cache key).
+
+        Returns:
+            Model name, or empty string if the provider has no model choice
+        """
+        return ""
+
+    def prepare_text(self, text: str) -> str:
+        """Get text exactly as it will be sent to the provider.
+
+        Args:
+            text: Input text
+
+        Returns:
+            Provider-ready text (default: unchanged)
+        """
+        return text
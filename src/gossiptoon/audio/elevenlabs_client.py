@@ -2,19 +2,27 @@
 
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import AsyncIterator, Optional
 
 from gossiptoon.audio.base import TTSClient
+from gossiptoon.audio.streaming import AudioStreamFormat
 from gossiptoon.core.constants import EMOTION_VOICE_SETTINGS, EmotionTone
 from gossiptoon.core.exceptions import ElevenLabsAPIError
+from gossiptoon.utils.client_pool import get_pooled_client
+from gossiptoon.utils.rate_limiter import get_rate_limiter, is_rate_limit_error
 from gossiptoon.utils.retry import retry_with_backoff
 
 logger = logging.getLogger(__name__)
 
+ELEVENLABS_MODEL_ID = "eleven_multilingual_v2"
+
 
 class ElevenLabsClient(TTSClient):
     """ElevenLabs Text-to-Speech client."""
 
+    provider_name = "elevenlabs"
+    stream_format = AudioStreamFormat(container="mp3")
+
     def __init__(self, api_key: str) -> None:
         """Initialize ElevenLabs client.
 
@@ -23,12 +31,14 @@ class ElevenLabsClient(TTSClient):
         """
         self.api_key = api_key
         self._client: Optional[any] = None
+        self._sync_client: Optional[any] = None
+        self.rate_limiter = get_rate_limiter("elevenlabs", ELEVENLABS_MODEL_ID)
 
     def _init_client(self) -> any:
-        """Initialize ElevenLabs SDK client (lazy loading).
+        """Initialize async ElevenLabs SDK client (lazy loading).
 
         Returns:
-            ElevenLabs client instance
+            AsyncElevenLabs client instance
 
         Raises:
             ElevenLabsAPIError: If initialization fails
@@ -36,12 +46,41 @@ class ElevenLabsClient(TTSClient):
         if self._client is not None:
             return self._client
 
+        try:
+            from elevenlabs.client import AsyncElevenLabs
+
+            self._client = get_pooled_client(
+                "elevenlabs_async", self.api_key, lambda: AsyncElevenLabs(api_key=self.api_key)
+            )
+            logger.info("ElevenLabs async client initialized")
+            return self._client
+        except ImportError:
+            raise ElevenLabsAPIError(
+                "ElevenLabs package not installed. Install with: pip install elevenlabs"
+            )
+        except Exception as e:
+            raise ElevenLabsAPIError(f"Failed to initialize ElevenLabs client: {e}") from e
+
+    def _init_sync_client(self) -> any:
+        """Initialize blocking ElevenLabs SDK client for account queries (lazy loading).
+
+        Returns:
+            ElevenLabs client instance
+
+        Raises:
+            ElevenLabsAPIError: If initialization fails
+        """
+        if self._sync_client is not None:
+            return self._sync_client
+
         try:
             from elevenlabs.client import ElevenLabs
 
-            self._client = ElevenLabs(api_key=self.api_key)
+            self._sync_client = get_pooled_client(
+                "elevenlabs", self.api_key, lambda: ElevenLabs(api_key=self.api_key)
+            )
             logger.info("ElevenLabs client initialized")
-            return self._client
+            return self._sync_client
         except ImportError:
             raise ElevenLabsAPIError(
                 "ElevenLabs package not installed. Install with: pip install elevenlabs"
@@ -72,46 +111,80 @@ class ElevenLabsClient(TTSClient):
             ElevenLabsAPIError: If generation fails
         """
         try:
-            client = self._init_client()
-
-            # Get voice settings for emotion
-            voice_settings = self._get_voice_settings(emotion)
-
             # Generate audio using ElevenLabs SDK v2
             logger.info(f"Generating speech: {len(text)} chars, voice={voice_id}, emotion={emotion}")
 
-            # New SDK v2 uses text_to_speech.convert()
-            from elevenlabs import VoiceSettings
-            
-            audio_generator = client.text_to_speech.convert(
-                text=text,
-                voice_id=voice_id,
-                model_id="eleven_multilingual_v2",
-                voice_settings=VoiceSettings(
-                    stability=voice_settings.get("stability", 0.5),
-                    similarity_boost=voice_settings.get("similarity_boost", 0.75),
-                    style=voice_settings.get("style", 0.5),
-                ),
-            )
-
             # Save to file
             if output_path is None:
                 output_path = Path(f"audio_{hash(text)}.mp3")
 
-            output_path.parent.mkdir(parents=True, exist_ok=True)
+            # Chunks are written (and measured) as they arrive
+            streamed = await self.stream_to_file(text, voice_id, output_path, emotion=emotion)
 
-            # Write audio bytes from generator
-            with open(output_path, "wb") as f:
-                for chunk in audio_generator:
-                    f.write(chunk)
-
-            logger.info(f"Audio saved to {output_path}")
+            logger.info(f"Audio saved to {output_path} ({streamed.duration_seconds:.1f}s)")
             return output_path
 
         except Exception as e:
             logger.error(f"ElevenLabs speech generation failed: {e}")
             raise ElevenLabsAPIError(f"Speech generation failed: {e}") from e
 
+    async def stream_speech(
+        self,
+        text: str,
+        voice_id: str,
+        emotion: Optional[EmotionTone] = None,
+        style_instruction: Optional[str] = None,
+    ) -> AsyncIterator[bytes]:
+        """Stream MP3 audio from ElevenLabs as it is generated.
+
+        Args:
+            text: Text to convert to speech
+            voice_id: ElevenLabs voice ID
+            emotion: Optional emotion tone for voice settings
+            style_instruction: Ignored (ElevenLabs uses voice settings)
+
+        Yields:
+            MP3 chunks
+        """
+        from elevenlabs import VoiceSettings
+
+        client = self._init_client()
+
+        # Get voice settings for emotion
+        voice_settings = self._get_voice_settings(emotion)
+
+        # Audio is streamed while the generator is consumed, so hold the
+        # rate limiter slot until every chunk has been delivered
+        async with self.rate_limiter.slot():
+            try:
+                audio_stream = client.text_to_speech.convert(
+                    text=text,
+                    voice_id=voice_id,
+                    model_id=ELEVENLABS_MODEL_ID,
+                    voice_settings=VoiceSettings(
+                        stability=voice_settings.get("stability", 0.5),
+                        similarity_boost=voice_settings.get("similarity_boost", 0.75),
+                        style=voice_settings.get("style", 0.5),
+                    ),
+                )
+
+                async for chunk in audio_stream:
+                    yield chunk
+            except Exception as e:
+                if is_rate_limit_error(e):
+                    self.rate_limiter.report_rate_limited()
+                raise
+
+        self.rate_limiter.report_success()
+
+    def get_model_name(self) -> str:
+        """Get model identifier.
+
+        Returns:
+            ElevenLabs model ID
+        """
+        return ELEVENLABS_MODEL_ID
+
     def _get_voice_settings(self, emotion: Optional[EmotionTone]) -> dict[str, float]:
         """Get voice settings for emotion tone.
 
@@ -136,7 +209,7 @@ class ElevenLabsClient(TTSClient):
             List of voice metadata
         """
         try:
-            client = self._init_client()
+            client = self._init_sync_client()
             voices = client.voices.get_all()
 
             return [
@@ -1,5 +1,7 @@
 """Audio generator orchestrator - combines TTS and timestamp extraction."""
 
+import asyncio
+import inspect
 import json
 import logging
 from datetime import datetime
@@ -10,15 +12,21 @@ from gossiptoon.audio.audio_processor import AudioProcessor
 from gossiptoon.audio.base import TTSClient
 from gossiptoon.audio.elevenlabs_client import ElevenLabsClient
 from gossiptoon.audio.google_tts_client import GoogleTTSClient
+from gossiptoon.audio.timeline import MasterTimeline
+from gossiptoon.audio.tts_cache import TTSCache
 from gossiptoon.audio.whisper import WhisperTimestampExtractor
 from gossiptoon.core.config import ConfigManager
 from gossiptoon.core.constants import EmotionTone
 from gossiptoon.core.exceptions import AudioGenerationError
-from gossiptoon.models.audio import AudioProject, AudioSegment
+from gossiptoon.models.audio import AudioProject, AudioSegment, DriftReport, WordTimestamp
 from gossiptoon.models.script import Script
+from gossiptoon.utils.journal import ItemJournal
 
 logger = logging.getLogger(__name__)
 
+# Largest acceptable gap between the rendered master and its timeline (seconds)
+MASTER_DRIFT_TOLERANCE = 0.05
+
 
 class AudioGenerator:
     """Main audio generation orchestrator.
@@ -49,19 +57,36 @@ class AudioGenerator:
                 api_key=config.api.google_api_key,
                 model=config.audio.google_tts_model,
                 default_voice=config.audio.google_tts_voice,
+                streaming=config.audio.tts_streaming,
             )
         else:
             logger.info("Using ElevenLabs TTS")
             self.tts_client = ElevenLabsClient(api_key=config.api.elevenlabs_api_key)
 
-        self.whisper = WhisperTimestampExtractor(model_name=config.audio.whisper_model)
+        self.whisper = WhisperTimestampExtractor(
+            model_name=config.audio.whisper_model,
+            processes=config.audio.whisper_processes,
+            backend=config.audio.timestamp_backend,
+        )
 
         self.processor = AudioProcessor()
 
+        # Content-addressed cache shared across jobs (skips TTS + Whisper on hits)
+        self.tts_cache: Optional[TTSCache] = None
+        if config.audio.tts_cache_enabled:
+            self.tts_cache = TTSCache(
+                cache_dir=config.cache_dir / "tts",
+                max_bytes=config.audio.tts_cache_max_mb * 1024 * 1024,
+            )
+
+        # Audio awaiting a batched Whisper pass: path -> (cache key, journal item ID, text)
+        self._deferred_timestamps: dict[Path, tuple[Optional[str], str, str]] = {}
+
     async def generate_audio_project(
         self,
         script: Script,
         voice_id: Optional[str] = None,
+        journal: Optional[ItemJournal] = None,
     ) -> AudioProject:
         """Generate complete audio project for script.
 
@@ -73,6 +98,8 @@ class AudioGenerator:
         Args:
             script: Script to generate audio for
             voice_id: Optional voice ID (uses default if not provided)
+            journal: Optional per-item journal; finished segments are recorded
+                as they complete and reused (if unchanged) instead of re-synthesized
 
         Returns:
             AudioProject with all segments and timestamps
@@ -86,37 +113,29 @@ class AudioGenerator:
         logger.info(f"Generating audio project for script: {script.script_id}")
         logger.info(f"Default voice: {voice_id}")
 
+        self._deferred_timestamps.clear()
+
         try:
-            # Generate audio for each scene
-            segments = []
-            current_offset = 0.0  # Master Clock
-
-            for scene in script.get_all_scenes():
-                # Check if webtoon-style scene with audio chunks
-                if hasattr(scene, "is_webtoon_style") and scene.is_webtoon_style():
-                    # NEW: Generate fragmented audio chunks
-                    logger.info(
-                        f"Scene {scene.scene_id} is webtoon-style with {len(scene.audio_chunks)} chunks"
-                    )
-                    chunk_segments, current_offset = await self._generate_scene_audio_chunks(
-                        scene=scene,
-                        current_offset=current_offset,
-                        gender_map={c.name: c.gender for c in script.character_profiles},
-                    )
-                    segments.extend(chunk_segments)
-                else:
-                    # LEGACY: Generate single narration audio
-                    logger.info(f"Scene {scene.scene_id} is legacy narration-style")
-                    segment = await self._generate_scene_audio(scene, voice_id)
-                    segment.global_offset = current_offset  # Set Master Clock offset
-                    segments.append(segment)
-                    current_offset += segment.duration_seconds
+            gender_map = {c.name: c.gender for c in script.character_profiles}
+
+            if self.config.audio.concurrent_synthesis:
+                segments = await self._generate_segments_concurrently(
+                    script, voice_id, gender_map, journal
+                )
+            else:
+                segments = await self._generate_segments_serially(
+                    script, voice_id, gender_map, journal
+                )
+
+            # One Whisper pass for every newly synthesized segment
+            await self._extract_deferred_timestamps(segments, journal)
 
             # Concatenate all segments into master audio
             master_audio_path = await self._create_master_audio(segments, script.script_id)
 
-            # Calculate total duration from Master Clock
-            total_duration = current_offset
+            # Lay segments out on the Master Clock as rendered (crossfades, tempo)
+            drift_report = self._apply_master_timeline(segments, master_audio_path)
+            total_duration = drift_report.timeline_duration
 
             # Create audio project
             audio_project = AudioProject(
@@ -125,6 +144,7 @@ class AudioGenerator:
                 total_duration=total_duration,
                 master_audio_path=master_audio_path,
                 voice_id=voice_id,
+                drift_report=drift_report,
             )
 
             # Save audio project
@@ -140,16 +160,112 @@ class AudioGenerator:
             logger.error(f"Audio project generation failed: {e}")
             raise AudioGenerationError(f"Failed to generate audio project: {e}") from e
 
+    async def _generate_segments_serially(
+        self,
+        script: Script,
+        voice_id: str,
+        gender_map: dict[str, str],
+        journal: Optional[ItemJournal] = None,
+    ) -> list[AudioSegment]:
+        """Synthesize every scene and chunk one after another.
+
+        Args:
+            script: Script to generate audio for
+            voice_id: Default voice for legacy narration scenes
+            gender_map: Map of character names to genders
+            journal: Optional per-item journal
+
+        Returns:
+            Segments in script order (offsets assigned by caller)
+        """
+        segments = []
+        current_offset = 0.0
+
+        for scene in script.get_all_scenes():
+            # Check if webtoon-style scene with audio chunks
+            if hasattr(scene, "is_webtoon_style") and scene.is_webtoon_style():
+                logger.info(
+                    f"Scene {scene.scene_id} is webtoon-style with {len(scene.audio_chunks)} chunks"
+                )
+                chunk_segments, current_offset = await self._generate_scene_audio_chunks(
+                    scene=scene,
+                    current_offset=current_offset,
+                    gender_map=gender_map,
+                    journal=journal,
+                )
+                segments.extend(chunk_segments)
+            else:
+                # LEGACY: Generate single narration audio
+                logger.info(f"Scene {scene.scene_id} is legacy narration-style")
+                segment = await self._generate_scene_audio(scene, voice_id, journal)
+                segments.append(segment)
+                current_offset += segment.duration_seconds
+
+        return segments
+
+    async def _generate_segments_concurrently(
+        self,
+        script: Script,
+        voice_id: str,
+        gender_map: dict[str, str],
+        journal: Optional[ItemJournal] = None,
+    ) -> list[AudioSegment]:
+        """Synthesize all scenes and chunks at once, across scene boundaries.
+
+        Throughput is bounded by the TTS client's provider rate limiter rather
+        than by chunk count. Offsets are not known until every duration is in,
+        so segments are created at offset 0 and laid out afterwards.
+
+        Args:
+            script: Script to generate audio for
+            voice_id: Default voice for legacy narration scenes
+            gender_map: Map of character names to genders
+            journal: Optional per-item journal
+
+        Returns:
+            Segments in script order (offsets assigned by caller)
+
+        Raises:
+            Exception: First synthesis failure, after all other requests finish
+        """
+        jobs = []
+        for scene in script.get_all_scenes():
+            if hasattr(scene, "is_webtoon_style") and scene.is_webtoon_style():
+                for audio_chunk in scene.audio_chunks:
+                    jobs.append(
+                        self._generate_chunk_audio(
+                            audio_chunk=audio_chunk,
+                            scene_id=scene.scene_id,
+                            global_offset=0.0,
+                            gender_map=gender_map,
+                            journal=journal,
+                        )
+                    )
+            else:
+                jobs.append(self._generate_scene_audio(scene, voice_id, journal))
+
+        logger.info(f"Synthesizing {len(jobs)} audio segments concurrently")
+
+        # Let every request finish so completed audio files are not wasted
+        results = await asyncio.gather(*jobs, return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+        return list(results)
+
     async def _generate_scene_audio(
         self,
         scene: any,  # Scene from script
         voice_id: str,
+        journal: Optional[ItemJournal] = None,
     ) -> AudioSegment:
         """Generate audio for a single scene.
 
         Args:
             scene: Scene object from script
             voice_id: Voice identifier
+            journal: Optional per-item journal
 
         Returns:
             AudioSegment with timestamps
@@ -159,20 +275,15 @@ class AudioGenerator:
         # Generate speech with TTS
         output_path = self.config.audio_dir / f"{scene.scene_id}.mp3"
 
-        audio_path = await self.tts_client.generate_speech(
+        audio_path, duration, timestamps = await self._synthesize(
             text=scene.narration,
             voice_id=voice_id,
-            emotion=scene.emotion,
             output_path=output_path,
+            emotion=scene.emotion,
+            journal=journal,
+            defer_timestamps=self.config.audio.batch_timestamps,
         )
 
-        # Get actual audio duration
-        duration = self.processor.get_audio_duration(audio_path)
-
-        # Extract word-level timestamps
-        logger.info(f"Extracting timestamps for scene: {scene.scene_id}")
-        timestamps = await self.whisper.extract_timestamps(audio_path)
-
         # Create audio segment
         segment = AudioSegment(
             scene_id=scene.scene_id,
@@ -193,6 +304,7 @@ class AudioGenerator:
         scene_id: str,
         global_offset: float,
         gender_map: Optional[dict[str, str]] = None,
+        journal: Optional[ItemJournal] = None,
     ) -> AudioSegment:
         """Generate audio for a single audio chunk (webtoon-style).
 
@@ -201,6 +313,7 @@ class AudioGenerator:
             scene_id: Parent scene identifier
             global_offset: Start time in master timeline
             gender_map: Map of character names to genders
+            journal: Optional per-item journal
         """
         from gossiptoon.models.audio import AudioChunkType
 
@@ -220,39 +333,20 @@ class AudioGenerator:
         # Generate speech with director's notes as style instruction
         output_path = self.config.audio_dir / f"{audio_chunk.chunk_id}.wav"
 
-        # Check if TTS client supports flexible style instructions (Google TTS)
-        if (
-            hasattr(self.tts_client.generate_speech, "__code__")
-            and "style_instruction" in self.tts_client.generate_speech.__code__.co_varnames
-        ):
-            # Google TTS with custom style
-            audio_path = await self.tts_client.generate_speech(
-                text=audio_chunk.text,
-                voice_id=voice_id,
-                style_instruction=audio_chunk.director_notes,
-                output_path=output_path,
-            )
-        else:
-            # ElevenLabs or legacy TTS (use emotion only)
-            audio_path = await self.tts_client.generate_speech(
-                text=audio_chunk.text,
-                voice_id=voice_id,
-                emotion=None,  # Director's notes not supported
-                output_path=output_path,
-            )
-
-        # RATE LIMITING: Google TTS has 10 RPM limit (6 seconds per request minimum)
-        # Using 8 seconds for safer margin to prevent 429 RESOURCE_EXHAUSTED errors
-        import asyncio
-        logger.info("⏱️ Rate limiting: waiting 8s before next TTS request...")
-        await asyncio.sleep(8)
-
-        # Get actual audio duration
-        duration = self.processor.get_audio_duration(audio_path)
+        # Director's notes only apply if the TTS client supports style
+        # instructions (Google TTS); ElevenLabs / legacy TTS ignore them
+        style_instruction = (
+            audio_chunk.director_notes if self._supports_style_instruction() else None
+        )
 
-        # Extract word-level timestamps
-        logger.info(f"Extracting timestamps for chunk: {audio_chunk.chunk_id}")
-        timestamps = await self.whisper.extract_timestamps(audio_path)
+        audio_path, duration, timestamps = await self._synthesize(
+            text=audio_chunk.text,
+            voice_id=voice_id,
+            output_path=output_path,
+            style_instruction=style_instruction,
+            journal=journal,
+            defer_timestamps=self.config.audio.batch_timestamps,
+        )
 
         # Create audio segment with Master Clock offset
         segment = AudioSegment(
@@ -272,6 +366,217 @@ class AudioGenerator:
 
         return segment
 
+    def _supports_style_instruction(self) -> bool:
+        """Check if the TTS client accepts free-form style instructions.
+
+        Uses the signature (which follows ``__wrapped__``), since clients
+        decorate ``generate_speech`` with ``retry_with_backoff``.
+        """
+        try:
+            parameters = inspect.signature(self.tts_client.generate_speech).parameters
+        except (TypeError, ValueError):
+            return False
+        return "style_instruction" in parameters
+
+    async def _synthesize(
+        self,
+        text: str,
+        voice_id: str,
+        output_path: Path,
+        emotion: Optional[EmotionTone] = None,
+        style_instruction: Optional[str] = None,
+        journal: Optional[ItemJournal] = None,
+        defer_timestamps: bool = False,
+    ) -> tuple[Path, float, list[WordTimestamp]]:
+        """Synthesize text and measure it, reusing earlier results when possible.
+
+        Results already recorded in the journal by an interrupted run are
+        reused first, then the shared TTS cache is consulted.
+
+        Args:
+            text: Text to speak
+            voice_id: Voice identifier
+            output_path: Desired output path in the project audio directory
+            emotion: Optional emotion tone
+            style_instruction: Optional style instruction (takes precedence over emotion)
+            journal: Optional per-item journal (items keyed by output file stem)
+            defer_timestamps: Skip Whisper for new audio and return no timestamps;
+                ``_extract_deferred_timestamps`` fills them in (and caches and
+                journals the result) in one batched pass
+
+        Returns:
+            Tuple of (audio path, duration in seconds, word timestamps)
+        """
+        item_id = output_path.stem
+
+        # Text as actually spoken (stage directions stripped, numbers expanded)
+        prepared = self.tts_client.prepare_text(text)
+
+        # The content hash doubles as the journal fingerprint
+        cache_key = None
+        if self.tts_cache is not None or journal is not None:
+            style = style_instruction or (emotion.value if emotion else None)
+            cache_key = TTSCache.make_key(
+                text=prepared,
+                voice_id=voice_id,
+                style=style,
+                model=self.tts_client.get_model_name(),
+                provider=self.tts_client.provider_name,
+                timestamp_backend=self.whisper.backend,
+                timestamp_model=self.whisper.model_name,
+            )
+
+        if journal is not None:
+            saved = journal.get(item_id, fingerprint=cache_key)
+            if saved and Path(saved["audio_path"]).exists():
+                logger.info(f"Reusing journaled audio for {item_id}")
+                audio_path = Path(saved["audio_path"])
+                if saved["timestamps"] is None:
+                    # Synthesized by the interrupted run, but not yet timed
+                    return await self._extract_or_defer_timestamps(
+                        audio_path, saved["duration_seconds"], prepared, cache_key, item_id, journal,
+                        defer_timestamps,
+                    )
+                return (
+                    audio_path,
+                    saved["duration_seconds"],
+                    [WordTimestamp.model_validate(t) for t in saved["timestamps"]],
+                )
+
+        if self.tts_cache is not None:
+            entry = self.tts_cache.get(cache_key)
+            if entry is not None:
+                logger.info(f"TTS cache hit for {output_path.stem}")
+                audio_path = self.tts_cache.restore(entry, output_path)
+                self._record_item(
+                    journal, item_id, cache_key, audio_path, entry.duration_seconds, entry.timestamps
+                )
+                return audio_path, entry.duration_seconds, entry.timestamps
+
+        if style_instruction is not None:
+            audio_path = await self.tts_client.generate_speech(
+                text=text,
+                voice_id=voice_id,
+                style_instruction=style_instruction,
+                output_path=output_path,
+            )
+        else:
+            audio_path = await self.tts_client.generate_speech(
+                text=text,
+                voice_id=voice_id,
+                emotion=emotion,
+                output_path=output_path,
+            )
+
+        # Get actual audio duration
+        duration = self.processor.get_audio_duration(audio_path)
+
+        return await self._extract_or_defer_timestamps(
+            audio_path, duration, prepared, cache_key, item_id, journal, defer_timestamps
+        )
+
+    async def _extract_or_defer_timestamps(
+        self,
+        audio_path: Path,
+        duration: float,
+        text: str,
+        cache_key: Optional[str],
+        item_id: str,
+        journal: Optional[ItemJournal],
+        defer_timestamps: bool,
+    ) -> tuple[Path, float, list[WordTimestamp]]:
+        """Time freshly synthesized audio now, or queue it for the batched pass.
+
+        Deferred audio is journaled right away without timestamps, so a
+        crash before the batched pass does not lose the TTS call.
+
+        Args:
+            audio_path: Synthesized audio
+            duration: Measured duration
+            text: Text as sent to the provider (used by text-aligning timestamp backends)
+            cache_key: Content hash (None when neither cache nor journal is used)
+            item_id: Journal item identifier
+            journal: Optional per-item journal
+            defer_timestamps: Queue for ``_extract_deferred_timestamps`` instead
+
+        Returns:
+            Tuple of (audio path, duration in seconds, word timestamps)
+        """
+        if defer_timestamps:
+            self._deferred_timestamps[audio_path] = (cache_key, item_id, text)
+            self._record_item(journal, item_id, cache_key, audio_path, duration, None)
+            return audio_path, duration, []
+
+        # Extract word-level timestamps
+        logger.info(f"Extracting timestamps for {item_id}")
+        timestamps = await self.whisper.extract_timestamps(audio_path, text=text)
+
+        if self.tts_cache is not None:
+            self.tts_cache.put(cache_key, audio_path, duration, timestamps)
+        self._record_item(journal, item_id, cache_key, audio_path, duration, timestamps)
+
+        return audio_path, duration, timestamps
+
+    async def _extract_deferred_timestamps(
+        self,
+        segments: list[AudioSegment],
+        journal: Optional[ItemJournal] = None,
+    ) -> None:
+        """Fill in timestamps for segments whose Whisper pass was deferred.
+
+        Args:
+            segments: All segments of the project
+            journal: Optional per-item journal
+        """
+        pending = [seg for seg in segments if seg.file_path in self._deferred_timestamps]
+        if not pending:
+            return
+
+        batches = await self.whisper.extract_timestamps_batch(
+            [seg.file_path for seg in pending],
+            texts=[self._deferred_timestamps[seg.file_path][2] for seg in pending],
+        )
+
+        for segment, timestamps in zip(pending, batches):
+            segment.timestamps = timestamps
+            cache_key, item_id, _ = self._deferred_timestamps.pop(segment.file_path)
+            if cache_key is None:
+                continue
+            if self.tts_cache is not None:
+                self.tts_cache.put(
+                    cache_key, segment.file_path, segment.duration_seconds, timestamps
+                )
+            self._record_item(
+                journal, item_id, cache_key, segment.file_path, segment.duration_seconds, timestamps
+            )
+
+    @staticmethod
+    def _record_item(
+        journal: Optional[ItemJournal],
+        item_id: str,
+        fingerprint: str,
+        audio_path: Path,
+        duration: float,
+        timestamps: Optional[list[WordTimestamp]],
+    ) -> None:
+        """Record a synthesis in the journal (no-op without one).
+
+        ``timestamps`` is None for audio still waiting for the batched pass.
+        """
+        if journal is None:
+            return
+        journal.record(
+            item_id,
+            {
+                "audio_path": str(audio_path),
+                "duration_seconds": duration,
+                "timestamps": (
+                    None if timestamps is None else [t.model_dump(mode="json") for t in timestamps]
+                ),
+            },
+            fingerprint=fingerprint,
+        )
+
     def _select_voice_for_speaker(
         self,
         speaker_id: str,
@@ -328,12 +633,15 @@ class AudioGenerator:
         scene: any,  # Scene from script
         current_offset: float,
         gender_map: Optional[dict[str, str]] = None,
+        journal: Optional[ItemJournal] = None,
     ) -> tuple[list[AudioSegment], float]:
         """Generate audio for all chunks in a webtoon-style scene.
 
         Args:
             scene: Scene object with audio_chunks
             current_offset: Current position in master timeline
+            gender_map: Map of character names to genders
+            journal: Optional per-item journal
 
         Returns:
             Tuple of (list of AudioSegments, updated offset)
@@ -351,6 +659,7 @@ class AudioGenerator:
                 scene_id=scene.scene_id,
                 global_offset=offset,
                 gender_map=gender_map,
+                journal=journal,
             )
             segments.append(segment)
             offset += segment.duration_seconds
@@ -367,7 +676,11 @@ class AudioGenerator:
         segments: list[AudioSegment],
         script_id: str,
     ) -> Path:
-        """Concatenate all scene audio into master file.
+        """Render all scene audio into the master file.
+
+        Segments are decoded once, loudness-matched, concatenated, sped up
+        and normalized to the target LUFS in memory; the master is written
+        once in a lossless format.
 
         Args:
             segments: List of audio segments
@@ -379,33 +692,63 @@ class AudioGenerator:
         logger.info(f"Creating master audio from {len(segments)} segments")
 
         audio_paths = [seg.file_path for seg in segments]
-        output_path = self.config.audio_dir / f"{script_id}_master.mp3"
-
-        # Concatenate audio files
-        master_path = await self.processor.concatenate_audio_files(
-            audio_paths=audio_paths,
-            output_path=output_path,
-            crossfade_ms=100,  # Small crossfade for smooth transitions
-        )
+        master_format = self.config.audio.master_format
+        output_path = self.config.audio_dir / f"{script_id}_master.{master_format}"
 
-        # Apply speed factor if needed (Dynamic Pacing)
         if self.config.audio.speed_factor != 1.0:
             logger.info(f"Applying speed factor: {self.config.audio.speed_factor}x")
-            master_path = await self.processor.change_speed(
-                audio_path=master_path,
-                speed_factor=self.config.audio.speed_factor,
-            )
 
-        # Normalize volume
-        await self.processor.normalize_audio(
-            audio_path=master_path,
-            target_dbfs=-20.0,
+        master_path = await self.processor.render_master(
+            audio_paths=audio_paths,
+            output_path=output_path,
+            crossfade_ms=self.config.audio.crossfade_ms,
+            speed_factor=self.config.audio.speed_factor,
+            target_dbfs=None,
+            target_lufs=(
+                self.config.audio.target_lufs if self.config.audio.normalize_audio else None
+            ),
         )
 
         logger.info(f"Master audio created: {master_path}")
 
         return master_path
 
+    def _apply_master_timeline(
+        self, segments: list[AudioSegment], master_audio_path: Path
+    ) -> DriftReport:
+        """Re-time segments to the rendered master and report the correction.
+
+        Crossfades pull every later segment earlier and the speed factor
+        rescales everything, so offsets, durations and word timestamps are
+        rewritten in master seconds (see MasterTimeline).
+
+        Args:
+            segments: Segments in master order
+            master_audio_path: Rendered master audio
+
+        Returns:
+            Drift report (with the measured master duration when available)
+        """
+        timeline = MasterTimeline.from_segments(
+            segments,
+            crossfade_seconds=self.config.audio.crossfade_ms / 1000,
+            speed_factor=self.config.audio.speed_factor,
+        )
+        report = timeline.apply(segments)
+
+        try:
+            report.master_duration = self.processor.get_audio_duration(master_audio_path)
+        except Exception as e:
+            logger.warning(f"Could not measure master audio for the drift report: {e}")
+            return report
+
+        if abs(report.residual_seconds) > MASTER_DRIFT_TOLERANCE:
+            logger.warning(
+                f"Master audio is {report.master_duration:.3f}s but the timeline expects "
+                f"{report.timeline_duration:.3f}s; captions may drift"
+            )
+        return report
+
     def _save_audio_project(self, audio_project: AudioProject) -> None:
         """Save audio project to disk.
 
@@ -453,19 +796,13 @@ class AudioGenerator:
                 # Generate new audio
                 output_path = self.config.audio_dir / f"{scene_id}_v2.mp3"
 
-                audio_path = await self.tts_client.generate_speech(
+                audio_path, duration, timestamps = await self._synthesize(
                     text=new_narration,
                     voice_id=voice_id,
-                    emotion=segment.emotion,
                     output_path=output_path,
+                    emotion=segment.emotion,
                 )
 
-                # Extract timestamps
-                timestamps = await self.whisper.extract_timestamps(audio_path)
-
-                # Get duration
-                duration = self.processor.get_audio_duration(audio_path)
-
                 # Create new segment
                 new_segment = AudioSegment(
                     scene_id=scene_id,
@@ -479,17 +816,18 @@ class AudioGenerator:
                 # Replace old segment
                 audio_project.segments[i] = new_segment
 
-                # Recalculate total duration
-                audio_project.total_duration = sum(
-                    seg.duration_seconds for seg in audio_project.segments
-                )
-
                 # Recreate master audio
                 audio_project.master_audio_path = await self._create_master_audio(
                     audio_project.segments,
                     audio_project.script_id,
                 )
 
+                # Re-time every segment against the new master
+                audio_project.drift_report = self._apply_master_timeline(
+                    audio_project.segments, audio_project.master_audio_path
+                )
+                audio_project.total_duration = audio_project.drift_report.timeline_duration
+
                 # Save updated project
                 self._save_audio_project(audio_project)
 
@@ -1,13 +1,16 @@
 """Google TTS 2.5 Flash client implementation using Gemini API."""
 
+import asyncio
 import logging
-import wave
 from pathlib import Path
-from typing import Optional
+from typing import AsyncIterator, Optional
 
 from gossiptoon.audio.base import TTSClient
+from gossiptoon.audio.streaming import AudioStreamFormat
 from gossiptoon.core.constants import EmotionTone
 from gossiptoon.core.exceptions import AudioGenerationError
+from gossiptoon.utils.client_pool import get_genai_client
+from gossiptoon.utils.rate_limiter import get_rate_limiter, is_rate_limit_error
 from gossiptoon.utils.retry import retry_with_backoff
 
 logger = logging.getLogger(__name__)
@@ -188,11 +191,15 @@ class GoogleTTSClient(TTSClient):
     - Director's Notes: Style, accent, pace
     """
 
+    provider_name = "google"
+    stream_format = AudioStreamFormat(container="pcm", sample_rate=24000, channels=1)
+
     def __init__(
         self,
         api_key: str,
         model: str = "gemini-2.5-flash-preview-tts",
         default_voice: str = "Kore",
+        streaming: bool = True,
     ) -> None:
         """Initialize Google TTS client.
 
@@ -200,11 +207,14 @@ class GoogleTTSClient(TTSClient):
             api_key: Google API key
             model: Google TTS model name
             default_voice: Default prebuilt voice name
+            streaming: Receive audio with the streaming API (False: one response)
         """
         self.api_key = api_key
         self.model = model
         self.default_voice = default_voice
+        self.streaming = streaming
         self._client: Optional[any] = None
+        self.rate_limiter = get_rate_limiter("google_tts", model)
 
     def _init_client(self) -> any:
         """Initialize Google GenAI client (lazy loading).
@@ -219,9 +229,7 @@ class GoogleTTSClient(TTSClient):
             return self._client
 
         try:
-            from google import genai
-
-            self._client = genai.Client(api_key=self.api_key)
+            self._client = get_genai_client(self.api_key)
             logger.info("Google TTS client initialized")
             return self._client
         except ImportError:
@@ -262,26 +270,6 @@ class GoogleTTSClient(TTSClient):
             AudioGenerationError: If generation fails
         """
         try:
-            from google.genai import types
-            import re
-
-            client = self._init_client()
-            
-            # Preprocess text for TTS compatibility
-            # Google TTS struggles with abbreviations like $28M, $1M
-            preprocessed_text = self._preprocess_text_for_tts(text)
-            if preprocessed_text != text:
-                logger.debug(f"Text preprocessed: '{text}' → '{preprocessed_text}'")
-
-            # Build styled prompt using the "Director" method
-            # Priority: style_instruction > emotion > plain text
-            if style_instruction:
-                styled_prompt = self._build_custom_styled_prompt(preprocessed_text, style_instruction)
-            elif emotion:
-                styled_prompt = self._build_emotion_styled_prompt(preprocessed_text, emotion)
-            else:
-                styled_prompt = text
-
             # Use provided voice or default
             voice_name = voice_id if voice_id else self.default_voice
 
@@ -289,107 +277,198 @@ class GoogleTTSClient(TTSClient):
                 f"Generating speech: {len(text)} chars, voice={voice_name}, emotion={emotion}"
             )
 
-            # Generate audio using Gemini API
-            response = client.models.generate_content(
-                model=self.model,
-                contents=styled_prompt,
-                config=types.GenerateContentConfig(
-                    response_modalities=["AUDIO"],
-                    speech_config=types.SpeechConfig(
-                        voice_config=types.VoiceConfig(
-                            prebuilt_voice_config=types.PrebuiltVoiceConfig(voice_name=voice_name)
-                        )
-                    ),
-                ),
+            # Save as WAV (Google TTS returns PCM at 24kHz)
+            if output_path is None:
+                output_path = Path(f"audio_{hash(text)}.wav")
+
+            # Ensure output path has .wav extension
+            if output_path.suffix.lower() != ".wav":
+                output_path = output_path.with_suffix(".wav")
+
+            # PCM is written to the WAV (and measured) as it arrives
+            streamed = await self.stream_to_file(
+                text, voice_name, output_path, emotion=emotion, style_instruction=style_instruction
             )
 
-            # Validate response
-            if not response or not response.candidates:
+            if streamed.bytes_received == 0:
                 logger.warning(
-                    f"Empty response from Google TTS API (attempt 1). Text: '{text[:50]}...'. "
+                    f"No audio content from Google TTS API (attempt 1). Text: '{text[:50]}...'. "
                     f"Retrying once more..."
                 )
-                # Special retry for None response (1 additional attempt)
-                import asyncio
+                # Special retry for empty responses (1 additional attempt)
                 await asyncio.sleep(2.0)  # Brief pause
-                
-                response = client.models.generate_content(
-                    model=self.model,
-                    contents=styled_prompt,
-                    config=types.GenerateContentConfig(
-                        response_modalities=["AUDIO"],
-                        speech_config=types.SpeechConfig(
-                            voice_config=types.VoiceConfig(
-                                prebuilt_voice_config=types.PrebuiltVoiceConfig(voice_name=voice_name)
-                            )
-                        ),
-                    ),
+
+                streamed = await self.stream_to_file(
+                    text,
+                    voice_name,
+                    output_path,
+                    emotion=emotion,
+                    style_instruction=style_instruction,
                 )
-                
-                # Check again after retry
-                if not response or not response.candidates:
+
+                if streamed.bytes_received == 0:
+                    output_path.unlink(missing_ok=True)
                     raise AudioGenerationError(
-                        f"Empty response from Google TTS API after retry. Text: '{text[:50]}...'"
+                        f"No audio content from Google TTS API after retry. Text: '{text[:50]}...'"
                     )
-            
-            candidate = response.candidates[0]
-            if not candidate.content or not candidate.content.parts:
-                logger.warning(
-                    f"No audio content in response (attempt 1). Text: '{text[:50]}...'. "
-                    f"Retrying once more..."
-                )
-                # Special retry for None content (1 additional attempt)
-                import asyncio
-                await asyncio.sleep(2.0)  # Brief pause
-                
-                response = client.models.generate_content(
+
+            if streamed.peak_dbfs is None:
+                logger.warning(f"Google TTS returned silent audio for: '{text[:50]}...'")
+
+            logger.info(
+                f"Audio saved to {output_path} ({streamed.duration_seconds:.1f}s, "
+                f"{streamed.rms_dbfs or float('-inf'):.1f} dBFS)"
+            )
+            return output_path
+
+        except Exception as e:
+            logger.error(f"Google TTS speech generation failed: {e}")
+            raise AudioGenerationError(f"Speech generation failed: {e}") from e
+
+    async def stream_speech(
+        self,
+        text: str,
+        voice_id: str,
+        emotion: Optional[EmotionTone] = None,
+        style_instruction: Optional[str] = None,
+    ) -> AsyncIterator[bytes]:
+        """Stream 24 kHz PCM from Google TTS as it is generated.
+
+        With streaming disabled, the whole response is requested at once and
+        yielded as a single chunk.
+
+        Args:
+            text: Text to convert to speech
+            voice_id: Voice name (Google prebuilt voice)
+            emotion: Optional emotion tone (converted to a style directive)
+            style_instruction: Optional custom style (takes precedence over emotion)
+
+        Yields:
+            Raw 16-bit mono PCM chunks
+        """
+        client = self._init_client()
+        styled_prompt = self._build_prompt(text, emotion, style_instruction)
+        voice_name = voice_id if voice_id else self.default_voice
+
+        if not self.streaming:
+            response = await self._request_audio(client, styled_prompt, voice_name)
+            for data in self._audio_parts(response):
+                yield data
+            return
+
+        # Hold the rate limiter slot until the stream is fully delivered
+        async with self.rate_limiter.slot():
+            try:
+                stream = await client.aio.models.generate_content_stream(
                     model=self.model,
                     contents=styled_prompt,
-                    config=types.GenerateContentConfig(
-                        response_modalities=["AUDIO"],
-                        speech_config=types.SpeechConfig(
-                            voice_config=types.VoiceConfig(
-                                prebuilt_voice_config=types.PrebuiltVoiceConfig(voice_name=voice_name)
-                            )
-                        ),
-                    ),
+                    config=self._speech_config(voice_name),
                 )
-                
-                # Check again after retry
-                if not response or not response.candidates:
-                    raise AudioGenerationError(
-                        f"Empty response from Google TTS API after content retry. Text: '{text[:50]}...'"
-                    )
-                
-                candidate = response.candidates[0]
-                if not candidate.content or not candidate.content.parts:
-                    raise AudioGenerationError(
-                        f"No audio content in response after retry. Text: '{text[:50]}...', "
-                        f"Response: {response}"
-                    )
+                async for response in stream:
+                    for data in self._audio_parts(response):
+                        yield data
+            except Exception as e:
+                if is_rate_limit_error(e):
+                    self.rate_limiter.report_rate_limited()
+                raise
 
-            # Extract audio data (PCM format)
-            audio_data = candidate.content.parts[0].inline_data.data
+        self.rate_limiter.report_success()
 
-            # Save as WAV (Google TTS returns PCM at 24kHz)
-            if output_path is None:
-                output_path = Path(f"audio_{hash(text)}.wav")
+    def _build_prompt(
+        self,
+        text: str,
+        emotion: Optional[EmotionTone],
+        style_instruction: Optional[str],
+    ) -> str:
+        """Build the TTS prompt using the "Director" method.
 
-            # Ensure output path has .wav extension
-            if output_path.suffix.lower() != ".wav":
-                output_path = output_path.with_suffix(".wav")
+        Args:
+            text: Text to speak
+            emotion: Optional emotion tone
+            style_instruction: Optional custom style (takes precedence over emotion)
 
-            output_path.parent.mkdir(parents=True, exist_ok=True)
+        Returns:
+            Styled prompt
+        """
+        # Preprocess text for TTS compatibility
+        # Google TTS struggles with abbreviations like $28M, $1M
+        preprocessed_text = self._preprocess_text_for_tts(text)
+        if preprocessed_text != text:
+            logger.debug(f"Text preprocessed: '{text}' → '{preprocessed_text}'")
+
+        # Priority: style_instruction > emotion > plain text
+        if style_instruction:
+            return self._build_custom_styled_prompt(preprocessed_text, style_instruction)
+        if emotion:
+            return self._build_emotion_styled_prompt(preprocessed_text, emotion)
+        return preprocessed_text
+
+    @staticmethod
+    def _audio_parts(response: any) -> list[bytes]:
+        """Extract PCM bytes from a (possibly partial) response.
 
-            # Save PCM data as WAV
-            self._save_wave_file(output_path, audio_data)
+        Args:
+            response: generate_content response or stream chunk
 
-            logger.info(f"Audio saved to {output_path}")
-            return output_path
+        Returns:
+            Audio data of every inline part (empty if there is none)
+        """
+        if not response or not response.candidates:
+            return []
+        content = response.candidates[0].content
+        if not content or not content.parts:
+            return []
+        return [
+            part.inline_data.data
+            for part in content.parts
+            if part.inline_data is not None and part.inline_data.data
+        ]
 
-        except Exception as e:
-            logger.error(f"Google TTS speech generation failed: {e}")
-            raise AudioGenerationError(f"Speech generation failed: {e}") from e
+    def _speech_config(self, voice_name: str) -> any:
+        """Build the audio generation config for a voice.
+
+        Args:
+            voice_name: Prebuilt voice name
+
+        Returns:
+            GenerateContentConfig requesting audio
+        """
+        from google.genai import types
+
+        return types.GenerateContentConfig(
+            response_modalities=["AUDIO"],
+            speech_config=types.SpeechConfig(
+                voice_config=types.VoiceConfig(
+                    prebuilt_voice_config=types.PrebuiltVoiceConfig(voice_name=voice_name)
+                )
+            ),
+        )
+
+    async def _request_audio(self, client: any, styled_prompt: str, voice_name: str) -> any:
+        """Call the Gemini TTS endpoint within the shared rate limit.
+
+        Args:
+            client: Google GenAI client
+            styled_prompt: Prompt including style directives
+            voice_name: Prebuilt voice name
+
+        Returns:
+            Raw generate_content response
+        """
+        async with self.rate_limiter.slot():
+            try:
+                response = await client.aio.models.generate_content(
+                    model=self.model,
+                    contents=styled_prompt,
+                    config=self._speech_config(voice_name),
+                )
+            except Exception as e:
+                if is_rate_limit_error(e):
+                    self.rate_limiter.report_rate_limited()
+                raise
+
+        self.rate_limiter.report_success()
+        return response
 
     def _build_emotion_styled_prompt(self, text: str, emotion: EmotionTone) -> str:
         """Build styled prompt from EmotionTone using the "Director" method.
@@ -427,18 +506,24 @@ class GoogleTTSClient(TTSClient):
         logger.debug(f"Using custom style: {style_instruction}")
         return prompt
 
-    def _save_wave_file(self, filename: Path, pcm_data: bytes) -> None:
-        """Save PCM data as WAV file.
+    def get_model_name(self) -> str:
+        """Get model identifier.
+
+        Returns:
+            Google TTS model name
+        """
+        return self.model
+
+    def prepare_text(self, text: str) -> str:
+        """Get text exactly as it will be sent to Google TTS.
 
         Args:
-            filename: Output WAV file path
-            pcm_data: PCM audio data
+            text: Input text
+
+        Returns:
+            Preprocessed text
         """
-        with wave.open(str(filename), "wb") as wf:
-            wf.setnchannels(1)  # Mono
-            wf.setsampwidth(2)  # 16-bit
-            wf.setframerate(24000)  # 24kHz sample rate
-            wf.writeframes(pcm_data)
+        return self._preprocess_text_for_tts(text)
 
     def get_available_voices(self) -> list[dict[str, str]]:
         """Get list of available Google TTS voices.
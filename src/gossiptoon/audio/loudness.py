@@ -0,0 +1,133 @@
+"""EBU R128 loudness measurement (ITU-R BS.1770-4).
+
+Integrated loudness is computed in one vectorized pass over decoded
+samples:
+
+1. K-weighting (high shelf + high pass). The two biquads are applied in
+   the frequency domain: the signal is zero-padded, multiplied by the
+   filters' response on the FFT bins and transformed back. The padding
+   is long enough for the filters' impulse response to die out, so this
+   matches time-domain filtering without a per-sample loop (and without
+   SciPy).
+2. Mean square over 400 ms blocks with 75% overlap, from a cumulative sum.
+3. Absolute gate at -70 LUFS, then a relative gate 10 LU below the
+   loudness of the blocks that passed.
+"""
+
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# BS.1770 gating
+BLOCK_SECONDS = 0.4
+BLOCK_STEP_SECONDS = 0.1
+ABSOLUTE_GATE_LUFS = -70.0
+RELATIVE_GATE_LU = -10.0
+
+# Zero padding for the FFT filter (the high pass settles within a few ms)
+_FILTER_PAD_SECONDS = 0.5
+
+
+def k_weighting_coefficients(sample_rate: int) -> list[tuple[np.ndarray, np.ndarray]]:
+    """Biquad coefficients of the K-weighting filter for a sample rate.
+
+    Args:
+        sample_rate: Sample rate in Hz
+
+    Returns:
+        [(b, a)] for the high shelf and the high pass stages
+    """
+    # Pre-filter: high shelf, +4 dB above ~1.7 kHz
+    k = np.tan(np.pi * 1681.974450955533 / sample_rate)
+    q = 0.7071752369554196
+    vh = 10 ** (3.999843853973347 / 20)
+    vb = vh**0.4996667741545416
+    a0 = 1 + k / q + k * k
+    shelf = (
+        np.array([vh + vb * k / q + k * k, 2 * (k * k - vh), vh - vb * k / q + k * k]) / a0,
+        np.array([1.0, 2 * (k * k - 1) / a0, (1 - k / q + k * k) / a0]),
+    )
+
+    # RLB weighting: high pass at ~38 Hz
+    k = np.tan(np.pi * 38.13547087602444 / sample_rate)
+    q = 0.5003270373238773
+    a0 = 1 + k / q + k * k
+    high_pass = (
+        np.array([1.0, -2.0, 1.0]),
+        np.array([1.0, 2 * (k * k - 1) / a0, (1 - k / q + k * k) / a0]),
+    )
+    return [shelf, high_pass]
+
+
+def k_weight(samples: np.ndarray, sample_rate: int) -> np.ndarray:
+    """Apply the K-weighting filter.
+
+    Args:
+        samples: Array of shape (frames, channels)
+        sample_rate: Sample rate in Hz
+
+    Returns:
+        Filtered float64 samples, same shape
+    """
+    frames = samples.shape[0]
+    size = frames + int(_FILTER_PAD_SECONDS * sample_rate)
+    spectrum = np.fft.rfft(samples.astype(np.float64), n=size, axis=0)
+
+    # z^-1 on every bin
+    z = np.exp(-2j * np.pi * np.arange(spectrum.shape[0]) / size)
+    response = np.ones_like(z)
+    for b, a in k_weighting_coefficients(sample_rate):
+        response *= (b[0] + b[1] * z + b[2] * z * z) / (a[0] + a[1] * z + a[2] * z * z)
+
+    return np.fft.irfft(spectrum * response[:, np.newaxis], n=size, axis=0)[:frames]
+
+
+def block_loudness(samples: np.ndarray, sample_rate: int) -> np.ndarray:
+    """Mean square per gating block, summed over channels.
+
+    Clips shorter than one block are measured as a single block.
+
+    Args:
+        samples: Array of shape (frames, channels)
+        sample_rate: Sample rate in Hz
+
+    Returns:
+        Channel-summed mean square per block
+    """
+    squared = np.square(k_weight(samples, sample_rate))
+    frames = squared.shape[0]
+    block = int(BLOCK_SECONDS * sample_rate)
+    if frames < block:
+        return np.atleast_1d(squared.mean(axis=0).sum()) if frames else np.zeros(0)
+
+    step = int(BLOCK_STEP_SECONDS * sample_rate)
+    cumulative = np.concatenate([np.zeros((1, squared.shape[1])), np.cumsum(squared, axis=0)])
+    starts = np.arange(0, frames - block + 1, step)
+    means = (cumulative[starts + block] - cumulative[starts]) / block
+    return means.sum(axis=1)
+
+
+def integrated_loudness(samples: np.ndarray, sample_rate: int) -> float:
+    """Gated integrated loudness.
+
+    Args:
+        samples: Array of shape (frames, channels) in [-1, 1]
+        sample_rate: Sample rate in Hz
+
+    Returns:
+        Loudness in LUFS (-inf if every block is below the absolute gate)
+    """
+    powers = block_loudness(samples, sample_rate)
+    with np.errstate(divide="ignore"):
+        loudness = -0.691 + 10 * np.log10(powers)
+
+    gated = powers[loudness > ABSOLUTE_GATE_LUFS]
+    if gated.size == 0:
+        return float("-inf")
+
+    relative_gate = -0.691 + 10 * np.log10(gated.mean()) + RELATIVE_GATE_LU
+    with np.errstate(divide="ignore"):
+        gated = gated[-0.691 + 10 * np.log10(gated) > relative_gate]
+    return float(-0.691 + 10 * np.log10(gated.mean()))
@@ -0,0 +1,333 @@
+"""In-memory PCM audio.
+
+The master track is assembled from decoded samples held in NumPy arrays:
+every source file is decoded once, concatenation, tempo and gain work on
+the samples directly, and the result is written once to a lossless file
+(WAV or FLAC). The final AAC encode in the muxer is the only lossy pass.
+"""
+
+import logging
+import subprocess
+import wave
+from pathlib import Path
+from typing import Any, Optional
+
+import numpy as np
+
+from gossiptoon.audio.loudness import integrated_loudness
+from gossiptoon.core.exceptions import AudioGenerationError
+
+logger = logging.getLogger(__name__)
+
+# Lossless formats the master track can be written in
+LOSSLESS_FORMATS = ("wav", "flac")
+
+# Highest sample peak loudness normalization may raise the audio to (dBFS)
+PEAK_CEILING_DBFS = -1.0
+
+# atempo accepts factors in this range per filter instance
+_ATEMPO_MIN = 0.5
+_ATEMPO_MAX = 2.0
+
+
+class PCMAudio:
+    """Float32 samples (frames x channels) in [-1, 1] at a fixed sample rate."""
+
+    def __init__(self, samples: np.ndarray, sample_rate: int) -> None:
+        """Initialize PCM audio.
+
+        Args:
+            samples: Array of shape (frames, channels); 1-D input is treated as mono
+            sample_rate: Sample rate in Hz
+        """
+        if samples.ndim == 1:
+            samples = samples[:, np.newaxis]
+        self.samples = samples.astype(np.float32, copy=False)
+        self.sample_rate = sample_rate
+
+    @property
+    def channels(self) -> int:
+        """Number of channels."""
+        return self.samples.shape[1]
+
+    @property
+    def frames(self) -> int:
+        """Number of sample frames."""
+        return self.samples.shape[0]
+
+    @property
+    def duration_seconds(self) -> float:
+        """Duration in seconds."""
+        return self.frames / self.sample_rate
+
+    @property
+    def dbfs(self) -> float:
+        """RMS level in dBFS (-inf for silence)."""
+        if self.frames == 0:
+            return float("-inf")
+        rms = float(np.sqrt(np.mean(np.square(self.samples, dtype=np.float64))))
+        return 20 * np.log10(rms) if rms > 0 else float("-inf")
+
+    @property
+    def peak_dbfs(self) -> float:
+        """Sample peak in dBFS (-inf for silence)."""
+        peak = float(np.abs(self.samples).max()) if self.frames else 0.0
+        return 20 * np.log10(peak) if peak > 0 else float("-inf")
+
+    @property
+    def loudness(self) -> float:
+        """Integrated loudness in LUFS (EBU R128; -inf for silence)."""
+        return integrated_loudness(self.samples, self.sample_rate)
+
+    @classmethod
+    def from_file(
+        cls,
+        path: Path,
+        sample_rate: Optional[int] = None,
+        channels: Optional[int] = None,
+    ) -> "PCMAudio":
+        """Decode an audio file (WAV natively, other formats through FFmpeg).
+
+        Args:
+            path: Audio file
+            sample_rate: Convert to this rate (default: keep the file's rate)
+            channels: Convert to this channel count (default: keep the file's)
+
+        Returns:
+            Decoded audio
+        """
+        from pydub import AudioSegment
+
+        return cls.from_segment(AudioSegment.from_file(str(path)), sample_rate, channels)
+
+    @classmethod
+    def from_segment(
+        cls,
+        segment: Any,
+        sample_rate: Optional[int] = None,
+        channels: Optional[int] = None,
+    ) -> "PCMAudio":
+        """Convert a decoded pydub segment.
+
+        Args:
+            segment: Decoded pydub AudioSegment
+            sample_rate: Convert to this rate (default: keep)
+            channels: Convert to this channel count (default: keep)
+
+        Returns:
+            Audio as float32 samples
+        """
+        if sample_rate is not None and segment.frame_rate != sample_rate:
+            segment = segment.set_frame_rate(sample_rate)
+        if channels is not None and segment.channels != channels:
+            segment = segment.set_channels(channels)
+
+        samples = np.array(segment.get_array_of_samples(), dtype=np.float32)
+        samples = samples.reshape(-1, segment.channels)
+        samples /= float(1 << (8 * segment.sample_width - 1))
+        return cls(samples, segment.frame_rate)
+
+    @classmethod
+    def load_many(cls, paths: list[Path]) -> list["PCMAudio"]:
+        """Decode files to a common format (highest rate and channel count).
+
+        Args:
+            paths: Audio files
+
+        Returns:
+            Decoded audio, one per path
+        """
+        from pydub import AudioSegment
+
+        segments = [AudioSegment.from_file(str(path)) for path in paths]
+        sample_rate = max(segment.frame_rate for segment in segments)
+        channels = max(segment.channels for segment in segments)
+        return [cls.from_segment(segment, sample_rate, channels) for segment in segments]
+
+    @classmethod
+    def concatenate(cls, clips: list["PCMAudio"], crossfade_seconds: float = 0.0) -> "PCMAudio":
+        """Join clips end to end, optionally with a linear crossfade at each join.
+
+        Args:
+            clips: Clips in the same format
+            crossfade_seconds: Overlap at each join (clamped to the shorter clip)
+
+        Returns:
+            Joined audio
+        """
+        if not clips:
+            raise AudioGenerationError("Nothing to concatenate")
+
+        sample_rate = clips[0].sample_rate
+        fade = int(crossfade_seconds * sample_rate)
+
+        # Preallocate the full output, then lay clips in with overlaps
+        overlaps = [
+            min(fade, previous.frames, clip.frames) for previous, clip in zip(clips, clips[1:])
+        ]
+        total = sum(clip.frames for clip in clips) - sum(overlaps)
+        out = np.zeros((total, clips[0].channels), dtype=np.float32)
+
+        cursor = 0
+        for index, clip in enumerate(clips):
+            overlap = overlaps[index - 1] if index > 0 else 0
+            start = cursor - overlap
+            if overlap:
+                ramp = np.linspace(0.0, 1.0, overlap, dtype=np.float32)[:, np.newaxis]
+                out[start:cursor] *= 1.0 - ramp
+                out[start:cursor] += clip.samples[:overlap] * ramp
+            out[cursor : start + clip.frames] = clip.samples[overlap:]
+            cursor = start + clip.frames
+
+        return cls(out, sample_rate)
+
+    def apply_gain(self, gain_db: float) -> "PCMAudio":
+        """Scale by a gain in dB.
+
+        Args:
+            gain_db: Gain in decibels
+
+        Returns:
+            New audio
+        """
+        return PCMAudio(self.samples * np.float32(10 ** (gain_db / 20)), self.sample_rate)
+
+    def normalize(self, target_dbfs: float) -> "PCMAudio":
+        """Apply gain so the RMS level reaches ``target_dbfs``.
+
+        Args:
+            target_dbfs: Target RMS level
+
+        Returns:
+            New audio (unchanged if silent)
+        """
+        current = self.dbfs
+        if current == float("-inf"):
+            return self
+        return self.apply_gain(target_dbfs - current)
+
+    def normalize_loudness(
+        self,
+        target_lufs: float,
+        max_gain_db: Optional[float] = None,
+        peak_ceiling_dbfs: float = PEAK_CEILING_DBFS,
+    ) -> tuple["PCMAudio", float]:
+        """Apply gain so the integrated loudness reaches ``target_lufs``.
+
+        The gain is reduced if it would push the sample peak above
+        ``peak_ceiling_dbfs``.
+
+        Args:
+            target_lufs: Target integrated loudness
+            max_gain_db: Limit on the gain magnitude (None: unlimited)
+            peak_ceiling_dbfs: Highest allowed sample peak
+
+        Returns:
+            Tuple of (new audio, measured loudness before the gain); the
+            audio is unchanged if it is silent
+        """
+        current = self.loudness
+        if current == float("-inf"):
+            return self, current
+
+        gain_db = target_lufs - current
+        if max_gain_db is not None:
+            gain_db = max(-max_gain_db, min(gain_db, max_gain_db))
+        gain_db = min(gain_db, peak_ceiling_dbfs - self.peak_dbfs)
+        return self.apply_gain(gain_db), current
+
+    def change_tempo(self, factor: float) -> "PCMAudio":
+        """Time-stretch without changing pitch (FFmpeg atempo over raw PCM pipes).
+
+        Samples go to FFmpeg and come back as raw float32, so no codec is
+        involved.
+
+        Args:
+            factor: Speed multiplier (e.g. 1.1 = 10% faster)
+
+        Returns:
+            New audio
+
+        Raises:
+            AudioGenerationError: If FFmpeg fails
+        """
+        if factor == 1.0:
+            return self
+
+        # atempo only takes 0.5-2.0 per instance; chain for larger changes
+        filters = []
+        remaining = factor
+        while remaining > _ATEMPO_MAX:
+            filters.append(f"atempo={_ATEMPO_MAX}")
+            remaining /= _ATEMPO_MAX
+        while remaining < _ATEMPO_MIN:
+            filters.append(f"atempo={_ATEMPO_MIN}")
+            remaining /= _ATEMPO_MIN
+        filters.append(f"atempo={remaining}")
+
+        raw_format = ["-f", "f32le", "-ar", str(self.sample_rate), "-ac", str(self.channels)]
+        cmd = [
+            "ffmpeg", "-v", "error",
+            *raw_format, "-i", "pipe:0",
+            "-filter:a", ",".join(filters),
+            *raw_format, "pipe:1",
+        ]
+
+        try:
+            result = subprocess.run(
+                cmd, input=self.samples.astype("<f4").tobytes(), capture_output=True, check=True
+            )
+        except subprocess.CalledProcessError as e:
+            raise AudioGenerationError(
+                f"Failed to change audio speed: {e.stderr.decode(errors='replace')}"
+            ) from e
+
+        samples = np.frombuffer(result.stdout, dtype="<f4").reshape(-1, self.channels)
+        return PCMAudio(samples.copy(), self.sample_rate)
+
+    def to_int16(self) -> np.ndarray:
+        """Clip and quantize to interleaved 16-bit samples."""
+        return (np.clip(self.samples, -1.0, 1.0) * 32767).round().astype("<i2")
+
+    def write(self, path: Path) -> Path:
+        """Write as 16-bit WAV or FLAC (chosen by suffix).
+
+        Args:
+            path: Output file (.wav or .flac)
+
+        Returns:
+            Output path
+
+        Raises:
+            AudioGenerationError: If the format is not lossless or writing fails
+        """
+        audio_format = path.suffix.lstrip(".").lower()
+        if audio_format not in LOSSLESS_FORMATS:
+            raise AudioGenerationError(
+                f"Master audio must be one of {LOSSLESS_FORMATS}, got '{path.suffix}'"
+            )
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        pcm = self.to_int16()
+
+        if audio_format == "wav":
+            with wave.open(str(path), "wb") as wav_file:
+                wav_file.setnchannels(self.channels)
+                wav_file.setsampwidth(2)
+                wav_file.setframerate(self.sample_rate)
+                wav_file.writeframes(pcm.tobytes())
+            return path
+
+        cmd = [
+            "ffmpeg", "-y", "-v", "error",
+            "-f", "s16le", "-ar", str(self.sample_rate), "-ac", str(self.channels),
+            "-i", "pipe:0",
+            "-c:a", "flac", str(path),
+        ]
+        try:
+            subprocess.run(cmd, input=pcm.tobytes(), capture_output=True, check=True)
+        except subprocess.CalledProcessError as e:
+            raise AudioGenerationError(
+                f"Failed to write {path}: {e.stderr.decode(errors='replace')}"
+            ) from e
+        return path
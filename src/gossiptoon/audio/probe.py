@@ -0,0 +1,192 @@
+"""Audio duration probing without decoding.
+
+Durations are read from the file header where possible:
+
+- WAV (what Google TTS produces): the ``fmt `` and ``data`` chunk headers
+  give the exact frame count, no samples are read.
+- Other formats: ``ffprobe`` reads the container metadata. Several files
+  are probed with concurrent ffprobe processes.
+- Without ffprobe, the file is decoded with pydub as a last resort.
+
+Results are cached per process by resolved path, size and modification
+time, so a file is probed once however often its length is asked for.
+Files written from a TTS stream are measured while they are written and
+recorded here directly (``remember_duration``).
+"""
+
+import logging
+import struct
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+from gossiptoon.core.exceptions import AudioGenerationError
+
+logger = logging.getLogger(__name__)
+
+# Concurrent ffprobe processes per probe_durations call
+MAX_FFPROBE_PROCESSES = 8
+
+# Data chunk size written by streaming encoders that do not know the length
+_UNKNOWN_SIZE = 0xFFFFFFFF
+
+_durations: dict[tuple[Path, int, int], float] = {}
+_durations_lock = threading.Lock()
+
+
+def read_wav_duration(audio_path: Path) -> Optional[float]:
+    """Read a WAV file's duration from its chunk headers.
+
+    Args:
+        audio_path: Audio file
+
+    Returns:
+        Duration in seconds, or None if the file is not a readable WAV
+    """
+    with open(audio_path, "rb") as f:
+        f.seek(0, 2)
+        file_size = f.tell()
+        f.seek(0)
+
+        header = f.read(12)
+        if len(header) < 12 or header[:4] not in (b"RIFF", b"RF64") or header[8:] != b"WAVE":
+            return None
+
+        sample_rate = 0
+        block_align = 0
+        while True:
+            chunk_header = f.read(8)
+            if len(chunk_header) < 8:
+                return None
+            chunk_id = chunk_header[:4]
+            (size,) = struct.unpack("<I", chunk_header[4:])
+
+            if chunk_id == b"fmt ":
+                fmt = f.read(size)
+                if len(fmt) < 16:
+                    return None
+                sample_rate, _, block_align = struct.unpack("<IIH", fmt[4:14])
+                f.seek(size % 2, 1)
+            elif chunk_id == b"data":
+                if not sample_rate or not block_align:
+                    return None
+                # Unknown (streamed) or truncated data runs to the end of the file
+                remaining = file_size - f.tell()
+                if size == _UNKNOWN_SIZE or size > remaining:
+                    size = remaining
+                return (size // block_align) / sample_rate
+            else:
+                f.seek(size + size % 2, 1)
+
+
+def probe_duration(audio_path: Path) -> float:
+    """Get an audio file's duration without decoding it (cached).
+
+    Args:
+        audio_path: Audio file
+
+    Returns:
+        Duration in seconds
+
+    Raises:
+        AudioGenerationError: If the file is missing or cannot be probed
+    """
+    return probe_durations([audio_path])[0]
+
+
+def probe_durations(audio_paths: list[Path]) -> list[float]:
+    """Get several files' durations, probing uncached non-WAV files concurrently.
+
+    Args:
+        audio_paths: Audio files
+
+    Returns:
+        Durations in seconds, in the same order
+
+    Raises:
+        AudioGenerationError: If a file is missing or cannot be probed
+    """
+    keys = [_cache_key(path) for path in audio_paths]
+    durations: dict[tuple[Path, int, int], float] = {}
+    with _durations_lock:
+        for key in keys:
+            if key in _durations:
+                durations[key] = _durations[key]
+
+    pending = []
+    for key in dict.fromkeys(keys):
+        if key in durations:
+            continue
+        duration = read_wav_duration(key[0]) if key[0].suffix.lower() == ".wav" else None
+        if duration is None:
+            pending.append(key)
+        else:
+            durations[key] = duration
+
+    if pending:
+        workers = min(MAX_FFPROBE_PROCESSES, len(pending))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ffprobe") as pool:
+            probed = list(pool.map(lambda key: _probe_with_ffprobe(key[0]), pending))
+        durations.update(zip(pending, probed))
+
+    with _durations_lock:
+        _durations.update(durations)
+    return [durations[key] for key in keys]
+
+
+def remember_duration(audio_path: Path, duration: float) -> None:
+    """Record a duration measured elsewhere (e.g. while the file was written).
+
+    Args:
+        audio_path: Finished audio file
+        duration: Its duration in seconds
+    """
+    key = _cache_key(audio_path)
+    with _durations_lock:
+        _durations[key] = duration
+
+
+def _cache_key(audio_path: Path) -> tuple[Path, int, int]:
+    """Cache key for a file: resolved path, size and modification time."""
+    path = Path(audio_path).resolve()
+    try:
+        stat = path.stat()
+    except OSError as e:
+        raise AudioGenerationError(f"Failed to get duration: {e}") from e
+    return path, stat.st_size, stat.st_mtime_ns
+
+
+def _probe_with_ffprobe(audio_path: Path) -> float:
+    """Read a file's duration from container metadata, decoding if ffprobe is missing."""
+    cmd = [
+        "ffprobe",
+        "-v",
+        "error",
+        "-show_entries",
+        "format=duration",
+        "-of",
+        "default=noprint_wrappers=1:nokey=1",
+        str(audio_path),
+    ]
+
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        return float(result.stdout.strip())
+    except FileNotFoundError:
+        logger.debug(f"ffprobe not found, decoding {audio_path.name} to measure it")
+        return _decode_duration(audio_path)
+    except (subprocess.CalledProcessError, ValueError) as e:
+        logger.error(f"FFprobe duration check failed: {e}")
+        raise AudioGenerationError(f"Failed to get duration of {audio_path}: {e}") from e
+
+
+def _decode_duration(audio_path: Path) -> float:
+    """Measure a file by decoding it (last resort)."""
+    try:
+        from pydub import AudioSegment
+
+        return len(AudioSegment.from_file(str(audio_path))) / 1000.0
+    except Exception as e:
+        raise AudioGenerationError(f"Failed to get duration of {audio_path}: {e}") from e
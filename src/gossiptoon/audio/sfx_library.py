@@ -0,0 +1,265 @@
+"""Preloaded SFX asset library backed by memory-mapped PCM.
+
+Every SFX asset is decoded once into a raw ``.npy`` file under the shared
+cache directory, one file per source and sample format. Later lookups map
+the file read-only (``np.load(mmap_mode="r")``) instead of decoding the MP3
+again, so all jobs, and all processes on the host, share the same page-cache
+pages. An ``index.json`` records each asset's duration, loudness and peak,
+plus the source size and mtime so a replaced asset is decoded again.
+
+One instance per cache directory is shared within a process (see
+``get_sfx_library``).
+"""
+
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+from pydantic import BaseModel, Field
+
+from gossiptoon.audio.pcm import PCMAudio
+from gossiptoon.audio.sfx_mapper import SFXMapper
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILENAME = "index.json"
+
+# Loudness floor recorded for silent assets
+SILENCE_DBFS = -120.0
+
+
+class SFXEntry(BaseModel):
+    """Index record for one SFX asset."""
+
+    source: str = Field(..., description="Asset path relative to the SFX directory")
+    source_size: int = Field(..., ge=0, description="Asset file size when decoded")
+    source_mtime_ns: int = Field(..., description="Asset modification time when decoded")
+    sample_rate: int = Field(..., gt=0, description="Native sample rate")
+    channels: int = Field(..., gt=0, description="Native channel count")
+    duration_seconds: float = Field(..., ge=0, description="Duration")
+    rms_dbfs: float = Field(..., description="RMS loudness (dBFS)")
+    peak_dbfs: float = Field(..., description="Sample peak (dBFS)")
+
+
+class SFXLibrary:
+    """Keyword lookup and memory-mapped decoded PCM for the SFX assets."""
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        base_dir: Path = SFXMapper.SFX_BASE_DIR,
+        library: Optional[dict[str, str]] = None,
+    ) -> None:
+        """Initialize SFX library.
+
+        Args:
+            cache_dir: Directory holding decoded PCM files and the index
+            base_dir: SFX asset directory
+            library: Keyword -> relative asset path (default: SFXMapper.SFX_LIBRARY)
+        """
+        self.cache_dir = cache_dir
+        self.base_dir = base_dir
+        self.library = dict(SFXMapper.SFX_LIBRARY if library is None else library)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._entries: Optional[dict[str, SFXEntry]] = None
+        self._buffers: dict[tuple[str, int, int], np.ndarray] = {}
+
+    @property
+    def index_path(self) -> Path:
+        """Path to the index file."""
+        return self.cache_dir / INDEX_FILENAME
+
+    def list_keywords(self) -> list[str]:
+        """List all SFX keywords."""
+        return list(self.library)
+
+    def get_path(self, keyword: str) -> Optional[Path]:
+        """Get the asset file for a keyword.
+
+        Args:
+            keyword: SFX keyword (case-insensitive)
+
+        Returns:
+            Asset path, or None if the keyword is unknown or the file is missing
+        """
+        relative_path = self.library.get(keyword.upper().strip())
+        if relative_path is None:
+            return None
+        path = self.base_dir / relative_path
+        return path if path.exists() else None
+
+    def get_entry(self, keyword: str) -> Optional[SFXEntry]:
+        """Get an asset's metadata, decoding it on first use.
+
+        Args:
+            keyword: SFX keyword (case-insensitive)
+
+        Returns:
+            Index entry, or None if the keyword or asset is missing
+        """
+        path = self.get_path(keyword)
+        if path is None:
+            return None
+        with self._lock:
+            return self._ensure_entry(path.relative_to(self.base_dir).as_posix())
+
+    def build_index(self) -> dict[str, SFXEntry]:
+        """Decode every asset that is missing or stale.
+
+        Returns:
+            Index entries by relative asset path
+        """
+        with self._lock:
+            for relative_path in self.library.values():
+                if (self.base_dir / relative_path).exists():
+                    self._ensure_entry(relative_path)
+            return dict(self._load())
+
+    def load_samples(
+        self, sfx_path: Path, sample_rate: int, channels: int
+    ) -> Optional[np.ndarray]:
+        """Get an asset's samples in a given format, memory-mapped.
+
+        Args:
+            sfx_path: Asset file (must be inside the SFX directory)
+            sample_rate: Target sample rate
+            channels: Target channel count
+
+        Returns:
+            Read-only float32 array of shape (frames, channels), or None for
+            files outside the library
+        """
+        try:
+            relative_path = sfx_path.resolve().relative_to(self.base_dir.resolve()).as_posix()
+        except ValueError:
+            return None
+
+        key = (relative_path, sample_rate, channels)
+        with self._lock:
+            entry = self._ensure_entry(relative_path)
+            samples = self._buffers.get(key)
+            if samples is not None:
+                return samples
+
+            pcm_path = self._pcm_path(relative_path, sample_rate, channels)
+            if not pcm_path.exists():
+                decoded = PCMAudio.from_file(
+                    self.base_dir / relative_path, sample_rate=sample_rate, channels=channels
+                )
+                self._save_array(pcm_path, decoded.samples)
+                logger.info(
+                    f"Cached SFX {relative_path} at {sample_rate} Hz x{channels} "
+                    f"({entry.duration_seconds:.2f}s)"
+                )
+
+            samples = np.load(pcm_path, mmap_mode="r")
+            self._buffers[key] = samples
+            return samples
+
+    def _ensure_entry(self, relative_path: str) -> SFXEntry:
+        """Get a fresh index entry, (re)decoding the asset if needed (lock held)."""
+        entries = self._load()
+        source = self.base_dir / relative_path
+        stat = source.stat()
+
+        entry = entries.get(relative_path)
+        if (
+            entry is not None
+            and entry.source_size == stat.st_size
+            and entry.source_mtime_ns == stat.st_mtime_ns
+        ):
+            return entry
+
+        if entry is not None:
+            logger.info(f"SFX asset changed, re-decoding: {relative_path}")
+            self._drop_pcm(relative_path)
+
+        decoded = PCMAudio.from_file(source)
+        peak = float(np.abs(decoded.samples).max()) if decoded.frames else 0.0
+        entry = SFXEntry(
+            source=relative_path,
+            source_size=stat.st_size,
+            source_mtime_ns=stat.st_mtime_ns,
+            sample_rate=decoded.sample_rate,
+            channels=decoded.channels,
+            duration_seconds=decoded.duration_seconds,
+            rms_dbfs=max(decoded.dbfs, SILENCE_DBFS),
+            peak_dbfs=max(20 * np.log10(peak), SILENCE_DBFS) if peak > 0 else SILENCE_DBFS,
+        )
+
+        # The native decode is kept too; it is the format used most often
+        self._save_array(
+            self._pcm_path(relative_path, decoded.sample_rate, decoded.channels), decoded.samples
+        )
+        entries[relative_path] = entry
+        self._save()
+        return entry
+
+    def _pcm_path(self, relative_path: str, sample_rate: int, channels: int) -> Path:
+        """Decoded PCM file for an asset and format."""
+        stem = relative_path.rsplit(".", 1)[0].replace("/", "__")
+        return self.cache_dir / f"{stem}.{sample_rate}x{channels}.npy"
+
+    def _drop_pcm(self, relative_path: str) -> None:
+        """Delete all decoded formats of an asset (lock held)."""
+        stem = relative_path.rsplit(".", 1)[0].replace("/", "__")
+        for pcm_path in self.cache_dir.glob(f"{stem}.*.npy"):
+            pcm_path.unlink(missing_ok=True)
+        self._buffers = {k: v for k, v in self._buffers.items() if k[0] != relative_path}
+
+    @staticmethod
+    def _save_array(path: Path, samples: np.ndarray) -> None:
+        """Write an array atomically (concurrent processes may race)."""
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            np.save(f, np.ascontiguousarray(samples, dtype=np.float32))
+        os.replace(tmp_path, path)
+
+    def _load(self) -> dict[str, SFXEntry]:
+        """Load the index on first use (lock held)."""
+        if self._entries is None:
+            try:
+                data = json.loads(self.index_path.read_text())
+                self._entries = {
+                    key: SFXEntry.model_validate(value)
+                    for key, value in data.get("entries", {}).items()
+                }
+            except FileNotFoundError:
+                self._entries = {}
+            except Exception as e:
+                logger.warning(f"SFX index unreadable, rebuilding: {e}")
+                self._entries = {}
+        return self._entries
+
+    def _save(self) -> None:
+        """Write the index atomically (lock held)."""
+        data = {"entries": {key: entry.model_dump() for key, entry in self._entries.items()}}
+        tmp_path = self.index_path.with_name(f".{INDEX_FILENAME}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(data, indent=2))
+        os.replace(tmp_path, self.index_path)
+
+
+_libraries: dict[Path, SFXLibrary] = {}
+_libraries_lock = threading.Lock()
+
+
+def get_sfx_library(cache_dir: Path) -> SFXLibrary:
+    """Get the process-wide SFX library for a cache directory.
+
+    Args:
+        cache_dir: Directory for decoded PCM and the index
+
+    Returns:
+        Shared SFXLibrary instance
+    """
+    with _libraries_lock:
+        library = _libraries.get(cache_dir)
+        if library is None:
+            library = SFXLibrary(cache_dir)
+            _libraries[cache_dir] = library
+        return library
@@ -1,27 +1,105 @@
 """Audio SFX mixer for overlaying sound effects on narration.
 
 Handles mixing SFX audio files with master narration at specific timestamps.
+
+Mixing works on PCM samples: the master is decoded once into a buffer and
+every SFX is added into its slice of that buffer, so the cost grows with the
+total SFX length rather than with SFX count times master length. Assets
+from the SFX library are read from its memory-mapped PCM cache; any other
+file is decoded once per process (keyed by file, modification time and
+target format).
 """
 
 import logging
+import threading
 from pathlib import Path
 from typing import Optional
 
-from pydub import AudioSegment
+import numpy as np
+
+from gossiptoon.audio.pcm import LOSSLESS_FORMATS, PCMAudio
+from gossiptoon.audio.sfx_library import SFXLibrary
 
 logger = logging.getLogger(__name__)
 
+# Samples above this level are softly compressed instead of hard-clipped
+LIMITER_THRESHOLD = 0.95
+
+_sfx_buffers: dict[tuple[Path, int, int, int], np.ndarray] = {}
+_sfx_buffers_lock = threading.Lock()
+
+
+def load_sfx_samples(sfx_path: Path, sample_rate: int, channels: int) -> np.ndarray:
+    """Get decoded SFX samples in the given format (cached per process).
+
+    Args:
+        sfx_path: SFX audio file
+        sample_rate: Target sample rate
+        channels: Target channel count
+
+    Returns:
+        Read-only float32 array of shape (frames, channels)
+    """
+    path = sfx_path.resolve()
+    key = (path, path.stat().st_mtime_ns, sample_rate, channels)
+
+    with _sfx_buffers_lock:
+        samples = _sfx_buffers.get(key)
+    if samples is not None:
+        return samples
+
+    samples = PCMAudio.from_file(path, sample_rate=sample_rate, channels=channels).samples
+    samples.setflags(write=False)
+    with _sfx_buffers_lock:
+        _sfx_buffers[key] = samples
+    logger.debug(f"Decoded SFX {path.name} ({len(samples) / sample_rate:.2f}s)")
+    return samples
+
+
+def soft_limit(samples: np.ndarray, threshold: float = LIMITER_THRESHOLD) -> int:
+    """Compress peaks above ``threshold`` into (threshold, 1.0) in place.
+
+    Samples below the threshold are untouched; above it a tanh curve
+    approaches full scale smoothly instead of clipping.
+
+    Args:
+        samples: Float samples (modified in place)
+        threshold: Level where limiting starts
+
+    Returns:
+        Number of samples limited
+    """
+    magnitude = np.abs(samples)
+    over = magnitude > threshold
+    count = int(np.count_nonzero(over))
+    if count:
+        headroom = 1.0 - threshold
+        limited = threshold + headroom * np.tanh((magnitude[over] - threshold) / headroom)
+        samples[over] = np.copysign(limited, samples[over])
+    return count
+
 
 class AudioSFXMixer:
     """Mixes SFX sounds with narration audio."""
 
-    def __init__(self, sfx_volume: float = 0.5):
+    def __init__(self, sfx_volume: float = 0.5, library: Optional[SFXLibrary] = None):
         """Initialize SFX mixer.
 
         Args:
             sfx_volume: Relative volume for SFX (0.0-1.0, default 0.5 = 50%)
+            library: Optional SFX library to read decoded assets from
         """
         self.sfx_volume = sfx_volume
+        self.library = library
+
+    @property
+    def sfx_gain(self) -> float:
+        """Linear SFX gain.
+
+        Volume maps to dB as 20 * (volume - 1): 1.0 -> 0 dB, 0.7 -> -6 dB.
+        """
+        volume_adjustment_db = 20 * (self.sfx_volume - 1)
+        return 10 ** (volume_adjustment_db / 20)
 
     def overlay_sfx(
         self,
@@ -41,38 +119,10 @@ class AudioSFXMixer:
         Returns:
             Path to mixed audio file
         """
-        logger.info(
-            f"Overlaying SFX '{sfx_audio_path.name}' at {offset_seconds}s on {master_audio_path.name}"
+        return self.overlay_multiple_sfx(
+            master_audio_path, [(sfx_audio_path, offset_seconds)], output_path
         )
 
-        # Load master audio
-        master = AudioSegment.from_file(str(master_audio_path))
-
-        # Load SFX audio
-        sfx = AudioSegment.from_file(str(sfx_audio_path))
-
-        # Adjust SFX volume
-        # pydub uses dB scale: -20dB = 10% volume, 0dB = 100% volume
-        # For 70% volume: approximately -3dB
-        volume_adjustment_db = 20 * (self.sfx_volume - 1)  # At 0.7 → -6dB
-        sfx = sfx + volume_adjustment_db
-
-        # Overlay at offset (pydub uses milliseconds)
-        offset_ms = int(offset_seconds * 1000)
-        mixed = master.overlay(sfx, position=offset_ms)
-
-        # Determine output path
-        if output_path is None:
-            output_path = master_audio_path.with_name(
-                master_audio_path.stem + "_sfx" + master_audio_path.suffix
-            )
-
-        # Export mixed audio
-        mixed.export(str(output_path), format="mp3")
-
-        logger.info(f"Mixed audio saved to: {output_path}")
-        return output_path
-
     def overlay_multiple_sfx(
         self,
         master_audio_path: Path,
@@ -81,6 +131,8 @@ class AudioSFXMixer:
     ) -> Path:
         """Overlay multiple SFX sounds on master audio.
 
+        SFX extending past the end of the master are truncated, as before.
+
         Args:
             master_audio_path: Path to master/narration audio file
             sfx_list: List of tuples (sfx_audio_path, offset_seconds)
@@ -91,23 +143,8 @@ class AudioSFXMixer:
         """
         logger.info(f"Overlaying {len(sfx_list)} SFX sounds on {master_audio_path.name}")
 
-        # Load master audio
-        mixed = AudioSegment.from_file(str(master_audio_path))
-
-        # Overlay each SFX
-        for sfx_path, offset_seconds in sfx_list:
-            logger.info(f"  - {sfx_path.name} at {offset_seconds}s")
-
-            # Load SFX
-            sfx = AudioSegment.from_file(str(sfx_path))
-
-            # Adjust volume
-            volume_adjustment_db = 20 * (self.sfx_volume - 1)
-            sfx = sfx + volume_adjustment_db
-
-            # Overlay
-            offset_ms = int(offset_seconds * 1000)
-            mixed = mixed.overlay(sfx, position=offset_ms)
+        master = PCMAudio.from_file(master_audio_path)
+        mixed = self.mix(master, sfx_list)
 
         # Determine output path
         if output_path is None:
@@ -115,8 +152,60 @@ class AudioSFXMixer:
                 master_audio_path.stem + "_sfx" + master_audio_path.suffix
             )
 
-        # Export
-        mixed.export(str(output_path), format="mp3")
+        self._export(mixed, output_path)
 
         logger.info(f"Mixed audio with {len(sfx_list)} SFX saved to: {output_path}")
         return output_path
+
+    def mix(self, master: PCMAudio, sfx_list: list[tuple[Path, float]]) -> PCMAudio:
+        """Mix SFX into decoded master audio.
+
+        Args:
+            master: Decoded master audio
+            sfx_list: List of tuples (sfx_audio_path, offset_seconds)
+
+        Returns:
+            New audio with SFX added and peaks limited
+        """
+        buffer = master.samples.copy()
+        gain = np.float32(self.sfx_gain)
+
+        for sfx_path, offset_seconds in sfx_list:
+            logger.info(f"  - {sfx_path.name} at {offset_seconds}s")
+            start = max(int(round(offset_seconds * master.sample_rate)), 0)
+            if start >= len(buffer):
+                logger.warning(f"SFX {sfx_path.name} starts after the end of the master, skipped")
+                continue
+
+            sfx = None
+            if self.library is not None:
+                sfx = self.library.load_samples(sfx_path, master.sample_rate, master.channels)
+            if sfx is None:
+                sfx = load_sfx_samples(sfx_path, master.sample_rate, master.channels)
+            length = min(len(sfx), len(buffer) - start)
+            buffer[start : start + length] += gain * sfx[:length]
+
+        limited = soft_limit(buffer)
+        if limited:
+            logger.info(f"Limiter engaged on {limited} samples")
+
+        return PCMAudio(buffer, master.sample_rate)
+
+    @staticmethod
+    def _export(audio: PCMAudio, output_path: Path) -> None:
+        """Write mixed audio, losslessly when the suffix allows it."""
+        audio_format = output_path.suffix.lstrip(".").lower()
+        if audio_format in LOSSLESS_FORMATS:
+            audio.write(output_path)
+            return
+
+        # Legacy lossy masters (e.g. .mp3)
+        from pydub import AudioSegment
+
+        segment = AudioSegment(
+            audio.to_int16().tobytes(),
+            frame_rate=audio.sample_rate,
+            sample_width=2,
+            channels=audio.channels,
+        )
+        segment.export(str(output_path), format=audio_format)
@@ -0,0 +1,240 @@
+"""Incremental writing of streamed TTS audio.
+
+TTS providers deliver audio in chunks. ``StreamingAudioWriter`` writes
+each chunk to disk as it arrives and measures the clip on the way:
+
+- PCM streams are written as WAV; frame count, RMS and peak are
+  accumulated from the samples, so duration and loudness are known the
+  moment the last chunk lands without reading the file back.
+- MP3 streams are written as-is; duration comes from walking the MPEG
+  frame headers (loudness would need a decode and is not measured).
+
+The measured duration is handed to the duration probe cache, so the
+generator's duration lookup for the new file is free.
+"""
+
+import logging
+import math
+import wave
+from pathlib import Path
+from types import TracebackType
+from typing import Optional
+
+import numpy as np
+from pydantic import BaseModel, Field
+
+from gossiptoon.audio.probe import remember_duration
+from gossiptoon.core.exceptions import AudioGenerationError
+
+logger = logging.getLogger(__name__)
+
+# MPEG audio bitrates (kbps) by [version is MPEG-1][layer][index]
+_MP3_BITRATES = {
+    (True, 1): (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    (True, 2): (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (True, 3): (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (False, 1): (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    (False, 2): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    (False, 3): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+_MP3_SAMPLE_RATES = {3: (44100, 48000, 32000), 2: (22050, 24000, 16000), 0: (11025, 12000, 8000)}
+
+
+class AudioStreamFormat(BaseModel):
+    """Format of the chunks a TTS client streams."""
+
+    container: str = Field(..., description="'pcm' (raw signed 16-bit little-endian) or 'mp3'")
+    sample_rate: int = Field(default=24000, gt=0, description="Sample rate (PCM)")
+    channels: int = Field(default=1, gt=0, description="Channel count (PCM)")
+
+
+class StreamedAudio(BaseModel):
+    """Measurements of a clip written from a stream."""
+
+    path: Path = Field(..., description="Written audio file")
+    bytes_received: int = Field(..., ge=0, description="Audio bytes received from the provider")
+    duration_seconds: float = Field(..., ge=0, description="Clip duration")
+    rms_dbfs: Optional[float] = Field(None, description="RMS loudness (PCM streams only)")
+    peak_dbfs: Optional[float] = Field(None, description="Sample peak (PCM streams only)")
+
+
+class _MP3FrameCounter:
+    """Counts MPEG audio samples from frame headers as bytes arrive."""
+
+    def __init__(self) -> None:
+        self._buffer = b""
+        self._skip = 0
+        self.samples = 0
+        self.sample_rate = 0
+
+    def feed(self, data: bytes) -> None:
+        buffer = self._buffer + data
+        position = self._skip
+
+        # An ID3v2 tag may precede the first frame
+        if self.sample_rate == 0 and position == 0 and buffer[:3] == b"ID3":
+            if len(buffer) < 10:
+                self._buffer = buffer
+                return
+            size = 0
+            for byte in buffer[6:10]:
+                size = (size << 7) | (byte & 0x7F)
+            position = 10 + size
+
+        while position + 4 <= len(buffer):
+            frame_length, samples, sample_rate = self._parse_header(buffer[position : position + 4])
+            if frame_length == 0:
+                position += 1  # Not a frame header: resync
+                continue
+            self.samples += samples
+            self.sample_rate = sample_rate
+            position += frame_length
+
+        # Keep the unparsed tail; frames may also end beyond the current data
+        self._skip = max(position - len(buffer), 0)
+        self._buffer = buffer[min(position, len(buffer)) :]
+
+    @property
+    def duration_seconds(self) -> float:
+        return self.samples / self.sample_rate if self.sample_rate else 0.0
+
+    @staticmethod
+    def _parse_header(header: bytes) -> tuple[int, int, int]:
+        """Return (frame length, samples, sample rate), or zeros if not a header."""
+        if header[0] != 0xFF or header[1] & 0xE0 != 0xE0:
+            return 0, 0, 0
+        version = (header[1] >> 3) & 0x03  # 3: MPEG-1, 2: MPEG-2, 0: MPEG-2.5
+        layer = 4 - ((header[1] >> 1) & 0x03)
+        bitrate_index = header[2] >> 4
+        rate_index = (header[2] >> 2) & 0x03
+        padding = (header[2] >> 1) & 0x01
+        if version == 1 or layer == 4 or bitrate_index in (0, 15) or rate_index == 3:
+            return 0, 0, 0
+
+        mpeg1 = version == 3
+        bitrate = _MP3_BITRATES[(mpeg1, layer)][bitrate_index] * 1000
+        sample_rate = _MP3_SAMPLE_RATES[version][rate_index]
+        if layer == 1:
+            return (12 * bitrate // sample_rate + padding) * 4, 384, sample_rate
+        samples = 1152 if layer == 2 or mpeg1 else 576
+        return samples // 8 * bitrate // sample_rate + padding, samples, sample_rate
+
+
+class StreamingAudioWriter:
+    """Writes streamed audio chunks to a file and measures the clip.
+
+    Use as a context manager; a stream that fails midway leaves no
+    partial file behind.
+    """
+
+    def __init__(self, output_path: Path, stream_format: AudioStreamFormat) -> None:
+        """Initialize writer.
+
+        Args:
+            output_path: Output file (.wav for PCM streams)
+            stream_format: Format of incoming chunks
+
+        Raises:
+            AudioGenerationError: If the container is not supported
+        """
+        if stream_format.container not in ("pcm", "mp3"):
+            raise AudioGenerationError(f"Unsupported stream format: {stream_format.container}")
+
+        self.output_path = output_path
+        self.format = stream_format
+        self.bytes_received = 0
+
+        self._frame_bytes = 2 * stream_format.channels
+        self._remainder = b""
+        self._frames = 0
+        self._sum_squares = 0.0
+        self._peak = 0
+        self._mp3 = _MP3FrameCounter() if stream_format.container == "mp3" else None
+        self._file = None
+        self._wav = None
+
+    def __enter__(self) -> "StreamingAudioWriter":
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        if self._mp3 is None:
+            self._wav = wave.open(str(self.output_path), "wb")
+            self._wav.setnchannels(self.format.channels)
+            self._wav.setsampwidth(2)
+            self._wav.setframerate(self.format.sample_rate)
+        else:
+            self._file = open(self.output_path, "wb")
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self._close_file()
+        if exc_type is not None:
+            self.output_path.unlink(missing_ok=True)
+
+    def write(self, chunk: bytes) -> None:
+        """Write one chunk and update the measurements.
+
+        Args:
+            chunk: Audio bytes in the stream format
+        """
+        if not chunk:
+            return
+        self.bytes_received += len(chunk)
+
+        if self._mp3 is not None:
+            self._file.write(chunk)
+            self._mp3.feed(chunk)
+            return
+
+        # Only whole frames go to the WAV; a split sample waits for the next chunk
+        data = self._remainder + chunk
+        usable = len(data) - len(data) % self._frame_bytes
+        self._remainder = data[usable:]
+        if not usable:
+            return
+
+        self._wav.writeframesraw(data[:usable])
+        samples = np.frombuffer(data[:usable], dtype="<i2")
+        self._frames += usable // self._frame_bytes
+        self._sum_squares += float(np.dot(samples, samples.astype(np.float64)))
+        self._peak = max(self._peak, int(np.abs(samples.astype(np.int32)).max()))
+
+    def finish(self) -> StreamedAudio:
+        """Close the file and return the measurements.
+
+        Returns:
+            Clip measurements
+        """
+        self._close_file()
+
+        if self._mp3 is not None:
+            result = StreamedAudio(
+                path=self.output_path,
+                bytes_received=self.bytes_received,
+                duration_seconds=self._mp3.duration_seconds,
+            )
+        else:
+            sample_count = self._frames * self.format.channels
+            rms = math.sqrt(self._sum_squares / sample_count) / 32768 if sample_count else 0.0
+            result = StreamedAudio(
+                path=self.output_path,
+                bytes_received=self.bytes_received,
+                duration_seconds=self._frames / self.format.sample_rate,
+                rms_dbfs=20 * math.log10(rms) if rms > 0 else None,
+                peak_dbfs=20 * math.log10(self._peak / 32768) if self._peak else None,
+            )
+
+        if result.duration_seconds > 0:
+            remember_duration(self.output_path, result.duration_seconds)
+        return result
+
+    def _close_file(self) -> None:
+        if self._wav is not None:
+            self._wav.close()
+            self._wav = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
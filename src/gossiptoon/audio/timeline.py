@@ -0,0 +1,170 @@
+"""Master timeline for segments rendered into one track.
+
+The master is not a plain sum of the segment files: every join overlaps
+the neighbouring segments by the crossfade, and a speed factor rescales
+all of it afterwards. ``MasterTimeline`` mirrors what
+``PCMAudio.concatenate`` and ``PCMAudio.change_tempo`` do to time, so
+segment offsets, durations and word timestamps can be rewritten in
+master seconds before captions and video are laid out against them.
+"""
+
+import logging
+
+from gossiptoon.core.exceptions import AudioGenerationError
+from gossiptoon.models.audio import AudioSegment, DriftReport, SegmentDrift
+
+logger = logging.getLogger(__name__)
+
+
+class MasterTimeline:
+    """Segment placement on a crossfaded, tempo-changed master track."""
+
+    def __init__(
+        self,
+        durations: list[float],
+        crossfade_seconds: float = 0.0,
+        speed_factor: float = 1.0,
+    ) -> None:
+        """Initialize timeline.
+
+        Args:
+            durations: Segment file durations in order (seconds)
+            crossfade_seconds: Crossfade at each join
+            speed_factor: Tempo multiplier applied to the joined audio
+        """
+        self.crossfade_seconds = crossfade_seconds
+        self.speed_factor = speed_factor
+        self.source_durations = list(durations)
+
+        # Same clamping as PCMAudio.concatenate: never overlap more than either clip
+        self.overlaps = [
+            min(crossfade_seconds, previous, current)
+            for previous, current in zip(durations, durations[1:])
+        ]
+
+        scale = self.time_scale
+        self.starts: list[float] = []
+        self.durations: list[float] = []
+        cursor = 0.0
+        for index, duration in enumerate(durations):
+            overlap_after = self.overlaps[index] if index < len(self.overlaps) else 0.0
+            self.starts.append(cursor * scale)
+            self.durations.append((duration - overlap_after) * scale)
+            cursor += duration - overlap_after
+
+        self.total_duration = cursor * scale
+
+    @classmethod
+    def from_segments(
+        cls,
+        segments: list[AudioSegment],
+        crossfade_seconds: float = 0.0,
+        speed_factor: float = 1.0,
+    ) -> "MasterTimeline":
+        """Build a timeline from segments (already placed or not).
+
+        Args:
+            segments: Segments in master order
+            crossfade_seconds: Crossfade at each join
+            speed_factor: Tempo multiplier
+
+        Returns:
+            Timeline
+        """
+        return cls([source_duration(s) for s in segments], crossfade_seconds, speed_factor)
+
+    @property
+    def time_scale(self) -> float:
+        """Master seconds per source second."""
+        return 1.0 / self.speed_factor
+
+    def to_master(self, index: int, seconds: float) -> float:
+        """Convert a time within a segment file to master time.
+
+        Args:
+            index: Segment index
+            seconds: Time from the start of the segment file
+
+        Returns:
+            Time in the master track
+        """
+        return self.starts[index] + seconds * self.time_scale
+
+    def apply(self, segments: list[AudioSegment]) -> DriftReport:
+        """Rewrite segment timing in master seconds, in place.
+
+        ``global_offset`` becomes the segment's start in the master,
+        ``duration_seconds`` the time until the next segment starts (so
+        summing durations still gives offsets) and word timestamps are
+        rescaled by the tempo. The file duration is kept in
+        ``source_duration_seconds``; applying a timeline again (e.g. after
+        a scene is regenerated) starts from the file timing, not from the
+        previous result.
+
+        Args:
+            segments: Segments in master order (same as the timeline)
+
+        Returns:
+            Drift report comparing naive offsets with the applied ones
+
+        Raises:
+            AudioGenerationError: If the segment count does not match
+        """
+        if len(segments) != len(self.source_durations):
+            raise AudioGenerationError(
+                f"Timeline has {len(self.source_durations)} segments, got {len(segments)}"
+            )
+
+        scale = self.time_scale
+        drifts = []
+        naive_offset = 0.0
+        for index, segment in enumerate(segments):
+            source = self.source_durations[index]
+            # Undo any earlier placement before applying this one
+            rescale = scale / segment.time_scale
+            segment.timestamps = [
+                word.model_copy(update={"start": word.start * rescale, "end": word.end * rescale})
+                for word in segment.timestamps
+            ]
+            segment.source_duration_seconds = source
+            segment.time_scale = scale
+            segment.global_offset = self.starts[index]
+            segment.duration_seconds = self.durations[index]
+
+            drifts.append(
+                SegmentDrift(
+                    scene_id=segment.scene_id,
+                    chunk_id=segment.chunk_id,
+                    naive_offset=naive_offset,
+                    offset=self.starts[index],
+                )
+            )
+            naive_offset += source
+
+        report = DriftReport(
+            crossfade_seconds=self.crossfade_seconds,
+            speed_factor=self.speed_factor,
+            naive_duration=naive_offset,
+            timeline_duration=self.total_duration,
+            segments=drifts,
+        )
+        logger.info(
+            f"Master timeline: {report.timeline_duration:.2f}s "
+            f"(files sum to {report.naive_duration:.2f}s, "
+            f"max offset correction {report.max_drift_seconds:.2f}s)"
+        )
+        return report
+
+
+def source_duration(segment: AudioSegment) -> float:
+    """Duration of a segment's audio file, before any timeline was applied.
+
+    Args:
+        segment: Audio segment
+
+    Returns:
+        Duration in seconds
+    """
+    if segment.source_duration_seconds is not None:
+        return segment.source_duration_seconds
+    return segment.duration_seconds
@@ -0,0 +1,405 @@
+"""Word timestamp backends.
+
+A backend decodes audio to 16 kHz mono float32 and produces word timings
+for it. ``WhisperTimestampExtractor`` picks one by name:
+
+- ``whisper``: openai-whisper (PyTorch). Most accurate, slow on CPU.
+- ``faster-whisper``: CTranslate2 with int8 weights. Same models, several
+  times faster on CPU-only hosts (``pip install faster-whisper``).
+- ``energy``: no model. Finds speech by frame energy and spreads the
+  known TTS text over the voiced time. Near-instant; good enough for
+  caption timing of clean synthesized speech, not for recognition.
+"""
+
+import logging
+import re
+from abc import ABC, abstractmethod
+from typing import Any, Optional
+
+import numpy as np
+
+from gossiptoon.core.exceptions import WhisperError
+from gossiptoon.models.audio import WordTimestamp
+
+logger = logging.getLogger(__name__)
+
+# Sample rate every backend decodes to (the rate Whisper models expect)
+SAMPLE_RATE = 16000
+
+
+class TimestampBackend(ABC):
+    """Produces word timestamps for decoded audio."""
+
+    name: str = ""
+
+    # Backends that align known text instead of recognizing speech
+    needs_text: bool = False
+
+    def __init__(self, model_name: str) -> None:
+        """Initialize backend.
+
+        Args:
+            model_name: Model size (ignored by model-free backends)
+        """
+        self.model_name = model_name
+
+    def load(self) -> None:
+        """Load the model up front (no-op for model-free backends)."""
+
+    @abstractmethod
+    def load_audio(self, audio_path: str) -> np.ndarray:
+        """Decode an audio file.
+
+        Args:
+            audio_path: Audio file
+
+        Returns:
+            Mono float32 samples at SAMPLE_RATE
+        """
+
+    @abstractmethod
+    def transcribe(
+        self, audio: np.ndarray, language: str, text: Optional[str] = None
+    ) -> list[WordTimestamp]:
+        """Produce word timestamps for decoded audio.
+
+        Args:
+            audio: Mono float32 samples at SAMPLE_RATE
+            language: Language code
+            text: Text that was synthesized (required when ``needs_text``)
+
+        Returns:
+            Word timestamps relative to the start of ``audio``
+        """
+
+
+class OpenAIWhisperBackend(TimestampBackend):
+    """openai-whisper (PyTorch)."""
+
+    name = "whisper"
+
+    def __init__(self, model_name: str) -> None:
+        """Initialize backend.
+
+        Args:
+            model_name: Model size (tiny, base, small, medium, large)
+        """
+        super().__init__(model_name)
+        self._model: Optional[Any] = None
+
+    def load(self) -> None:
+        """Load the Whisper model (once).
+
+        Raises:
+            WhisperError: If whisper is missing or loading fails
+        """
+        if self._model is not None:
+            return
+        try:
+            import whisper
+
+            logger.info(f"Loading Whisper model: {self.model_name}")
+            self._model = whisper.load_model(self.model_name)
+            logger.info("Whisper model loaded successfully")
+        except ImportError:
+            raise WhisperError(
+                "Whisper package not installed. Install with: pip install openai-whisper"
+            )
+        except Exception as e:
+            raise WhisperError(f"Failed to load Whisper model: {e}") from e
+
+    def load_audio(self, audio_path: str) -> np.ndarray:
+        """Decode an audio file with whisper's FFmpeg loader.
+
+        Args:
+            audio_path: Audio file
+
+        Returns:
+            Mono float32 samples at SAMPLE_RATE
+        """
+        import whisper
+
+        return whisper.load_audio(audio_path)
+
+    def transcribe(
+        self, audio: np.ndarray, language: str, text: Optional[str] = None
+    ) -> list[WordTimestamp]:
+        """Transcribe with word timestamps (loads the model on first use).
+
+        Args:
+            audio: Mono float32 samples at SAMPLE_RATE
+            language: Language code
+            text: Ignored (speech is recognized, not aligned)
+
+        Returns:
+            Word timestamps relative to the start of ``audio``
+        """
+        self.load()
+        result = self._model.transcribe(
+            audio,
+            language=language,
+            word_timestamps=True,
+            verbose=False,
+        )
+        return parse_whisper_words(result)
+
+
+class FasterWhisperBackend(TimestampBackend):
+    """faster-whisper (CTranslate2) with int8 weights on CPU."""
+
+    name = "faster-whisper"
+
+    # faster-whisper names large checkpoints by version
+    model_aliases = {"large": "large-v3"}
+
+    def __init__(self, model_name: str) -> None:
+        """Initialize backend.
+
+        Args:
+            model_name: Model size (tiny, base, small, medium, large)
+        """
+        super().__init__(model_name)
+        self._model: Optional[Any] = None
+
+    def load(self) -> None:
+        """Load the quantized model (once).
+
+        Raises:
+            WhisperError: If faster-whisper is missing or loading fails
+        """
+        if self._model is not None:
+            return
+        try:
+            from faster_whisper import WhisperModel
+
+            model_name = self.model_aliases.get(self.model_name, self.model_name)
+            logger.info(f"Loading faster-whisper model: {model_name} (int8, CPU)")
+            self._model = WhisperModel(model_name, device="cpu", compute_type="int8")
+            logger.info("faster-whisper model loaded successfully")
+        except ImportError:
+            raise WhisperError(
+                "faster-whisper package not installed. Install with: pip install faster-whisper"
+            )
+        except Exception as e:
+            raise WhisperError(f"Failed to load faster-whisper model: {e}") from e
+
+    def load_audio(self, audio_path: str) -> np.ndarray:
+        """Decode an audio file with faster-whisper's PyAV decoder.
+
+        Args:
+            audio_path: Audio file
+
+        Returns:
+            Mono float32 samples at SAMPLE_RATE
+        """
+        from faster_whisper import decode_audio
+
+        return decode_audio(audio_path, sampling_rate=SAMPLE_RATE)
+
+    def transcribe(
+        self, audio: np.ndarray, language: str, text: Optional[str] = None
+    ) -> list[WordTimestamp]:
+        """Transcribe with word timestamps (loads the model on first use).
+
+        Args:
+            audio: Mono float32 samples at SAMPLE_RATE
+            language: Language code
+            text: Ignored (speech is recognized, not aligned)
+
+        Returns:
+            Word timestamps relative to the start of ``audio``
+        """
+        self.load()
+        segments, _ = self._model.transcribe(audio, language=language, word_timestamps=True)
+
+        timestamps = []
+        for segment in segments:
+            for word in segment.words or []:
+                timestamps.append(
+                    WordTimestamp(
+                        word=word.word.strip(),
+                        start=word.start,
+                        end=word.end,
+                        confidence=word.probability,
+                    )
+                )
+        return timestamps
+
+
+class EnergyBackend(TimestampBackend):
+    """Model-free timing from the synthesized text and speech energy.
+
+    The audio is cut into 20 ms frames; frames above an energy threshold
+    relative to the loudest frame are speech, and silences shorter than
+    ``min_pause`` are bridged. Each pause is matched to the word boundary
+    nearest to it by proportion of text, and within a stretch of speech
+    every word takes a share of time proportional to its length.
+    """
+
+    name = "energy"
+    needs_text = True
+
+    frame_seconds = 0.02
+    threshold_db = -35.0
+    min_pause = 0.12
+
+    def load_audio(self, audio_path: str) -> np.ndarray:
+        """Decode an audio file with pydub.
+
+        Args:
+            audio_path: Audio file
+
+        Returns:
+            Mono float32 samples at SAMPLE_RATE
+        """
+        from pydub import AudioSegment as PydubSegment
+
+        sound = PydubSegment.from_file(audio_path).set_channels(1).set_frame_rate(SAMPLE_RATE)
+        samples = np.array(sound.get_array_of_samples(), dtype=np.float32)
+        return samples / float(1 << (8 * sound.sample_width - 1))
+
+    def transcribe(
+        self, audio: np.ndarray, language: str, text: Optional[str] = None
+    ) -> list[WordTimestamp]:
+        """Spread the synthesized words over the detected speech.
+
+        Args:
+            audio: Mono float32 samples at SAMPLE_RATE
+            language: Language code (unused)
+            text: Text that was synthesized
+
+        Returns:
+            Word timestamps relative to the start of ``audio``
+
+        Raises:
+            WhisperError: If ``text`` is missing
+        """
+        if text is None:
+            raise WhisperError("The energy timestamp backend needs the synthesized text")
+
+        words = re.findall(r"\S+", text)
+        regions = self.speech_regions(audio)
+        if not words or not regions:
+            return []
+
+        # Character count (plus one for the inter-word transition) as a
+        # proxy for spoken length
+        weights = np.array([len(word) + 1 for word in words], dtype=np.float64)
+        word_edges = np.concatenate([[0.0], np.cumsum(weights)]) / weights.sum()
+
+        lengths = np.array([end - start for start, end in regions])
+        pause_fractions = np.cumsum(lengths)[:-1] / lengths.sum()
+
+        # Each pause lands on the word boundary closest to it in proportion,
+        # so words never straddle a pause
+        cuts = [0]
+        for fraction in pause_fractions:
+            cut = int(np.argmin(np.abs(word_edges[1:-1] - fraction))) + 1 if len(words) > 1 else 1
+            cuts.append(max(cut, cuts[-1]))
+        cuts.append(len(words))
+
+        timestamps = []
+        for (region_start, region_end), first, last in zip(regions, cuts, cuts[1:]):
+            if first == last:
+                continue  # Voiced region without words (breath, noise)
+            region_weights = weights[first:last]
+            region_edges = np.concatenate([[0.0], np.cumsum(region_weights)]) / region_weights.sum()
+            times = region_start + region_edges * (region_end - region_start)
+            for offset, word in enumerate(words[first:last]):
+                timestamps.append(
+                    WordTimestamp(
+                        word=word,
+                        start=float(times[offset]),
+                        end=float(times[offset + 1]),
+                        confidence=0.5,
+                    )
+                )
+        return timestamps
+
+    def speech_regions(self, audio: np.ndarray) -> list[tuple[float, float]]:
+        """Find speech as (start, end) seconds.
+
+        Args:
+            audio: Mono float32 samples at SAMPLE_RATE
+
+        Returns:
+            Speech regions in time order
+        """
+        frame = int(self.frame_seconds * SAMPLE_RATE)
+        frame_count = len(audio) // frame
+        if frame_count == 0:
+            return []
+
+        frames = audio[: frame_count * frame].reshape(frame_count, frame)
+        rms = np.sqrt(np.mean(frames.astype(np.float64) ** 2, axis=1))
+        peak = rms.max()
+        if peak <= 0:
+            return []
+
+        voiced = rms >= peak * 10 ** (self.threshold_db / 20)
+
+        # Rising/falling edges of the voiced mask give region boundaries
+        padded = np.concatenate([[False], voiced, [False]]).astype(np.int8)
+        changes = np.flatnonzero(np.diff(padded))
+        regions = [
+            (start * self.frame_seconds, end * self.frame_seconds)
+            for start, end in zip(changes[::2], changes[1::2])
+        ]
+
+        # Bridge pauses too short to be real gaps between words
+        merged = [regions[0]]
+        for start, end in regions[1:]:
+            if start - merged[-1][1] < self.min_pause:
+                merged[-1] = (merged[-1][0], end)
+            else:
+                merged.append((start, end))
+        return merged
+
+
+_BACKENDS: dict[str, type[TimestampBackend]] = {
+    backend.name: backend
+    for backend in (OpenAIWhisperBackend, FasterWhisperBackend, EnergyBackend)
+}
+
+
+def create_timestamp_backend(name: str, model_name: str) -> TimestampBackend:
+    """Create a timestamp backend by name.
+
+    Args:
+        name: Backend name (whisper, faster-whisper or energy)
+        model_name: Model size for model-based backends
+
+    Returns:
+        Backend instance (model not loaded yet)
+
+    Raises:
+        WhisperError: If the backend name is unknown
+    """
+    backend_class = _BACKENDS.get(name)
+    if backend_class is None:
+        raise WhisperError(
+            f"Unknown timestamp backend '{name}' (expected one of {sorted(_BACKENDS)})"
+        )
+    return backend_class(model_name)
+
+
+def parse_whisper_words(result: dict) -> list[WordTimestamp]:
+    """Convert an openai-whisper transcription result into word timestamps.
+
+    Args:
+        result: ``model.transcribe`` output (with word timestamps)
+
+    Returns:
+        List of word timestamps
+    """
+    timestamps = []
+    for segment in result.get("segments", []):
+        for word_info in segment.get("words", []):
+            timestamp = WordTimestamp(
+                word=word_info["word"].strip(),
+                start=word_info["start"],
+                end=word_info["end"],
+                confidence=word_info.get("probability", 0.9),
+            )
+            timestamps.append(timestamp)
+    return timestamps
@@ -0,0 +1,230 @@
+"""Content-addressed on-disk cache for synthesized TTS audio.
+
+Entries are keyed by a hash of everything that affects the rendered audio
+(provider, model, voice, style instruction and the text as sent to the
+provider) plus the timestamp backend and model that timed it, and store the audio file alongside its measured duration and
+Whisper word timestamps, so a cache hit skips TTS, probing and Whisper.
+
+Layout (shared by all jobs under the base output directory)::
+
+    <cache_dir>/tts/ab/abcdef....wav     audio
+    <cache_dir>/tts/ab/abcdef....json    metadata (duration, timestamps)
+
+Each entry's metadata file doubles as its LRU clock: its mtime is bumped on
+every hit, and the least recently used entries are evicted once the cache
+grows past ``max_bytes``.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+from gossiptoon.models.audio import WordTimestamp
+
+logger = logging.getLogger(__name__)
+
+
+class TTSCacheEntry(BaseModel):
+    """Cached synthesis result."""
+
+    key: str = Field(..., description="Content hash")
+    audio_path: Path = Field(..., description="Cached audio file")
+    duration_seconds: float = Field(..., ge=0.0, description="Measured audio duration")
+    timestamps: list[WordTimestamp] = Field(default_factory=list, description="Word timestamps")
+    created_at: datetime = Field(default_factory=datetime.now)
+
+
+class TTSCache:
+    """Size-bounded LRU cache of TTS audio, durations and timestamps."""
+
+    def __init__(self, cache_dir: Path, max_bytes: int) -> None:
+        """Initialize TTS cache.
+
+        Args:
+            cache_dir: Directory holding cache entries
+            max_bytes: Maximum total size of cached files before LRU eviction
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._total_bytes: Optional[int] = None
+
+    @staticmethod
+    def make_key(
+        text: str,
+        voice_id: str,
+        style: Optional[str],
+        model: str,
+        provider: str,
+        timestamp_backend: str,
+        timestamp_model: str,
+    ) -> str:
+        """Build the content hash for a synthesis request.
+
+        Args:
+            text: Text exactly as sent to the provider (after preprocessing)
+            voice_id: Voice identifier
+            style: Style instruction / emotion (None if unstyled)
+            model: TTS model name
+            provider: TTS provider name
+            timestamp_backend: Backend that produced the stored word timestamps
+            timestamp_model: Recognizer model used by that backend
+
+        Returns:
+            Hex SHA-256 digest
+        """
+        payload = json.dumps(
+            {
+                "provider": provider,
+                "model": model,
+                "voice": voice_id,
+                "style": style or "",
+                "text": text,
+                "timestamp_backend": timestamp_backend,
+                "timestamp_model": timestamp_model,
+            },
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _meta_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[TTSCacheEntry]:
+        """Look up a cached synthesis result.
+
+        Args:
+            key: Content hash from ``make_key``
+
+        Returns:
+            Cache entry, or None on a miss
+        """
+        meta_path = self._meta_path(key)
+        try:
+            entry = TTSCacheEntry.model_validate_json(meta_path.read_text())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Discarding unreadable TTS cache entry {key[:12]}: {e}")
+            self._remove(key)
+            return None
+
+        if not entry.audio_path.exists():
+            self._remove(key)
+            return None
+
+        # Mark as recently used
+        os.utime(meta_path)
+        logger.debug(f"TTS cache hit: {key[:12]}")
+        return entry
+
+    def put(
+        self,
+        key: str,
+        audio_path: Path,
+        duration_seconds: float,
+        timestamps: list[WordTimestamp],
+    ) -> TTSCacheEntry:
+        """Store a synthesis result (the audio file is copied into the cache).
+
+        Args:
+            key: Content hash from ``make_key``
+            audio_path: Generated audio file
+            duration_seconds: Measured duration
+            timestamps: Whisper word timestamps
+
+        Returns:
+            Stored cache entry
+        """
+        meta_path = self._meta_path(key)
+        meta_path.parent.mkdir(parents=True, exist_ok=True)
+
+        cached_audio = meta_path.with_suffix(audio_path.suffix)
+        tmp_audio = cached_audio.with_name(f".{cached_audio.name}.{os.getpid()}.tmp")
+        shutil.copyfile(audio_path, tmp_audio)
+        os.replace(tmp_audio, cached_audio)
+
+        entry = TTSCacheEntry(
+            key=key,
+            audio_path=cached_audio,
+            duration_seconds=duration_seconds,
+            timestamps=timestamps,
+        )
+        tmp_meta = meta_path.with_name(f".{meta_path.name}.{os.getpid()}.tmp")
+        tmp_meta.write_text(entry.model_dump_json())
+        os.replace(tmp_meta, meta_path)
+
+        with self._lock:
+            if self._total_bytes is not None:
+                self._total_bytes += cached_audio.stat().st_size + meta_path.stat().st_size
+
+        self._evict_if_needed()
+        return entry
+
+    def restore(self, entry: TTSCacheEntry, output_path: Path) -> Path:
+        """Copy cached audio into a project directory.
+
+        Args:
+            entry: Cache entry from ``get``
+            output_path: Desired output path (suffix follows the cached file)
+
+        Returns:
+            Path to the restored audio file
+        """
+        output_path = output_path.with_suffix(entry.audio_path.suffix)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(entry.audio_path, output_path)
+        return output_path
+
+    def _remove(self, key: str) -> None:
+        """Delete every file belonging to an entry."""
+        for path in self._meta_path(key).parent.glob(f"{key}.*"):
+            path.unlink(missing_ok=True)
+
+    def _scan(self) -> list[tuple[float, str, int]]:
+        """List entries as (last_used, key, size_bytes)."""
+        entries = []
+        for meta_path in self.cache_dir.glob("*/*.json"):
+            key = meta_path.stem
+            try:
+                size = sum(p.stat().st_size for p in meta_path.parent.glob(f"{key}.*"))
+                entries.append((meta_path.stat().st_mtime, key, size))
+            except FileNotFoundError:
+                continue  # Evicted concurrently
+        return entries
+
+    def _evict_if_needed(self) -> None:
+        """Evict least recently used entries until under ``max_bytes``."""
+        with self._lock:
+            if self._total_bytes is not None and self._total_bytes <= self.max_bytes:
+                return
+
+            entries = self._scan()
+            total = sum(size for _, _, size in entries)
+
+            evicted = 0
+            for _, key, size in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                self._remove(key)
+                total -= size
+                evicted += 1
+
+            self._total_bytes = total
+
+        if evicted:
+            logger.info(f"TTS cache evicted {evicted} entries ({total / 1e6:.1f} MB kept)")
+
+    def size_bytes(self) -> int:
+        """Get total size of cached files."""
+        return sum(size for _, _, size in self._scan())
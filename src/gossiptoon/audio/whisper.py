@@ -1,14 +1,192 @@
-"""Whisper timestamp extraction for precise audio-visual sync."""
+"""Whisper timestamp extraction for precise audio-visual sync.
 
+Transcription is CPU-heavy and blocks for seconds per call, so it never runs
+on the event loop. With ``processes > 0`` it runs in a process-wide pool of
+long-lived worker processes, each of which loads the model once and keeps
+it for its lifetime; every extractor using the same backend and model
+shares the pool. With ``processes == 0`` it runs in this process on a
+dedicated thread.
+
+The recognizer itself is pluggable (see ``timestamp_backends``).
+"""
+
+import asyncio
 import logging
+import multiprocessing
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
+from gossiptoon.audio.timestamp_backends import (
+    SAMPLE_RATE,
+    TimestampBackend,
+    create_timestamp_backend,
+)
 from gossiptoon.core.exceptions import WhisperError
 from gossiptoon.models.audio import WordTimestamp
+from gossiptoon.utils.client_pool import get_dedicated_executor
 
 logger = logging.getLogger(__name__)
 
+# Silence inserted between chunks in a batched pass (keeps words from merging
+# across chunk boundaries)
+BATCH_GAP_SECONDS = 0.5
+
+# Upper bound on audio per batched pass (bounds memory for very long scripts)
+MAX_BATCH_SECONDS = 600.0
+
+_pools: dict[tuple[str, str, int], ProcessPoolExecutor] = {}
+_pools_lock = threading.Lock()
+
+# Backend held by a worker process for its whole lifetime
+_worker_backend: Optional[TimestampBackend] = None
+
+
+def _init_worker(backend_name: str, model_name: str) -> None:
+    """Worker process initializer: load the model up front."""
+    global _worker_backend
+    _worker_backend = create_timestamp_backend(backend_name, model_name)
+    try:
+        _worker_backend.load()
+    except WhisperError as e:
+        # Surfaced again (and raised to the caller) by the first request
+        logger.error(f"Timestamp worker could not preload model: {e}")
+
+
+def _worker_transcribe_file(
+    audio_path: str, language: str, text: Optional[str]
+) -> list[WordTimestamp]:
+    """Worker entry point for a single file."""
+    return _transcribe_file(_worker_backend, audio_path, language, text)
+
+
+def _worker_transcribe_batch(
+    audio_paths: list[str], language: str, texts: list[Optional[str]]
+) -> list[list[WordTimestamp]]:
+    """Worker entry point for a batched pass."""
+    return _transcribe_batch(_worker_backend, audio_paths, language, texts)
+
+
+def _transcribe_file(
+    backend: TimestampBackend, audio_path: str, language: str, text: Optional[str]
+) -> list[WordTimestamp]:
+    """Transcribe one file with word timestamps.
+
+    Args:
+        backend: Timestamp backend
+        audio_path: Audio file
+        language: Language code
+        text: Synthesized text (used by text-aligning backends)
+
+    Returns:
+        List of word timestamps
+    """
+    return backend.transcribe(backend.load_audio(audio_path), language, text)
+
+
+def _transcribe_batch(
+    backend: TimestampBackend,
+    audio_paths: list[str],
+    language: str,
+    texts: list[Optional[str]],
+) -> list[list[WordTimestamp]]:
+    """Transcribe many files as concatenated passes and split the words back.
+
+    Backends that align known text gain nothing from concatenation and
+    process each file on its own.
+
+    Args:
+        backend: Timestamp backend
+        audio_paths: Audio files
+        language: Language code
+        texts: Synthesized text per file
+
+    Returns:
+        Word timestamps per input file, in input order
+    """
+    if backend.needs_text:
+        return [
+            _transcribe_file(backend, audio_path, language, text)
+            for audio_path, text in zip(audio_paths, texts)
+        ]
+
+    import numpy as np
+
+    gap = np.zeros(int(BATCH_GAP_SECONDS * SAMPLE_RATE), dtype=np.float32)
+
+    # Group chunks into passes of at most MAX_BATCH_SECONDS
+    batches: list[list[tuple[int, np.ndarray]]] = [[]]
+    batch_seconds = 0.0
+    for index, audio_path in enumerate(audio_paths):
+        audio = backend.load_audio(audio_path)
+        seconds = len(audio) / SAMPLE_RATE + BATCH_GAP_SECONDS
+        if batches[-1] and batch_seconds + seconds > MAX_BATCH_SECONDS:
+            batches.append([])
+            batch_seconds = 0.0
+        batches[-1].append((index, audio))
+        batch_seconds += seconds
+
+    results: list[list[WordTimestamp]] = [[] for _ in audio_paths]
+    for batch in batches:
+        bounds = []
+        pieces = []
+        cursor = 0.0
+        for _, audio in batch:
+            duration = len(audio) / SAMPLE_RATE
+            bounds.append((cursor, cursor + duration))
+            pieces.extend([audio, gap])
+            cursor += duration + BATCH_GAP_SECONDS
+
+        logger.info(f"Extracting timestamps for {len(batch)} chunks in one pass ({cursor:.1f}s)")
+        words = backend.transcribe(np.concatenate(pieces), language)
+
+        per_chunk = WhisperTimestampExtractor.split_batched_words(words, bounds)
+        for (index, _), chunk_words in zip(batch, per_chunk):
+            results[index] = chunk_words
+
+    return results
+
+
+def get_whisper_pool(backend_name: str, model_name: str, processes: int) -> ProcessPoolExecutor:
+    """Get the process-wide timestamp worker pool for a backend and model.
+
+    Workers are started with the ``spawn`` method (forking a process that
+    runs an event loop and SDK threads is unsafe) and load the model once.
+
+    Args:
+        backend_name: Timestamp backend name
+        model_name: Model size
+        processes: Number of worker processes
+
+    Returns:
+        Shared ProcessPoolExecutor
+    """
+    key = (backend_name, model_name, processes)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            logger.info(
+                f"Starting {processes} timestamp worker process(es) ({backend_name}, {model_name})"
+            )
+            pool = ProcessPoolExecutor(
+                max_workers=processes,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(backend_name, model_name),
+            )
+            _pools[key] = pool
+        return pool
+
+
+def _discard_pool(key: tuple[str, str, int], pool: ProcessPoolExecutor) -> None:
+    """Drop a broken pool so the next request starts fresh workers."""
+    with _pools_lock:
+        if _pools.get(key) is pool:
+            del _pools[key]
+    pool.shutdown(wait=False, cancel_futures=True)
+
 
 class WhisperTimestampExtractor:
     """Extract word-level timestamps from audio using Whisper.
@@ -17,49 +195,75 @@ class WhisperTimestampExtractor:
     All visual timing is driven by these timestamps.
     """
 
-    def __init__(self, model_name: str = "base") -> None:
+    def __init__(
+        self, model_name: str = "base", processes: int = 0, backend: str = "whisper"
+    ) -> None:
         """Initialize Whisper timestamp extractor.
 
         Args:
             model_name: Whisper model size (tiny, base, small, medium, large)
+            processes: Worker processes to transcribe in (0 = in this process,
+                on a dedicated thread)
+            backend: Timestamp backend (whisper, faster-whisper or energy)
         """
         self.model_name = model_name
-        self._model: Optional[any] = None
+        self.processes = processes
+        self.backend = backend
+        self._model: Optional[TimestampBackend] = None
 
-    def _load_model(self) -> any:
-        """Load Whisper model (lazy loading).
+    def _load_model(self) -> TimestampBackend:
+        """Load the backend for in-process transcription (lazy loading).
 
         Returns:
-            Whisper model instance
+            Loaded timestamp backend
 
         Raises:
-            WhisperError: If model loading fails
+            WhisperError: If the backend is unknown or its model fails to load
         """
-        if self._model is not None:
-            return self._model
+        if self._model is None:
+            backend = create_timestamp_backend(self.backend, self.model_name)
+            backend.load()
+            self._model = backend
+        return self._model
 
-        try:
-            import whisper
-
-            logger.info(f"Loading Whisper model: {self.model_name}")
-            self._model = whisper.load_model(self.model_name)
-            logger.info("Whisper model loaded successfully")
-            return self._model
-        except ImportError:
-            raise WhisperError(
-                "Whisper package not installed. Install with: pip install openai-whisper"
+    async def _run(self, worker_fn, local_fn, *args) -> Any:
+        """Run a transcription job off the event loop.
+
+        Args:
+            worker_fn: Module-level function to run in a worker process
+            local_fn: Function taking the backend first, for in-process runs
+            *args: Arguments for the job
+
+        Returns:
+            Job result
+        """
+        loop = asyncio.get_running_loop()
+
+        if self.processes <= 0:
+            executor: Executor = get_dedicated_executor("whisper")
+            return await loop.run_in_executor(
+                executor, lambda: local_fn(self._load_model(), *args)
             )
-        except Exception as e:
-            raise WhisperError(f"Failed to load Whisper model: {e}") from e
+
+        # Fail fast on a bad backend name instead of inside every worker
+        create_timestamp_backend(self.backend, self.model_name)
+
+        pool = get_whisper_pool(self.backend, self.model_name, self.processes)
+        try:
+            return await loop.run_in_executor(pool, worker_fn, *args)
+        except BrokenProcessPool:
+            _discard_pool((self.backend, self.model_name, self.processes), pool)
+            raise
 
     async def extract_timestamps(
-        self, audio_path: Path, language: str = "en"
+        self, audio_path: Path, language: str = "en", text: Optional[str] = None
     ) -> list[WordTimestamp]:
         """Extract word-level timestamps from audio file.
 
         Args:
             audio_path: Path to audio file
             language: Language code (default: "en")
+            text: Text that was synthesized (required by the energy backend)
 
         Returns:
             List of word timestamps
@@ -71,37 +275,138 @@ class WhisperTimestampExtractor:
             raise WhisperError(f"Audio file not found: {audio_path}")
 
         try:
-            model = self._load_model()
-
             logger.info(f"Extracting timestamps from {audio_path}")
 
-            # Transcribe with word-level timestamps
-            result = model.transcribe(
-                str(audio_path),
-                language=language,
-                word_timestamps=True,
-                verbose=False,
+            timestamps = await self._run(
+                _worker_transcribe_file, _transcribe_file, str(audio_path), language, text
             )
 
-            # Extract word timestamps
-            timestamps = []
-            for segment in result.get("segments", []):
-                for word_info in segment.get("words", []):
-                    timestamp = WordTimestamp(
-                        word=word_info["word"].strip(),
-                        start=word_info["start"],
-                        end=word_info["end"],
-                        confidence=word_info.get("probability", 0.9),
-                    )
-                    timestamps.append(timestamp)
-
             logger.info(f"Extracted {len(timestamps)} word timestamps")
             return timestamps
 
+        except WhisperError:
+            raise
         except Exception as e:
             logger.error(f"Whisper timestamp extraction failed: {e}")
             raise WhisperError(f"Failed to extract timestamps: {e}") from e
 
+    async def extract_timestamps_batch(
+        self,
+        audio_paths: list[Path],
+        language: str = "en",
+        texts: Optional[list[Optional[str]]] = None,
+    ) -> list[list[WordTimestamp]]:
+        """Extract word timestamps for many audio files in as few Whisper passes as possible.
+
+        Whisper pads every input to a 30 second window, so transcribing short
+        chunks one by one costs a full window each. Here the chunks are joined
+        (separated by short silences), transcribed once, and the words are
+        split back by chunk boundary with times made relative to each chunk.
+        With several worker processes the chunks are divided into one
+        contiguous group per worker and the groups run in parallel.
+
+        Args:
+            audio_paths: Audio files, in any order
+            language: Language code (default: "en")
+            texts: Synthesized text per file (required by the energy backend)
+
+        Returns:
+            Word timestamps per input file, in input order
+
+        Raises:
+            WhisperError: If extraction fails
+        """
+        for audio_path in audio_paths:
+            if not audio_path.exists():
+                raise WhisperError(f"Audio file not found: {audio_path}")
+
+        if not audio_paths:
+            return []
+
+        paths = [str(audio_path) for audio_path in audio_paths]
+        if texts is None:
+            texts = [None] * len(paths)
+        group_count = max(1, min(self.processes, len(paths)))
+        group_size = -(-len(paths) // group_count)
+        groups = [
+            (paths[i : i + group_size], texts[i : i + group_size])
+            for i in range(0, len(paths), group_size)
+        ]
+
+        try:
+            group_results = await asyncio.gather(
+                *(
+                    self._run(
+                        _worker_transcribe_batch,
+                        _transcribe_batch,
+                        group_paths,
+                        language,
+                        group_texts,
+                    )
+                    for group_paths, group_texts in groups
+                )
+            )
+        except WhisperError:
+            raise
+        except Exception as e:
+            logger.error(f"Batched Whisper timestamp extraction failed: {e}")
+            raise WhisperError(f"Failed to extract timestamps: {e}") from e
+
+        results = [words for group in group_results for words in group]
+        logger.info(
+            f"Extracted {sum(len(words) for words in results)} word timestamps "
+            f"for {len(paths)} chunks across {len(groups)} worker(s)"
+        )
+        return results
+
+    @staticmethod
+    def split_batched_words(
+        words: list[WordTimestamp],
+        bounds: list[tuple[float, float]],
+    ) -> list[list[WordTimestamp]]:
+        """Split words from a batched pass back into their source chunks.
+
+        A word belongs to the chunk its midpoint falls in; the boundary
+        between two chunks is the middle of the silence separating them.
+        Times are shifted to be relative to the chunk and clamped to it.
+
+        Args:
+            words: Word timestamps over the concatenated audio
+            bounds: (start, end) of each chunk in the concatenated audio
+
+        Returns:
+            Word timestamps per chunk
+        """
+        per_chunk: list[list[WordTimestamp]] = [[] for _ in bounds]
+        if not bounds:
+            return per_chunk
+
+        # Cut points halfway through each gap
+        cuts = [
+            (bounds[i][1] + bounds[i + 1][0]) / 2 for i in range(len(bounds) - 1)
+        ]
+
+        index = 0
+        for word in words:
+            midpoint = (word.start + word.end) / 2
+            while index < len(cuts) and midpoint >= cuts[index]:
+                index += 1
+
+            chunk_start, chunk_end = bounds[index]
+            duration = chunk_end - chunk_start
+            start = min(max(word.start - chunk_start, 0.0), duration)
+            end = min(max(word.end - chunk_start, start), duration)
+            per_chunk[index].append(
+                WordTimestamp(
+                    word=word.word,
+                    start=start,
+                    end=end,
+                    confidence=word.confidence,
+                )
+            )
+
+        return per_chunk
+
     def get_total_duration(self, timestamps: list[WordTimestamp]) -> float:
         """Get total audio duration from timestamps.
 
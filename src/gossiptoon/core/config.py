@@ -1,22 +1,30 @@
 """Configuration management for GossipToon."""
 
+import copy
 import os
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 from dotenv import load_dotenv
 from pydantic import BaseModel, Field, field_validator
 
 from gossiptoon.core.constants import (
     DEFAULT_AUDIO_CODEC,
+    DEFAULT_EFFECT_ENGINE,
     DEFAULT_MAX_RETRIES,
     DEFAULT_OUTPUT_DIR,
+    DEFAULT_RATE_LIMITS,
+    DEFAULT_RENDER_PROFILE,
     DEFAULT_REQUEST_TIMEOUT,
+    DEFAULT_TIMESTAMP_BACKEND,
     DEFAULT_VIDEO_CODEC,
     DEFAULT_VIDEO_FPS,
     DEFAULT_VIDEO_PRESET,
     DEFAULT_VIDEO_RESOLUTION,
     DEFAULT_WHISPER_MODEL,
+    EFFECT_ENGINES,
+    RENDER_PROFILES,
+    TIMESTAMP_BACKENDS,
 )
 from gossiptoon.core.exceptions import ConfigurationError
 
@@ -42,6 +50,95 @@ class APIConfig(BaseModel):
         return v
 
 
+class RenderProfile(BaseModel):
+    """Named render quality tier (see ``RENDER_PROFILE_SETTINGS``)."""
+
+    name: str = Field(..., description="Profile name")
+    preset: Optional[str] = Field(None, description="x264 preset (None = VideoConfig.preset)")
+    crf: int = Field(default=23, ge=0, le=51, description="x264 constant rate factor")
+    scale: float = Field(
+        default=1.0, gt=0.0, le=1.0, description="Resolution relative to VideoConfig.resolution"
+    )
+    fps: Optional[int] = Field(None, ge=1, le=60, description="Frame rate (None = VideoConfig.fps)")
+    effects_enabled: bool = Field(default=True, description="Render camera/Ken Burns effects")
+    burn_subtitles: bool = Field(
+        default=True, description="Burn captions and engagement overlay into the video"
+    )
+    tune: Optional[str] = Field(None, description="x264 tune (e.g. stillimage)")
+    threads: int = Field(
+        default=0, ge=0, description="Max encoder threads per FFmpeg process (0 = auto)"
+    )
+
+    def output_size(self, width: int, height: int) -> tuple[int, int]:
+        """Scale a resolution, keeping both dimensions even (yuv420p).
+
+        Args:
+            width: Full width
+            height: Full height
+
+        Returns:
+            (width, height) for this profile
+        """
+        return (
+            max(2, round(width * self.scale / 2) * 2),
+            max(2, round(height * self.scale / 2) * 2),
+        )
+
+    def encoder_options(self, default_preset: str) -> dict[str, Any]:
+        """Encoder options for FFmpegBuilder commands.
+
+        Args:
+            default_preset: Preset used when the profile does not set one
+
+        Returns:
+            Options mapping (preset, crf and optionally tune)
+        """
+        options: dict[str, Any] = {"preset": self.preset or default_preset, "crf": self.crf}
+        if self.tune:
+            options["tune"] = self.tune
+        return options
+
+
+# Built-in render profiles
+RENDER_PROFILE_SETTINGS: dict[str, dict[str, Any]] = {
+    # 540p still frames in seconds: layout, timing and captions only
+    "draft": {
+        "preset": "ultrafast",
+        "crf": 30,
+        "scale": 0.5,
+        "fps": 24,
+        "effects_enabled": False,
+        # Captions stay: checking their timing is what a draft is for
+        "burn_subtitles": True,
+        "tune": "stillimage",
+        # x264 gains little from more threads on 540p frames; leave cores to other jobs
+        "threads": 4,
+    },
+    # 720p with effects, fast encode
+    "review": {"preset": "veryfast", "crf": 26, "scale": 2 / 3},
+    # Full quality upload
+    "publish": {},
+}
+
+
+def get_render_profile(name: str) -> RenderProfile:
+    """Get a built-in render profile.
+
+    Args:
+        name: Profile name (one of RENDER_PROFILES)
+
+    Returns:
+        Render profile
+
+    Raises:
+        ConfigurationError: If the profile does not exist
+    """
+    settings = RENDER_PROFILE_SETTINGS.get(name)
+    if settings is None:
+        raise ConfigurationError(f"Unknown render profile '{name}' (one of {RENDER_PROFILES})")
+    return RenderProfile(name=name, **settings)
+
+
 class VideoConfig(BaseModel):
     """Video rendering configuration."""
 
@@ -63,6 +160,50 @@ class VideoConfig(BaseModel):
     )
     captions_enabled: bool = Field(default=True, description="Enable dynamic captions")
 
+    # Rendering
+    render_profile: str = Field(
+        default=DEFAULT_RENDER_PROFILE,
+        description="Render quality tier (draft, review or publish)",
+    )
+    prescale_images: bool = Field(
+        default=True, description="Resize images to the size their effects need before rendering"
+    )
+    parallel_render: bool = Field(
+        default=False,
+        description="Render segments as separate clips in parallel and join them by stream copy",
+    )
+    render_workers: int = Field(
+        default=0, ge=0, description="Concurrent FFmpeg processes for parallel render (0 = CPUs)"
+    )
+    effect_engine: str = Field(
+        default=DEFAULT_EFFECT_ENGINE,
+        description="Camera effect engine for parallel render (ffmpeg filters or numpy frames)",
+    )
+    segment_cache_enabled: bool = Field(
+        default=True, description="Reuse unchanged segment clips across parallel renders"
+    )
+    segment_cache_max_mb: int = Field(
+        default=2048, ge=1, description="Segment clip cache size limit (MB)"
+    )
+
+    @field_validator("render_profile")
+    @classmethod
+    def validate_render_profile(cls, v: str) -> str:
+        """Validate render profile."""
+        v_lower = v.lower()
+        if v_lower not in RENDER_PROFILES:
+            raise ValueError(f"Render profile must be one of {RENDER_PROFILES}")
+        return v_lower
+
+    @field_validator("effect_engine")
+    @classmethod
+    def validate_effect_engine(cls, v: str) -> str:
+        """Validate effect engine."""
+        v_lower = v.lower()
+        if v_lower not in EFFECT_ENGINES:
+            raise ValueError(f"Effect engine must be one of {EFFECT_ENGINES}")
+        return v_lower
+
     @field_validator("resolution")
     @classmethod
     def validate_resolution(cls, v: str) -> str:
@@ -117,10 +258,48 @@ class AudioConfig(BaseModel):
 
     # Whisper Configuration
     whisper_model: str = Field(default=DEFAULT_WHISPER_MODEL, description="Whisper model size")
+    timestamp_backend: str = Field(
+        default=DEFAULT_TIMESTAMP_BACKEND,
+        description="Word timestamp backend (whisper, faster-whisper or energy)",
+    )
+    batch_timestamps: bool = Field(
+        default=True,
+        description="Extract timestamps for all chunks in one Whisper pass instead of per chunk",
+    )
+    whisper_processes: int = Field(
+        default=1,
+        ge=0,
+        description="Whisper worker processes (0 = transcribe in the main process)",
+    )
 
     # Audio Dynamics
     speed_factor: float = Field(default=1.0, description="Audio speed factor (1.0 = normal, 1.1 = +10%)")
+    crossfade_ms: int = Field(
+        default=100, ge=0, description="Crossfade between segments in the master track (ms)"
+    )
+    master_format: str = Field(
+        default="wav", description="Lossless format of the master track (wav or flac)"
+    )
     normalize_audio: bool = Field(default=True, description="Normalize audio volume")
+    target_lufs: float = Field(
+        default=-14.0,
+        ge=-40.0,
+        le=-5.0,
+        description="Integrated loudness of the master track (EBU R128, LUFS)",
+    )
+
+    # Synthesis
+    concurrent_synthesis: bool = Field(
+        default=True,
+        description="Synthesize all chunks concurrently (bounded by TTS rate limits)",
+    )
+    tts_streaming: bool = Field(
+        default=True, description="Stream TTS audio to disk as it is generated (Google TTS)"
+    )
+
+    # TTS Cache (shared across jobs)
+    tts_cache_enabled: bool = Field(default=True, description="Reuse identical TTS requests")
+    tts_cache_max_mb: int = Field(default=1024, ge=1, description="TTS cache size limit (MB)")
 
     @field_validator("whisper_model")
     @classmethod
@@ -131,6 +310,25 @@ class AudioConfig(BaseModel):
             raise ValueError(f"Whisper model must be one of {valid_models}")
         return v
 
+    @field_validator("master_format")
+    @classmethod
+    def validate_master_format(cls, v: str) -> str:
+        """Validate master audio format."""
+        valid_formats = ["wav", "flac"]
+        v_lower = v.lower()
+        if v_lower not in valid_formats:
+            raise ValueError(f"Master audio format must be one of {valid_formats}")
+        return v_lower
+
+    @field_validator("timestamp_backend")
+    @classmethod
+    def validate_timestamp_backend(cls, v: str) -> str:
+        """Validate timestamp backend."""
+        v_lower = v.lower()
+        if v_lower not in TIMESTAMP_BACKENDS:
+            raise ValueError(f"Timestamp backend must be one of {TIMESTAMP_BACKENDS}")
+        return v_lower
+
 
 class ImageConfig(BaseModel):
     """Image generation configuration."""
@@ -150,6 +348,10 @@ class ImageConfig(BaseModel):
         description="Negative prompt",
     )
 
+    # Image Cache (shared across jobs)
+    cache_enabled: bool = Field(default=True, description="Reuse identical image requests")
+    cache_max_mb: int = Field(default=2048, ge=1, description="Image cache size limit (MB)")
+
 
 class RedditConfig(BaseModel):
     """Reddit scraper configuration."""
@@ -257,6 +459,16 @@ class LLMConfig(BaseModel):
     )
 
 
+class RateLimitConfig(BaseModel):
+    """Rate limits for one API provider (or provider:model)."""
+
+    rpm: Optional[int] = Field(default=None, ge=1, description="Requests per minute (None = unlimited)")
+    tpm: Optional[int] = Field(default=None, ge=1, description="Tokens per minute (None = unlimited)")
+    max_concurrent: Optional[int] = Field(
+        default=None, ge=1, description="Maximum in-flight requests (None = unlimited)"
+    )
+
+
 class AppConfig(BaseModel):
     """Application-level configuration."""
 
@@ -268,6 +480,9 @@ class AppConfig(BaseModel):
     request_timeout: int = Field(
         default=DEFAULT_REQUEST_TIMEOUT, ge=5, le=300, description="Request timeout in seconds"
     )
+    checkpoint_backend: str = Field(
+        default="sqlite", description="Checkpoint store backend (sqlite or json)"
+    )
 
     @field_validator("log_level")
     @classmethod
@@ -279,6 +494,16 @@ class AppConfig(BaseModel):
             raise ValueError(f"Log level must be one of {valid_levels}")
         return v_upper
 
+    @field_validator("checkpoint_backend")
+    @classmethod
+    def validate_checkpoint_backend(cls, v: str) -> str:
+        """Validate checkpoint backend."""
+        valid_backends = ["sqlite", "json"]
+        v_lower = v.lower()
+        if v_lower not in valid_backends:
+            raise ValueError(f"Checkpoint backend must be one of {valid_backends}")
+        return v_lower
+
     @field_validator("output_dir")
     @classmethod
     def validate_output_dir(cls, v: Path) -> Path:
@@ -320,11 +545,29 @@ class ConfigManager:
                 audio_codec=os.getenv("DEFAULT_AUDIO_CODEC", DEFAULT_AUDIO_CODEC),
                 preset=os.getenv("DEFAULT_VIDEO_PRESET", DEFAULT_VIDEO_PRESET),
                 bitrate=os.getenv("DEFAULT_VIDEO_BITRATE", "5M"),
+                render_profile=os.getenv("VIDEO_RENDER_PROFILE", DEFAULT_RENDER_PROFILE),
+                prescale_images=os.getenv("VIDEO_PRESCALE_IMAGES", "true").lower() == "true",
+                parallel_render=os.getenv("VIDEO_PARALLEL_RENDER", "false").lower() == "true",
+                render_workers=int(os.getenv("VIDEO_RENDER_WORKERS", "0")),
+                effect_engine=os.getenv("VIDEO_EFFECT_ENGINE", DEFAULT_EFFECT_ENGINE),
+                segment_cache_enabled=(
+                    os.getenv("VIDEO_SEGMENT_CACHE_ENABLED", "true").lower() == "true"
+                ),
+                segment_cache_max_mb=int(os.getenv("VIDEO_SEGMENT_CACHE_MAX_MB", "2048")),
             )
 
             self.audio = AudioConfig(
                 default_voice_id=os.getenv("DEFAULT_VOICE_ID", "21m00Tcm4TlvDq8ikWAM"),
                 whisper_model=os.getenv("WHISPER_MODEL", DEFAULT_WHISPER_MODEL),
+                timestamp_backend=os.getenv("TIMESTAMP_BACKEND", DEFAULT_TIMESTAMP_BACKEND),
+                batch_timestamps=os.getenv("WHISPER_BATCH_TIMESTAMPS", "true").lower() == "true",
+                whisper_processes=int(os.getenv("WHISPER_PROCESSES", "1")),
+                concurrent_synthesis=os.getenv("AUDIO_CONCURRENT_SYNTHESIS", "true").lower() == "true",
+                tts_streaming=os.getenv("TTS_STREAMING", "true").lower() == "true",
+                tts_cache_enabled=os.getenv("TTS_CACHE_ENABLED", "true").lower() == "true",
+                tts_cache_max_mb=int(os.getenv("TTS_CACHE_MAX_MB", "1024")),
+                master_format=os.getenv("AUDIO_MASTER_FORMAT", "wav"),
+                target_lufs=float(os.getenv("AUDIO_TARGET_LUFS", "-14.0")),
             )
 
             self.image = ImageConfig(
@@ -342,6 +585,8 @@ class ConfigManager:
                     "IMAGE_NEGATIVE_PROMPT",
                     "text, watermark, blurry, low quality, distorted, speech bubbles, jagged lines, messy sketch",
                 ),
+                cache_enabled=os.getenv("IMAGE_CACHE_ENABLED", "true").lower() == "true",
+                cache_max_mb=int(os.getenv("IMAGE_CACHE_MAX_MB", "2048")),
             )
 
             self.reddit = RedditConfig(
@@ -370,6 +615,9 @@ class ConfigManager:
                 visual_detailer_temperature=float(os.getenv("VISUAL_DETAILER_TEMPERATURE", "0.7")),
             )
 
+            # Rate limits (env override: RATE_LIMIT_<PROVIDER>_<RPM|TPM|MAX_CONCURRENT>)
+            self.rate_limits = self._load_rate_limits()
+
             output_dir_str = os.getenv("OUTPUT_DIR", str(DEFAULT_OUTPUT_DIR))
             self._base_output_dir = Path(output_dir_str)
             self.app = AppConfig(
@@ -377,6 +625,7 @@ class ConfigManager:
                 log_level=os.getenv("LOG_LEVEL", "INFO"),
                 max_retries=int(os.getenv("MAX_RETRIES", DEFAULT_MAX_RETRIES)),
                 request_timeout=int(os.getenv("REQUEST_TIMEOUT", DEFAULT_REQUEST_TIMEOUT)),
+                checkpoint_backend=os.getenv("CHECKPOINT_BACKEND", "sqlite"),
             )
 
         except Exception as e:
@@ -399,6 +648,44 @@ class ConfigManager:
         self.videos_dir
         self.checkpoints_dir
 
+    def for_job(self, job_id: str) -> "ConfigManager":
+        """Create an isolated copy of this configuration scoped to one job.
+
+        The copy has its own sub-configs, so calling ``set_job_context`` on it
+        (or on the original) never leaks output paths between concurrent jobs.
+
+        Args:
+            job_id: Unique job identifier (e.g., project_id)
+
+        Returns:
+            New ConfigManager whose output directory points at the job
+        """
+        job_config = copy.copy(self)
+        for name in ("api", "video", "audio", "image", "reddit", "script", "llm", "app"):
+            setattr(job_config, name, getattr(self, name).model_copy(deep=True))
+
+        job_config.set_job_context(job_id)
+        return job_config
+
+    @staticmethod
+    def _load_rate_limits() -> dict[str, RateLimitConfig]:
+        """Load per-provider rate limits from defaults and environment.
+
+        An override of ``0`` (or an empty value) turns that limit off.
+
+        Returns:
+            Mapping of provider key to RateLimitConfig
+        """
+        rate_limits = {}
+        for provider, defaults in DEFAULT_RATE_LIMITS.items():
+            values = dict(defaults)
+            for field in values:
+                env_value = os.getenv(f"RATE_LIMIT_{provider.upper()}_{field.upper()}")
+                if env_value is not None:
+                    values[field] = int(env_value.strip() or 0) or None
+            rate_limits[provider] = RateLimitConfig(**values)
+        return rate_limits
+
     @staticmethod
     def _get_env(key: str) -> str:
         """Get environment variable or raise error if missing.
@@ -472,6 +759,20 @@ class ConfigManager:
         path.mkdir(parents=True, exist_ok=True)
         return path
 
+    @property
+    def shared_checkpoints_dir(self) -> Path:
+        """Get the checkpoint database directory (shared by all jobs)."""
+        path = self._base_output_dir / "checkpoints"
+        path.mkdir(parents=True, exist_ok=True)
+        return path
+
+    @property
+    def cache_dir(self) -> Path:
+        """Get cache directory (shared by all jobs under the base output directory)."""
+        path = self._base_output_dir / "cache"
+        path.mkdir(parents=True, exist_ok=True)
+        return path
+
     @property
     def outputs_dir(self) -> Path:
         """Get base outputs directory (alias for app.output_dir for backward compatibility)."""
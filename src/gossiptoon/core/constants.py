@@ -20,12 +20,18 @@ DEFAULT_VIDEO_CODEC = "libx264"
 DEFAULT_VIDEO_PRESET = "medium"
 DEFAULT_VIDEO_BITRATE = "5M"
 DEFAULT_ASPECT_RATIO = "9:16"
+EFFECT_ENGINES = ["ffmpeg", "numpy"]
+DEFAULT_EFFECT_ENGINE = "ffmpeg"
+RENDER_PROFILES = ["draft", "review", "publish"]
+DEFAULT_RENDER_PROFILE = "publish"
 
 # Audio configuration
 DEFAULT_AUDIO_CODEC = "aac"
 DEFAULT_AUDIO_BITRATE = "192k"
 WHISPER_MODELS = ["tiny", "base", "small", "medium", "large"]
 DEFAULT_WHISPER_MODEL = "base"
+TIMESTAMP_BACKENDS = ["whisper", "faster-whisper", "energy"]
+DEFAULT_TIMESTAMP_BACKEND = "whisper"
 
 # Script configuration
 MIN_SCRIPT_DURATION = 60.0  # seconds (1 minute minimum for engaging storytelling)
@@ -125,3 +131,12 @@ EMOTION_VOICE_SETTINGS = {
     EmotionTone.SUSPENSEFUL: {"stability": 0.6, "similarity_boost": 0.75, "style": 0.8},
     EmotionTone.SARCASTIC: {"stability": 0.4, "similarity_boost": 0.75, "style": 0.75},
 }
+
+# API rate limits per provider (override per model with "provider:model" keys)
+# rpm = requests/minute, tpm = tokens/minute, max_concurrent = in-flight requests
+DEFAULT_RATE_LIMITS = {
+    "google_tts": {"rpm": 10, "tpm": None, "max_concurrent": 4},
+    "gemini_image": {"rpm": 10, "tpm": None, "max_concurrent": 4},
+    "gemini_llm": {"rpm": 15, "tpm": 1_000_000, "max_concurrent": None},
+    "elevenlabs": {"rpm": None, "tpm": None, "max_concurrent": 4},
+}
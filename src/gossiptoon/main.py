@@ -2,6 +2,7 @@
 
 Usage:
     gossiptoon run <story_url>      - Generate video from Reddit URL
+    gossiptoon batch <urls...>      - Generate videos for many stories in parallel
     gossiptoon resume <project_id>  - Resume from checkpoint
     gossiptoon validate             - Validate API keys and setup
     gossiptoon list                 - List checkpoints
@@ -16,10 +17,11 @@ from typing import List, Optional
 import click
 from rich.console import Console
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.progress import BarColumn, MofNCompleteColumn, Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
 from gossiptoon.core.config import ConfigManager
+from gossiptoon.core.constants import RENDER_PROFILES
 from gossiptoon.pipeline.checkpoint import PipelineStage
 from gossiptoon.pipeline.orchestrator import PipelineOrchestrator
 from gossiptoon.youtube.comments import CommentManager
@@ -39,6 +41,17 @@ logging.basicConfig(
 logger = logging.getLogger("gossiptoon")
 
 
+# Shared by the commands that render video
+profile_option = click.option(
+    "--profile",
+    type=click.Choice(RENDER_PROFILES, case_sensitive=False),
+    help=(
+        "Render profile: draft (540p, no camera effects, captions burned in), "
+        "review (720p) or publish (default: VIDEO_RENDER_PROFILE)"
+    ),
+)
+
+
 @click.group()
 @click.version_option(version="0.1.0", prog_name="GossipToon")
 def cli():
@@ -61,13 +74,76 @@ def cli():
     type=click.Path(exists=True),
     help="Path to config file",
 )
-def run(story_url: str, config: Optional[str]):
+@profile_option
+def run(story_url: str, config: Optional[str], profile: Optional[str]):
     """Generate video from Reddit story URL.
 
     Example:
         gossiptoon run https://reddit.com/r/AmItheAsshole/comments/...
+        gossiptoon run --profile draft https://reddit.com/r/AmItheAsshole/comments/...
+    """
+    asyncio.run(_run_pipeline(story_url, config_path=config, profile=profile))
+
+
+@cli.command()
+@click.argument("story_urls", nargs=-1)
+@click.option(
+    "--file",
+    "-f",
+    "url_file",
+    type=click.Path(exists=True, dir_okay=False),
+    help="Text file with one story URL per line",
+)
+@click.option(
+    "--max-parallel",
+    "-p",
+    type=click.IntRange(min=1),
+    default=2,
+    help="Maximum number of videos generated concurrently",
+)
+@click.option(
+    "--report",
+    "-r",
+    type=click.Path(dir_okay=False),
+    help="Write the batch result as JSON to this path",
+)
+@click.option(
+    "--config",
+    "-c",
+    type=click.Path(exists=True),
+    help="Path to config file",
+)
+@profile_option
+def batch(
+    story_urls: tuple[str, ...],
+    url_file: Optional[str],
+    max_parallel: int,
+    report: Optional[str],
+    config: Optional[str],
+    profile: Optional[str],
+):
+    """Generate videos for multiple Reddit stories in parallel.
+
+    Example:
+        gossiptoon batch --file stories.txt --max-parallel 4
     """
-    asyncio.run(_run_pipeline(story_url, config_path=config))
+    urls = [*story_urls]
+    if url_file:
+        lines = Path(url_file).read_text().splitlines()
+        urls.extend(line.strip() for line in lines if line.strip() and not line.startswith("#"))
+
+    if not urls:
+        raise click.UsageError("Provide story URLs as arguments or via --file")
+
+    asyncio.run(
+        _run_batch(
+            urls,
+            max_parallel=max_parallel,
+            report_path=report,
+            config_path=config,
+            profile=profile,
+        )
+    )
 
 
 @cli.command()
@@ -78,13 +154,14 @@ def run(story_url: str, config: Optional[str]):
     type=click.Path(exists=True),
     help="Path to config file",
 )
-def resume(project_id: str, config: Optional[str]):
+@profile_option
+def resume(project_id: str, config: Optional[str], profile: Optional[str]):
     """Resume pipeline from checkpoint.
 
     Example:
         gossiptoon resume project_20250131_123456
     """
-    asyncio.run(_resume_pipeline(project_id, config_path=config))
+    asyncio.run(_resume_pipeline(project_id, config_path=config, profile=profile))
 
 
 @cli.command()
@@ -230,11 +307,15 @@ def comment(url: str, template: str, config: Optional[str]):
     _generate_comment(url, template, config_path=config)
 
 
-async def _run_pipeline(story_url: str, config_path: Optional[str] = None):
+async def _run_pipeline(
+    story_url: str,
+    config_path: Optional[str] = None,
+    profile: Optional[str] = None,
+):
     """Run complete pipeline."""
     try:
         # Load config
-        config = _load_config(config_path)
+        config = _load_config(config_path, profile=profile)
 
         # Initialize orchestrator
         orchestrator = PipelineOrchestrator(config)
@@ -274,11 +355,101 @@ async def _run_pipeline(story_url: str, config_path: Optional[str] = None):
         return 1
 
 
-async def _resume_pipeline(project_id: str, config_path: Optional[str] = None):
+async def _run_batch(
+    story_urls: List[str],
+    max_parallel: int,
+    report_path: Optional[str] = None,
+    config_path: Optional[str] = None,
+    profile: Optional[str] = None,
+):
+    """Run pipeline for a batch of stories."""
+    from gossiptoon.pipeline.batch import BatchProcessor
+
+    try:
+        # Load config
+        config = _load_config(config_path, profile=profile)
+
+        # Display header
+        console.print(
+            Panel.fit(
+                "[bold cyan]GossipToon Batch[/bold cyan]\n"
+                f"[dim]Stories: {len(story_urls)} | Max parallel: {max_parallel}[/dim]",
+                border_style="cyan",
+            )
+        )
+
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            MofNCompleteColumn(),
+            console=console,
+        ) as progress:
+            task = progress.add_task("[cyan]Generating videos...", total=len(story_urls))
+
+            def on_result(video_result, finished: int, total: int) -> None:
+                mark = "[green]✓[/green]" if video_result.status == "success" else "[red]✗[/red]"
+                progress.console.print(f"{mark} {video_result.url}")
+                progress.update(task, completed=finished)
+
+            processor = BatchProcessor(
+                config,
+                max_parallel=max_parallel,
+                progress_callback=on_result,
+            )
+            batch_result = await processor.process_batch(story_urls)
+
+            progress.update(task, description="[green]Batch complete!")
+
+        # Display results
+        table = Table(show_header=True, header_style="bold magenta")
+        table.add_column("#", style="cyan", width=3)
+        table.add_column("Project ID", style="cyan")
+        table.add_column("Status", justify="center")
+        table.add_column("Output / Error")
+
+        for i, video_result in enumerate(batch_result.results, 1):
+            if video_result.status == "success":
+                table.add_row(
+                    str(i),
+                    video_result.project_id or "-",
+                    "[green]✓ OK[/green]",
+                    str(video_result.output_path),
+                )
+            else:
+                table.add_row(
+                    str(i),
+                    video_result.project_id or "-",
+                    "[red]✗ FAILED[/red]",
+                    video_result.error or "",
+                )
+
+        console.print(table)
+        console.print(
+            f"\n[bold]{batch_result.successful}/{batch_result.total} succeeded[/bold] "
+            f"in {batch_result.total_duration_seconds:.0f}s\n"
+        )
+
+        if report_path:
+            Path(report_path).write_text(batch_result.model_dump_json(indent=2))
+            console.print(f"[dim]Batch report written to {report_path}[/dim]\n")
+
+        return 0 if batch_result.failed == 0 else 1
+
+    except Exception as e:
+        console.print(f"[bold red]Error:[/bold red] {e}")
+        return 1
+
+
+async def _resume_pipeline(
+    project_id: str,
+    config_path: Optional[str] = None,
+    profile: Optional[str] = None,
+):
     """Resume pipeline from checkpoint."""
     try:
         # Load config
-        config = _load_config(config_path)
+        config = _load_config(config_path, profile=profile)
 
         # Set context for correct paths
         config.set_job_context(project_id)
@@ -286,8 +457,8 @@ async def _resume_pipeline(project_id: str, config_path: Optional[str] = None):
         # Initialize orchestrator
         orchestrator = PipelineOrchestrator(config)
 
-        # Load checkpoint to show current stage
-        checkpoint = orchestrator.checkpoint_manager.load_checkpoint(project_id)
+        # Load checkpoint header to show current stage
+        checkpoint = orchestrator.checkpoint_manager.load_checkpoint(project_id, stages=())
 
         # Display header
         console.print(
@@ -376,7 +547,11 @@ def _list_checkpoints(config_path: Optional[str] = None):
         # Initialize checkpoint manager
         from gossiptoon.pipeline.checkpoint import CheckpointManager
 
-        checkpoint_manager = CheckpointManager(config.checkpoints_dir)
+        checkpoint_manager = CheckpointManager(
+            config.checkpoints_dir,
+            backend=config.app.checkpoint_backend,
+            shared_dir=config.shared_checkpoints_dir,
+        )
 
         # Get checkpoints
         checkpoints = checkpoint_manager.list_checkpoints()
@@ -393,7 +568,8 @@ def _list_checkpoints(config_path: Optional[str] = None):
 
         for project_id in checkpoints:
             try:
-                checkpoint = checkpoint_manager.load_checkpoint(project_id)
+                # Header only: stage outputs are not needed for the listing
+                checkpoint = checkpoint_manager.load_checkpoint(project_id, stages=())
                 table.add_row(
                     project_id,
                     checkpoint.current_stage.value,
@@ -422,7 +598,11 @@ def _clean_checkpoints(config_path: Optional[str] = None, max_age_days: int = 7)
         # Initialize checkpoint manager
         from gossiptoon.pipeline.checkpoint import CheckpointManager
 
-        checkpoint_manager = CheckpointManager(config.checkpoints_dir)
+        checkpoint_manager = CheckpointManager(
+            config.checkpoints_dir,
+            backend=config.app.checkpoint_backend,
+            shared_dir=config.shared_checkpoints_dir,
+        )
 
         # Clean checkpoints
         deleted = checkpoint_manager.clean_old_checkpoints(max_age_days)
@@ -461,10 +641,16 @@ def _generate_comment(url: str, template: str, config_path: Optional[str] = None
         return 1
 
 
-def _load_config(config_path: Optional[str] = None) -> ConfigManager:
-    """Load configuration."""
+def _load_config(
+    config_path: Optional[str] = None,
+    profile: Optional[str] = None,
+) -> ConfigManager:
+    """Load configuration, optionally overriding the render profile."""
     # ConfigManager loads from .env automatically, config_path is unused for now
-    return ConfigManager()
+    config = ConfigManager()
+    if profile:
+        config.video.render_profile = profile.lower()
+    return config
 
 
 def _display_success(result):
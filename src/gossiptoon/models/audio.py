@@ -167,6 +167,16 @@ class AudioSegment(BaseModel):
         ge=0,
         description="Start time in master timeline (seconds) - for fragmented audio",
     )
+    source_duration_seconds: Optional[float] = Field(
+        None,
+        ge=0,
+        description="Duration of the audio file itself (set once placed on the master timeline)",
+    )
+    time_scale: float = Field(
+        default=1.0,
+        gt=0,
+        description="Master seconds per second of the audio file (1 / speed factor)",
+    )
 
     def get_timestamps_in_range(self, start: float, end: float) -> list[WordTimestamp]:
         """Get timestamps within a time range.
@@ -216,6 +226,57 @@ class AudioSegment(BaseModel):
         }
 
 
+class SegmentDrift(BaseModel):
+    """Where a segment lands on the master track versus summed file durations."""
+
+    scene_id: str = Field(..., description="Reference to scene")
+    chunk_id: Optional[str] = Field(None, description="Reference to AudioChunk")
+    naive_offset: float = Field(..., ge=0, description="Sum of the preceding file durations")
+    offset: float = Field(..., ge=0, description="Start time in the rendered master")
+
+    @property
+    def drift_seconds(self) -> float:
+        """How far the naive offset is from the real one.
+
+        Returns:
+            Drift in seconds (positive = naive offset is late)
+        """
+        return self.naive_offset - self.offset
+
+
+class DriftReport(BaseModel):
+    """Timing correction applied when laying segments onto the master track."""
+
+    crossfade_seconds: float = Field(..., ge=0, description="Crossfade at each join")
+    speed_factor: float = Field(..., gt=0, description="Tempo applied to the master")
+    naive_duration: float = Field(..., ge=0, description="Sum of segment file durations")
+    timeline_duration: float = Field(..., ge=0, description="Master duration per the timeline")
+    master_duration: Optional[float] = Field(
+        None, ge=0, description="Measured duration of the rendered master file"
+    )
+    segments: list[SegmentDrift] = Field(default_factory=list, description="Per-segment drift")
+
+    @property
+    def max_drift_seconds(self) -> float:
+        """Largest correction applied to any segment offset.
+
+        Returns:
+            Drift in seconds
+        """
+        return max((abs(s.drift_seconds) for s in self.segments), default=0.0)
+
+    @property
+    def residual_seconds(self) -> Optional[float]:
+        """Difference between the measured master and the timeline.
+
+        Returns:
+            Residual in seconds, or None if the master was not measured
+        """
+        if self.master_duration is None:
+            return None
+        return self.master_duration - self.timeline_duration
+
+
 class AudioProject(BaseModel):
     """Complete audio project for a script."""
 
@@ -226,6 +287,9 @@ class AudioProject(BaseModel):
         None, description="Path to combined master audio file"
     )
     voice_id: str = Field(..., description="Primary voice ID used")
+    drift_report: Optional[DriftReport] = Field(
+        None, description="Offset corrections for crossfade and tempo"
+    )
 
     def get_segment_by_scene(self, scene_id: str) -> Optional[AudioSegment]:
         """Retrieve segment for specific scene.
@@ -3,10 +3,14 @@
 Coordinates end-to-end video generation with checkpoint recovery.
 """
 
+from gossiptoon.pipeline.batch import BatchProcessor, BatchResult, VideoResult
 from gossiptoon.pipeline.checkpoint import CheckpointData, CheckpointManager, PipelineStage
 from gossiptoon.pipeline.orchestrator import PipelineOrchestrator, PipelineResult
 
 __all__ = [
+    "BatchProcessor",
+    "BatchResult",
+    "VideoResult",
     "CheckpointManager",
     "CheckpointData",
     "PipelineStage",
@@ -1,12 +1,14 @@
 """Batch processing system for multiple video generation."""
 
+import asyncio
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, List, Optional
 
 from pydantic import BaseModel, Field
 
+from gossiptoon.core.config import ConfigManager
 from gossiptoon.pipeline.orchestrator import PipelineOrchestrator, PipelineResult
 
 logger = logging.getLogger(__name__)
@@ -35,22 +37,40 @@ class BatchResult(BaseModel):
     total_duration_seconds: Optional[float] = None
 
 
+# Called after each job finishes: (result, finished_count, total_count)
+ProgressCallback = Callable[[VideoResult, int, int], None]
+
+
 class BatchProcessor:
-    """Batch video generation processor."""
+    """Batch video generation processor.
+
+    Every job gets its own job-scoped ConfigManager copy and its own
+    PipelineOrchestrator, so concurrent jobs never share output paths
+    or checkpoint managers. At most ``max_parallel`` jobs run at once.
+    """
 
     def __init__(
         self,
-        orchestrator: PipelineOrchestrator,
+        config: ConfigManager,
         max_parallel: int = 1,
+        orchestrator_factory: Callable[[ConfigManager], PipelineOrchestrator] = PipelineOrchestrator,
+        progress_callback: Optional[ProgressCallback] = None,
     ):
         """Initialize batch processor.
 
         Args:
-            orchestrator: Pipeline orchestrator instance
+            config: Base configuration (never mutated; copied per job)
             max_parallel: Maximum number of parallel videos (default: 1 = sequential)
+            orchestrator_factory: Builds an orchestrator for a job-scoped config
+            progress_callback: Optional callback invoked as each job finishes
         """
-        self.orchestrator = orchestrator
+        if max_parallel < 1:
+            raise ValueError("max_parallel must be at least 1")
+
+        self.config = config
         self.max_parallel = max_parallel
+        self.orchestrator_factory = orchestrator_factory
+        self.progress_callback = progress_callback
         logger.info(f"BatchProcessor initialized (max_parallel={max_parallel})")
 
     async def process_batch(
@@ -63,9 +83,12 @@ class BatchProcessor:
             story_urls: List of Reddit story URLs
 
         Returns:
-            BatchResult with summary and individual results
+            BatchResult with summary and individual results (in input order)
         """
-        logger.info(f"Starting batch processing of {len(story_urls)} stories")
+        logger.info(
+            f"Starting batch processing of {len(story_urls)} stories "
+            f"(max_parallel={self.max_parallel})"
+        )
 
         batch_result = BatchResult(
             total=len(story_urls),
@@ -73,49 +96,29 @@ class BatchProcessor:
             failed=0,
         )
 
-        # Process sequentially for now (Phase B)
-        for i, url in enumerate(story_urls, 1):
-            logger.info(f"Processing story {i}/{len(story_urls)}: {url}")
-
-            try:
-                # Run pipeline for this story
-                pipeline_result = await self.orchestrator.run(story_url=url)
-
-                if pipeline_result.success:
-                    video_result = VideoResult(
-                        url=url,
-                        project_id=pipeline_result.project_id,
-                        status="success",
-                        output_path=pipeline_result.video_project.output_path
-                        if pipeline_result.video_project
-                        else None,
-                        duration=pipeline_result.video_project.total_duration
-                        if pipeline_result.video_project
-                        else None,
-                    )
-                    batch_result.successful += 1
-                    logger.info(f"✓ Story {i} completed successfully")
-                else:
-                    video_result = VideoResult(
-                        url=url,
-                        project_id=pipeline_result.project_id,
-                        status="failed",
-                        error=str(pipeline_result.error),
-                    )
-                    batch_result.failed +=1
-                    logger.warning(f"✗ Story {i} failed: {pipeline_result.error}")
-
-                batch_result.results.append(video_result)
-
-            except Exception as e:
-                logger.error(f"✗ Unexpected error processing story {i}: {e}")
-                video_result = VideoResult(
-                    url=url,
-                    status="failed",
-                    error=str(e),
-                )
+        semaphore = asyncio.Semaphore(self.max_parallel)
+        finished = 0
+
+        async def worker(index: int, url: str) -> VideoResult:
+            nonlocal finished
+
+            async with semaphore:
+                video_result = await self._process_story(index, len(story_urls), url)
+
+            if video_result.status == "success":
+                batch_result.successful += 1
+            else:
                 batch_result.failed += 1
-                batch_result.results.append(video_result)
+
+            finished += 1
+            if self.progress_callback:
+                self.progress_callback(video_result, finished, len(story_urls))
+
+            return video_result
+
+        batch_result.results = list(
+            await asyncio.gather(*(worker(i, url) for i, url in enumerate(story_urls, 1)))
+        )
 
         # Finalize
         batch_result.completed_at = datetime.now()
@@ -130,3 +133,55 @@ class BatchProcessor:
         )
 
         return batch_result
+
+    async def _process_story(self, index: int, total: int, url: str) -> VideoResult:
+        """Run the pipeline for one story in an isolated job context.
+
+        Args:
+            index: 1-based position of the story in the batch
+            total: Number of stories in the batch
+            url: Reddit story URL
+
+        Returns:
+            VideoResult for this story (failures are captured, not raised)
+        """
+        logger.info(f"Processing story {index}/{total}: {url}")
+
+        try:
+            project_id = PipelineOrchestrator._generate_project_id()
+            orchestrator = self.orchestrator_factory(self.config.for_job(project_id))
+
+            pipeline_result: PipelineResult = await orchestrator.run(
+                story_url=url,
+                project_id=project_id,
+            )
+
+            if pipeline_result.success:
+                logger.info(f"✓ Story {index} completed successfully")
+                return VideoResult(
+                    url=url,
+                    project_id=pipeline_result.project_id,
+                    status="success",
+                    output_path=pipeline_result.video_project.output_path
+                    if pipeline_result.video_project
+                    else None,
+                    duration=pipeline_result.video_project.total_duration
+                    if pipeline_result.video_project
+                    else None,
+                )
+
+            logger.warning(f"✗ Story {index} failed: {pipeline_result.error}")
+            return VideoResult(
+                url=url,
+                project_id=pipeline_result.project_id,
+                status="failed",
+                error=str(pipeline_result.error),
+            )
+
+        except Exception as e:
+            logger.error(f"✗ Unexpected error processing story {index}: {e}")
+            return VideoResult(
+                url=url,
+                status="failed",
+                error=str(e),
+            )
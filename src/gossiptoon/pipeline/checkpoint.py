@@ -5,14 +5,19 @@ Enables pipeline resumption from any stage on failure.
 
 import json
 import logging
+import sqlite3
+from abc import ABC, abstractmethod
+from contextlib import closing
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 
 from pydantic import BaseModel, Field
+from pydantic_core import to_json
 
 from gossiptoon.core.exceptions import CheckpointError
+from gossiptoon.utils.journal import ItemJournal
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +40,9 @@ class CheckpointData(BaseModel):
 
     project_id: str = Field(..., description="Unique project identifier")
     current_stage: PipelineStage = Field(..., description="Current pipeline stage")
+    completed_stages: list[PipelineStage] = Field(
+        default_factory=list, description="Stages finished so far (any order)"
+    )
     created_at: datetime = Field(default_factory=datetime.now, description="Checkpoint creation time")
     updated_at: datetime = Field(default_factory=datetime.now, description="Last update time")
 
@@ -56,25 +64,556 @@ class CheckpointData(BaseModel):
         json_encoders = {datetime: lambda v: v.isoformat()}
 
 
+# CheckpointData field holding each stage's output
+STAGE_DATA_FIELDS: dict[PipelineStage, str] = {
+    PipelineStage.STORY_FOUND: "story_data",
+    PipelineStage.SCRIPT_GENERATED: "script_data",
+    PipelineStage.ENGAGEMENT_GENERATED: "engagement_data",
+    PipelineStage.AUDIO_GENERATED: "audio_data",
+    PipelineStage.VISUALS_GENERATED: "visual_data",
+    PipelineStage.VIDEO_ASSEMBLED: "video_data",
+}
+
+CHECKPOINT_BACKENDS = ("sqlite", "json")
+
+
+class CheckpointStore(ABC):
+    """Storage backend for checkpoints.
+
+    Implementations persist a small per-project header (stages, timestamps,
+    errors) and one data blob per stage, so a stage save only writes that
+    stage's output.
+    """
+
+    @abstractmethod
+    def load(
+        self,
+        project_id: str,
+        stages: Optional[Iterable[PipelineStage]] = None,
+    ) -> Optional[CheckpointData]:
+        """Load a checkpoint.
+
+        Args:
+            project_id: Project identifier
+            stages: Stages whose data to load (None = all, empty = header only)
+
+        Returns:
+            Checkpoint data, or None if the project has no checkpoint
+        """
+
+    @abstractmethod
+    def save_stage(self, project_id: str, stage: PipelineStage, data: dict[str, Any]) -> None:
+        """Record a finished stage and its output.
+
+        Args:
+            project_id: Project identifier
+            stage: Finished stage
+            data: Stage output
+        """
+
+    @abstractmethod
+    def add_error(self, project_id: str, error_message: str) -> None:
+        """Append to a checkpoint's error history.
+
+        Args:
+            project_id: Project identifier
+            error_message: Timestamped error message
+        """
+
+    @abstractmethod
+    def exists(self, project_id: str) -> bool:
+        """Check whether a project has a checkpoint."""
+
+    @abstractmethod
+    def delete(self, project_id: str) -> None:
+        """Delete a project's checkpoint."""
+
+    @abstractmethod
+    def list_projects(self) -> list[str]:
+        """List project IDs with checkpoints, sorted."""
+
+    @abstractmethod
+    def delete_older_than(self, cutoff: float) -> list[str]:
+        """Delete checkpoints last updated before a Unix timestamp.
+
+        Args:
+            cutoff: Unix timestamp
+
+        Returns:
+            IDs of deleted projects
+        """
+
+    @abstractmethod
+    def location(self, project_id: str) -> Path:
+        """Get the file holding a project's checkpoint."""
+
+
+class JSONCheckpointStore(CheckpointStore):
+    """One pretty-printed JSON file per project (original format).
+
+    Every save rewrites the whole file; kept for compatibility and debugging.
+    """
+
+    def __init__(self, checkpoint_dir: Path) -> None:
+        """Initialize JSON checkpoint store.
+
+        Args:
+            checkpoint_dir: Directory for checkpoint files
+        """
+        self.checkpoint_dir = checkpoint_dir
+
+    def location(self, project_id: str) -> Path:
+        """Get the JSON file holding a project's checkpoint.
+
+        Args:
+            project_id: Project identifier
+
+        Returns:
+            Path to the checkpoint file
+        """
+        return self.checkpoint_dir / f"checkpoint_{project_id}.json"
+
+    def load(
+        self,
+        project_id: str,
+        stages: Optional[Iterable[PipelineStage]] = None,
+    ) -> Optional[CheckpointData]:
+        """Load a checkpoint from its JSON file.
+
+        Args:
+            project_id: Project identifier
+            stages: Ignored; the whole file is always read
+
+        Returns:
+            Checkpoint data, or None if the file does not exist
+        """
+        path = self.location(project_id)
+        if not path.exists():
+            return None
+        return CheckpointData.model_validate_json(path.read_text())
+
+    def _write(self, checkpoint: CheckpointData) -> None:
+        """Rewrite a project's checkpoint file."""
+        self.location(checkpoint.project_id).write_text(checkpoint.model_dump_json(indent=2))
+
+    def save_stage(self, project_id: str, stage: PipelineStage, data: dict[str, Any]) -> None:
+        """Record a finished stage by rewriting the checkpoint file.
+
+        Args:
+            project_id: Project identifier
+            stage: Finished stage
+            data: Stage output
+        """
+        checkpoint = self.load(project_id)
+        if checkpoint is None:
+            checkpoint = CheckpointData(project_id=project_id, current_stage=stage)
+        else:
+            checkpoint.current_stage = stage
+            checkpoint.updated_at = datetime.now()
+
+        field = STAGE_DATA_FIELDS.get(stage)
+        if field:
+            setattr(checkpoint, field, data)
+        if stage not in checkpoint.completed_stages:
+            checkpoint.completed_stages.append(stage)
+
+        self._write(checkpoint)
+
+    def add_error(self, project_id: str, error_message: str) -> None:
+        """Append to a checkpoint's error history.
+
+        Args:
+            project_id: Project identifier
+            error_message: Timestamped error message
+
+        Raises:
+            CheckpointError: If the project has no checkpoint
+        """
+        checkpoint = self.load(project_id)
+        if checkpoint is None:
+            raise CheckpointError(f"No checkpoint found for project: {project_id}")
+        checkpoint.error_history.append(error_message)
+        checkpoint.updated_at = datetime.now()
+        self._write(checkpoint)
+
+    def exists(self, project_id: str) -> bool:
+        """Check whether a project's checkpoint file exists.
+
+        Args:
+            project_id: Project identifier
+
+        Returns:
+            True if the checkpoint exists
+        """
+        return self.location(project_id).exists()
+
+    def delete(self, project_id: str) -> None:
+        """Delete a project's checkpoint file (no-op if missing).
+
+        Args:
+            project_id: Project identifier
+        """
+        self.location(project_id).unlink(missing_ok=True)
+
+    def list_projects(self) -> list[str]:
+        """List project IDs with checkpoint files.
+
+        Returns:
+            Sorted project IDs
+        """
+        return sorted(
+            path.stem.replace("checkpoint_", "", 1)
+            for path in self.checkpoint_dir.glob("checkpoint_*.json")
+        )
+
+    def delete_older_than(self, cutoff: float) -> list[str]:
+        """Delete checkpoint files last modified before a Unix timestamp.
+
+        Args:
+            cutoff: Unix timestamp
+
+        Returns:
+            IDs of deleted projects
+        """
+        deleted = []
+        for path in self.checkpoint_dir.glob("checkpoint_*.json"):
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+                deleted.append(path.stem.replace("checkpoint_", "", 1))
+        return deleted
+
+
+class SQLiteCheckpointStore(CheckpointStore):
+    """All checkpoints in one SQLite database.
+
+    Each project has a header row plus one row per finished stage, so saves
+    touch only the stage being written, loads deserialize only the stages
+    asked for, and listing/cleanup use indexed queries. Writes are single
+    transactions (WAL mode, safe across concurrent jobs and processes).
+
+    JSON checkpoints from the original format found in the directory (or
+    passed to ``migrate_json_checkpoints``) are imported once and renamed
+    to ``*.json.migrated``.
+    """
+
+    DB_FILENAME = "checkpoints.db"
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS checkpoints (
+            project_id TEXT PRIMARY KEY,
+            current_stage TEXT NOT NULL,
+            completed_stages TEXT NOT NULL,
+            created_at REAL NOT NULL,
+            updated_at REAL NOT NULL,
+            metadata TEXT NOT NULL,
+            error_history TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_checkpoints_updated_at ON checkpoints (updated_at);
+        CREATE TABLE IF NOT EXISTS stage_data (
+            project_id TEXT NOT NULL,
+            stage TEXT NOT NULL,
+            data TEXT NOT NULL,
+            PRIMARY KEY (project_id, stage)
+        );
+    """
+
+    def __init__(self, checkpoint_dir: Path) -> None:
+        """Initialize SQLite checkpoint store.
+
+        Args:
+            checkpoint_dir: Directory holding the database
+        """
+        self.checkpoint_dir = checkpoint_dir
+        self.db_path = checkpoint_dir / self.DB_FILENAME
+
+        with closing(self._connect()) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(self._SCHEMA)
+
+        self.migrate_json_checkpoints(checkpoint_dir)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection to the database (rows accessible by name)."""
+        conn = sqlite3.connect(self.db_path, timeout=30.0)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def location(self, project_id: str) -> Path:
+        """Get the database file (shared by all projects).
+
+        Args:
+            project_id: Project identifier
+
+        Returns:
+            Path to the database
+        """
+        return self.db_path
+
+    def load(
+        self,
+        project_id: str,
+        stages: Optional[Iterable[PipelineStage]] = None,
+    ) -> Optional[CheckpointData]:
+        """Load a checkpoint header and the requested stage data.
+
+        Args:
+            project_id: Project identifier
+            stages: Stages whose data to load (None = all, empty = header only)
+
+        Returns:
+            Checkpoint data, or None if the project has no checkpoint
+        """
+        with closing(self._connect()) as conn:
+            header = conn.execute(
+                "SELECT * FROM checkpoints WHERE project_id = ?", (project_id,)
+            ).fetchone()
+            if header is None:
+                return None
+
+            if stages is None:
+                rows = conn.execute(
+                    "SELECT stage, data FROM stage_data WHERE project_id = ?", (project_id,)
+                ).fetchall()
+            else:
+                wanted = [PipelineStage(stage).value for stage in stages]
+                rows = []
+                if wanted:
+                    placeholders = ", ".join("?" for _ in wanted)
+                    rows = conn.execute(
+                        f"SELECT stage, data FROM stage_data "
+                        f"WHERE project_id = ? AND stage IN ({placeholders})",
+                        (project_id, *wanted),
+                    ).fetchall()
+
+        checkpoint = CheckpointData(
+            project_id=project_id,
+            current_stage=header["current_stage"],
+            completed_stages=json.loads(header["completed_stages"]),
+            created_at=datetime.fromtimestamp(header["created_at"]),
+            updated_at=datetime.fromtimestamp(header["updated_at"]),
+            metadata=json.loads(header["metadata"]),
+            error_history=json.loads(header["error_history"]),
+        )
+        for row in rows:
+            setattr(checkpoint, STAGE_DATA_FIELDS[PipelineStage(row["stage"])], json.loads(row["data"]))
+        return checkpoint
+
+    def save_stage(self, project_id: str, stage: PipelineStage, data: dict[str, Any]) -> None:
+        """Record a finished stage and its output in one transaction.
+
+        Args:
+            project_id: Project identifier
+            stage: Finished stage
+            data: Stage output
+        """
+        now = datetime.now().timestamp()
+        with closing(self._connect()) as conn, conn:
+            row = conn.execute(
+                "SELECT completed_stages FROM checkpoints WHERE project_id = ?", (project_id,)
+            ).fetchone()
+            completed = json.loads(row["completed_stages"]) if row else []
+            if stage.value not in completed:
+                completed.append(stage.value)
+
+            if row is None:
+                conn.execute(
+                    "INSERT INTO checkpoints VALUES (?, ?, ?, ?, ?, '{}', '[]')",
+                    (project_id, stage.value, json.dumps(completed), now, now),
+                )
+            else:
+                conn.execute(
+                    "UPDATE checkpoints SET current_stage = ?, completed_stages = ?, updated_at = ? "
+                    "WHERE project_id = ?",
+                    (stage.value, json.dumps(completed), now, project_id),
+                )
+
+            if stage in STAGE_DATA_FIELDS:
+                conn.execute(
+                    "INSERT OR REPLACE INTO stage_data VALUES (?, ?, ?)",
+                    (project_id, stage.value, to_json(data).decode("utf-8")),
+                )
+
+    def add_error(self, project_id: str, error_message: str) -> None:
+        """Append to a checkpoint's error history.
+
+        Args:
+            project_id: Project identifier
+            error_message: Timestamped error message
+
+        Raises:
+            CheckpointError: If the project has no checkpoint
+        """
+        with closing(self._connect()) as conn, conn:
+            row = conn.execute(
+                "SELECT error_history FROM checkpoints WHERE project_id = ?", (project_id,)
+            ).fetchone()
+            if row is None:
+                raise CheckpointError(f"No checkpoint found for project: {project_id}")
+            errors = json.loads(row["error_history"])
+            errors.append(error_message)
+            conn.execute(
+                "UPDATE checkpoints SET error_history = ?, updated_at = ? WHERE project_id = ?",
+                (json.dumps(errors), datetime.now().timestamp(), project_id),
+            )
+
+    def exists(self, project_id: str) -> bool:
+        """Check whether a project has a checkpoint row.
+
+        Args:
+            project_id: Project identifier
+
+        Returns:
+            True if the checkpoint exists
+        """
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT 1 FROM checkpoints WHERE project_id = ?", (project_id,)
+            ).fetchone()
+        return row is not None
+
+    def delete(self, project_id: str) -> None:
+        """Delete a project's header and stage data.
+
+        Args:
+            project_id: Project identifier
+        """
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM stage_data WHERE project_id = ?", (project_id,))
+            conn.execute("DELETE FROM checkpoints WHERE project_id = ?", (project_id,))
+
+    def list_projects(self) -> list[str]:
+        """List project IDs with checkpoints.
+
+        Returns:
+            Sorted project IDs
+        """
+        with closing(self._connect()) as conn:
+            rows = conn.execute("SELECT project_id FROM checkpoints ORDER BY project_id").fetchall()
+        return [row["project_id"] for row in rows]
+
+    def delete_older_than(self, cutoff: float) -> list[str]:
+        """Delete checkpoints last updated before a Unix timestamp.
+
+        Args:
+            cutoff: Unix timestamp
+
+        Returns:
+            IDs of deleted projects
+        """
+        with closing(self._connect()) as conn, conn:
+            rows = conn.execute(
+                "SELECT project_id FROM checkpoints WHERE updated_at < ?", (cutoff,)
+            ).fetchall()
+            deleted = [row["project_id"] for row in rows]
+            for project_id in deleted:
+                conn.execute("DELETE FROM stage_data WHERE project_id = ?", (project_id,))
+                conn.execute("DELETE FROM checkpoints WHERE project_id = ?", (project_id,))
+        return deleted
+
+    def migrate_json_checkpoints(self, json_dir: Path) -> None:
+        """Import checkpoints written by the JSON store.
+
+        Args:
+            json_dir: Directory holding JSON checkpoint files
+        """
+        legacy = JSONCheckpointStore(json_dir)
+        for project_id in legacy.list_projects():
+            path = legacy.location(project_id)
+            try:
+                if not self.exists(project_id):
+                    self._import(legacy.load(project_id))
+                path.rename(path.with_name(f"{path.name}.migrated"))
+                logger.info(f"Migrated JSON checkpoint to SQLite: {project_id}")
+            except Exception as e:
+                logger.warning(f"Failed to migrate JSON checkpoint {path.name}: {e}")
+
+    def _import(self, checkpoint: CheckpointData) -> None:
+        """Write a complete checkpoint (used for migration)."""
+        completed = [stage.value for stage in checkpoint.completed_stages]
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT INTO checkpoints VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    checkpoint.project_id,
+                    checkpoint.current_stage.value,
+                    json.dumps(completed),
+                    checkpoint.created_at.timestamp(),
+                    checkpoint.updated_at.timestamp(),
+                    to_json(checkpoint.metadata).decode("utf-8"),
+                    json.dumps(checkpoint.error_history),
+                ),
+            )
+            for stage, field in STAGE_DATA_FIELDS.items():
+                data = getattr(checkpoint, field)
+                if data:
+                    conn.execute(
+                        "INSERT INTO stage_data VALUES (?, ?, ?)",
+                        (checkpoint.project_id, stage.value, to_json(data).decode("utf-8")),
+                    )
+
+
+def create_checkpoint_store(backend: str, checkpoint_dir: Path) -> CheckpointStore:
+    """Create a checkpoint store by backend name.
+
+    Args:
+        backend: "sqlite" or "json"
+        checkpoint_dir: Directory for checkpoint storage
+
+    Returns:
+        Checkpoint store
+
+    Raises:
+        CheckpointError: If the backend is unknown
+    """
+    if backend == "sqlite":
+        return SQLiteCheckpointStore(checkpoint_dir)
+    if backend == "json":
+        return JSONCheckpointStore(checkpoint_dir)
+    raise CheckpointError(
+        f"Unknown checkpoint backend: {backend} (expected one of {', '.join(CHECKPOINT_BACKENDS)})"
+    )
+
+
 class CheckpointManager:
     """Manages pipeline checkpoints for recovery.
 
     Features:
-    - Save/load checkpoint state
+    - Save/load checkpoint state (pluggable store, SQLite by default)
     - Resume from any pipeline stage
+    - Per-item journals inside long stages (audio chunks, scene images)
     - Track error history for debugging
     - Clean up old checkpoints
     """
 
-    def __init__(self, checkpoint_dir: Path) -> None:
+    def __init__(
+        self,
+        checkpoint_dir: Path,
+        backend: str = "sqlite",
+        shared_dir: Optional[Path] = None,
+    ) -> None:
         """Initialize checkpoint manager.
 
         Args:
-            checkpoint_dir: Directory for checkpoint files
+            checkpoint_dir: Directory for JSON checkpoints and item journals
+                (per job)
+            backend: Checkpoint store backend ("sqlite" or "json")
+            shared_dir: Directory of the SQLite database shared by all jobs
+                (default: checkpoint_dir)
         """
         self.checkpoint_dir = checkpoint_dir
         self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
-        logger.info(f"Checkpoint manager initialized: {checkpoint_dir}")
+
+        store_dir = checkpoint_dir
+        if backend == "sqlite" and shared_dir is not None:
+            store_dir = shared_dir
+            store_dir.mkdir(parents=True, exist_ok=True)
+        self.store = create_checkpoint_store(backend, store_dir)
+
+        # Pick up JSON checkpoints left in the job directory
+        if isinstance(self.store, SQLiteCheckpointStore) and store_dir != checkpoint_dir:
+            self.store.migrate_json_checkpoints(checkpoint_dir)
+
+        logger.info(f"Checkpoint manager initialized: {store_dir} ({backend})")
 
     def save_checkpoint(
         self,
@@ -96,38 +635,28 @@ class CheckpointManager:
             CheckpointError: If save fails
         """
         try:
-            checkpoint_path = self._get_checkpoint_path(project_id)
-
-            # Load existing checkpoint or create new one
-            if checkpoint_path.exists():
-                checkpoint = self.load_checkpoint(project_id)
-                checkpoint.current_stage = stage
-                checkpoint.updated_at = datetime.now()
-            else:
-                checkpoint = CheckpointData(
-                    project_id=project_id,
-                    current_stage=stage,
-                )
+            self.store.save_stage(project_id, stage, data)
 
-            # Update stage-specific data
-            self._update_stage_data(checkpoint, stage, data)
-
-            # Save to disk
-            checkpoint_json = checkpoint.model_dump_json(indent=2)
-            checkpoint_path.write_text(checkpoint_json)
+            # Stage output supersedes its per-item progress
+            self.get_item_journal(project_id, stage).clear()
 
             logger.info(f"Checkpoint saved: {project_id} at stage {stage.value}")
-            return checkpoint_path
+            return self._get_checkpoint_path(project_id)
 
         except Exception as e:
             logger.error(f"Failed to save checkpoint: {e}")
             raise CheckpointError(f"Failed to save checkpoint: {e}") from e
 
-    def load_checkpoint(self, project_id: str) -> CheckpointData:
+    def load_checkpoint(
+        self,
+        project_id: str,
+        stages: Optional[Iterable[PipelineStage]] = None,
+    ) -> CheckpointData:
         """Load checkpoint for project.
 
         Args:
             project_id: Project identifier
+            stages: Stages whose data to load (None = all, empty = header only)
 
         Returns:
             Checkpoint data
@@ -136,14 +665,11 @@ class CheckpointManager:
             CheckpointError: If checkpoint not found or invalid
         """
         try:
-            checkpoint_path = self._get_checkpoint_path(project_id)
+            checkpoint = self.store.load(project_id, stages)
 
-            if not checkpoint_path.exists():
+            if checkpoint is None:
                 raise CheckpointError(f"No checkpoint found for project: {project_id}")
 
-            checkpoint_json = checkpoint_path.read_text()
-            checkpoint = CheckpointData.model_validate_json(checkpoint_json)
-
             logger.info(f"Checkpoint loaded: {project_id} at stage {checkpoint.current_stage.value}")
             return checkpoint
 
@@ -162,7 +688,7 @@ class CheckpointManager:
         Returns:
             True if checkpoint exists
         """
-        return self._get_checkpoint_path(project_id).exists()
+        return self.store.exists(project_id)
 
     def delete_checkpoint(self, project_id: str) -> None:
         """Delete checkpoint for project.
@@ -170,11 +696,33 @@ class CheckpointManager:
         Args:
             project_id: Project identifier
         """
-        checkpoint_path = self._get_checkpoint_path(project_id)
-        if checkpoint_path.exists():
-            checkpoint_path.unlink()
+        self._delete_item_journals(project_id)
+        if self.store.exists(project_id):
+            self.store.delete(project_id)
             logger.info(f"Checkpoint deleted: {project_id}")
 
+    def get_item_journal(self, project_id: str, stage: PipelineStage) -> ItemJournal:
+        """Get the per-item progress journal for a stage.
+
+        Items recorded here survive a crash in the middle of the stage and
+        are discarded once the stage checkpoint itself is saved.
+
+        Args:
+            project_id: Project identifier
+            stage: Pipeline stage
+
+        Returns:
+            Item journal stored next to the checkpoint file
+        """
+        return ItemJournal(
+            self.checkpoint_dir / f"checkpoint_{project_id}.{stage.value}.journal.jsonl"
+        )
+
+    def _delete_item_journals(self, project_id: str) -> None:
+        """Delete every stage journal of a project."""
+        for stage in PipelineStage:
+            self.get_item_journal(project_id, stage).clear()
+
     def add_error(self, project_id: str, error_message: str) -> None:
         """Add error message to checkpoint history.
 
@@ -183,14 +731,7 @@ class CheckpointManager:
             error_message: Error message to record
         """
         try:
-            checkpoint = self.load_checkpoint(project_id)
-            checkpoint.error_history.append(f"{datetime.now().isoformat()}: {error_message}")
-            checkpoint.updated_at = datetime.now()
-
-            checkpoint_path = self._get_checkpoint_path(project_id)
-            checkpoint_json = checkpoint.model_dump_json(indent=2)
-            checkpoint_path.write_text(checkpoint_json)
-
+            self.store.add_error(project_id, f"{datetime.now().isoformat()}: {error_message}")
             logger.debug(f"Error added to checkpoint: {project_id}")
 
         except Exception as e:
@@ -202,11 +743,7 @@ class CheckpointManager:
         Returns:
             List of project IDs with checkpoints
         """
-        checkpoints = []
-        for path in self.checkpoint_dir.glob("checkpoint_*.json"):
-            project_id = path.stem.replace("checkpoint_", "")
-            checkpoints.append(project_id)
-        return sorted(checkpoints)
+        return self.store.list_projects()
 
     def clean_old_checkpoints(self, max_age_days: int = 7) -> int:
         """Delete checkpoints older than specified age.
@@ -217,19 +754,17 @@ class CheckpointManager:
         Returns:
             Number of checkpoints deleted
         """
-        deleted = 0
         cutoff = datetime.now().timestamp() - (max_age_days * 86400)
 
-        for path in self.checkpoint_dir.glob("checkpoint_*.json"):
-            if path.stat().st_mtime < cutoff:
-                path.unlink()
-                deleted += 1
-                logger.debug(f"Deleted old checkpoint: {path.name}")
+        deleted = self.store.delete_older_than(cutoff)
+        for project_id in deleted:
+            self._delete_item_journals(project_id)
+            logger.debug(f"Deleted old checkpoint: {project_id}")
 
-        if deleted > 0:
-            logger.info(f"Cleaned up {deleted} old checkpoints")
+        if deleted:
+            logger.info(f"Cleaned up {len(deleted)} old checkpoints")
 
-        return deleted
+        return len(deleted)
 
     def _get_checkpoint_path(self, project_id: str) -> Path:
         """Get checkpoint file path for project.
@@ -238,35 +773,40 @@ class CheckpointManager:
             project_id: Project identifier
 
         Returns:
-            Path to checkpoint file
+            Path to the project's JSON file, or the database shared by all
+            jobs for SQLite
         """
-        return self.checkpoint_dir / f"checkpoint_{project_id}.json"
+        return self.store.location(project_id)
 
-    def _update_stage_data(
-        self,
-        checkpoint: CheckpointData,
-        stage: PipelineStage,
-        data: dict[str, Any],
-    ) -> None:
-        """Update stage-specific data in checkpoint.
+    def get_completed_stages(self, checkpoint: CheckpointData) -> set[PipelineStage]:
+        """Get the set of stages already finished in a checkpoint.
+
+        Stages can finish out of order when they run concurrently, so this
+        does not rely on ``current_stage``. Checkpoints written before
+        ``completed_stages`` existed are handled by inspecting which
+        stage data fields are populated.
 
         Args:
-            checkpoint: Checkpoint object
-            stage: Pipeline stage
-            data: Data to store
-        """
-        if stage == PipelineStage.STORY_FOUND:
-            checkpoint.story_data = data
-        elif stage == PipelineStage.SCRIPT_GENERATED:
-            checkpoint.script_data = data
-        elif stage == PipelineStage.ENGAGEMENT_GENERATED:
-            checkpoint.engagement_data = data
-        elif stage == PipelineStage.AUDIO_GENERATED:
-            checkpoint.audio_data = data
-        elif stage == PipelineStage.VISUALS_GENERATED:
-            checkpoint.visual_data = data
-        elif stage == PipelineStage.VIDEO_ASSEMBLED:
-            checkpoint.video_data = data
+            checkpoint: Checkpoint data
+
+        Returns:
+            Set of completed stages
+        """
+        completed = set(checkpoint.completed_stages)
+
+        stage_data = {
+            PipelineStage.STORY_FOUND: checkpoint.story_data,
+            PipelineStage.SCRIPT_GENERATED: checkpoint.script_data,
+            PipelineStage.ENGAGEMENT_GENERATED: checkpoint.engagement_data,
+            PipelineStage.AUDIO_GENERATED: checkpoint.audio_data,
+            PipelineStage.VISUALS_GENERATED: checkpoint.visual_data,
+            PipelineStage.VIDEO_ASSEMBLED: checkpoint.video_data,
+        }
+        for stage, data in stage_data.items():
+            if data:
+                completed.add(stage)
+
+        return completed
 
     def get_next_stage(self, current_stage: PipelineStage) -> Optional[PipelineStage]:
         """Get next pipeline stage.
@@ -1,13 +1,14 @@
 """Pipeline orchestrator for end-to-end video generation.
 
-Coordinates: Story → Script → Audio → Visual → Video
+Coordinates: Story → Script → {Engagement, Audio, Visual} → Video
 """
 
 import asyncio
 import logging
+import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 from gossiptoon.agents.engagement_writer import EngagementWriter
 from gossiptoon.agents.scene_structurer import SceneStructurerAgent
@@ -19,16 +20,44 @@ from gossiptoon.audio.generator import AudioGenerator
 from gossiptoon.core.config import ConfigManager
 from gossiptoon.core.exceptions import GossipToonException
 from gossiptoon.models.audio import AudioProject
+from gossiptoon.models.engagement import EngagementProject
 from gossiptoon.models.script import Script
 from gossiptoon.models.story import Story
 from gossiptoon.models.video import VideoProject
 from gossiptoon.models.visual import VisualProject
 from gossiptoon.pipeline.checkpoint import CheckpointManager, PipelineStage
+from gossiptoon.utils.journal import ItemJournal
+from gossiptoon.utils.rate_limiter import configure_rate_limits
 from gossiptoon.video.assembler import VideoAssembler
 from gossiptoon.visual.director import VisualDirector
 
 logger = logging.getLogger(__name__)
 
+# Stage dependency graph (declaration order is a valid topological order).
+# Stages whose dependencies are all satisfied run concurrently.
+STAGE_DEPENDENCIES: dict[PipelineStage, tuple[PipelineStage, ...]] = {
+    PipelineStage.STORY_FOUND: (),
+    PipelineStage.SCRIPT_GENERATED: (PipelineStage.STORY_FOUND,),
+    PipelineStage.ENGAGEMENT_GENERATED: (PipelineStage.SCRIPT_GENERATED,),
+    PipelineStage.AUDIO_GENERATED: (PipelineStage.SCRIPT_GENERATED,),
+    PipelineStage.VISUALS_GENERATED: (PipelineStage.SCRIPT_GENERATED,),
+    PipelineStage.VIDEO_ASSEMBLED: (
+        PipelineStage.ENGAGEMENT_GENERATED,
+        PipelineStage.AUDIO_GENERATED,
+        PipelineStage.VISUALS_GENERATED,
+    ),
+}
+
+# Key under which each stage's output is stored in its checkpoint data
+STAGE_CHECKPOINT_KEYS: dict[PipelineStage, str] = {
+    PipelineStage.STORY_FOUND: "story",
+    PipelineStage.SCRIPT_GENERATED: "script",
+    PipelineStage.ENGAGEMENT_GENERATED: "engagement_project",
+    PipelineStage.AUDIO_GENERATED: "audio_project",
+    PipelineStage.VISUALS_GENERATED: "visual_project",
+    PipelineStage.VIDEO_ASSEMBLED: "video_project",
+}
+
 
 class PipelineResult:
     """Result from pipeline execution."""
@@ -66,15 +95,14 @@ class PipelineResult:
 class PipelineOrchestrator:
     """Orchestrates complete video generation pipeline.
 
-    Pipeline stages:
+    Pipeline stages (see STAGE_DEPENDENCIES):
     1. Story Finding - Discover viral Reddit content
     2. Script Writing - Generate five-act narrative
-    3. Audio Generation - TTS with emotion + timestamps
-    4. Visual Generation - 9:16 images with character consistency
-    5. Video Assembly - FFmpeg rendering with effects
+    3. Engagement / Audio / Visual Generation - run concurrently once the script exists
+    4. Video Assembly - FFmpeg rendering with effects (+ YouTube metadata)
 
     Features:
-    - Checkpoint recovery (resume from any stage)
+    - Checkpoint recovery (resume any subset of missing stages)
     - Progress tracking
     - Error handling with retry
     - Validation before execution
@@ -88,6 +116,9 @@ class PipelineOrchestrator:
         """
         self.config = config
 
+        # Apply configured API rate limits (shared by all clients in the process)
+        configure_rate_limits(config.rate_limits)
+
         # Initialize components
         self.story_finder = StoryFinderAgent(config)
 
@@ -103,7 +134,7 @@ class PipelineOrchestrator:
         self.video_assembler = VideoAssembler(config)
 
         # Checkpoint manager
-        self.checkpoint_manager = CheckpointManager(config.checkpoints_dir)
+        self.checkpoint_manager = self._create_checkpoint_manager()
 
         # Use new 3-agent workflow by default
         self.use_new_workflow = True
@@ -120,7 +151,7 @@ class PipelineOrchestrator:
 
         Args:
             story_url: Reddit story URL (for new run)
-            project_id: Project ID (for resume)
+            project_id: Project ID (required for resume, generated for new runs if omitted)
             resume: Whether to resume from checkpoint
 
         Returns:
@@ -137,25 +168,26 @@ class PipelineOrchestrator:
             # Set context before checking for checkpoint
             self.config.set_job_context(project_id)
             # Re-init checkpoint manager with new path
-            # Re-init checkpoint manager with new path
-            # Re-init checkpoint manager with new path
-            self.checkpoint_manager = CheckpointManager(self.config.checkpoints_dir)
-            print(f"DEBUG: Checking for checkpoint in: {self.config.checkpoints_dir}")
-            
-            if not self.checkpoint_manager.checkpoint_exists(project_id):
-                path = self.checkpoint_manager._get_checkpoint_path(project_id)
-                print(f"DEBUG: Checkpoint not found at: {path}")
-                print(f"DEBUG: File exists? {path.exists()}")
-                raise GossipToonException(f"No checkpoint found for project: {project_id} in {self.config.checkpoints_dir}")
+            self.checkpoint_manager = self._create_checkpoint_manager()
+            store_path = self.checkpoint_manager._get_checkpoint_path(project_id)
+            found = self.checkpoint_manager.checkpoint_exists(project_id)
+            logger.debug(
+                f"Checkpoint for {project_id} in {store_path}: {'found' if found else 'missing'}"
+            )
+
+            if not found:
+                raise GossipToonException(
+                    f"No checkpoint found for project: {project_id} in {store_path}"
+                )
         else:
             if not story_url:
                 raise GossipToonException("story_url required for new run")
-            project_id = self._generate_project_id()
-            
+            project_id = project_id or self._generate_project_id()
+
             # Set context for new run
             self.config.set_job_context(project_id)
             # Re-init checkpoint manager with new path
-            self.checkpoint_manager = CheckpointManager(self.config.checkpoints_dir)
+            self.checkpoint_manager = self._create_checkpoint_manager()
 
         logger.info(f"Starting pipeline: {project_id} (resume={resume})")
 
@@ -164,136 +196,61 @@ class PipelineOrchestrator:
 
         try:
             # Resume from checkpoint or start fresh
+            artifacts: dict[PipelineStage, Any] = {}
+            done: set[PipelineStage] = set()
+
             if resume:
                 checkpoint = self.checkpoint_manager.load_checkpoint(project_id)
-                start_stage = checkpoint.current_stage
-                logger.info(f"Resuming from stage: {start_stage.value}")
-
-
-                # Load cached data from checkpoint
-                story = self._load_story_from_checkpoint(checkpoint) if checkpoint.story_data else None
-                script = self._load_script_from_checkpoint(checkpoint) if checkpoint.script_data else None
-                audio_project = (
-                    self._load_audio_from_checkpoint(checkpoint) if checkpoint.audio_data else None
-                )
-                visual_project = (
-                    self._load_visual_from_checkpoint(checkpoint) if checkpoint.visual_data else None
-                )
-            else:
-                start_stage = PipelineStage.INITIALIZED
-                story = None
-                script = None
-                audio_project = None
-                visual_project = None
-
-            # Stage 1: Story Finding
-            if self._should_run_stage(start_stage, PipelineStage.STORY_FOUND):
-                logger.info("Stage 1: Finding story...")
-                story = await self._run_story_finder(story_url)
-                completed_stages.append(PipelineStage.STORY_FOUND)
-                self.checkpoint_manager.save_checkpoint(
-                    project_id,
-                    PipelineStage.STORY_FOUND,
-                    {"story": story.model_dump()},
-                )
-
-            # Stage 2: Script Writing
-            if self._should_run_stage(start_stage, PipelineStage.SCRIPT_GENERATED):
-                logger.info("Stage 2: Generating script...")
-                if not story:
-                    raise GossipToonException("Story not available for script generation")
-                script = await self._run_script_writer(story)
-                completed_stages.append(PipelineStage.SCRIPT_GENERATED)
-                self.checkpoint_manager.save_checkpoint(
-                    project_id,
-                    PipelineStage.SCRIPT_GENERATED,
-                    {"script": script.model_dump()},
+                done = self.checkpoint_manager.get_completed_stages(checkpoint)
+                logger.info(
+                    f"Resuming from stage: {checkpoint.current_stage.value} "
+                    f"(completed: {sorted(s.value for s in done)})"
                 )
 
-            # Stage 2.5: Engagement Hook Generation
-            engagement_project = None
-            if self._should_run_stage(start_stage, PipelineStage.ENGAGEMENT_GENERATED):
-                logger.info("="*60)
-                logger.info("Stage 2.5: Generating engagement hooks...")
-                logger.info("="*60)
-                if not script:
-                    raise GossipToonException("Script not available for engagement generation")
-                logger.info(f"Calling EngagementWriter with script: {script.get_scene_count()} scenes")
-                engagement_project = await self._run_engagement_writer(script)
-                logger.info(f"EngagementWriter completed successfully!")
-                completed_stages.append(PipelineStage.ENGAGEMENT_GENERATED)
-                self.checkpoint_manager.save_checkpoint(
-                    project_id,
-                    PipelineStage.ENGAGEMENT_GENERATED,
-                    {"engagement_project": engagement_project.model_dump()},
-                )
-                logger.info(f"Engagement checkpoint saved")
-
-            # Stage 3: Audio Generation
-            if self._should_run_stage(start_stage, PipelineStage.AUDIO_GENERATED):
-                logger.info("Stage 3: Generating audio...")
-                if not script:
-                    raise GossipToonException("Script not available for audio generation")
-                audio_project = await self._run_audio_generator(script)
-                completed_stages.append(PipelineStage.AUDIO_GENERATED)
-                self.checkpoint_manager.save_checkpoint(
-                    project_id,
-                    PipelineStage.AUDIO_GENERATED,
-                    {"audio_project": audio_project.model_dump()},
-                )
-
-            # Stage 4: Visual Generation
-            if self._should_run_stage(start_stage, PipelineStage.VISUALS_GENERATED):
-                logger.info("Stage 4: Generating visuals...")
-                if not script:
-                    raise GossipToonException("Script not available for visual generation")
-                visual_project = await self._run_visual_director(script)
-                completed_stages.append(PipelineStage.VISUALS_GENERATED)
+                # Load cached data from checkpoint
+                loaders = {
+                    PipelineStage.STORY_FOUND: self._load_story_from_checkpoint,
+                    PipelineStage.SCRIPT_GENERATED: self._load_script_from_checkpoint,
+                    PipelineStage.ENGAGEMENT_GENERATED: self._load_engagement_from_checkpoint,
+                    PipelineStage.AUDIO_GENERATED: self._load_audio_from_checkpoint,
+                    PipelineStage.VISUALS_GENERATED: self._load_visual_from_checkpoint,
+                    PipelineStage.VIDEO_ASSEMBLED: self._load_video_from_checkpoint,
+                }
+                for stage, loader in loaders.items():
+                    if stage in done:
+                        artifacts[stage] = loader(checkpoint)
+
+            # Schedule every missing stage; each waits only on its own dependencies
+            tasks: dict[PipelineStage, asyncio.Task] = {}
+
+            async def run_stage(stage: PipelineStage) -> None:
+                for dependency in STAGE_DEPENDENCIES[stage]:
+                    if dependency in tasks:
+                        await tasks[dependency]
+
+                result = await self._execute_stage(stage, story_url, artifacts, project_id)
+                artifacts[stage] = result
+
+                completed_stages.append(stage)
                 self.checkpoint_manager.save_checkpoint(
                     project_id,
-                    PipelineStage.VISUALS_GENERATED,
-                    {"visual_project": visual_project.model_dump()},
+                    stage,
+                    {STAGE_CHECKPOINT_KEYS[stage]: result.model_dump()},
                 )
 
-            # Stage 5: Assembly (Video) & Metadata
-            if self._should_run_stage(start_stage, PipelineStage.VIDEO_ASSEMBLED):
-                logger.info("Stage 5: Assembling video & Generating metadata...")
-                if not visual_project or not audio_project:
-                    raise GossipToonException("Visual/Audio projects not available for video assembly")
-                
-                # Run parallel tasks: Video Assembly + Metadata Generation
-                video_task = self._run_video_assembler(
-                    visual_project, 
-                    audio_project,
-                    script,
-                    engagement_project=engagement_project
-                )
-                
-                metadata_task = self._run_metadata_generator(story, script)
-                
-                # Execute concurrently
-                results = await asyncio.gather(video_task, metadata_task, return_exceptions=True)
-                
-                video_project = results[0]
-                metadata = results[1]
-                
-                # Check for video failure
-                if isinstance(video_project, Exception):
-                    raise video_project
+            for stage in STAGE_DEPENDENCIES:
+                if stage not in done:
+                    tasks[stage] = asyncio.create_task(run_stage(stage), name=stage.value)
 
-                # Log metadata status
-                if isinstance(metadata, Exception):
-                    logger.warning(f"Metadata generation failed: {metadata}")
-                else:
-                    logger.info("Metadata generation completed successfully")
+            if tasks:
+                # Let independent stages finish (and checkpoint) even if a sibling fails,
+                # so a resume only has to redo the stages that are actually missing.
+                results = await asyncio.gather(*tasks.values(), return_exceptions=True)
+                errors = [r for r in results if isinstance(r, BaseException)]
+                if errors:
+                    raise errors[0]
 
-                completed_stages.append(PipelineStage.VIDEO_ASSEMBLED)
-                
-                self.checkpoint_manager.save_checkpoint(
-                    project_id,
-                    PipelineStage.VIDEO_ASSEMBLED,
-                    {"video_project": video_project.model_dump()},
-                )
+            video_project = artifacts.get(PipelineStage.VIDEO_ASSEMBLED)
 
             # Mark as completed
             self.checkpoint_manager.save_checkpoint(
@@ -323,6 +280,98 @@ class PipelineOrchestrator:
                 completed_stages=completed_stages,
             )
 
+    async def _execute_stage(
+        self,
+        stage: PipelineStage,
+        story_url: Optional[str],
+        artifacts: dict[PipelineStage, Any],
+        project_id: Optional[str] = None,
+    ) -> Any:
+        """Execute a single pipeline stage from its dependencies' outputs.
+
+        Args:
+            stage: Stage to execute
+            story_url: Reddit story URL (only needed for story finding)
+            artifacts: Outputs of already completed stages
+            project_id: Project identifier; when given, long stages record
+                finished items in a per-stage journal so a resume only
+                regenerates the missing ones
+
+        Returns:
+            Stage output model
+
+        Raises:
+            GossipToonException: If a required input is missing
+        """
+        story = artifacts.get(PipelineStage.STORY_FOUND)
+        script = artifacts.get(PipelineStage.SCRIPT_GENERATED)
+
+        if stage == PipelineStage.STORY_FOUND:
+            logger.info("Stage 1: Finding story...")
+            if not story_url:
+                raise GossipToonException("story_url required for story finding")
+            return await self._run_story_finder(story_url)
+
+        if stage == PipelineStage.SCRIPT_GENERATED:
+            logger.info("Stage 2: Generating script...")
+            if not story:
+                raise GossipToonException("Story not available for script generation")
+            return await self._run_script_writer(story)
+
+        if not script:
+            raise GossipToonException(f"Script not available for stage: {stage.value}")
+
+        journal = (
+            self.checkpoint_manager.get_item_journal(project_id, stage) if project_id else None
+        )
+
+        if stage == PipelineStage.ENGAGEMENT_GENERATED:
+            logger.info("Stage 3a: Generating engagement hooks...")
+            engagement_project = await self._run_engagement_writer(script)
+            logger.info("Engagement hooks complete")
+            return engagement_project
+
+        if stage == PipelineStage.AUDIO_GENERATED:
+            logger.info("Stage 3b: Generating audio...")
+            return await self._run_audio_generator(script, journal=journal)
+
+        if stage == PipelineStage.VISUALS_GENERATED:
+            logger.info("Stage 3c: Generating visuals...")
+            return await self._run_visual_director(script, journal=journal)
+
+        if stage == PipelineStage.VIDEO_ASSEMBLED:
+            logger.info("Stage 4: Assembling video & Generating metadata...")
+            visual_project = artifacts.get(PipelineStage.VISUALS_GENERATED)
+            audio_project = artifacts.get(PipelineStage.AUDIO_GENERATED)
+            if not visual_project or not audio_project:
+                raise GossipToonException("Visual/Audio projects not available for video assembly")
+
+            # Run parallel tasks: Video Assembly + Metadata Generation
+            video_task = self._run_video_assembler(
+                visual_project,
+                audio_project,
+                script,
+                engagement_project=artifacts.get(PipelineStage.ENGAGEMENT_GENERATED),
+            )
+            metadata_task = self._run_metadata_generator(story, script)
+
+            results = await asyncio.gather(video_task, metadata_task, return_exceptions=True)
+            video_project, metadata = results
+
+            # Check for video failure
+            if isinstance(video_project, Exception):
+                raise video_project
+
+            # Log metadata status
+            if isinstance(metadata, Exception):
+                logger.warning(f"Metadata generation failed: {metadata}")
+            else:
+                logger.info("Metadata generation completed successfully")
+
+            return video_project
+
+        raise GossipToonException(f"Unknown pipeline stage: {stage.value}")
+
     async def validate_setup(self) -> dict[str, bool]:
         """Validate pipeline setup and API keys.
 
@@ -495,7 +544,7 @@ class PipelineOrchestrator:
             logger.info(f"Script generated: {len(script.acts)} acts, {script.get_scene_count()} scenes")
             return script
 
-    async def _run_engagement_writer(self, script: Script):
+    async def _run_engagement_writer(self, script: Script) -> EngagementProject:
         """Run engagement writer stage.
 
         Args:
@@ -504,8 +553,6 @@ class PipelineOrchestrator:
         Returns:
             EngagementProject object
         """
-        from gossiptoon.models.engagement import EngagementProject
-
         engagement_project = await self.engagement_writer.generate_engagement_hooks(script)
         logger.info(
             f"Engagement hooks generated: {len(engagement_project.hooks)} hooks - "
@@ -513,16 +560,19 @@ class PipelineOrchestrator:
         )
         return engagement_project
 
-    async def _run_audio_generator(self, script: Script) -> AudioProject:
+    async def _run_audio_generator(
+        self, script: Script, journal: Optional[ItemJournal] = None
+    ) -> AudioProject:
         """Run audio generator stage.
 
         Args:
             script: Script object
+            journal: Optional per-chunk progress journal
 
         Returns:
             AudioProject object
         """
-        audio_project = await self.audio_generator.generate_audio_project(script)
+        audio_project = await self.audio_generator.generate_audio_project(script, journal=journal)
         logger.info(f"Audio generated: {audio_project.total_duration:.1f}s")
         
         # Overlay SFX if scenes have visual_sfx
@@ -540,7 +590,7 @@ class PipelineOrchestrator:
         Returns:
             AudioProject with SFX-mixed master audio
         """
-        from gossiptoon.audio.sfx_mapper import SFXMapper
+        from gossiptoon.audio.sfx_library import get_sfx_library
         from gossiptoon.audio.sfx_mixer import AudioSFXMixer
 
         # Group segments by scene_id first
@@ -550,7 +600,8 @@ class PipelineOrchestrator:
         for segment in audio_project.segments:
             segments_by_scene[segment.scene_id].append(segment)
         
-        # Collect SFX to overlay
+        # Collect SFX to overlay (library is shared by all jobs in the process)
+        library = get_sfx_library(self.config.cache_dir / "sfx")
         sfx_list = []
         current_offset = 0.0
 
@@ -562,16 +613,15 @@ class PipelineOrchestrator:
             # Check if scene has visual SFX
             if hasattr(scene, 'visual_sfx') and scene.visual_sfx:
                 # Map SFX keyword to audio file
-                mapper = SFXMapper()
                 sfx_key = scene.visual_sfx.upper().strip()
                 
                 # Check if it's a known Audio SFX keyword
                 # This decouples "Visual Text" (e.g. "AITA?") from "Audio Cues" (e.g. "BAM!")
-                if sfx_key in mapper.list_available_sfx():
+                if sfx_key in library.list_keywords():
                     logger.info(f"Scene {scene.scene_id} has Audio SFX: {scene.visual_sfx}")
-                    sfx_path = mapper.get_sfx_path(scene.visual_sfx)
+                    sfx_path = library.get_path(scene.visual_sfx)
                     
-                    if sfx_path and sfx_path.exists():
+                    if sfx_path:
                         sfx_list.append((sfx_path, current_offset))
                         logger.info(f"  → Mapped to: {sfx_path.name} at {current_offset:.2f}s")
                     else:
@@ -587,14 +637,17 @@ class PipelineOrchestrator:
         if sfx_list:
             logger.info(f"Applying {len(sfx_list)} SFX overlays to master audio...")
             
-            mixer = AudioSFXMixer(sfx_volume=0.8)  # 80% volume - increased for better audibility
+            # 80% volume - increased for better audibility
+            mixer = AudioSFXMixer(sfx_volume=0.8, library=library)
             master_audio_path = audio_project.master_audio_path
             
             # Create mixed audio with all SFX
             mixed_audio_path = mixer.overlay_multiple_sfx(
                 master_audio_path,
                 sfx_list,
-                output_path=master_audio_path.with_name(master_audio_path.stem + "_with_sfx.mp3")
+                output_path=master_audio_path.with_name(
+                    master_audio_path.stem + "_with_sfx" + master_audio_path.suffix
+                ),
             )
             
             # Update audio project to use mixed audio
@@ -605,16 +658,19 @@ class PipelineOrchestrator:
         
         return audio_project
 
-    async def _run_visual_director(self, script: Script) -> VisualProject:
+    async def _run_visual_director(
+        self, script: Script, journal: Optional[ItemJournal] = None
+    ) -> VisualProject:
         """Run visual director stage.
 
         Args:
             script: Script object
+            journal: Optional per-scene progress journal
 
         Returns:
             VisualProject object
         """
-        visual_project = await self.visual_director.create_visual_project(script)
+        visual_project = await self.visual_director.create_visual_project(script, journal=journal)
         logger.info(f"Visuals generated: {len(visual_project.assets)} images")
         return visual_project
 
@@ -623,7 +679,7 @@ class PipelineOrchestrator:
         visual_project: VisualProject,
         audio_project: AudioProject,
         script: Script,
-        engagement_project=None,  # Optional EngagementProject
+        engagement_project: Optional[EngagementProject] = None,
     ) -> VideoProject:
         """Run video assembler stage.
 
@@ -675,14 +731,31 @@ class PipelineOrchestrator:
 
         return target_idx > current_idx
 
-    def _generate_project_id(self) -> str:
+    def _create_checkpoint_manager(self) -> CheckpointManager:
+        """Create a checkpoint manager for the current job context.
+
+        JSON checkpoints and item journals live in the job's directory; the
+        SQLite database is shared by every job under the base output directory.
+
+        Returns:
+            Checkpoint manager
+        """
+        return CheckpointManager(
+            self.config.checkpoints_dir,
+            backend=self.config.app.checkpoint_backend,
+            shared_dir=self.config.shared_checkpoints_dir,
+        )
+
+    @staticmethod
+    def _generate_project_id() -> str:
         """Generate unique project ID.
 
         Returns:
             Project ID string
         """
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        return f"project_{timestamp}"
+        # Random suffix keeps IDs unique when batch jobs start in the same second
+        return f"project_{timestamp}_{uuid.uuid4().hex[:6]}"
 
     def _load_story_from_checkpoint(self, checkpoint) -> Optional[Story]:
         """Load story from checkpoint data.
@@ -710,6 +783,19 @@ class PipelineOrchestrator:
             return Script.model_validate(checkpoint.script_data["script"])
         return None
 
+    def _load_engagement_from_checkpoint(self, checkpoint) -> Optional[EngagementProject]:
+        """Load engagement project from checkpoint data.
+
+        Args:
+            checkpoint: Checkpoint data
+
+        Returns:
+            EngagementProject object or None
+        """
+        if checkpoint.engagement_data and "engagement_project" in checkpoint.engagement_data:
+            return EngagementProject.model_validate(checkpoint.engagement_data["engagement_project"])
+        return None
+
     def _load_audio_from_checkpoint(self, checkpoint) -> Optional[AudioProject]:
         """Load audio project from checkpoint data.
 
@@ -736,6 +822,19 @@ class PipelineOrchestrator:
             return VisualProject.model_validate(checkpoint.visual_data["visual_project"])
         return None
 
+    def _load_video_from_checkpoint(self, checkpoint) -> Optional[VideoProject]:
+        """Load video project from checkpoint data.
+
+        Args:
+            checkpoint: Checkpoint data
+
+        Returns:
+            VideoProject object or None
+        """
+        if checkpoint.video_data and "video_project" in checkpoint.video_data:
+            return VideoProject.model_validate(checkpoint.video_data["video_project"])
+        return None
+
     async def _run_metadata_generator(self, story: Story, script: Script):
         """Run metadata generator stage.
         
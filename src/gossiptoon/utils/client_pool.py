@@ -0,0 +1,77 @@
+"""Process-wide pool of provider SDK clients.
+
+SDK clients hold HTTP connection pools, so creating one per request (or per
+wrapper instance) throws away keep-alive connections and TLS sessions. The
+helpers here hand out one client per provider and credential set for the
+lifetime of the process; all wrappers for the same provider share it.
+"""
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Hashable
+
+logger = logging.getLogger(__name__)
+
+_clients: dict[tuple[str, Hashable], Any] = {}
+_clients_lock = threading.Lock()
+
+_executors: dict[str, ThreadPoolExecutor] = {}
+_executors_lock = threading.Lock()
+
+
+def get_pooled_client(kind: str, key: Hashable, factory: Callable[[], Any]) -> Any:
+    """Get (or create) the shared client for a provider and credential set.
+
+    Args:
+        kind: Client kind (e.g. "genai", "elevenlabs_async")
+        key: Credential identity (API key or tuple of credentials)
+        factory: Zero-argument callable that builds the client on first use
+
+    Returns:
+        Shared client instance
+    """
+    with _clients_lock:
+        client = _clients.get((kind, key))
+        if client is None:
+            client = factory()
+            _clients[(kind, key)] = client
+            logger.debug(f"Created pooled {kind} client")
+        return client
+
+
+def get_genai_client(api_key: str) -> Any:
+    """Get the shared Google GenAI client for an API key.
+
+    The same client serves both the blocking (``client.models``) and the
+    async (``client.aio.models``) interfaces.
+
+    Args:
+        api_key: Google API key
+
+    Returns:
+        google.genai.Client instance
+    """
+    from google import genai
+
+    return get_pooled_client("genai", api_key, lambda: genai.Client(api_key=api_key))
+
+
+def get_dedicated_executor(name: str) -> ThreadPoolExecutor:
+    """Get a single-worker executor reserved for one non-thread-safe SDK.
+
+    Work submitted here runs off the event loop but strictly one call at a
+    time, which is what SDKs such as PRAW require.
+
+    Args:
+        name: Executor name (also used as the worker thread prefix)
+
+    Returns:
+        Shared single-thread executor
+    """
+    with _executors_lock:
+        executor = _executors.get(name)
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=name)
+            _executors[name] = executor
+        return executor
@@ -0,0 +1,110 @@
+"""Append-only journal of finished work items.
+
+Long stages (TTS chunks, scene images) record each item as soon as it
+completes, so an interrupted stage can be resumed without redoing the items
+that already finished. Each line is one JSON record::
+
+    {"item_id": "...", "fingerprint": "...", "data": {...}}
+
+Later records for the same item win. A torn final line (crash mid-write) is
+discarded on load. Fingerprints hash the item's inputs, so a record is only
+reused while the inputs that produced it are unchanged.
+"""
+
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ItemJournal:
+    """Per-item progress journal backed by a JSON Lines file."""
+
+    def __init__(self, path: Path) -> None:
+        """Initialize item journal.
+
+        Args:
+            path: Journal file (created on first record)
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._records: Optional[dict[str, dict[str, Any]]] = None
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        """Read the journal on first use (caller holds the lock)."""
+        if self._records is not None:
+            return self._records
+
+        records: dict[str, dict[str, Any]] = {}
+        if self.path.exists():
+            content = self.path.read_bytes()
+
+            # Drop a torn final line so new records start on a fresh line
+            if content and not content.endswith(b"\n"):
+                logger.warning(f"Discarding incomplete last record in {self.path}")
+                content = content[: content.rfind(b"\n") + 1]
+                with open(self.path, "r+b") as f:
+                    f.truncate(len(content))
+
+            for line_number, line in enumerate(content.decode("utf-8").splitlines(), start=1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                    records[record["item_id"]] = record
+                except (json.JSONDecodeError, KeyError, TypeError):
+                    logger.warning(f"Skipping corrupt journal line {line_number} in {self.path}")
+
+        self._records = records
+        return records
+
+    def record(self, item_id: str, data: dict[str, Any], fingerprint: str = "") -> None:
+        """Append a finished item.
+
+        Args:
+            item_id: Item identifier (chunk or scene ID)
+            data: JSON-serializable item result
+            fingerprint: Hash of the item's inputs
+        """
+        record = {"item_id": item_id, "fingerprint": fingerprint, "data": data}
+        line = json.dumps(record, default=str, ensure_ascii=False)
+
+        with self._lock:
+            records = self._load()
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            records[item_id] = record
+
+    def get(self, item_id: str, fingerprint: str = "") -> Optional[dict[str, Any]]:
+        """Get a recorded item if its inputs are unchanged.
+
+        Args:
+            item_id: Item identifier
+            fingerprint: Hash of the item's current inputs
+
+        Returns:
+            Recorded item data, or None if missing or stale
+        """
+        with self._lock:
+            record = self._load().get(item_id)
+        if record is None or record["fingerprint"] != fingerprint:
+            return None
+        return record["data"]
+
+    def item_ids(self) -> list[str]:
+        """Get IDs of all recorded items."""
+        with self._lock:
+            return sorted(self._load())
+
+    def clear(self) -> None:
+        """Delete the journal."""
+        with self._lock:
+            self.path.unlink(missing_ok=True)
+            self._records = {}
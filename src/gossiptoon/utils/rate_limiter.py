@@ -0,0 +1,433 @@
+"""Process-wide, provider-aware rate limiting for external APIs.
+
+One limiter exists per (provider, model) pair and is shared by every client,
+agent and concurrent job in the process. Each limiter enforces any of:
+
+- ``rpm``: requests per rolling 60 second window
+- ``tpm``: tokens per rolling 60 second window, from usage that callers
+  report (LangChain models report it through ``get_token_usage_callback``)
+- ``max_concurrent``: requests in flight at once
+
+On a 429 / RESOURCE_EXHAUSTED response callers report back via
+``report_rate_limited``; the limiter then pauses all requests for a cooldown
+and halves its effective RPM, recovering one RPM per successful request.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Mapping, Optional
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import LLMResult
+from langchain_core.rate_limiters import BaseRateLimiter
+
+from gossiptoon.core.constants import DEFAULT_RATE_LIMITS
+
+logger = logging.getLogger(__name__)
+
+WINDOW_SECONDS = 60.0
+INITIAL_COOLDOWN_SECONDS = 5.0
+MAX_COOLDOWN_SECONDS = 60.0
+
+
+class RateLimiter:
+    """Sliding-window rate limiter with concurrency cap and 429 adaptation.
+
+    Window bookkeeping is guarded by a thread lock (critical sections never
+    await), so the same limiter can be used from coroutines and worker threads.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        rpm: Optional[int] = None,
+        tpm: Optional[int] = None,
+        max_concurrent: Optional[int] = None,
+    ) -> None:
+        """Initialize rate limiter.
+
+        Args:
+            name: Limiter name for logging (e.g., "google_tts:gemini-2.5-flash-preview-tts")
+            rpm: Requests per minute (None = unlimited)
+            tpm: Tokens per minute (None = unlimited)
+            max_concurrent: Maximum in-flight requests (None = unlimited)
+        """
+        self.name = name
+        self._lock = threading.Lock()
+        self._requests: deque[float] = deque()
+        self._tokens: deque[tuple[float, int]] = deque()
+        self._cooldown_until = 0.0
+        self._consecutive_limits = 0
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._semaphore_stale = False
+        self._in_flight = 0
+        self.rpm = rpm
+        self.tpm = tpm
+        self.max_concurrent = max_concurrent
+        self._effective_rpm = float(rpm) if rpm else None
+
+    def configure(
+        self,
+        rpm: Optional[int] = None,
+        tpm: Optional[int] = None,
+        max_concurrent: Optional[int] = None,
+    ) -> None:
+        """Update limits.
+
+        Unchanged settings are a no-op, so every job can apply its config.
+        A learned 429 slow-down is kept (capped at the new RPM), and a new
+        ``max_concurrent`` takes effect once the requests holding the
+        current semaphore have finished.
+
+        Args:
+            rpm: Requests per minute (None = unlimited)
+            tpm: Tokens per minute (None = unlimited)
+            max_concurrent: Maximum in-flight requests (None = unlimited)
+        """
+        with self._lock:
+            if rpm != self.rpm:
+                if not rpm:
+                    self._effective_rpm = None
+                elif self._effective_rpm is None:
+                    self._effective_rpm = float(rpm)
+                else:
+                    self._effective_rpm = min(self._effective_rpm, float(rpm))
+                self.rpm = rpm
+            self.tpm = tpm
+            if max_concurrent != self.max_concurrent:
+                self.max_concurrent = max_concurrent
+                self._semaphore_stale = True
+
+    @property
+    def effective_rpm(self) -> Optional[float]:
+        """Current RPM after adaptive slow-down (None = unlimited)."""
+        return self._effective_rpm
+
+    def _reserve(self, tokens: int) -> float:
+        """Reserve a request slot if quota allows.
+
+        Args:
+            tokens: Tokens the request is expected to consume
+
+        Returns:
+            0.0 if reserved, otherwise seconds to wait before trying again
+        """
+        with self._lock:
+            now = time.monotonic()
+            cutoff = now - WINDOW_SECONDS
+
+            while self._requests and self._requests[0] <= cutoff:
+                self._requests.popleft()
+            while self._tokens and self._tokens[0][0] <= cutoff:
+                self._tokens.popleft()
+
+            waits = [self._cooldown_until - now]
+
+            if self._effective_rpm is not None:
+                allowed = max(1, int(self._effective_rpm))
+                if len(self._requests) >= allowed:
+                    waits.append(self._requests[len(self._requests) - allowed] + WINDOW_SECONDS - now)
+
+            if self.tpm is not None and self._tokens:
+                # Requests of unknown size still need room for one token
+                needed = max(tokens, 1)
+                used = sum(t for _, t in self._tokens)
+                if used + needed > self.tpm:
+                    # Wait until enough old usage leaves the window
+                    excess = used + needed - self.tpm
+                    freed = 0
+                    for stamp, amount in self._tokens:
+                        freed += amount
+                        if freed >= excess:
+                            waits.append(stamp + WINDOW_SECONDS - now)
+                            break
+
+            wait = max(waits)
+            if wait > 0:
+                return wait
+
+            self._requests.append(now)
+            if tokens > 0:
+                self._tokens.append((now, tokens))
+            return 0.0
+
+    def _get_semaphore(self) -> Optional[asyncio.Semaphore]:
+        """Get the concurrency semaphore for the running event loop.
+
+        A semaphore that requests still hold is never replaced: after a
+        ``max_concurrent`` change it stays in use until it drains.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            replace = (
+                self._semaphore is None
+                or self._semaphore_loop is not loop
+                or (self._semaphore_stale and self._in_flight == 0)
+            )
+            if replace:
+                if not self.max_concurrent:
+                    self._semaphore = None
+                    self._semaphore_loop = None
+                else:
+                    self._semaphore = asyncio.Semaphore(self.max_concurrent)
+                    self._semaphore_loop = loop
+                self._semaphore_stale = False
+            return self._semaphore
+
+    async def wait_for_quota(self, tokens: int = 0) -> None:
+        """Wait until a request fits in the RPM/TPM windows and record it.
+
+        Args:
+            tokens: Tokens the request is expected to consume
+        """
+        while True:
+            wait = self._reserve(tokens)
+            if wait <= 0:
+                return
+            logger.debug(f"Rate limiter {self.name}: waiting {wait:.2f}s")
+            await asyncio.sleep(wait)
+
+    def wait_for_quota_sync(self, tokens: int = 0) -> None:
+        """Blocking variant of ``wait_for_quota`` for synchronous callers.
+
+        Args:
+            tokens: Tokens the request is expected to consume
+        """
+        while True:
+            wait = self._reserve(tokens)
+            if wait <= 0:
+                return
+            time.sleep(wait)
+
+    @asynccontextmanager
+    async def slot(self, tokens: int = 0) -> AsyncIterator[None]:
+        """Hold a request slot for the duration of an API call.
+
+        Example:
+            async with limiter.slot():
+                response = await client.generate(...)
+
+        Args:
+            tokens: Tokens the request is expected to consume
+        """
+        semaphore = self._get_semaphore()
+        with self._lock:
+            self._in_flight += 1
+        try:
+            if semaphore is not None:
+                await semaphore.acquire()
+            try:
+                await self.wait_for_quota(tokens)
+                yield
+            finally:
+                if semaphore is not None:
+                    semaphore.release()
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    def record_usage(self, tokens: int) -> None:
+        """Record tokens consumed by a completed request (counts toward TPM).
+
+        Args:
+            tokens: Tokens actually consumed
+        """
+        if tokens <= 0:
+            return
+        with self._lock:
+            self._tokens.append((time.monotonic(), tokens))
+
+    def report_rate_limited(self, retry_after: Optional[float] = None) -> None:
+        """Adapt to a 429 response: pause all requests and halve effective RPM.
+
+        Args:
+            retry_after: Server-provided retry delay in seconds, if any
+        """
+        with self._lock:
+            self._consecutive_limits += 1
+            cooldown = retry_after or min(
+                INITIAL_COOLDOWN_SECONDS * 2 ** (self._consecutive_limits - 1),
+                MAX_COOLDOWN_SECONDS,
+            )
+            self._cooldown_until = max(self._cooldown_until, time.monotonic() + cooldown)
+
+            if self._effective_rpm is not None:
+                self._effective_rpm = max(1.0, self._effective_rpm / 2)
+
+        logger.warning(
+            f"Rate limited by {self.name}: cooling down {cooldown:.1f}s "
+            f"(effective rpm: {self._effective_rpm or 'unlimited'})"
+        )
+
+    def report_success(self) -> None:
+        """Record a successful request, gradually restoring the configured RPM."""
+        with self._lock:
+            self._consecutive_limits = 0
+            if self._effective_rpm is not None and self.rpm:
+                self._effective_rpm = min(float(self.rpm), self._effective_rpm + 1)
+
+
+class LangChainRateLimiter(BaseRateLimiter):
+    """Adapter exposing a shared RateLimiter to LangChain chat models.
+
+    LangChain only calls ``acquire`` before a request (there is no release),
+    so this enforces RPM and cooldowns but not ``max_concurrent``. Request
+    sizes are unknown up front; TPM is enforced from the usage reported by
+    ``TokenUsageCallback``.
+    """
+
+    def __init__(self, limiter: RateLimiter) -> None:
+        """Initialize adapter.
+
+        Args:
+            limiter: Shared limiter to draw quota from
+        """
+        self.limiter = limiter
+
+    def acquire(self, *, blocking: bool = True) -> bool:
+        """Acquire quota for one request (sync)."""
+        if not blocking:
+            return self.limiter._reserve(0) <= 0
+        self.limiter.wait_for_quota_sync()
+        return True
+
+    async def aacquire(self, *, blocking: bool = True) -> bool:
+        """Acquire quota for one request (async)."""
+        if not blocking:
+            return self.limiter._reserve(0) <= 0
+        await self.limiter.wait_for_quota()
+        return True
+
+
+class TokenUsageCallback(BaseCallbackHandler):
+    """Reports LangChain chat model token usage to a shared RateLimiter."""
+
+    def __init__(self, limiter: RateLimiter) -> None:
+        """Initialize callback.
+
+        Args:
+            limiter: Shared limiter to record usage on
+        """
+        self.limiter = limiter
+
+    def on_llm_end(self, response: LLMResult, **kwargs: Any) -> None:
+        """Record the total tokens of a finished request."""
+        self.limiter.record_usage(llm_result_tokens(response))
+
+
+def llm_result_tokens(response: LLMResult) -> int:
+    """Total tokens (prompt + completion) of a LangChain result.
+
+    Args:
+        response: Result passed to ``on_llm_end``
+
+    Returns:
+        Token count (0 if the provider did not report usage)
+    """
+    total = 0
+    for generations in response.generations:
+        for generation in generations:
+            usage = getattr(getattr(generation, "message", None), "usage_metadata", None)
+            if usage:
+                total += usage.get("total_tokens", 0)
+    if total:
+        return total
+
+    usage = (response.llm_output or {}).get("usage_metadata") or {}
+    return usage.get("total_tokens", 0)
+
+
+_registry: dict[str, RateLimiter] = {}
+_settings: dict[str, dict[str, Any]] = {key: dict(value) for key, value in DEFAULT_RATE_LIMITS.items()}
+_registry_lock = threading.Lock()
+
+
+def _resolve_settings(provider: str, model: Optional[str]) -> dict[str, Any]:
+    """Find limits for a provider/model ("provider:model" wins over "provider")."""
+    if model and f"{provider}:{model}" in _settings:
+        return _settings[f"{provider}:{model}"]
+    return _settings.get(provider, {})
+
+
+def get_rate_limiter(provider: str, model: Optional[str] = None) -> RateLimiter:
+    """Get the shared rate limiter for a provider/model.
+
+    Args:
+        provider: Provider key (e.g., "google_tts", "gemini_image", "elevenlabs", "gemini_llm")
+        model: Optional model name (limits are tracked per model)
+
+    Returns:
+        Process-wide RateLimiter instance
+    """
+    key = f"{provider}:{model}" if model else provider
+    with _registry_lock:
+        limiter = _registry.get(key)
+        if limiter is None:
+            limiter = RateLimiter(key, **_resolve_settings(provider, model))
+            _registry[key] = limiter
+        return limiter
+
+
+def get_langchain_rate_limiter(provider: str, model: Optional[str] = None) -> LangChainRateLimiter:
+    """Get a LangChain-compatible view of the shared rate limiter.
+
+    Args:
+        provider: Provider key
+        model: Optional model name
+
+    Returns:
+        LangChainRateLimiter wrapping the shared limiter
+    """
+    return LangChainRateLimiter(get_rate_limiter(provider, model))
+
+
+def get_token_usage_callback(provider: str, model: Optional[str] = None) -> TokenUsageCallback:
+    """Get a LangChain callback counting token usage toward the shared TPM limit.
+
+    Args:
+        provider: Provider key
+        model: Optional model name
+
+    Returns:
+        TokenUsageCallback for the shared limiter
+    """
+    return TokenUsageCallback(get_rate_limiter(provider, model))
+
+
+def configure_rate_limits(limits: Mapping[str, Any]) -> None:
+    """Override rate limit settings (applies to existing limiters too).
+
+    Args:
+        limits: Mapping of "provider" or "provider:model" to settings
+                (dicts or RateLimitConfig models with rpm/tpm/max_concurrent)
+    """
+    with _registry_lock:
+        for key, value in limits.items():
+            settings = value.model_dump() if hasattr(value, "model_dump") else dict(value)
+            _settings[key] = settings
+
+        for key, limiter in _registry.items():
+            provider, _, model = key.partition(":")
+            limiter.configure(**_resolve_settings(provider, model or None))
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """Check whether an SDK exception represents a 429 / quota error.
+
+    Args:
+        error: Exception raised by a provider SDK
+
+    Returns:
+        True if the error means the request was rate limited
+    """
+    for attr in ("code", "status_code", "status"):
+        if getattr(error, attr, None) in (429, "429"):
+            return True
+
+    message = str(error).upper()
+    return "429" in message or "RESOURCE_EXHAUSTED" in message or "RATE LIMIT" in message
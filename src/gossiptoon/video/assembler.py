@@ -5,11 +5,14 @@ Coordinates effects, audio sync, and final video assembly.
 
 import asyncio
 import logging
+import os
+import shutil
 import subprocess
 from pathlib import Path
+from collections.abc import Callable, Iterator
 from typing import Any, Optional
 
-from gossiptoon.core.config import ConfigManager
+from gossiptoon.core.config import ConfigManager, get_render_profile
 from gossiptoon.core.exceptions import VideoAssemblyError
 from gossiptoon.models.audio import AudioProject
 from gossiptoon.models.video import VideoProject
@@ -18,7 +21,10 @@ from gossiptoon.utils.retry import retry_with_backoff
 from gossiptoon.video.effects.captions import CaptionConfig, CaptionEffect
 from gossiptoon.video.effects.ken_burns import KenBurnsConfig, KenBurnsEffect
 from gossiptoon.video.effects.camera import CameraEffect, CameraEffectConfig
-from gossiptoon.video.ffmpeg_builder import FFmpegBuilder, VideoSegment
+from gossiptoon.video.ffmpeg_builder import FFmpegBuilder, FFmpegCommand, VideoSegment
+from gossiptoon.video.frame_renderer import FrameRenderer
+from gossiptoon.video.image_prep import prepare_images, prepared_size
+from gossiptoon.video.segment_cache import SegmentCache, caption_window, get_segment_cache
 
 logger = logging.getLogger(__name__)
 
@@ -33,21 +39,44 @@ class VideoAssembler:
     - Video rendering
     """
 
-    def __init__(self, config: ConfigManager) -> None:
+    def __init__(self, config: ConfigManager, profile: Optional[str] = None) -> None:
         """Initialize video assembler.
 
         Args:
             config: Configuration manager
+            profile: Render profile name (default: config.video.render_profile)
         """
         self.config = config
 
+        # Render quality tier: output size, fps, encoder settings, effects, burn-in
+        self.profile = get_render_profile(profile or config.video.render_profile)
+        self.width, self.height = self.profile.output_size(config.video.width, config.video.height)
+        self.fps = self.profile.fps or config.video.fps
+        self.encode_options = self.profile.encoder_options(config.video.preset)
+        if self.profile.threads:
+            self.encode_options["threads"] = self.profile.threads
+
         self.ffmpeg_builder = FFmpegBuilder(
-            fps=config.video.fps,
-            output_width=config.video.width,
-            output_height=config.video.height,
+            fps=self.fps,
+            output_width=self.width,
+            output_height=self.height,
         )
 
-        logger.info("Video assembler initialized")
+        # Rendered segment clips shared across jobs (parallel render only)
+        self.segment_cache: Optional[SegmentCache] = None
+        if config.video.parallel_render and config.video.segment_cache_enabled:
+            self.segment_cache = get_segment_cache(
+                cache_dir=config.cache_dir / "segments",
+                max_bytes=config.video.segment_cache_max_mb * 1024 * 1024,
+            )
+
+        if config.video.effect_engine == "numpy" and not config.video.parallel_render:
+            logger.warning("The numpy effect engine renders segment clips; enable parallel render")
+
+        logger.info(
+            f"Video assembler initialized ({self.profile.name} profile: "
+            f"{self.width}x{self.height} @ {self.fps} fps)"
+        )
 
     async def assemble_video(
         self,
@@ -78,9 +107,13 @@ class VideoAssembler:
             audio_project,
         )
 
+        # Fit images to the size their effects need, once instead of per frame
+        if self.config.video.prescale_images:
+            segments = await self._prepare_segment_images(segments, visual_project.script_id)
+
         # Generate caption file if enabled
         subtitle_file = None
-        if self.config.video.captions_enabled:
+        if self.config.video.captions_enabled and self.profile.burn_subtitles:
             subtitle_file = await self._generate_captions(
                 audio_project,
                 visual_project.script_id,
@@ -88,7 +121,7 @@ class VideoAssembler:
 
         # Generate engagement overlay if provided
         engagement_overlay_file = None
-        if engagement_project:
+        if engagement_project and self.profile.burn_subtitles:
             from gossiptoon.video.engagement_overlay import EngagementOverlayGenerator
             
             generator = EngagementOverlayGenerator()
@@ -105,23 +138,35 @@ class VideoAssembler:
             logger.info(f"Generated engagement overlay: {engagement_overlay_file}")
 
         # Build FFmpeg command
-        output_file = self.config.videos_dir / f"{visual_project.script_id}.mp4"
+        output_file = self._output_path(visual_project.script_id)
 
-        command = self.ffmpeg_builder.build_video_command(
-            segments=segments,
-            master_audio=audio_project.master_audio_path,
-            output_file=output_file,
-            subtitles_path=subtitle_file,
-            engagement_overlay=engagement_overlay_file,  # NEW
-            fonts_dir=self.config.root_dir / "assets/fonts/nanum-myeongjo", # Pass fonts directory
-        )
+        fonts_dir = self.config.root_dir / "assets/fonts/nanum-myeongjo"  # Pass fonts directory
 
         # Execute FFmpeg
         logger.info("Starting video render...")
         estimated_time = self.ffmpeg_builder.estimate_render_time(segments)
         logger.info(f"Estimated render time: {estimated_time:.1f}s")
 
-        await self._execute_ffmpeg(command.to_list())
+        if self.config.video.parallel_render:
+            command = await self._render_parallel(
+                segments,
+                audio_project.master_audio_path,
+                output_file,
+                subtitles_path=subtitle_file,
+                engagement_overlay=engagement_overlay_file,
+                fonts_dir=fonts_dir,
+            )
+        else:
+            command = self.ffmpeg_builder.build_video_command(
+                segments=segments,
+                master_audio=audio_project.master_audio_path,
+                output_file=output_file,
+                subtitles_path=subtitle_file,
+                engagement_overlay=engagement_overlay_file,  # NEW
+                fonts_dir=fonts_dir,
+                **self.encode_options,
+            )
+            await self._execute_ffmpeg(command.to_list())
 
         # Build timeline segments
         timeline = self._build_timeline(visual_project, audio_project)
@@ -130,12 +175,12 @@ class VideoAssembler:
         from gossiptoon.models.video import RenderConfig
 
         render_config = RenderConfig(
-            resolution=self.config.video.resolution,
-            fps=self.config.video.fps,
+            resolution=f"{self.width}x{self.height}",
+            fps=self.fps,
             video_codec=self.config.video.video_codec,
             audio_codec=self.config.video.audio_codec,
             bitrate=self.config.video.bitrate,
-            preset=self.config.video.preset,
+            preset=self.encode_options["preset"],
         )
 
         # Create video project
@@ -147,10 +192,15 @@ class VideoAssembler:
             output_path=output_file,
             metadata={
                 "effects_applied": [
-                    "ken_burns" if self.config.video.ken_burns_enabled else None,
-                    "captions" if self.config.video.captions_enabled else None,
+                    "ken_burns"
+                    if self.config.video.ken_burns_enabled and self.profile.effects_enabled
+                    else None,
+                    "captions" if subtitle_file else None,
                 ],
                 "ffmpeg_command": command.to_string(),
+                "render_mode": "parallel" if self.config.video.parallel_render else "single",
+                "render_profile": self.profile.name,
+                "crf": self.profile.crf,
                 "audio_path": str(audio_project.master_audio_path),
                 "total_duration": audio_project.total_duration,
             },
@@ -160,6 +210,191 @@ class VideoAssembler:
 
         return video_project
 
+    def _output_path(self, script_id: str) -> Path:
+        """Output video path; non-publish renders are suffixed with the profile name.
+
+        Args:
+            script_id: Script identifier
+
+        Returns:
+            Output video file
+        """
+        if self.profile.name == "publish":
+            return self.config.videos_dir / f"{script_id}.mp4"
+        return self.config.videos_dir / f"{script_id}_{self.profile.name}.mp4"
+
+    async def _prepare_segment_images(
+        self,
+        segments: list[VideoSegment],
+        script_id: str,
+    ) -> list[VideoSegment]:
+        """Replace segment images with copies sized for their effects.
+
+        Each image is fitted and padded to the output aspect ratio at the
+        output resolution times the effects' input scale (see
+        ``video.image_prep``), in parallel across scenes.
+
+        Args:
+            segments: Video segments
+            script_id: Script identifier (names the prepared image directory)
+
+        Returns:
+            Segments pointing at the prepared images
+        """
+        requests = []
+        for segment in segments:
+            scales = [e.get_input_scale() for e in segment.effects if e.is_enabled()]
+            scale = max(scales, default=1.0)
+            width, height = prepared_size(self.width, self.height, scale)
+            requests.append((segment.image_path, width, height))
+
+        prepared_dir = self.config.videos_dir / f"{script_id}_prepared"
+        prepared_paths = await asyncio.to_thread(prepare_images, requests, prepared_dir)
+        logger.info(f"Prepared {len(prepared_paths)} images in {prepared_dir}")
+
+        return [
+            segment.model_copy(update={"image_path": path})
+            for segment, path in zip(segments, prepared_paths)
+        ]
+
+    async def _render_parallel(
+        self,
+        segments: list[VideoSegment],
+        master_audio: Path,
+        output_file: Path,
+        subtitles_path: Optional[Path] = None,
+        engagement_overlay: Optional[Path] = None,
+        fonts_dir: Optional[Path] = None,
+    ) -> FFmpegCommand:
+        """Render segments as separate clips in parallel, then join them.
+
+        Each segment (effects and captions included) is encoded by its own
+        FFmpeg process with the single-pass encoder settings, at most
+        ``render_workers`` at a time, with the CPU threads split between
+        them. The clips are then joined with the concat demuxer and
+        stream copy; only the master audio is encoded in the final pass.
+        Clips found in the segment cache are reused instead of re-encoded.
+        With the numpy effect engine, camera effects are rendered by
+        ``FrameRenderer`` and piped to the encoder as raw frames.
+
+        Args:
+            segments: Video segments with effects
+            master_audio: Master audio file
+            output_file: Output video file
+            subtitles_path: Optional caption file
+            engagement_overlay: Optional engagement overlay file
+            fonts_dir: Optional fonts directory for the captions
+
+        Returns:
+            The final (mux) command
+
+        Raises:
+            VideoAssemblyError: If a segment or the final pass fails
+        """
+        cpus = os.cpu_count() or 1
+        workers = min(self.config.video.render_workers or cpus, len(segments))
+        threads = max(1, cpus // workers)
+        if self.profile.threads:
+            threads = min(threads, self.profile.threads)
+        segment_options = {**self.encode_options, "threads": threads}
+        logger.info(
+            f"Rendering {len(segments)} segments in parallel "
+            f"({workers} processes, {threads} threads each)"
+        )
+
+        clips_dir = output_file.parent / f"{output_file.stem}_segments"
+        clips_dir.mkdir(parents=True, exist_ok=True)
+
+        semaphore = asyncio.Semaphore(workers)
+
+        renderer = None
+        if self.config.video.effect_engine == "numpy":
+            renderer = FrameRenderer(self.width, self.height, self.fps, workers=threads)
+
+        async def render(index: int, segment: VideoSegment, start_time: float) -> Path:
+            clip_path = clips_dir / f"segment_{index:03d}.mp4"
+            native = renderer is not None and renderer.supports(segment)
+
+            key = None
+            if self.segment_cache is not None:
+                end_time = start_time + segment.duration
+                key = self.segment_cache.make_key(
+                    segment.image_path,
+                    segment.effects,
+                    frames=round(segment.duration * self.fps),
+                    fps=self.fps,
+                    width=self.width,
+                    height=self.height,
+                    encoder_options=self.ffmpeg_builder.video_encode_options(
+                        **self.encode_options
+                    ),
+                    engine="numpy" if native else "ffmpeg",
+                    captions="\n".join(
+                        [
+                            caption_window(subtitles_path, start_time, end_time),
+                            caption_window(engagement_overlay, start_time, end_time),
+                        ]
+                    ),
+                )
+                if self.segment_cache.get(key, clip_path):
+                    return clip_path
+
+            command = self.ffmpeg_builder.build_segment_command(
+                segment,
+                clip_path,
+                start_time=start_time,
+                subtitles_path=subtitles_path,
+                engagement_overlay=engagement_overlay,
+                fonts_dir=fonts_dir,
+                raw_frames=native,
+                **segment_options,
+            )
+            # Never write through a hard link into the cache
+            clip_path.unlink(missing_ok=True)
+            async with semaphore:
+                if native:
+                    await self._pipe_frames_to_ffmpeg(
+                        command.to_list(), lambda: renderer.iter_frames(segment)
+                    )
+                else:
+                    await self._execute_ffmpeg(command.to_list())
+
+            if key is not None:
+                self.segment_cache.put(key, clip_path)
+            return clip_path
+
+        try:
+            tasks = []
+            start_time = 0.0
+            for index, segment in enumerate(segments):
+                tasks.append(asyncio.create_task(render(index, segment, start_time)))
+                start_time += segment.duration
+            try:
+                clip_paths = await asyncio.gather(*tasks)
+            except BaseException:
+                # Stop (and reap) the other encoders before their clips dir is removed
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
+            if self.segment_cache is not None:
+                logger.info(
+                    f"Segment cache: {self.segment_cache.hits} hits, "
+                    f"{self.segment_cache.misses} misses so far"
+                )
+
+            concat_list = self.ffmpeg_builder.write_concat_list(
+                clip_paths, clips_dir / "concat.txt"
+            )
+            command = self.ffmpeg_builder.build_mux_command(
+                concat_list, master_audio, output_file
+            )
+            await self._execute_ffmpeg(command.to_list())
+        finally:
+            shutil.rmtree(clips_dir, ignore_errors=True)
+
+        return command
+
     def _create_segments_with_effects(
         self,
         visual_project: VisualProject,
@@ -178,7 +413,7 @@ class VideoAssembler:
 
         total_audio_time = 0.0
         total_frames = 0
-        fps = self.config.video.fps
+        fps = self.fps
         
         for i, asset in enumerate(visual_project.assets):
             # Get raw audio duration
@@ -261,13 +496,17 @@ class VideoAssembler:
     def _create_segment_effects(self, asset: Any) -> list:
         """Determines logic for applying effects to a visual asset segment."""
         effects = []
+        if not self.profile.effects_enabled:
+            return effects
 
         # 1. AI Camera Effects (Priority)
         if self.config.video.use_ai_camera_effects and asset.camera_effect:
             camera_effect = CameraEffect(CameraEffectConfig(
                 enabled=True,
                 effect_type=asset.camera_effect,
-                intensity=0.3
+                intensity=0.3,
+                output_width=self.width,
+                output_height=self.height,
             ))
             effects.append(camera_effect)
         
@@ -295,8 +534,8 @@ class VideoAssembler:
             pan_direction="up",
             pan_intensity=0.15,
             ease_function="ease-in-out",
-            output_width=self.config.video.width,
-            output_height=self.config.video.height,
+            output_width=self.width,
+            output_height=self.height,
         )
 
         return KenBurnsEffect(config)
@@ -452,7 +691,80 @@ class VideoAssembler:
                 stderr=asyncio.subprocess.PIPE,
             )
 
-            stdout, stderr = await process.communicate()
+            try:
+                stdout, stderr = await process.communicate()
+            except asyncio.CancelledError:
+                process.kill()
+                await process.wait()
+                raise
+
+            if process.returncode != 0:
+                error_msg = stderr.decode() if stderr else "Unknown error"
+                logger.error(f"FFmpeg failed: {error_msg}")
+                raise VideoAssemblyError(f"FFmpeg failed: {error_msg}")
+
+            logger.info("FFmpeg completed successfully")
+
+        except Exception as e:
+            logger.error(f"FFmpeg execution failed: {e}")
+            raise VideoAssemblyError(f"FFmpeg execution failed: {e}") from e
+
+    @retry_with_backoff(max_retries=2, exceptions=(VideoAssemblyError,))
+    async def _pipe_frames_to_ffmpeg(
+        self,
+        command: list[str],
+        frames: Callable[[], Iterator[bytes]],
+    ) -> None:
+        """Execute FFmpeg, feeding it raw frames on stdin.
+
+        Frames are produced off the event loop and written as FFmpeg
+        consumes them, so only a few frames are held in memory.
+
+        Args:
+            command: FFmpeg command as list (reading rawvideo from pipe:0)
+            frames: Factory for the frame iterator (called again on retry)
+
+        Raises:
+            VideoAssemblyError: If FFmpeg or frame rendering fails
+        """
+        try:
+            logger.debug(f"Executing: {' '.join(command)}")
+
+            process = await asyncio.create_subprocess_exec(
+                *command,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            # Drain stderr concurrently so FFmpeg never blocks on it
+            stderr_task = asyncio.create_task(process.stderr.read())
+
+            frame_iter = frames()
+            aborted = False
+            try:
+                while True:
+                    frame = await asyncio.to_thread(next, frame_iter, None)
+                    if frame is None:
+                        break
+                    process.stdin.write(frame)
+                    await process.stdin.drain()
+                process.stdin.close()
+            except (BrokenPipeError, ConnectionResetError):
+                pass  # FFmpeg exited early; its error output says why
+            except BaseException:
+                aborted = True
+                process.kill()
+                raise
+            finally:
+                frame_iter.close()
+                # Reap FFmpeg and collect its output on every path
+                try:
+                    await process.wait()
+                    stderr = await stderr_task
+                finally:
+                    stderr_task.cancel()  # No-op once the read has finished
+                if aborted and stderr:
+                    logger.error(f"FFmpeg output before abort: {stderr.decode(errors='replace')}")
 
             if process.returncode != 0:
                 error_msg = stderr.decode() if stderr else "Unknown error"
@@ -7,6 +7,7 @@ Each effect is independent, tunable, and readable.
 from abc import ABC, abstractmethod
 from typing import Any, Optional
 
+import numpy as np
 from pydantic import BaseModel, Field
 
 
@@ -78,6 +79,41 @@ class Effect(ABC):
         """
         return self.config.enabled
 
+    def get_input_scale(self) -> float:
+        """Get how much larger than the output the input image should be.
+
+        Effects that crop into the image (zoom, shake) need more source
+        pixels than the output size to stay sharp at their tightest crop.
+
+        Returns:
+            Input size as a multiple of the output size
+        """
+        return 1.0
+
+    def get_crop_windows(
+        self,
+        frames: int,
+        image_width: int,
+        image_height: int,
+        **context: Any,
+    ) -> Optional[np.ndarray]:
+        """Compute the effect's crop window for every frame up front.
+
+        Used by the native frame renderer, which resamples each window to
+        the output size itself instead of running FFmpeg filters per frame.
+
+        Args:
+            frames: Number of frames to render
+            image_width: Source image width
+            image_height: Source image height
+            **context: Same context as ``get_filter_string`` (duration, fps)
+
+        Returns:
+            Array of shape (frames, 4) with x, y, width, height in image
+            pixels, or None if the effect can only render through FFmpeg
+        """
+        return None
+
     def get_description(self) -> str:
         """Get effect description for logging.
 
@@ -146,6 +182,15 @@ class CompositeEffect(Effect):
 
         return ";".join(filter_parts)
 
+    def get_input_scale(self) -> float:
+        """Get the largest input scale of the chained effects.
+
+        Returns:
+            Input size as a multiple of the output size
+        """
+        scales = [e.get_input_scale() for e in self.effects if e.is_enabled()]
+        return max(scales, default=1.0)
+
     def get_effect_name(self) -> str:
         """Get composite effect name.
 
@@ -154,3 +199,20 @@ class CompositeEffect(Effect):
         """
         names = [e.get_effect_name() for e in self.effects if e.is_enabled()]
         return f"Composite({', '.join(names)})"
+
+
+def full_frame_windows(frames: int, image_width: int, image_height: int) -> np.ndarray:
+    """Crop windows covering the whole image on every frame (no movement).
+
+    Args:
+        frames: Number of frames
+        image_width: Source image width
+        image_height: Source image height
+
+    Returns:
+        Array of shape (frames, 4) with x, y, width, height
+    """
+    windows = np.zeros((frames, 4))
+    windows[:, 2] = image_width
+    windows[:, 3] = image_height
+    return windows
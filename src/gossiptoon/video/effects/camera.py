@@ -6,16 +6,27 @@ into specific FFmpeg filter configurations.
 
 from typing import Any, Optional
 
+import numpy as np
+from pydantic import Field
+
 from gossiptoon.core.constants import CameraEffectType
-from gossiptoon.video.effects.base import Effect, EffectConfig
+from gossiptoon.video.effects.base import Effect, EffectConfig, full_frame_windows
 from gossiptoon.video.effects.ken_burns import KenBurnsConfig, KenBurnsEffect
 
+# Fraction of the frame the shake effect keeps (the rest is room to move)
+SHAKE_CROP = 0.9
+
+# Seed of the jitter in natively rendered shakes (reproducible frames)
+SHAKE_SEED = 1
+
 
 class CameraEffectConfig(EffectConfig):
     """Configuration for camera effect."""
     
     effect_type: CameraEffectType
     intensity: float = 0.3  # Generic intensity multiplier
+    output_width: int = Field(default=1080, ge=2, description="Output width")
+    output_height: int = Field(default=1920, ge=2, description="Output height")
 
 
 class CameraEffect(Effect):
@@ -30,6 +41,10 @@ class CameraEffect(Effect):
         """Create the specific underlying effect implementation."""
         eff_type = self.config.effect_type
         intensity = self.config.intensity
+        output_size = {
+            "output_width": self.config.output_width,
+            "output_height": self.config.output_height,
+        }
 
         # Static shot
         if eff_type == CameraEffectType.STATIC:
@@ -41,7 +56,8 @@ class CameraEffect(Effect):
                 zoom_start=1.0,
                 zoom_end=1.0 + intensity,
                 pan_direction="none",
-                ease_function="ease-in-out"
+                ease_function="ease-in-out",
+                **output_size,
             ))
 
         # Zoom Out (1.0 + intensity -> 1.0)
@@ -50,7 +66,8 @@ class CameraEffect(Effect):
                 zoom_start=1.0 + intensity,
                 zoom_end=1.0,
                 pan_direction="none",
-                ease_function="ease-in-out"
+                ease_function="ease-in-out",
+                **output_size,
             ))
 
         # Pans (require slight zoom to allow movement)
@@ -61,7 +78,8 @@ class CameraEffect(Effect):
                 zoom_start=pan_zoom,
                 zoom_end=pan_zoom,
                 pan_direction="left",
-                pan_intensity=intensity
+                pan_intensity=intensity,
+                **output_size,
             ))
 
         if eff_type == CameraEffectType.PAN_RIGHT:
@@ -69,7 +87,8 @@ class CameraEffect(Effect):
                 zoom_start=pan_zoom,
                 zoom_end=pan_zoom,
                 pan_direction="right",
-                pan_intensity=intensity
+                pan_intensity=intensity,
+                **output_size,
             ))
             
         if eff_type == CameraEffectType.PAN_UP:
@@ -77,7 +96,8 @@ class CameraEffect(Effect):
                 zoom_start=pan_zoom,
                 zoom_end=pan_zoom,
                 pan_direction="up",
-                pan_intensity=intensity
+                pan_intensity=intensity,
+                **output_size,
             ))
 
         if eff_type == CameraEffectType.PAN_DOWN:
@@ -85,18 +105,19 @@ class CameraEffect(Effect):
                 zoom_start=pan_zoom,
                 zoom_end=pan_zoom,
                 pan_direction="down",
-                pan_intensity=intensity
+                pan_intensity=intensity,
+                **output_size,
             ))
 
         # SHAKE variants
         if eff_type == CameraEffectType.SHAKE:
-            return ShakeEffect(intensity=0.3, speed="normal")
+            return ShakeEffect(intensity=0.3, speed="normal", **output_size)
             
         if eff_type == CameraEffectType.SHAKE_SLOW:
-            return ShakeEffect(intensity=0.15, speed="slow")
+            return ShakeEffect(intensity=0.15, speed="slow", **output_size)
             
         if eff_type == CameraEffectType.SHAKE_FAST:
-            return ShakeEffect(intensity=0.5, speed="fast")
+            return ShakeEffect(intensity=0.5, speed="fast", **output_size)
 
         return None
 
@@ -116,6 +137,22 @@ class CameraEffect(Effect):
         # Static fallback (just copy)
         return f"{input_label}copy{output_label}"
 
+    def get_input_scale(self) -> float:
+        return self._delegate.get_input_scale() if self._delegate else 1.0
+
+    def get_crop_windows(
+        self,
+        frames: int,
+        image_width: int,
+        image_height: int,
+        **context: Any,
+    ) -> Optional[np.ndarray]:
+        if self._delegate:
+            return self._delegate.get_crop_windows(frames, image_width, image_height, **context)
+
+        # Static shot: the whole image
+        return full_frame_windows(frames, image_width, image_height)
+
     def get_effect_name(self) -> str:
         return f"Camera({self.config.effect_type.value})"
 
@@ -129,10 +166,18 @@ class ShakeEffect(Effect):
     - fast: rapid, jittery movement (impact/shock)
     """
     
-    def __init__(self, intensity: float = 0.3, speed: str = "normal") -> None:
+    def __init__(
+        self,
+        intensity: float = 0.3,
+        speed: str = "normal",
+        output_width: int = 1080,
+        output_height: int = 1920,
+    ) -> None:
         super().__init__(EffectConfig())
         self.intensity = intensity
         self.speed = speed
+        self.output_width = output_width
+        self.output_height = output_height
 
     def get_filter_string(
         self,
@@ -144,19 +189,7 @@ class ShakeEffect(Effect):
         # Requires input to be slightly larger or we crop in
         # We'll zoom in 10% to give room for shake
         
-        # Shake parameters
-        # Frequency (hz): How fast it shakes
-        if self.speed == "slow":
-            freq = 2  # Hz
-            ampl_mult = 1.5  # Wider movement
-        elif self.speed == "fast":
-            freq = 15 # Hz
-            ampl_mult = 0.8  # Tighter movement
-        else: # normal
-            freq = 5  # Hz
-            ampl_mult = 1.0
-            
-        shake_px = int(50 * self.intensity * ampl_mult)
+        freq, shake_px = self._motion()
         
         # Uses sine wave for smoother movement (slow) or random for jitter (fast)
         if self.speed == "slow":
@@ -170,13 +203,66 @@ class ShakeEffect(Effect):
         
         return (
             f"{input_label}"
-            f"crop=w=iw*0.9:h=ih*0.9:"
+            f"crop=w=iw*{SHAKE_CROP}:h=ih*{SHAKE_CROP}:"
             f"x='{x_expr}':"
             f"y='{y_expr}':"
             f"exact=1"
-            f",scale=1080:1920"  # Resize back to full res
+            f",scale={self.output_width}:{self.output_height}"  # Resize back to output res
             f"{output_label}"
         )
 
+    def _motion(self) -> tuple[int, int]:
+        """Get (frequency in Hz, amplitude in pixels) for the speed."""
+        # Shake parameters
+        # Frequency (hz): How fast it shakes
+        if self.speed == "slow":
+            freq = 2  # Hz
+            ampl_mult = 1.5  # Wider movement
+        elif self.speed == "fast":
+            freq = 15 # Hz
+            ampl_mult = 0.8  # Tighter movement
+        else: # normal
+            freq = 5  # Hz
+            ampl_mult = 1.0
+            
+        return freq, int(50 * self.intensity * ampl_mult)
+
+    def get_crop_windows(
+        self,
+        frames: int,
+        image_width: int,
+        image_height: int,
+        **context: Any,
+    ) -> np.ndarray:
+        """Compute the shake's crop window for every frame at once.
+
+        The slow shake follows the same sine/cosine path as the filter.
+        Jitter uses a seeded generator instead of FFmpeg's ``random(1)``:
+        same amplitude and distribution, reproducible between renders.
+        """
+        fps = context.get("fps", 30)
+        freq, shake_px = self._motion()
+
+        width = image_width * SHAKE_CROP
+        height = image_height * SHAKE_CROP
+        if self.speed == "slow":
+            t = np.arange(frames) / fps
+            dx = np.sin(t * freq) * shake_px
+            dy = np.cos(t * freq * 0.8) * shake_px
+        else:
+            rng = np.random.default_rng(SHAKE_SEED)
+            dx = (rng.random(frames) - 0.5) * shake_px
+            dy = (rng.random(frames) - 0.5) * shake_px
+
+        # crop keeps the window inside the image
+        x = np.clip((image_width - width) / 2 + dx, 0, image_width - width)
+        y = np.clip((image_height - height) / 2 + dy, 0, image_height - height)
+
+        return np.column_stack([x, y, np.full(frames, width), np.full(frames, height)])
+
+    def get_input_scale(self) -> float:
+        # The shake crops 90% of the frame
+        return 1 / SHAKE_CROP
+
     def get_effect_name(self) -> str:
         return f"ShockShake({self.speed})"
@@ -6,6 +6,7 @@ Highly tunable parameters for easy customization.
 
 from typing import Any, Literal
 
+import numpy as np
 from pydantic import Field
 
 from gossiptoon.video.effects.base import Effect, EffectConfig
@@ -50,8 +51,8 @@ class KenBurnsConfig(EffectConfig):
     )
 
     # Output dimensions
-    output_width: int = Field(default=1080, ge=720, description="Output width")
-    output_height: int = Field(default=1920, ge=1280, description="Output height")
+    output_width: int = Field(default=1080, ge=2, description="Output width")
+    output_height: int = Field(default=1920, ge=2, description="Output height")
 
     class Config:
         """Pydantic config."""
@@ -178,6 +179,88 @@ class KenBurnsEffect(Effect):
 
         return zoom_expr
 
+    def get_crop_windows(
+        self,
+        frames: int,
+        image_width: int,
+        image_height: int,
+        **context: Any,
+    ) -> np.ndarray:
+        """Compute zoompan's crop window for every frame at once.
+
+        Same zoom, easing and pan as the zoompan expressions, evaluated as
+        arrays. Windows keep sub-pixel positions (zoompan truncates them to
+        whole pixels, which is where its visible stepping comes from).
+
+        Args:
+            frames: Number of frames to render
+            image_width: Source image width
+            image_height: Source image height
+            **context: Must contain 'duration' and 'fps', as for the filter
+
+        Returns:
+            Array of shape (frames, 4) with x, y, width, height
+        """
+        duration = context.get("duration", 5.0)
+        fps = context.get("fps", 30)
+
+        # Same progress as the filter: on / total_frames
+        total_frames = max(int(duration * fps), 1)
+        progress = np.arange(frames) / total_frames
+
+        zoom = self._zoom_curve(progress)
+        width = image_width / zoom
+        height = image_height / zoom
+        x = (image_width - width) / 2
+        y = (image_height - height) / 2
+
+        pan = self.config.pan_intensity * (1 - progress)
+        if self.config.pan_direction == "right":
+            x = x - image_width * pan
+        elif self.config.pan_direction == "left":
+            x = x + image_width * pan
+        elif self.config.pan_direction == "down":
+            y = y - image_height * pan
+        elif self.config.pan_direction == "up":
+            y = y + image_height * pan
+
+        # zoompan keeps the window inside the image
+        x = np.clip(x, 0, image_width - width)
+        y = np.clip(y, 0, image_height - height)
+
+        return np.column_stack([x, y, width, height])
+
+    def _zoom_curve(self, progress: np.ndarray) -> np.ndarray:
+        """Evaluate the zoom expression for an array of progress values.
+
+        Args:
+            progress: Progress per frame (on / total_frames)
+
+        Returns:
+            Zoom level per frame
+        """
+        z_start = self.config.zoom_start
+        z_end = self.config.zoom_end
+
+        if z_start == z_end:
+            return np.full(progress.shape, z_start, dtype=np.float64)
+
+        if self.config.ease_function == "ease-in":
+            eased = progress * progress
+        elif self.config.ease_function == "ease-out":
+            eased = 1 - (1 - progress) * (1 - progress)
+        elif self.config.ease_function == "ease-in-out":
+            eased = np.where(
+                progress < 0.5,
+                4 * progress * progress * progress,
+                1 - np.power(-2 * progress + 2, 3) / 2,
+            )
+        else:
+            eased = progress
+
+        # zoompan clamps zoom to [1, 10]
+        return np.clip(z_start + (z_end - z_start) * eased, 1.0, 10.0)
+
     def _build_pan_expressions(self, total_frames: int) -> tuple[str, str]:
         """Build pan expressions for x and y coordinates.
 
@@ -233,6 +316,14 @@ class KenBurnsEffect(Effect):
         """
         return f"KenBurns(zoom:{self.config.zoom_start}->{self.config.zoom_end}, pan:{self.config.pan_direction})"
 
+    def get_input_scale(self) -> float:
+        """Get input scale: the deepest zoom crops 1/zoom of the image.
+
+        Returns:
+            Maximum zoom level
+        """
+        return max(self.config.zoom_start, self.config.zoom_end)
+
     def get_tunable_params(self) -> dict[str, Any]:
         """Get tunable parameters for easy adjustment.
 
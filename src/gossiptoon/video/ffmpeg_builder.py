@@ -216,50 +216,7 @@ class FFmpegBuilder:
 
         # Process each segment with effects
         for i, segment in enumerate(segments):
-            input_label = f"[{i}:v]"
-            output_label = f"[v{i}]"
-
-            if segment.effects:
-                # Apply effects to this segment
-                # Use strict intermediate labels to enforce property standardization
-                effect_out_label = f"[tmp_eff_{i}]"
-                
-                segment_filter = self._apply_effects(
-                    input_label,
-                    effect_out_label,
-                    segment.effects,
-                    unique_id=str(i),
-                    duration=segment.duration,
-                    fps=self.fps,
-                )
-                
-                # Log effect timing
-                logger.info(f"Applied effect to segment {i}: Duration={segment.duration:.3f}s, FPS={self.fps}")
-                filter_parts.append(segment_filter)
-                
-                # Enforce consistent properties + resolution (Scale & Pad)
-                # This ensures that even if an effect (like static CameraEffect) didn't scale, we force it here.
-                standardize_input = effect_out_label
-            else:
-                # No effects - input comes directly from source
-                standardize_input = input_label
-
-            # Universal standardization filter (Trim + Scale + Pad + SAR + Format + FPS)
-            # 1. trim: Enforce EXACT duration (prevents zoompan drift)
-            # 2. scale/pad: Enforce resolution (fixes mismatch)
-            # 3. setsar/format/fps: Enforce encoding properties
-            standardize_filter = (
-                f"{standardize_input}"
-                f"trim=duration={segment.duration},"
-                f"scale={self.output_width}:{self.output_height}:"
-                f"force_original_aspect_ratio=decrease,"
-                f"pad={self.output_width}:{self.output_height}:-1:-1:color=black,"
-                f"setsar=1,"
-                f"format=yuv420p,"
-                f"fps={self.fps}"
-                f"{output_label}"
-            )
-            filter_parts.append(standardize_filter)
+            filter_parts.extend(self._build_segment_filters(i, segment))
 
         # Concatenate all segments
         concat_inputs = "".join(f"[v{i}]" for i in range(len(segments)))
@@ -273,21 +230,120 @@ class FFmpegBuilder:
         )
         filter_parts.append(concat_filter)
 
-        # Apply subtitles if provided
-        # Apply subtitles if provided
-        current_v = final_video_label
-        
+        # Apply subtitles and engagement overlay if provided
+        filter_parts.extend(
+            self._build_overlay_filters(
+                final_video_label,
+                "[outv]",
+                subtitles_path=options.get("subtitles_path"),
+                engagement_overlay=engagement_overlay,
+                fonts_dir=options.get("fonts_dir"),
+            )
+        )
+
+        # Join all filters
+        filter_complex = ";".join(filter_parts)
+
+        return filter_complex
+
+    def _build_segment_filters(self, index: int, segment: VideoSegment) -> list[str]:
+        """Build the effect and standardization filters for one segment.
+
+        Reads input ``[{index}:v]`` and writes ``[v{index}]``.
+
+        Args:
+            index: Segment input index
+            segment: Video segment
+
+        Returns:
+            Filter strings
+        """
+        filter_parts = []
+        input_label = f"[{index}:v]"
+        output_label = f"[v{index}]"
+
+        if segment.effects:
+            # Apply effects to this segment
+            # Use strict intermediate labels to enforce property standardization
+            effect_out_label = f"[tmp_eff_{index}]"
+
+            segment_filter = self._apply_effects(
+                input_label,
+                effect_out_label,
+                segment.effects,
+                unique_id=str(index),
+                duration=segment.duration,
+                fps=self.fps,
+            )
+
+            # Log effect timing
+            logger.info(
+                f"Applied effect to segment {index}: "
+                f"Duration={segment.duration:.3f}s, FPS={self.fps}"
+            )
+            filter_parts.append(segment_filter)
+
+            # Enforce consistent properties + resolution (Scale & Pad)
+            # This ensures that even if an effect (like static CameraEffect) didn't scale,
+            # we force it here.
+            standardize_input = effect_out_label
+        else:
+            # No effects - input comes directly from source
+            standardize_input = input_label
+
+        # Universal standardization filter (Trim + Scale + Pad + SAR + Format + FPS)
+        # 1. trim: Enforce EXACT duration (prevents zoompan drift)
+        # 2. scale/pad: Enforce resolution (fixes mismatch)
+        # 3. setsar/format/fps: Enforce encoding properties
+        standardize_filter = (
+            f"{standardize_input}"
+            f"trim=duration={segment.duration},"
+            f"scale={self.output_width}:{self.output_height}:"
+            f"force_original_aspect_ratio=decrease,"
+            f"pad={self.output_width}:{self.output_height}:-1:-1:color=black,"
+            f"setsar=1,"
+            f"format=yuv420p,"
+            f"fps={self.fps}"
+            f"{output_label}"
+        )
+        filter_parts.append(standardize_filter)
+
+        return filter_parts
+
+    def _build_overlay_filters(
+        self,
+        input_label: str,
+        output_label: str,
+        subtitles_path: Optional[Path] = None,
+        engagement_overlay: Optional[Path] = None,
+        fonts_dir: Optional[Path] = None,
+    ) -> list[str]:
+        """Build the caption and engagement overlay filters.
+
+        Args:
+            input_label: Video stream to draw on
+            output_label: Label of the result
+            subtitles_path: Optional caption file (ASS)
+            engagement_overlay: Optional engagement overlay file (ASS)
+            fonts_dir: Optional fonts directory for the captions
+
+        Returns:
+            Filter strings (empty if there is nothing to draw)
+        """
+        filter_parts = []
+        current_v = input_label
+
         # 1. Main captions
-        if options.get("subtitles_path"):
+        if subtitles_path:
             # Escape path for FFmpeg filter
-            sub_path = str(options["subtitles_path"]).replace(":", "\\\\:").replace("'", "\\'")
-            next_v = "[v_subs]" if engagement_overlay else "[outv]"
-            
+            sub_path = str(subtitles_path).replace(":", "\\\\:").replace("'", "\\'")
+            next_v = "[v_subs]" if engagement_overlay else output_label
+
             # Add fontsdir if provided
             fonts_dir_opt = ""
-            if options.get("fonts_dir"):
+            if fonts_dir:
                 # Escape fonts dir path
-                fdir = str(options["fonts_dir"]).replace(":", "\\\\:").replace("'", "\\'")
+                fdir = str(fonts_dir).replace(":", "\\\\:").replace("'", "\\'")
                 fonts_dir_opt = f":fontsdir='{fdir}'"
 
             # If engagement overlay exists, we output to intermediate, else final
@@ -299,18 +355,10 @@ class FFmpegBuilder:
         if engagement_overlay:
             # Escape path for FFmpeg filter
             overlay_path = str(engagement_overlay).replace(":", "\\\\:").replace("'", "\\'")
-            overlay_filter = f"{current_v}subtitles='{overlay_path}'[outv]"
+            overlay_filter = f"{current_v}subtitles='{overlay_path}'{output_label}"
             filter_parts.append(overlay_filter)
-            
-        # Ensure we have a path to [outv] if no subtitles were applied to final_video_label
-        if not options.get("subtitles_path") and not engagement_overlay:
-            # Already mapped to [outv] via concat if final_video_label was [outv]
-            pass
 
-        # Join all filters
-        filter_complex = ";".join(filter_parts)
-
-        return filter_complex
+        return filter_parts
 
     def _apply_effects(
         self,
@@ -370,30 +418,221 @@ class FFmpegBuilder:
         """
         # Default high-quality options for YouTube Shorts
         output_opts = [
+            *self.video_encode_options(**options),
+            *self._audio_encode_options(**options),
+            "-r", str(self.fps),
+            "-shortest",  # Stop encoding when the shortest stream (audio) ends
+        ]
+
+        # Add custom options
+        output_opts.extend(self._custom_options(**options))
+
+        return output_opts
+
+    def video_encode_options(self, **options: Any) -> list[str]:
+        """Video encoder options shared by every render mode.
+
+        Segment clips must use exactly these settings, or they cannot be
+        joined without re-encoding.
+
+        Args:
+            **options: Custom options
+
+        Returns:
+            List of option arguments
+        """
+        encode_opts = [
             "-c:v", options.get("video_codec", "libx264"),
             "-preset", options.get("preset", "medium"),
             "-crf", str(options.get("crf", 23)),
-            "-pix_fmt", "yuv420p",
+        ]
+        if options.get("tune"):
+            encode_opts.extend(["-tune", options["tune"]])
+        encode_opts.extend(["-pix_fmt", "yuv420p"])
+        return encode_opts
+
+    def _audio_encode_options(self, **options: Any) -> list[str]:
+        """Audio encoder options for the final output.
+
+        Args:
+            **options: Custom options
+
+        Returns:
+            List of option arguments
+        """
+        return [
             "-c:a", options.get("audio_codec", "aac"),
             "-b:a", options.get("audio_bitrate", "192k"),
             "-ar", str(options.get("sample_rate", 44100)),
-            "-r", str(self.fps),
-            "-shortest",  # Stop encoding when the shortest stream (audio) ends
         ]
 
+    @staticmethod
+    def _custom_options(**options: Any) -> list[str]:
+        """Turn options without special handling into FFmpeg flags.
+
+        Args:
+            **options: Custom options
+
+        Returns:
+            List of option arguments
+        """
         # Keys that are handled specially and should NOT become FFmpeg flags
         excluded_keys = [
-            "video_codec", "preset", "crf", "audio_codec", 
+            "video_codec", "preset", "crf", "tune", "audio_codec",
             "audio_bitrate", "sample_rate", "subtitle_file", "subtitles_path",
             "fonts_dir",  # Handled inside specific filters
         ]
 
-        # Add custom options
+        custom_opts = []
         for key, value in options.items():
             if key not in excluded_keys:
-                output_opts.extend([f"-{key}", str(value)])
+                custom_opts.extend([f"-{key}", str(value)])
 
-        return output_opts
+        return custom_opts
+
+    def build_segment_command(
+        self,
+        segment: VideoSegment,
+        output_file: Path,
+        start_time: float = 0.0,
+        subtitles_path: Optional[Path] = None,
+        engagement_overlay: Optional[Path] = None,
+        raw_frames: bool = False,
+        **options: Any,
+    ) -> FFmpegCommand:
+        """Build the command rendering one segment to a silent clip.
+
+        Used by parallel rendering: every clip is encoded with the same
+        settings as a single-pass render, so the clips can be joined with
+        the concat demuxer and stream copy. Captions are burned in here
+        (shifted to the segment's place on the timeline), which leaves
+        the final pass with nothing to re-encode.
+
+        Args:
+            segment: Video segment with effects
+            output_file: Clip file path
+            start_time: Segment start on the video timeline (seconds)
+            subtitles_path: Optional caption file (ASS, timed for the whole video)
+            engagement_overlay: Optional engagement overlay file (ASS)
+            raw_frames: Read finished RGB24 frames of the output size from
+                stdin (see ``FrameRenderer``) instead of applying the
+                segment's effects to its image
+            **options: Additional options (codec, preset, threads, etc.)
+
+        Returns:
+            FFmpegCommand ready to execute
+        """
+        if raw_frames:
+            inputs = [
+                "-f", "rawvideo",
+                "-pix_fmt", "rgb24",
+                "-s", f"{self.output_width}x{self.output_height}",
+                "-framerate", str(self.fps),
+                "-i", "pipe:0",
+            ]
+            filter_parts = ["[0:v]setsar=1,format=yuv420p[v0]"]
+        else:
+            inputs = [
+                "-loop", "1",
+                "-framerate", str(self.fps),
+                "-t", str(segment.duration),
+                "-i", str(segment.image_path),
+            ]
+            filter_parts = self._build_segment_filters(0, segment)
+
+        overlays = self._build_overlay_filters(
+            "[v_timed]",
+            "[v_drawn]",
+            subtitles_path=subtitles_path,
+            engagement_overlay=engagement_overlay,
+            fonts_dir=options.get("fonts_dir"),
+        )
+        if overlays:
+            # Captions are timed for the whole video: draw them at the
+            # segment's timeline position, then restart the clip at zero
+            filter_parts.append(f"[v0]setpts=PTS+{start_time}/TB[v_timed]")
+            filter_parts.extend(overlays)
+            filter_parts.append("[v_drawn]setpts=PTS-STARTPTS[outv]")
+        else:
+            filter_parts.append("[v0]null[outv]")
+
+        frames = round(segment.duration * self.fps)
+        output_options = [
+            *self.video_encode_options(**options),
+            "-r", str(self.fps),
+            "-frames:v", str(frames),
+            "-an",
+            *self._custom_options(**options),
+        ]
+
+        return FFmpegCommand(
+            inputs=inputs,
+            filter_complex=";".join(filter_parts),
+            maps=["[outv]"],
+            output_options=output_options,
+            output_file=output_file,
+        )
+
+    @staticmethod
+    def write_concat_list(clip_paths: list[Path], list_file: Path) -> Path:
+        """Write a concat demuxer list for segment clips.
+
+        Args:
+            clip_paths: Clips in playback order
+            list_file: List file to write
+
+        Returns:
+            Path to the list file
+        """
+        lines = []
+        for clip_path in clip_paths:
+            # Single quotes inside a quoted path are written as '\''
+            escaped = str(Path(clip_path).resolve()).replace("'", "'\\''")
+            lines.append(f"file '{escaped}'")
+
+        list_file.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        return list_file
+
+    def build_mux_command(
+        self,
+        concat_list: Path,
+        master_audio: Path,
+        output_file: Path,
+        **options: Any,
+    ) -> FFmpegCommand:
+        """Build the final pass joining segment clips with the master audio.
+
+        The video is stream-copied from the clips; only the audio is encoded.
+
+        Args:
+            concat_list: Concat demuxer list (see ``write_concat_list``)
+            master_audio: Path to master audio file
+            output_file: Output video file path
+            **options: Additional options (audio codec, bitrate, etc.)
+
+        Returns:
+            FFmpegCommand ready to execute
+        """
+        inputs = [
+            "-f", "concat",
+            "-safe", "0",
+            "-i", str(concat_list),
+            "-i", str(master_audio),
+        ]
+
+        output_options = [
+            "-c:v", "copy",
+            *self._audio_encode_options(**options),
+            "-shortest",
+            *self._custom_options(**options),
+        ]
+
+        return FFmpegCommand(
+            inputs=inputs,
+            maps=["0:v", "1:a"],
+            output_options=output_options,
+            output_file=output_file,
+        )
 
     def build_simple_concat_command(
         self,
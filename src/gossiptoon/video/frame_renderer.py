@@ -0,0 +1,143 @@
+"""Native frame renderer for camera effects.
+
+FFmpeg's ``zoompan`` evaluates its expressions and rescales the image one
+frame at a time on a single thread, which makes it the slowest stage of
+a render. ``FrameRenderer`` produces the same frames outside the filter
+graph:
+
+1. The effect computes its crop window (x, y, width, height) for every
+   frame up front as NumPy arrays (``Effect.get_crop_windows``).
+2. Each window is resampled to the output size with Pillow's resize,
+   which takes fractional crop boxes and filters properly when scaling
+   down. Pillow releases the GIL, so frames are resampled on a thread
+   pool.
+3. Frames are yielded as raw RGB bytes, in order, for the encoder to read
+   from a pipe (see ``FFmpegBuilder.build_segment_command``).
+
+Segments whose effects cannot compute crop windows (e.g. composite
+effects) still render through FFmpeg filters.
+"""
+
+import logging
+import os
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+import numpy as np
+
+from gossiptoon.core.exceptions import VideoAssemblyError
+from gossiptoon.video.effects.base import full_frame_windows
+from gossiptoon.video.ffmpeg_builder import VideoSegment
+
+logger = logging.getLogger(__name__)
+
+# Frames resampled ahead of the encoder, per worker thread
+FRAMES_AHEAD_PER_WORKER = 2
+
+
+class FrameRenderer:
+    """Renders segment frames from precomputed crop windows."""
+
+    def __init__(self, width: int, height: int, fps: int, workers: int = 0) -> None:
+        """Initialize frame renderer.
+
+        Args:
+            width: Output width
+            height: Output height
+            fps: Frames per second
+            workers: Resampling threads (0 = one per CPU)
+        """
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.workers = workers or os.cpu_count() or 1
+
+    def frame_count(self, segment: VideoSegment) -> int:
+        """Number of frames in a segment (durations are frame-exact).
+
+        Args:
+            segment: Video segment
+
+        Returns:
+            Frame count
+        """
+        return round(segment.duration * self.fps)
+
+    def crop_windows(
+        self,
+        segment: VideoSegment,
+        image_width: int,
+        image_height: int,
+    ) -> Optional[np.ndarray]:
+        """Compute the crop window of every frame of a segment.
+
+        Args:
+            segment: Video segment
+            image_width: Source image width
+            image_height: Source image height
+
+        Returns:
+            Array of shape (frames, 4), or None if the segment's effects
+            can only render through FFmpeg
+        """
+        frames = self.frame_count(segment)
+        effects = [e for e in segment.effects if e.is_enabled()]
+        if not effects:
+            return full_frame_windows(frames, image_width, image_height)
+        if len(effects) > 1:
+            return None
+
+        return effects[0].get_crop_windows(
+            frames,
+            image_width,
+            image_height,
+            duration=segment.duration,
+            fps=self.fps,
+        )
+
+    def supports(self, segment: VideoSegment) -> bool:
+        """Check whether a segment can be rendered natively.
+
+        Args:
+            segment: Video segment
+
+        Returns:
+            True if every effect of the segment provides crop windows
+        """
+        # Windows are cheap to compute; the image size does not matter here
+        return self.crop_windows(segment, self.width, self.height) is not None
+
+    def iter_frames(self, segment: VideoSegment) -> Iterator[bytes]:
+        """Render a segment's frames.
+
+        Args:
+            segment: Video segment (must be supported, see ``supports``)
+
+        Yields:
+            Raw RGB24 frames of the output size, in order
+
+        Raises:
+            VideoAssemblyError: If the segment's effects cannot provide crop windows
+        """
+        from PIL import Image
+
+        with Image.open(segment.image_path) as source:
+            image = source.convert("RGB")
+
+        windows = self.crop_windows(segment, image.width, image.height)
+        if windows is None:
+            raise VideoAssemblyError(f"Effects of {segment.image_path.name} need the FFmpeg engine")
+
+        size = (self.width, self.height)
+
+        def render(window: np.ndarray) -> bytes:
+            x, y, width, height = (float(v) for v in window)
+            box = (x, y, x + width, y + height)
+            return image.resize(size, Image.BILINEAR, box=box).tobytes()
+
+        # Bounded read-ahead: a whole segment of frames would not fit in memory
+        batch = self.workers * FRAMES_AHEAD_PER_WORKER
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="frames") as pool:
+            for start in range(0, len(windows), batch):
+                yield from pool.map(render, windows[start : start + batch])
@@ -0,0 +1,113 @@
+"""Scene image preparation before rendering.
+
+Generated images arrive at arbitrary resolutions, and FFmpeg runs its
+per-frame filters (zoompan, crop, scale, pad) on whatever it is given,
+for every frame of the segment. Preparing each image once up front
+means those filters work on right-sized inputs:
+
+- The image is fitted to the output aspect ratio and padded with black,
+  centered (what the standardization filter's ``scale``/``pad`` did per
+  frame).
+- It is sized to the output resolution times the segment effect's input
+  scale (e.g. the maximum Ken Burns zoom), so the tightest crop still has
+  one source pixel per output pixel and nothing larger is carried along.
+
+Prepared images are cached by source content and target size, and images
+for different scenes are prepared in parallel (Pillow releases the GIL
+while resampling).
+"""
+
+import hashlib
+import logging
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+def prepared_size(width: int, height: int, scale: float = 1.0) -> tuple[int, int]:
+    """Size of a prepared image for an output resolution and effect scale.
+
+    Args:
+        width: Output width
+        height: Output height
+        scale: Effect input scale (>= 1.0)
+
+    Returns:
+        (width, height), rounded up to even numbers for yuv420p
+    """
+    scale = max(scale, 1.0)
+    # Rounded first so 1080 * 1.2 does not become 1298
+    return (
+        math.ceil(round(width * scale, 6) / 2) * 2,
+        math.ceil(round(height * scale, 6) / 2) * 2,
+    )
+
+
+def prepare_image(image_path: Path, width: int, height: int, cache_dir: Path) -> Path:
+    """Fit and pad an image to an exact size (cached).
+
+    Args:
+        image_path: Source image
+        width: Target width
+        height: Target height
+        cache_dir: Directory for prepared images
+
+    Returns:
+        Path to the prepared PNG
+    """
+    from PIL import Image, ImageOps
+
+    digest = hashlib.sha256(Path(image_path).read_bytes()).hexdigest()
+    prepared_path = cache_dir / f"{digest}_{width}x{height}.png"
+    if prepared_path.exists():
+        return prepared_path
+
+    with Image.open(image_path) as img:
+        img = img.convert("RGB")
+        if img.size != (width, height):
+            img = ImageOps.pad(img, (width, height), method=Image.LANCZOS, color=(0, 0, 0))
+
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = prepared_path.with_name(f".{prepared_path.name}.{os.getpid()}.tmp")
+        img.save(tmp_path, format="PNG", compress_level=1)
+    os.replace(tmp_path, prepared_path)
+
+    logger.debug(f"Prepared {Path(image_path).name} at {width}x{height}")
+    return prepared_path
+
+
+def prepare_images(
+    requests: list[tuple[Path, int, int]],
+    cache_dir: Path,
+    max_workers: int = 0,
+) -> list[Path]:
+    """Prepare several images in parallel.
+
+    An image that cannot be prepared is logged and used as-is, so the
+    render falls back to scaling it per frame.
+
+    Args:
+        requests: (image path, width, height) per image
+        cache_dir: Directory for prepared images
+        max_workers: Worker threads (0 = one per CPU)
+
+    Returns:
+        Prepared image paths, in the same order
+    """
+    if not requests:
+        return []
+
+    def prepare(request: tuple[Path, int, int]) -> Path:
+        image_path, width, height = request
+        try:
+            return prepare_image(image_path, width, height, cache_dir)
+        except Exception as e:
+            logger.warning(f"Could not prepare {Path(image_path).name}, using original: {e}")
+            return image_path
+
+    workers = min(max_workers or os.cpu_count() or 1, len(requests))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="image-prep") as pool:
+        return list(pool.map(prepare, requests))
@@ -0,0 +1,280 @@
+"""Content-addressed on-disk cache for rendered segment clips.
+
+Parallel rendering encodes every segment to its own clip (see
+``VideoAssembler``). Keys hash everything that determines a clip's
+pixels: the image content, each effect's tunable parameters, the exact
+frame count, fps, resolution, the effect engine, the video encoder
+settings and the caption events drawn during the segment. Re-assembling
+a project after one scene image was regenerated, or one caption changed,
+re-encodes only the segments whose key changed; the rest are reused and
+concatenated.
+
+Layout (shared by all jobs under the base output directory)::
+
+    <cache_dir>/segments/ab/abcdef....mp4
+
+A clip's mtime is its LRU clock: it is bumped on every hit, and the least
+recently used clips are evicted once the cache grows past ``max_bytes``.
+Clips are hard-linked in and out of the cache where the filesystem
+allows it, so a hit costs no copy.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+from pathlib import Path
+from typing import Any, Optional
+
+from gossiptoon.video.effects.base import Effect
+
+logger = logging.getLogger(__name__)
+
+CLIP_SUFFIX = ".mp4"
+
+
+class SegmentCache:
+    """Size-bounded LRU cache of rendered segment clips."""
+
+    def __init__(self, cache_dir: Path, max_bytes: int) -> None:
+        """Initialize segment cache.
+
+        Args:
+            cache_dir: Directory holding cached clips
+            max_bytes: Maximum total clip size before LRU eviction
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._total_bytes: Optional[int] = None
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(
+        image_path: Path,
+        effects: list[Effect],
+        frames: int,
+        fps: int,
+        width: int,
+        height: int,
+        encoder_options: list[str],
+        captions: str = "",
+        engine: str = "ffmpeg",
+    ) -> str:
+        """Build the content hash for a segment clip.
+
+        Args:
+            image_path: Segment image (hashed by content)
+            effects: Effects applied to the segment
+            frames: Exact frame count of the clip
+            fps: Frames per second
+            width: Output width
+            height: Output height
+            encoder_options: Video encoder arguments
+            captions: Caption events drawn on the segment (see ``caption_window``)
+            engine: Effect engine that renders the frames
+
+        Returns:
+            Hex SHA-256 digest
+        """
+        payload = json.dumps(
+            {
+                "image": hashlib.sha256(Path(image_path).read_bytes()).hexdigest(),
+                "effects": [effect_params(e) for e in effects if e.is_enabled()],
+                "frames": frames,
+                "fps": fps,
+                "resolution": [width, height],
+                "encoder": encoder_options,
+                "captions": captions,
+                "engine": engine,
+            },
+            sort_keys=True,
+            ensure_ascii=False,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _clip_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}{CLIP_SUFFIX}"
+
+    def get(self, key: str, output_path: Path) -> Optional[Path]:
+        """Place a cached clip at ``output_path`` if present.
+
+        Args:
+            key: Content hash from ``make_key``
+            output_path: Where the caller wants the clip
+
+        Returns:
+            output_path on a hit, None on a miss
+        """
+        cached_clip = self._clip_path(key)
+        try:
+            # Mark as recently used
+            os.utime(cached_clip)
+            _link_or_copy(cached_clip, output_path)
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.hits += 1
+        logger.debug(f"Segment cache hit: {output_path.name} ({key[:12]})")
+        return output_path
+
+    def put(self, key: str, clip_path: Path) -> Path:
+        """Store a rendered clip.
+
+        Args:
+            key: Content hash from ``make_key``
+            clip_path: Rendered clip
+
+        Returns:
+            Path to the cached clip
+        """
+        cached_clip = self._clip_path(key)
+        cached_clip.parent.mkdir(parents=True, exist_ok=True)
+        tmp_clip = cached_clip.with_name(f".{cached_clip.name}.{os.getpid()}.tmp")
+        _link_or_copy(clip_path, tmp_clip)
+        os.replace(tmp_clip, cached_clip)
+
+        with self._lock:
+            if self._total_bytes is not None:
+                self._total_bytes += cached_clip.stat().st_size
+
+        self._evict_if_needed()
+        return cached_clip
+
+    def _scan(self) -> list[tuple[float, Path, int]]:
+        """List clips as (last_used, path, size_bytes)."""
+        entries = []
+        for clip_path in self.cache_dir.glob(f"*/*{CLIP_SUFFIX}"):
+            try:
+                stat = clip_path.stat()
+            except FileNotFoundError:
+                continue  # Evicted concurrently
+            entries.append((stat.st_mtime, clip_path, stat.st_size))
+        return entries
+
+    def _evict_if_needed(self) -> None:
+        """Evict least recently used clips until under ``max_bytes``."""
+        with self._lock:
+            if self._total_bytes is not None and self._total_bytes <= self.max_bytes:
+                return
+
+            entries = self._scan()
+            total = sum(size for _, _, size in entries)
+
+            evicted = 0
+            for _, clip_path, size in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                clip_path.unlink(missing_ok=True)
+                total -= size
+                evicted += 1
+
+            self._total_bytes = total
+
+        if evicted:
+            logger.info(f"Segment cache evicted {evicted} clips ({total / 1e6:.1f} MB kept)")
+
+    def size_bytes(self) -> int:
+        """Get total size of cached clips."""
+        return sum(size for _, _, size in self._scan())
+
+
+def effect_params(effect: Effect) -> dict[str, Any]:
+    """Describe an effect for the cache key.
+
+    Args:
+        effect: Video effect
+
+    Returns:
+        Effect type and its tunable parameters (full config if it has none)
+    """
+    if hasattr(effect, "get_tunable_params"):
+        params = effect.get_tunable_params()
+    else:
+        params = effect.config.model_dump()
+    return {"type": type(effect).__name__, "params": params}
+
+
+def caption_window(ass_path: Optional[Path], start: float, end: float) -> str:
+    """Extract what an ASS file draws between two timeline positions.
+
+    Returns the file's header (styles) and the dialogue events overlapping
+    ``[start, end)``, with event times relative to ``start``. A caption
+    edit elsewhere in the video, or an earlier scene changing length, does
+    not change a segment's cache key.
+
+    Args:
+        ass_path: ASS subtitle file (None for no captions)
+        start: Segment start on the timeline (seconds)
+        end: Segment end on the timeline (seconds)
+
+    Returns:
+        Header and overlapping events, one per line ("" without a file;
+        the event times are not valid ASS timestamps)
+    """
+    if ass_path is None:
+        return ""
+
+    lines = []
+    for line in Path(ass_path).read_text(encoding="utf-8").splitlines():
+        if not line.startswith("Dialogue:"):
+            lines.append(line)
+            continue
+        fields = line.split(",", 3)
+        if len(fields) < 4:
+            continue
+        event_start, event_end = _ass_seconds(fields[1]), _ass_seconds(fields[2])
+        if event_start < end and event_end > start:
+            fields[1] = f"{event_start - start:.3f}"
+            fields[2] = f"{event_end - start:.3f}"
+            lines.append(",".join(fields))
+    return "\n".join(lines)
+
+
+def _ass_seconds(timestamp: str) -> float:
+    """Parse an ASS timestamp (H:MM:SS.cc)."""
+    hours, minutes, seconds = timestamp.strip().split(":")
+    return int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+
+
+def _link_or_copy(source: Path, destination: Path) -> None:
+    """Hard-link a file, copying it if linking is not possible."""
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    destination.unlink(missing_ok=True)
+    try:
+        os.link(source, destination)
+    except FileNotFoundError:
+        raise
+    except OSError:
+        shutil.copyfile(source, destination)
+
+
+_caches: dict[Path, SegmentCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_segment_cache(cache_dir: Path, max_bytes: int) -> SegmentCache:
+    """Get the process-wide segment cache for a directory.
+
+    Args:
+        cache_dir: Cache directory
+        max_bytes: Maximum cache size (updates an existing instance)
+
+    Returns:
+        Shared SegmentCache instance
+    """
+    with _caches_lock:
+        cache = _caches.get(cache_dir)
+        if cache is None:
+            cache = SegmentCache(cache_dir, max_bytes)
+            _caches[cache_dir] = cache
+        cache.max_bytes = max_bytes
+        return cache
@@ -1,5 +1,7 @@
 """Visual Director orchestrates image generation with character consistency."""
 
+import asyncio
+import hashlib
 import json
 import logging
 from datetime import datetime
@@ -10,9 +12,11 @@ from gossiptoon.core.config import ConfigManager
 from gossiptoon.core.exceptions import ImageGenerationError
 from gossiptoon.models.script import Script
 from gossiptoon.models.visual import ImagePrompt, VisualAsset, VisualProject
+from gossiptoon.utils.journal import ItemJournal
 from gossiptoon.visual.base import ImageClient
 from gossiptoon.visual.character_bank import CharacterConsistencyBank
 from gossiptoon.visual.gemini_client import GeminiImageClient
+from gossiptoon.visual.image_cache import ImageCache, get_image_cache
 
 logger = logging.getLogger(__name__)
 
@@ -33,15 +37,27 @@ class VisualDirector:
         self,
         config: ConfigManager,
         image_client: Optional[ImageClient] = None,
+        image_cache: Optional[ImageCache] = None,
     ) -> None:
         """Initialize Visual Director.
 
         Args:
             config: Configuration manager
             image_client: Optional image client (defaults to Gemini)
+            image_cache: Optional image cache. Defaults to the shared on-disk cache
+                when the default client is used (and caching is enabled); injected
+                clients are uncached unless a cache is passed too.
         """
         self.config = config
 
+        # Content-addressed cache shared across jobs (skips repeated image calls)
+        if image_cache is None and image_client is None and config.image.cache_enabled:
+            image_cache = get_image_cache(
+                cache_dir=config.cache_dir / "images",
+                max_bytes=config.image.cache_max_mb * 1024 * 1024,
+            )
+        self.image_cache = image_cache
+
         # Use provided image client or default to Gemini
         self.image_client = image_client or GeminiImageClient(
             api_key=config.api.google_api_key,
@@ -53,11 +69,14 @@ class VisualDirector:
     async def create_visual_project(
         self,
         script: Script,
+        journal: Optional[ItemJournal] = None,
     ) -> VisualProject:
         """Create complete visual project for script.
 
         Args:
             script: Script with all scenes
+            journal: Optional per-scene progress journal (defaults to one in the
+                images directory)
 
         Returns:
             VisualProject with all visual assets
@@ -78,6 +97,7 @@ class VisualDirector:
         logger.info(f"Script has {len(characters)} characters: {', '.join(characters)}")
 
         # STEP 1: Pre-generate character portraits FIRST for consistency
+        # (barrier: every scene prompt depends on the finished character bank)
         if characters:
             await self._generate_character_portraits(
                 script=script,
@@ -85,15 +105,8 @@ class VisualDirector:
                 character_bank=character_bank,
             )
 
-        # STEP 2: Generate images for all scenes (using character refs)
-        assets = []
-        for scene in script.get_all_scenes():
-            asset = await self._generate_scene_image(
-                scene=scene,
-                character_bank=character_bank,
-            )
-            assets.append(asset)
-
+        # STEP 2: Generate images for all scenes concurrently (using character refs)
+        assets = await self._generate_scene_images(script, character_bank, journal)
         # Create visual project
         visual_project = VisualProject(
             script_id=script.script_id,
@@ -116,6 +129,14 @@ class VisualDirector:
             f"Visual project complete: {len(assets)} assets, "
             f"{len(character_bank.get_all_characters())} characters"
         )
+        if self.image_cache is not None:
+            stats = self.image_cache.stats
+            totals = await asyncio.to_thread(self.image_cache.flush_stats)
+            logger.info(
+                f"Image cache: {stats.hits} hits, {stats.misses} misses "
+                f"({stats.hit_rate:.0%} hit rate), {stats.evictions} evictions "
+                f"this process; {totals.hit_rate:.0%} hit rate overall"
+            )
 
         return visual_project
 
@@ -136,79 +157,224 @@ class VisualDirector:
         """
         logger.info(f"Pre-generating {len(characters)} character portraits...")
 
+        pending = []
         for char_name in characters:
             if character_bank.has_character(char_name):
                 logger.info(f"Character {char_name} already in bank, skipping")
                 continue
+            pending.append(char_name)
 
-            # Check for detailed character profile first (TICKET-028)
-            # Use getattr to safely access character_profiles as it might not exist in old scripts
-            profiles = getattr(script, "character_profiles", [])
-            profile = next((p for p in profiles if p.name == char_name), None)
-
-            if profile:
-                logger.info(f"Using detailed profile for character: {char_name}")
-                portrait_base_prompt = CHARACTER_SHEET_TEMPLATE.format(
-                    age=profile.age.replace(
-                        "year old", ""
-                    ).strip(),  # Clean up if LLM adds "year old"
-                    gender=profile.gender,
-                    vibe=profile.personality_vibe,
-                    body_type=profile.body_type,
-                    hair=profile.hair_style_color,
-                    face=profile.face_details_expression,
-                    outfit=profile.outfit,
-                    style=self.config.image.style or "Korean Webtoon style, cel-shaded",
-                )
-                # Store structural description for bank reference
-                char_description = f"{char_name}: {profile.age} {profile.gender}, {profile.hair_style_color}, {profile.outfit}"
-            else:
-                # Fallback to legacy extraction
-                char_description = self._get_character_description_from_script(script, char_name)
+        # In-flight requests are bounded by the image client's provider rate limiter
+        results = await asyncio.gather(
+            *(self._generate_character_portrait(script, name, character_bank) for name in pending),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+    async def _generate_character_portrait(
+        self,
+        script: Script,
+        char_name: str,
+        character_bank: CharacterConsistencyBank,
+    ) -> None:
+        """Generate one character portrait and register it in the bank.
 
-                # Create portrait-specific prompt with strict isolation
-                # TICKET-006: Forced single character generation
-                portrait_base_prompt = f"""Character design sheet for {char_name}:
+        Args:
+            script: Script with character info
+            char_name: Character name
+            character_bank: Character consistency bank
+        """
+        # Check for detailed character profile first (TICKET-028)
+        # Use getattr to safely access character_profiles as it might not exist in old scripts
+        profiles = getattr(script, "character_profiles", [])
+        profile = next((p for p in profiles if p.name == char_name), None)
+
+        if profile:
+            logger.info(f"Using detailed profile for character: {char_name}")
+            portrait_base_prompt = CHARACTER_SHEET_TEMPLATE.format(
+                age=profile.age.replace(
+                    "year old", ""
+                ).strip(),  # Clean up if LLM adds "year old"
+                gender=profile.gender,
+                vibe=profile.personality_vibe,
+                body_type=profile.body_type,
+                hair=profile.hair_style_color,
+                face=profile.face_details_expression,
+                outfit=profile.outfit,
+                style=self.config.image.style or "Korean Webtoon style, cel-shaded",
+            )
+            # Store structural description for bank reference
+            char_description = f"{char_name}: {profile.age} {profile.gender}, {profile.hair_style_color}, {profile.outfit}"
+        else:
+            # Fallback to legacy extraction
+            char_description = self._get_character_description_from_script(script, char_name)
+
+            # Create portrait-specific prompt with strict isolation
+            # TICKET-006: Forced single character generation
+            portrait_base_prompt = f"""Character design sheet for {char_name}:
 {char_description}
 
 FORMAT: Single character full-body portrait on white background.
 VIEW: Front facing, neutral expression.
 STRICTLY SINGLE CHARACTER. NO background elements, NO other people."""
 
-            portrait_prompt = ImagePrompt(
-                scene_id=f"portrait_{char_name.lower().replace(' ', '_')}",
-                base_prompt=portrait_base_prompt,
-                characters=[char_name],
-                style=self.config.image.style,
-                aspect_ratio=self.config.image.aspect_ratio,
-                negative_prompt=self.config.image.negative_prompt
-                + ", group, couple, multiple people, crowd, background, scenery, text, overlay",
-            )
+        portrait_prompt = ImagePrompt(
+            scene_id=f"portrait_{char_name.lower().replace(' ', '_')}",
+            base_prompt=portrait_base_prompt,
+            characters=[char_name],
+            style=self.config.image.style,
+            aspect_ratio=self.config.image.aspect_ratio,
+            negative_prompt=self.config.image.negative_prompt
+            + ", group, couple, multiple people, crowd, background, scenery, text, overlay",
+        )
 
-            # Generate portrait image
-            output_path = (
-                self.config.images_dir
-                / "characters"
-                / script.script_id
-                / f"{char_name.lower().replace(' ', '_')}_portrait.png"
-            )
-            output_path.parent.mkdir(parents=True, exist_ok=True)
+        # Generate portrait image
+        output_path = (
+            self.config.images_dir
+            / "characters"
+            / script.script_id
+            / f"{char_name.lower().replace(' ', '_')}_portrait.png"
+        )
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        portrait_path = await self._generate_image(
+            prompt=portrait_prompt,
+            output_path=output_path,
+        )
+
+        # Add to character bank with portrait as reference
+        character_bank.add_character(
+            character_name=char_name,
+            reference_image_path=portrait_path,
+            description=char_description,
+            first_appearance_scene_id="portrait",
+            appearance_tags=[],
+        )
+
+        logger.info(f"Generated portrait for {char_name}: {portrait_path}")
+
+    async def _generate_image(
+        self,
+        prompt: ImagePrompt | str,
+        output_path: Path,
+        reference_image: Optional[Path] = None,
+    ) -> Path:
+        """Generate an image, serving identical requests from the image cache.
 
-            portrait_path = await self.image_client.generate_image(
-                prompt=portrait_prompt,
+        Args:
+            prompt: Image prompt (ImagePrompt or composite prompt string)
+            output_path: Where to save the image
+            reference_image: Optional reference image for I2I
+
+        Returns:
+            Path to the image
+        """
+        if self.image_cache is None:
+            return await self.image_client.generate_image(
+                prompt=prompt,
+                reference_image=reference_image,
                 output_path=output_path,
             )
 
-            # Add to character bank with portrait as reference
-            character_bank.add_character(
-                character_name=char_name,
-                reference_image_path=portrait_path,
-                description=char_description,
-                first_appearance_scene_id="portrait",
-                appearance_tags=[],
+        aspect_ratio = (
+            prompt.aspect_ratio
+            if isinstance(prompt, ImagePrompt)
+            else self.config.image.aspect_ratio
+        )
+        cache_key = ImageCache.make_key(
+            prompt=prompt,
+            model=self.image_client.get_model_name(),
+            aspect_ratio=aspect_ratio,
+            reference_image=reference_image,
+        )
+
+        cached_path = await asyncio.to_thread(self.image_cache.get, cache_key, output_path)
+        if cached_path is not None:
+            return cached_path
+
+        image_path = await self.image_client.generate_image(
+            prompt=prompt,
+            reference_image=reference_image,
+            output_path=output_path,
+        )
+        await asyncio.to_thread(self.image_cache.put, cache_key, image_path)
+        return image_path
+
+    async def _generate_scene_images(
+        self,
+        script: Script,
+        character_bank: CharacterConsistencyBank,
+        journal: Optional[ItemJournal] = None,
+    ) -> list[VisualAsset]:
+        """Generate all scene images concurrently, returning them in scene order.
+
+        In-flight requests are bounded by the image client's provider rate
+        limiter. Each finished scene is appended to the progress journal right
+        away, so a failure on one scene does not lose the others and a re-run
+        only regenerates scenes that are missing or have changed.
+
+        Args:
+            script: Script with all scenes
+            character_bank: Character consistency bank (portraits already generated)
+            journal: Optional per-scene progress journal (defaults to one in the
+                images directory)
+
+        Returns:
+            Visual assets in scene order
+
+        Raises:
+            Exception: First scene failure, after all other scenes finish
+        """
+        # Pipeline journals are cleared with the stage checkpoint; a default
+        # one has no checkpoint, so it is dropped once every scene is done
+        owns_journal = journal is None
+        if owns_journal:
+            journal = ItemJournal(self._partial_assets_path(script.script_id))
+
+        scenes = script.get_all_scenes()
+        assets: dict[str, VisualAsset] = {}
+
+        for scene in scenes:
+            saved = journal.get(scene.scene_id, fingerprint=self._scene_fingerprint(scene))
+            if saved and Path(saved["image_path"]).exists():
+                assets[scene.scene_id] = VisualAsset.model_validate(saved)
+
+        if assets:
+            logger.info(f"Reusing {len(assets)}/{len(scenes)} scene images from partial progress")
+
+        async def generate(scene: any) -> None:
+            asset = await self._generate_scene_image(scene=scene, character_bank=character_bank)
+            assets[scene.scene_id] = asset
+            journal.record(
+                scene.scene_id,
+                asset.model_dump(mode="json"),
+                fingerprint=self._scene_fingerprint(scene),
             )
 
-            logger.info(f"Generated portrait for {char_name}: {portrait_path}")
+        missing = [scene for scene in scenes if scene.scene_id not in assets]
+        results = await asyncio.gather(*(generate(scene) for scene in missing), return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                logger.error(
+                    f"Scene image generation failed; {len(assets)}/{len(scenes)} scenes saved "
+                    f"for resume"
+                )
+                raise result
+
+        if owns_journal:
+            journal.clear()
+        return [assets[scene.scene_id] for scene in scenes]
+
+    @staticmethod
+    def _scene_fingerprint(scene: any) -> str:
+        """Hash a scene's content so stale partial results are not reused."""
+        return hashlib.sha256(scene.model_dump_json().encode("utf-8")).hexdigest()
+
+    def _partial_assets_path(self, script_id: str) -> Path:
+        """Get path of the default partial-progress journal for a script."""
+        return self.config.images_dir / f"{script_id}_partial.jsonl"
 
     def _get_character_description_from_script(
         self,
@@ -277,7 +443,7 @@ STRICTLY SINGLE CHARACTER. NO background elements, NO other people."""
             prompt_used = composite_prompt
             output_path = self.config.images_dir / f"{scene.scene_id}.png"
             
-            image_path = await self.image_client.generate_image(
+            image_path = await self._generate_image(
                 prompt=composite_prompt,
                 output_path=output_path,
             )
@@ -299,7 +465,7 @@ STRICTLY SINGLE CHARACTER. NO background elements, NO other people."""
             prompt_used = prompt
 
             output_path = self.config.images_dir / f"{scene.scene_id}.png"
-            image_path = await self.image_client.generate_image(
+            image_path = await self._generate_image(
                 prompt=prompt,
                 reference_image=None,  # Gemini doesn't fully support I2I yet
                 output_path=output_path,
@@ -524,7 +690,7 @@ CHARACTER CONSISTENCY REQUIREMENTS:
                 # Generate new image
                 output_path = self.config.images_dir / f"{scene_id}_v2.png"
 
-                image_path = await self.image_client.generate_image(
+                image_path = await self._generate_image(
                     prompt=prompt,
                     reference_image=prompt.reference_image_path,
                     output_path=output_path,
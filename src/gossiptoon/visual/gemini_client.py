@@ -7,11 +7,16 @@ from typing import Optional
 
 from gossiptoon.core.exceptions import GeminiAPIError, ImageGenerationError
 from gossiptoon.models.visual import ImagePrompt
+from gossiptoon.utils.client_pool import get_genai_client
+from gossiptoon.utils.rate_limiter import get_rate_limiter, is_rate_limit_error
 from gossiptoon.utils.retry import retry_with_backoff
 from gossiptoon.visual.base import ImageClient
 
 logger = logging.getLogger(__name__)
 
+# Only model that supports free-tier image generation (see class docstring)
+GEMINI_IMAGE_MODEL = "gemini-2.5-flash-image"
+
 
 class GeminiImageClient(ImageClient):
     """Google Gemini image generation client.
@@ -45,6 +50,7 @@ class GeminiImageClient(ImageClient):
         self.api_key = api_key
         self.model = model
         self._client: Optional[any] = None
+        self.rate_limiter = get_rate_limiter("gemini_image", GEMINI_IMAGE_MODEL)
 
     def _init_client(self) -> any:
         """Initialize Gemini SDK client (lazy loading).
@@ -59,10 +65,8 @@ class GeminiImageClient(ImageClient):
             return self._client
 
         try:
-            from google import genai
-            
-            self._client = genai.Client(api_key=self.api_key)
-            logger.info(f"Gemini image client initialized (google-genai SDK)")
+            self._client = get_genai_client(self.api_key)
+            logger.info("Gemini image client initialized (google-genai SDK)")
             return self._client
         except ImportError:
             raise GeminiAPIError(
@@ -101,8 +105,7 @@ class GeminiImageClient(ImageClient):
         try:
             client = self._init_client()
             
-            logger.info(f"Generating image with {self.model}")
-            logger.info(f"Generating image with {self.model}")
+            logger.info(f"Generating image with {GEMINI_IMAGE_MODEL}")
             
             # Handle both string prompts and ImagePrompt objects
             if isinstance(prompt, str):
@@ -120,13 +123,7 @@ class GeminiImageClient(ImageClient):
             
             # Use Gemini 2.5 Flash Image (official image generation model)
             # Docs: https://ai.google.dev/gemini-api/docs/image-generation
-            from google import genai
-            from google.genai import types
-
             logger.info(f"Generating image with Gemini 2.5 Flash Image")
-            
-            # Create client with API key
-            client = genai.Client(api_key=self.api_key)
 
             # Generate image with Gemini 2.5 Flash Image model
             image_prompt = f"""Generate a 9:16 vertical image for a YouTube Short video.
@@ -138,10 +135,17 @@ Style: Cinematic digital art, dramatic lighting, 8k quality.
 CRITICAL: Do not include any Korean text or Hangul characters. If any text appears, it MUST be in English. No watermarks."""
 
             # Use Gemini 2.5 Flash Image (correct model name)
-            response = client.models.generate_content(
-                model="gemini-2.5-flash-image",
-                contents=[image_prompt],
-            )
+            async with self.rate_limiter.slot():
+                try:
+                    response = await client.aio.models.generate_content(
+                        model=GEMINI_IMAGE_MODEL,
+                        contents=[image_prompt],
+                    )
+                except Exception as e:
+                    if is_rate_limit_error(e):
+                        self.rate_limiter.report_rate_limited()
+                    raise
+            self.rate_limiter.report_success()
             
             # Check for image in response parts
             image_data = None
@@ -174,12 +178,12 @@ CRITICAL: Do not include any Korean text or Hangul characters. If any text appea
             raise ImageGenerationError(f"Image generation failed: {e}") from e
 
     def get_model_name(self) -> str:
-        """Get model name.
+        """Get the model that actually generates images.
 
         Returns:
-            Model identifier
+            Model identifier (always ``GEMINI_IMAGE_MODEL``)
         """
-        return self.model
+        return GEMINI_IMAGE_MODEL
 
     def supports_i2i(self) -> bool:
         """Check if model supports I2I.
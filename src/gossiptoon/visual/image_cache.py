@@ -0,0 +1,265 @@
+"""Content-addressed on-disk cache for generated images.
+
+Keys hash everything that determines the generated image: the full prompt
+text, the model, the aspect ratio and the bytes of any reference image.
+
+Layout (shared by all jobs and processes under the base output directory)::
+
+    <cache_dir>/images/ab/abcdef....png     image
+    <cache_dir>/images/stats.json           cumulative hit/miss statistics
+
+An image's mtime is its LRU clock: it is bumped on every hit, and the least
+recently used images are evicted once the cache grows past ``max_bytes``.
+Eviction scans the directory, so images stored by other processes count
+toward the limit. Hit/miss counters are kept in memory and added to
+``stats.json`` by ``flush_stats`` (once per visual project), never on a
+lookup.
+
+One instance per directory is shared within a process (see ``get_image_cache``).
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Union
+
+from pydantic import BaseModel
+
+from gossiptoon.models.visual import ImagePrompt
+
+logger = logging.getLogger(__name__)
+
+STATS_FILENAME = "stats.json"
+
+
+class ImageCacheStats(BaseModel):
+    """Cache statistics."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class ImageCache:
+    """Size-bounded LRU cache of generated images."""
+
+    def __init__(self, cache_dir: Path, max_bytes: int) -> None:
+        """Initialize image cache.
+
+        Args:
+            cache_dir: Directory holding cached images
+            max_bytes: Maximum total image size before LRU eviction
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        # Counted since the process started (see ``flush_stats``)
+        self.stats = ImageCacheStats()
+        self._unflushed = ImageCacheStats()
+
+    @property
+    def stats_path(self) -> Path:
+        """Path to the cumulative statistics file."""
+        return self.cache_dir / STATS_FILENAME
+
+    @staticmethod
+    def make_key(
+        prompt: Union[ImagePrompt, str],
+        model: str,
+        aspect_ratio: str,
+        reference_image: Optional[Path] = None,
+    ) -> str:
+        """Build the content hash for an image request.
+
+        Args:
+            prompt: Image prompt (ImagePrompt or raw prompt string)
+            model: Image model identifier
+            aspect_ratio: Requested aspect ratio
+            reference_image: Optional reference image (hashed by content)
+
+        Returns:
+            Hex SHA-256 digest
+        """
+        if isinstance(prompt, ImagePrompt):
+            prompt_text = f"{prompt.build_full_prompt()}\nNEGATIVE: {prompt.negative_prompt}"
+        else:
+            prompt_text = str(prompt)
+
+        reference_hash = ""
+        if reference_image is not None and Path(reference_image).exists():
+            reference_hash = hashlib.sha256(Path(reference_image).read_bytes()).hexdigest()
+
+        payload = json.dumps(
+            {
+                "prompt": prompt_text,
+                "model": model,
+                "aspect_ratio": aspect_ratio,
+                "reference": reference_hash,
+            },
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _find(self, key: str) -> Optional[Path]:
+        """Find the cached image for a key (any suffix)."""
+        return next((self.cache_dir / key[:2]).glob(f"{key}.*"), None)
+
+    def _count(self, **deltas: int) -> None:
+        """Add to the in-memory counters."""
+        with self._lock:
+            for name, delta in deltas.items():
+                setattr(self.stats, name, getattr(self.stats, name) + delta)
+                setattr(self._unflushed, name, getattr(self._unflushed, name) + delta)
+
+    def get(self, key: str, output_path: Path) -> Optional[Path]:
+        """Copy a cached image to ``output_path`` if present.
+
+        Args:
+            key: Content hash from ``make_key``
+            output_path: Where the caller wants the image
+
+        Returns:
+            output_path on a hit, None on a miss
+        """
+        cached_file = self._find(key)
+        try:
+            if cached_file is None:
+                raise FileNotFoundError(key)
+            # Mark as recently used (explicit time: the file clock is coarser)
+            now = time.time_ns()
+            os.utime(cached_file, ns=(now, now))
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(cached_file, output_path)
+        except FileNotFoundError:
+            self._count(misses=1)
+            return None
+
+        self._count(hits=1)
+        logger.info(f"Image cache hit: {output_path.name} ({key[:12]})")
+        return output_path
+
+    def put(self, key: str, image_path: Path) -> Path:
+        """Store a generated image.
+
+        Args:
+            key: Content hash from ``make_key``
+            image_path: Generated image file
+
+        Returns:
+            Path to the cached image
+        """
+        cached_file = self.cache_dir / key[:2] / f"{key}{image_path.suffix or '.png'}"
+        cached_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cached_file.with_name(f".{cached_file.name}.{os.getpid()}.tmp")
+        shutil.copyfile(image_path, tmp_file)
+        os.replace(tmp_file, cached_file)
+
+        self._evict_if_needed()
+        return cached_file
+
+    def _scan(self) -> list[tuple[float, Path, int]]:
+        """List images as (last_used, path, size_bytes)."""
+        entries = []
+        for image_file in self.cache_dir.glob("*/*"):
+            if image_file.name.startswith("."):
+                continue  # Write in progress
+            try:
+                stat = image_file.stat()
+            except FileNotFoundError:
+                continue  # Evicted concurrently
+            entries.append((stat.st_mtime, image_file, stat.st_size))
+        return entries
+
+    def _evict_if_needed(self) -> None:
+        """Evict least recently used images until under ``max_bytes``.
+
+        Always rescans: other processes store images in the same directory,
+        and images are generated slowly enough that a listing is cheap.
+        """
+        with self._lock:
+            entries = self._scan()
+            total = sum(size for _, _, size in entries)
+
+            evicted = 0
+            for _, image_file, size in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                image_file.unlink(missing_ok=True)
+                total -= size
+                evicted += 1
+
+        if evicted:
+            self._count(evictions=evicted)
+            logger.info(f"Image cache evicted {evicted} images ({total / 1e6:.1f} MB kept)")
+
+    def size_bytes(self) -> int:
+        """Get total size of cached images."""
+        return sum(size for _, _, size in self._scan())
+
+    def cumulative_stats(self) -> ImageCacheStats:
+        """Get statistics accumulated across runs (as of the last flush).
+
+        Returns:
+            Cumulative statistics (all zero if never flushed)
+        """
+        try:
+            return ImageCacheStats.model_validate_json(self.stats_path.read_text())
+        except FileNotFoundError:
+            return ImageCacheStats()
+        except Exception as e:
+            logger.warning(f"Image cache stats unreadable, starting fresh: {e}")
+            return ImageCacheStats()
+
+    def flush_stats(self) -> ImageCacheStats:
+        """Add the counters since the last flush to the cumulative statistics.
+
+        Returns:
+            Updated cumulative statistics
+        """
+        with self._lock:
+            pending, self._unflushed = self._unflushed, ImageCacheStats()
+
+        totals = self.cumulative_stats()
+        for name in ImageCacheStats.model_fields:
+            setattr(totals, name, getattr(totals, name) + getattr(pending, name))
+
+        tmp_path = self.stats_path.with_name(f".{STATS_FILENAME}.{os.getpid()}.tmp")
+        tmp_path.write_text(totals.model_dump_json())
+        os.replace(tmp_path, self.stats_path)
+        return totals
+
+
+_caches: dict[Path, ImageCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_image_cache(cache_dir: Path, max_bytes: int) -> ImageCache:
+    """Get the process-wide image cache for a directory.
+
+    Args:
+        cache_dir: Cache directory
+        max_bytes: Maximum cache size (updates an existing instance)
+
+    Returns:
+        Shared ImageCache instance
+    """
+    with _caches_lock:
+        cache = _caches.get(cache_dir)
+        if cache is None:
+            cache = ImageCache(cache_dir, max_bytes)
+            _caches[cache_dir] = cache
+        cache.max_bytes = max_bytes
+        return cache
@@ -49,6 +49,7 @@ def mock_config(temp_dirs):
     """Create mock configuration."""
     config = MagicMock(spec=ConfigManager)
     config.checkpoints_dir = temp_dirs["checkpoints"]
+    config.shared_checkpoints_dir = temp_dirs["checkpoints"]
     config.images_dir = temp_dirs["images"]
     config.audio_dir = temp_dirs["audio"]
     config.videos_dir = temp_dirs["videos"]
@@ -80,6 +81,13 @@ def mock_config(temp_dirs):
     video_config.captions_enabled = True
     config.video = video_config
 
+    # Keep default API rate limits
+    config.rate_limits = {}
+
+    app_config = MagicMock()
+    app_config.checkpoint_backend = "sqlite"
+    config.app = app_config
+
     return config
 
 
@@ -230,6 +238,122 @@ def test_list_checkpoints(temp_dirs):
     assert "project_003" in checkpoints
 
 
+def test_item_journal_survives_stage_and_clears_on_save(temp_dirs):
+    """Per-item progress is kept until the stage checkpoint is saved."""
+    manager = CheckpointManager(temp_dirs["checkpoints"])
+    project_id = "test_project_journal"
+
+    journal = manager.get_item_journal(project_id, PipelineStage.AUDIO_GENERATED)
+    journal.record("chunk_01", {"duration_seconds": 1.5}, fingerprint="abc")
+    journal.record("chunk_02", {"duration_seconds": 2.0}, fingerprint="def")
+    # Simulate a crash in the middle of writing the next record
+    with open(journal.path, "a") as f:
+        f.write('{"item_id": "chunk_03", "finger')
+
+    reloaded = manager.get_item_journal(project_id, PipelineStage.AUDIO_GENERATED)
+    assert reloaded.item_ids() == ["chunk_01", "chunk_02"]
+    assert reloaded.get("chunk_01", fingerprint="abc") == {"duration_seconds": 1.5}
+    assert reloaded.get("chunk_01", fingerprint="changed") is None
+    assert manager.list_checkpoints() == []
+
+    reloaded.record("chunk_03", {"duration_seconds": 0.5}, fingerprint="ghi")
+    assert manager.get_item_journal(project_id, PipelineStage.AUDIO_GENERATED).item_ids() == [
+        "chunk_01",
+        "chunk_02",
+        "chunk_03",
+    ]
+
+    manager.save_checkpoint(project_id, PipelineStage.AUDIO_GENERATED, {"audio_project": {}})
+    assert not journal.path.exists()
+
+
+def test_sqlite_checkpoint_loads_only_requested_stages(temp_dirs):
+    """Stage outputs are stored separately and loaded on demand."""
+    manager = CheckpointManager(temp_dirs["checkpoints"], backend="sqlite")
+    project_id = "test_project_lazy"
+
+    manager.save_checkpoint(project_id, PipelineStage.SCRIPT_GENERATED, {"script": {"id": "s"}})
+    manager.save_checkpoint(project_id, PipelineStage.AUDIO_GENERATED, {"audio_project": {"id": "a"}})
+
+    header = manager.load_checkpoint(project_id, stages=())
+    assert header.current_stage == PipelineStage.AUDIO_GENERATED
+    assert header.completed_stages == [
+        PipelineStage.SCRIPT_GENERATED,
+        PipelineStage.AUDIO_GENERATED,
+    ]
+    assert header.script_data is None and header.audio_data is None
+
+    audio_only = manager.load_checkpoint(project_id, stages=[PipelineStage.AUDIO_GENERATED])
+    assert audio_only.audio_data == {"audio_project": {"id": "a"}}
+    assert audio_only.script_data is None
+
+    full = manager.load_checkpoint(project_id)
+    assert full.script_data == {"script": {"id": "s"}}
+
+
+def test_sqlite_store_migrates_json_checkpoints(temp_dirs):
+    """Checkpoints written by the JSON backend are imported into SQLite."""
+    json_manager = CheckpointManager(temp_dirs["checkpoints"], backend="json")
+    json_manager.save_checkpoint("legacy_project", PipelineStage.STORY_FOUND, {"story": {"id": "x"}})
+    json_manager.add_error("legacy_project", "boom")
+    assert json_manager.list_checkpoints() == ["legacy_project"]
+
+    manager = CheckpointManager(temp_dirs["checkpoints"], backend="sqlite")
+
+    checkpoint = manager.load_checkpoint("legacy_project")
+    assert checkpoint.story_data == {"story": {"id": "x"}}
+    assert checkpoint.completed_stages == [PipelineStage.STORY_FOUND]
+    assert "boom" in checkpoint.error_history[0]
+    assert not (temp_dirs["checkpoints"] / "checkpoint_legacy_project.json").exists()
+    assert manager.list_checkpoints() == ["legacy_project"]
+
+
+def test_sqlite_checkpoints_shared_across_job_contexts(tmp_path, monkeypatch):
+    """Jobs with their own output directories save to one database."""
+    monkeypatch.setenv("GOOGLE_API_KEY", "test_google_key")
+    monkeypatch.setenv("ELEVENLABS_API_KEY", "test_elevenlabs_key")
+    monkeypatch.setenv("OUTPUT_DIR", str(tmp_path / "outputs"))
+    config = ConfigManager()
+
+    def job_manager(job_config: ConfigManager) -> CheckpointManager:
+        return CheckpointManager(
+            job_config.checkpoints_dir,
+            backend="sqlite",
+            shared_dir=job_config.shared_checkpoints_dir,
+        )
+
+    for project_id in ("project_a", "project_b"):
+        job_config = config.for_job(project_id)
+        job_manager(job_config).save_checkpoint(
+            project_id, PipelineStage.STORY_FOUND, {"story": {"id": project_id}}
+        )
+        assert not (job_config.checkpoints_dir / "checkpoints.db").exists()
+
+    # What `gossiptoon list` sees from the base configuration
+    assert sorted(job_manager(config).list_checkpoints()) == ["project_a", "project_b"]
+
+
+def test_clean_old_checkpoints_uses_last_update(temp_dirs):
+    """Cleanup removes checkpoints (and journals) not updated within the window."""
+    import sqlite3
+
+    manager = CheckpointManager(temp_dirs["checkpoints"], backend="sqlite")
+    manager.save_checkpoint("old_project", PipelineStage.STORY_FOUND, {"story": {}})
+    manager.save_checkpoint("new_project", PipelineStage.STORY_FOUND, {"story": {}})
+    journal = manager.get_item_journal("old_project", PipelineStage.AUDIO_GENERATED)
+    journal.record("chunk_01", {})
+
+    with sqlite3.connect(manager.store.db_path) as conn:
+        conn.execute(
+            "UPDATE checkpoints SET updated_at = updated_at - 30 * 86400 "
+            "WHERE project_id = 'old_project'"
+        )
+
+    assert manager.clean_old_checkpoints(max_age_days=7) == 1
+    assert manager.list_checkpoints() == ["new_project"]
+    assert not journal.path.exists()
+
+
 def test_checkpoint_not_found(temp_dirs):
     """Test loading non-existent checkpoint."""
     manager = CheckpointManager(temp_dirs["checkpoints"])
@@ -605,3 +729,175 @@ def test_generate_project_id(mock_config):
         project_id = orchestrator._generate_project_id()
         assert project_id.startswith("project_")
         assert len(project_id) > 10
+
+
+# ============================================================================
+# Stage DAG Tests
+# ============================================================================
+
+
+@pytest.fixture
+def dag_orchestrator(mock_config):
+    """Create orchestrator with every agent mocked out."""
+    with patch("gossiptoon.pipeline.orchestrator.StoryFinderAgent"), \
+         patch("gossiptoon.pipeline.orchestrator.SceneStructurerAgent"), \
+         patch("gossiptoon.pipeline.orchestrator.ScriptWriterAgent"), \
+         patch("gossiptoon.pipeline.orchestrator.ScriptEvaluator"), \
+         patch("gossiptoon.pipeline.orchestrator.VisualDetailerAgent"), \
+         patch("gossiptoon.pipeline.orchestrator.EngagementWriter"), \
+         patch("gossiptoon.pipeline.orchestrator.AudioGenerator"), \
+         patch("gossiptoon.pipeline.orchestrator.VisualDirector"), \
+         patch("gossiptoon.pipeline.orchestrator.VideoAssembler"):
+        orchestrator = PipelineOrchestrator(mock_config)
+
+    orchestrator._run_metadata_generator = AsyncMock(return_value=None)
+    return orchestrator
+
+
+def _stage_output(name: str) -> MagicMock:
+    """Create a fake stage output that can be checkpointed."""
+    output = MagicMock(name=name)
+    output.model_dump.return_value = {"name": name}
+    return output
+
+
+def test_stage_dependencies_are_topologically_ordered():
+    """Every stage's dependencies are declared before it."""
+    from gossiptoon.pipeline.orchestrator import STAGE_DEPENDENCIES
+
+    seen = set()
+    for stage, dependencies in STAGE_DEPENDENCIES.items():
+        assert set(dependencies) <= seen
+        seen.add(stage)
+
+
+@pytest.mark.asyncio
+async def test_audio_and_visual_stages_run_concurrently(dag_orchestrator):
+    """Audio and visual stages overlap instead of running back to back."""
+    audio_started = asyncio.Event()
+    visual_started = asyncio.Event()
+
+    async def fake_audio(script, journal=None):
+        audio_started.set()
+        await asyncio.wait_for(visual_started.wait(), timeout=2)
+        return _stage_output("audio")
+
+    async def fake_visual(script, journal=None):
+        visual_started.set()
+        await asyncio.wait_for(audio_started.wait(), timeout=2)
+        return _stage_output("visual")
+
+    dag_orchestrator._run_story_finder = AsyncMock(return_value=_stage_output("story"))
+    dag_orchestrator._run_script_writer = AsyncMock(return_value=_stage_output("script"))
+    dag_orchestrator._run_engagement_writer = AsyncMock(return_value=_stage_output("engagement"))
+    dag_orchestrator._run_audio_generator = fake_audio
+    dag_orchestrator._run_visual_director = fake_visual
+    dag_orchestrator._run_video_assembler = AsyncMock(return_value=_stage_output("video"))
+
+    result = await dag_orchestrator.run(story_url="https://reddit.com/test")
+
+    assert result.success is True, result.error
+    assert result.completed_stages[-1] == PipelineStage.COMPLETED
+    assert set(result.completed_stages) == set(PipelineStage) - {PipelineStage.INITIALIZED}
+
+    checkpoint = dag_orchestrator.checkpoint_manager.load_checkpoint(result.project_id)
+    assert checkpoint.audio_data == {"audio_project": {"name": "audio"}}
+    assert checkpoint.visual_data == {"visual_project": {"name": "visual"}}
+
+
+@pytest.mark.asyncio
+async def test_failed_stage_keeps_sibling_checkpoints(dag_orchestrator):
+    """A failing audio stage does not discard the finished visual stage."""
+    dag_orchestrator._run_story_finder = AsyncMock(return_value=_stage_output("story"))
+    dag_orchestrator._run_script_writer = AsyncMock(return_value=_stage_output("script"))
+    dag_orchestrator._run_engagement_writer = AsyncMock(return_value=_stage_output("engagement"))
+    dag_orchestrator._run_audio_generator = AsyncMock(side_effect=GossipToonException("TTS down"))
+    dag_orchestrator._run_visual_director = AsyncMock(return_value=_stage_output("visual"))
+    dag_orchestrator._run_video_assembler = AsyncMock()
+
+    result = await dag_orchestrator.run(story_url="https://reddit.com/test")
+
+    assert result.success is False
+    assert "TTS down" in result.error
+    dag_orchestrator._run_video_assembler.assert_not_called()
+
+    checkpoint = dag_orchestrator.checkpoint_manager.load_checkpoint(result.project_id)
+    completed = dag_orchestrator.checkpoint_manager.get_completed_stages(checkpoint)
+    assert PipelineStage.VISUALS_GENERATED in completed
+    assert PipelineStage.AUDIO_GENERATED not in completed
+
+
+@pytest.mark.asyncio
+async def test_resume_runs_only_missing_stages(dag_orchestrator):
+    """Resume regenerates only the stages absent from the checkpoint."""
+    from gossiptoon.models.engagement import EngagementHook, EngagementProject, EngagementStyle
+
+    engagement = EngagementProject(
+        hooks=[
+            EngagementHook(
+                hook_id=f"hook_{i}",
+                text="Who is right?",
+                scene_id="scene_1",
+                timing=0.5,
+                style=EngagementStyle.QUESTION,
+                reasoning="test",
+            )
+            for i in range(2)
+        ],
+        strategy="test",
+    )
+
+    project_id = "project_resume_dag"
+    manager = dag_orchestrator.checkpoint_manager
+    manager.save_checkpoint(project_id, PipelineStage.STORY_FOUND, {"story": {"id": "s"}})
+    manager.save_checkpoint(project_id, PipelineStage.SCRIPT_GENERATED, {"script": {"id": "s"}})
+    manager.save_checkpoint(
+        project_id,
+        PipelineStage.ENGAGEMENT_GENERATED,
+        {"engagement_project": engagement.model_dump()},
+    )
+
+    dag_orchestrator._load_story_from_checkpoint = MagicMock(return_value=_stage_output("story"))
+    dag_orchestrator._load_script_from_checkpoint = MagicMock(return_value=_stage_output("script"))
+    dag_orchestrator._run_story_finder = AsyncMock()
+    dag_orchestrator._run_script_writer = AsyncMock()
+    dag_orchestrator._run_engagement_writer = AsyncMock()
+    dag_orchestrator._run_audio_generator = AsyncMock(return_value=_stage_output("audio"))
+    dag_orchestrator._run_visual_director = AsyncMock(return_value=_stage_output("visual"))
+    dag_orchestrator._run_video_assembler = AsyncMock(return_value=_stage_output("video"))
+
+    result = await dag_orchestrator.run(project_id=project_id, resume=True)
+
+    assert result.success is True, result.error
+    dag_orchestrator._run_story_finder.assert_not_called()
+    dag_orchestrator._run_script_writer.assert_not_called()
+    dag_orchestrator._run_engagement_writer.assert_not_called()
+    dag_orchestrator._run_audio_generator.assert_awaited_once()
+    dag_orchestrator._run_visual_director.assert_awaited_once()
+
+    # Engagement hooks restored from the checkpoint are passed to assembly
+    _, kwargs = dag_orchestrator._run_video_assembler.call_args
+    assert kwargs["engagement_project"] == engagement
+
+
+@pytest.mark.asyncio
+async def test_long_stages_receive_item_journals(dag_orchestrator):
+    """Audio and visual stages get per-item journals stored next to the checkpoint."""
+    dag_orchestrator._run_story_finder = AsyncMock(return_value=_stage_output("story"))
+    dag_orchestrator._run_script_writer = AsyncMock(return_value=_stage_output("script"))
+    dag_orchestrator._run_engagement_writer = AsyncMock(return_value=_stage_output("engagement"))
+    dag_orchestrator._run_audio_generator = AsyncMock(return_value=_stage_output("audio"))
+    dag_orchestrator._run_visual_director = AsyncMock(return_value=_stage_output("visual"))
+    dag_orchestrator._run_video_assembler = AsyncMock(return_value=_stage_output("video"))
+
+    result = await dag_orchestrator.run(story_url="https://reddit.com/test")
+
+    assert result.success is True, result.error
+    checkpoints_dir = dag_orchestrator.checkpoint_manager.checkpoint_dir
+    for mock_stage, stage in [
+        (dag_orchestrator._run_audio_generator, PipelineStage.AUDIO_GENERATED),
+        (dag_orchestrator._run_visual_director, PipelineStage.VISUALS_GENERATED),
+    ]:
+        journal = mock_stage.call_args.kwargs["journal"]
+        assert journal.path.parent == checkpoints_dir
+        assert stage.value in journal.path.name
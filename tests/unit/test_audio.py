@@ -1,5 +1,6 @@
 """Unit tests for audio pipeline components."""
 
+import json
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -150,6 +151,163 @@ class TestWhisperTimestampExtractor:
         total_words = sum(len(scene_words) for scene_words in scene_timestamps)
         assert total_words <= len(timestamps)
 
+    def test_split_batched_words(self) -> None:
+        """Words from a batched pass return to their chunk with local times."""
+        words = [
+            WordTimestamp(word="Hi", start=0.1, end=0.4, confidence=0.9),
+            WordTimestamp(word="there", start=0.5, end=1.0, confidence=0.9),
+            WordTimestamp(word="Oh", start=1.5, end=1.8, confidence=0.8),
+            # Runs slightly into the gap after the second chunk
+            WordTimestamp(word="no", start=2.3, end=2.7, confidence=0.8),
+            WordTimestamp(word="Bye", start=3.2, end=3.5, confidence=0.9),
+        ]
+        bounds = [(0.0, 1.0), (1.5, 2.5), (3.0, 4.0)]
+
+        per_chunk = WhisperTimestampExtractor.split_batched_words(words, bounds)
+
+        assert [[w.word for w in chunk] for chunk in per_chunk] == [
+            ["Hi", "there"],
+            ["Oh", "no"],
+            ["Bye"],
+        ]
+        assert per_chunk[1][0].start == pytest.approx(0.0)
+        assert per_chunk[1][1].end == pytest.approx(1.0)
+        assert per_chunk[2][0].start == pytest.approx(0.2)
+        assert per_chunk[2][0].confidence == 0.9
+
+
+class TestWhisperWorkers:
+    """Tests for running Whisper off the event loop with a persistent model."""
+
+    @staticmethod
+    def _fake_backend(calls: list):
+        """Backend that emits one word per second of non-silent audio.
+
+        Audio files hold their length in seconds.
+        """
+        import threading
+
+        import numpy as np
+
+        from gossiptoon.audio.timestamp_backends import TimestampBackend
+
+        class FakeBackend(TimestampBackend):
+            name = "fake"
+
+            def load_audio(self, audio_path):
+                return np.ones(int(Path(audio_path).read_text()) * 16000, dtype=np.float32)
+
+            def transcribe(self, audio, language, text=None):
+                calls.append(threading.get_ident())
+                # Speech wherever the signal is non-zero at the top of a second
+                return [
+                    WordTimestamp(word=f"w{n}", start=n + 0.1, end=n + 0.4, confidence=0.9)
+                    for n, i in enumerate(range(0, len(audio), 16000))
+                    if audio[i]
+                ]
+
+        return FakeBackend("base")
+
+    @pytest.mark.asyncio
+    async def test_in_process_runs_off_event_loop_and_loads_once(
+        self, tmp_path: Path, monkeypatch
+    ) -> None:
+        """In-process mode transcribes on a worker thread with one model load."""
+        import threading
+
+        from gossiptoon.audio import whisper as whisper_module
+
+        calls: list = []
+        factory = MagicMock(return_value=self._fake_backend(calls))
+        monkeypatch.setattr(whisper_module, "create_timestamp_backend", factory)
+        audio = tmp_path / "a.wav"
+        audio.write_text("1")
+
+        extractor = WhisperTimestampExtractor(processes=0)
+        for _ in range(2):
+            words = await extractor.extract_timestamps(audio)
+
+        assert [w.word for w in words] == ["w0"]
+        assert factory.call_count == 1
+        assert threading.get_ident() not in calls
+
+    @pytest.mark.asyncio
+    async def test_batch_split_across_workers_keeps_input_order(
+        self, tmp_path: Path, monkeypatch
+    ) -> None:
+        """Batched extraction runs one pass per worker and returns results in order."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        from gossiptoon.audio import whisper as whisper_module
+
+        calls: list = []
+        monkeypatch.setattr(whisper_module, "_worker_backend", self._fake_backend(calls))
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            monkeypatch.setattr(whisper_module, "get_whisper_pool", lambda *args: pool)
+
+            paths = []
+            for i, seconds in enumerate([1, 2, 3, 2]):
+                path = tmp_path / f"chunk_{i}.wav"
+                path.write_text(str(seconds))
+                paths.append(path)
+
+            extractor = WhisperTimestampExtractor(processes=2)
+            results = await extractor.extract_timestamps_batch(paths)
+
+        assert len(calls) == 2
+        assert [len(words) for words in results] == [1, 2, 3, 2]
+        assert results[2][0].start == pytest.approx(0.1)
+        assert results[2][-1].end == pytest.approx(2.4)
+
+
+class TestTimestampBackends:
+    """Tests for selectable timestamp backends."""
+
+    @staticmethod
+    def _speech(segments: list[tuple[float, float]], total: float):
+        """Tone bursts at the given (start, end) seconds, silence elsewhere."""
+        import numpy as np
+
+        audio = np.zeros(int(total * 16000), dtype=np.float32)
+        for start, end in segments:
+            t = np.arange(int(start * 16000), int(end * 16000))
+            audio[t] = 0.5 * np.sin(2 * np.pi * 220 * t / 16000)
+        return audio
+
+    def test_energy_backend_places_words_in_speech(self) -> None:
+        """Words are spread over voiced time; pauses become gaps between words."""
+        from gossiptoon.audio.timestamp_backends import create_timestamp_backend
+
+        backend = create_timestamp_backend("energy", "base")
+        audio = self._speech([(0.2, 1.0), (1.6, 2.4)], total=3.0)
+
+        words = backend.transcribe(audio, "en", text="Wait what. Seriously now")
+
+        assert [w.word for w in words] == ["Wait", "what.", "Seriously", "now"]
+        assert words[0].start == pytest.approx(0.2, abs=0.03)
+        assert words[-1].end == pytest.approx(2.4, abs=0.03)
+        assert all(a.end <= b.start + 1e-6 for a, b in zip(words, words[1:]))
+        # "what." ends in the first burst; "Seriously" starts in the second
+        assert words[1].end <= 1.0 + 0.03
+        assert words[2].start >= 1.6 - 0.03
+
+    def test_energy_backend_requires_text(self) -> None:
+        """The model-free backend cannot recognize speech on its own."""
+        from gossiptoon.audio.timestamp_backends import create_timestamp_backend
+        from gossiptoon.core.exceptions import WhisperError
+
+        backend = create_timestamp_backend("energy", "base")
+        with pytest.raises(WhisperError):
+            backend.transcribe(self._speech([(0.0, 1.0)], total=1.0), "en")
+
+    def test_unknown_backend_rejected(self) -> None:
+        """Unknown backend names fail with a WhisperError."""
+        from gossiptoon.audio.timestamp_backends import create_timestamp_backend
+        from gossiptoon.core.exceptions import WhisperError
+
+        with pytest.raises(WhisperError):
+            create_timestamp_backend("nope", "base")
+
 
 class TestAudioProcessor:
     """Tests for audio processing utilities."""
@@ -197,6 +355,527 @@ class TestAudioProcessor:
             assert "concat" in call_args
 
 
+def _write_tone(
+    path: Path, seconds: float, sample_rate: int = 24000, amplitude: float = 0.5
+) -> Path:
+    """Write a mono 16-bit sine tone WAV."""
+    import wave
+
+    import numpy as np
+
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    samples = (amplitude * np.sin(2 * np.pi * 440 * t) * 32767).astype("<i2")
+    with wave.open(str(path), "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(samples.tobytes())
+    return path
+
+
+class TestPCMAudio:
+    """Tests for the in-memory PCM master pipeline."""
+
+    def test_concatenate_with_crossfade(self) -> None:
+        """Joins overlap by the crossfade length and blend linearly."""
+        import numpy as np
+
+        from gossiptoon.audio.pcm import PCMAudio
+
+        a = PCMAudio(np.ones(1000, dtype=np.float32), 1000)
+        b = PCMAudio(np.zeros(1000, dtype=np.float32), 1000)
+
+        joined = PCMAudio.concatenate([a, b, a], crossfade_seconds=0.1)
+
+        assert joined.frames == 3000 - 2 * 100
+        assert joined.samples[899, 0] == pytest.approx(1.0)
+        assert joined.samples[950, 0] == pytest.approx(0.5, abs=0.01)
+        assert joined.samples[1000:1800, 0].max() == 0.0
+        assert joined.samples[-1, 0] == pytest.approx(1.0)
+
+    def test_normalize_sets_rms_level(self) -> None:
+        """Normalization reaches the target RMS level."""
+        import numpy as np
+
+        from gossiptoon.audio.pcm import PCMAudio
+
+        audio = PCMAudio(np.full(500, 0.01, dtype=np.float32), 1000)
+
+        assert audio.normalize(-20.0).dbfs == pytest.approx(-20.0, abs=0.01)
+
+    def test_write_rejects_lossy_format(self, tmp_path: Path) -> None:
+        """The master is only ever written losslessly."""
+        import numpy as np
+
+        from gossiptoon.audio.pcm import PCMAudio
+        from gossiptoon.core.exceptions import AudioGenerationError
+
+        with pytest.raises(AudioGenerationError):
+            PCMAudio(np.zeros(10, dtype=np.float32), 1000).write(tmp_path / "master.mp3")
+
+    @pytest.mark.asyncio
+    async def test_render_master_writes_single_wav(self, tmp_path: Path) -> None:
+        """Segments with different rates are decoded, joined and written as one WAV."""
+        import wave
+
+        from gossiptoon.audio.pcm import PCMAudio
+
+        paths = [
+            _write_tone(tmp_path / "a.wav", 1.0, sample_rate=24000),
+            _write_tone(tmp_path / "b.wav", 0.5, sample_rate=48000, amplitude=0.1),
+        ]
+
+        master_path = await AudioProcessor().render_master(
+            paths, tmp_path / "master.wav", crossfade_ms=100, target_dbfs=-20.0
+        )
+
+        with wave.open(str(master_path), "rb") as wav_file:
+            assert wav_file.getframerate() == 48000
+            assert wav_file.getnframes() == pytest.approx(1.4 * 48000, abs=2)
+        assert PCMAudio.from_file(master_path).dbfs == pytest.approx(-20.0, abs=0.1)
+
+
+class TestLoudness:
+    """Tests for EBU R128 loudness measurement and normalization."""
+
+    def _sine(self, seconds: float, sample_rate: int, amplitude: float, hz: float = 997.0):
+        import numpy as np
+
+        t = np.arange(int(seconds * sample_rate)) / sample_rate
+        return (amplitude * np.sin(2 * np.pi * hz * t))[:, np.newaxis].astype(np.float32)
+
+    def test_k_weighting_matches_reference_coefficients(self) -> None:
+        """48 kHz coefficients match the BS.1770 reference values."""
+        from gossiptoon.audio.loudness import k_weighting_coefficients
+
+        (shelf_b, shelf_a), (high_pass_b, high_pass_a) = k_weighting_coefficients(48000)
+
+        assert shelf_b == pytest.approx([1.53512486, -2.69169619, 1.19839281], abs=1e-7)
+        assert shelf_a == pytest.approx([1.0, -1.69065929, 0.73248077], abs=1e-7)
+        assert high_pass_b == pytest.approx([1.0, -2.0, 1.0])
+        assert high_pass_a == pytest.approx([1.0, -1.99004745, 0.99007225], abs=1e-7)
+
+    @pytest.mark.parametrize("sample_rate", [24000, 44100, 48000])
+    def test_reference_tone_loudness(self, sample_rate: int) -> None:
+        """A 997 Hz tone with 0.1 peak amplitude measures -23 LUFS (mono)."""
+        from gossiptoon.audio.loudness import integrated_loudness
+
+        tone = self._sine(5.0, sample_rate, 0.1)
+
+        assert integrated_loudness(tone, sample_rate) == pytest.approx(-23.0, abs=0.1)
+
+    def test_gating_ignores_silence(self) -> None:
+        """Silence is gated out; all-silent audio has no loudness."""
+        import numpy as np
+
+        from gossiptoon.audio.loudness import integrated_loudness
+
+        tone = self._sine(5.0, 24000, 0.1)
+        padded = np.concatenate([tone, np.zeros_like(tone), tone])
+
+        assert integrated_loudness(padded, 24000) == pytest.approx(-23.0, abs=0.2)
+        assert integrated_loudness(np.zeros((24000, 1)), 24000) == float("-inf")
+
+    def test_low_frequencies_weigh_less(self) -> None:
+        """K-weighting: a 30 Hz tone is quieter than 1 kHz at the same level."""
+        from gossiptoon.audio.loudness import integrated_loudness
+
+        low = integrated_loudness(self._sine(5.0, 24000, 0.1, hz=30.0), 24000)
+
+        assert low < -23.0 - 1.0
+
+    @pytest.mark.asyncio
+    async def test_render_master_matches_segments_and_hits_target(
+        self, tmp_path: Path
+    ) -> None:
+        """Quiet and loud segments come out at the same loudness as the target."""
+        from gossiptoon.audio.pcm import PCMAudio
+
+        paths = [
+            _write_tone(tmp_path / "quiet.wav", 2.0, sample_rate=24000, amplitude=0.1),
+            _write_tone(tmp_path / "loud.wav", 2.0, sample_rate=24000, amplitude=0.4),
+        ]
+
+        master_path = await AudioProcessor().render_master(
+            paths, tmp_path / "master.wav", target_dbfs=None, target_lufs=-16.0
+        )
+
+        master = PCMAudio.from_file(master_path)
+        first = PCMAudio(master.samples[: 2 * 24000], 24000)
+        second = PCMAudio(master.samples[2 * 24000 :], 24000)
+        assert master.loudness == pytest.approx(-16.0, abs=0.1)
+        assert first.loudness == pytest.approx(second.loudness, abs=0.1)
+
+    def test_normalize_loudness_respects_peak_ceiling(self) -> None:
+        """Gain stops short of pushing peaks above the ceiling."""
+        from gossiptoon.audio.pcm import PEAK_CEILING_DBFS, PCMAudio
+
+        audio = PCMAudio(self._sine(2.0, 24000, 0.5), 24000)
+
+        normalized, before = audio.normalize_loudness(-3.0)
+
+        assert before == pytest.approx(-9.0, abs=0.1)
+        assert normalized.peak_dbfs == pytest.approx(PEAK_CEILING_DBFS, abs=0.01)
+
+
+class TestDurationProbe:
+    """Tests for header-based duration probing."""
+
+    @pytest.fixture(autouse=True)
+    def empty_probe_cache(self, monkeypatch):
+        """Give each test an empty duration cache."""
+        from gossiptoon.audio import probe
+
+        monkeypatch.setattr(probe, "_durations", {})
+
+    def test_wav_duration_from_header(self, tmp_path: Path) -> None:
+        """WAV durations come from the chunk headers without decoding."""
+        path = _write_tone(tmp_path / "chunk.wav", 1.25, sample_rate=24000)
+
+        with patch("pydub.AudioSegment.from_file", side_effect=AssertionError("decoded")):
+            duration = AudioProcessor().get_audio_duration(path)
+
+        assert duration == pytest.approx(1.25)
+
+    def test_wav_with_extra_chunks_and_unknown_size(self, tmp_path: Path) -> None:
+        """Chunks before the data are skipped; a streamed data size runs to EOF."""
+        import struct
+
+        from gossiptoon.audio.probe import read_wav_duration
+
+        fmt = struct.pack("<HHIIHH", 1, 2, 8000, 32000, 4, 16)
+        frames = b"\x00" * (4 * 4000)
+        body = (
+            b"WAVE"
+            + b"fmt " + struct.pack("<I", len(fmt)) + fmt
+            + b"LIST" + struct.pack("<I", 3) + b"abc\x00"
+            + b"data" + struct.pack("<I", 0xFFFFFFFF) + frames
+        )
+        path = tmp_path / "streamed.wav"
+        path.write_bytes(b"RIFF" + struct.pack("<I", 0xFFFFFFFF) + body)
+
+        assert read_wav_duration(path) == pytest.approx(0.5)
+        not_wav = tmp_path / "chunk.wav"
+        not_wav.write_bytes(b"ID3" + b"\x00" * 64)
+        assert read_wav_duration(not_wav) is None
+
+    def test_durations_cached_until_file_changes(self, tmp_path: Path) -> None:
+        """A file is probed once until its size or mtime changes."""
+        from gossiptoon.audio import probe
+
+        path = _write_tone(tmp_path / "chunk.wav", 1.0, sample_rate=8000)
+
+        with patch.object(probe, "read_wav_duration", wraps=probe.read_wav_duration) as read:
+            assert probe.probe_duration(path) == pytest.approx(1.0)
+            assert probe.probe_duration(path) == pytest.approx(1.0)
+            _write_tone(path, 2.0, sample_rate=8000)
+            assert probe.probe_duration(path) == pytest.approx(2.0)
+
+        assert read.call_count == 2
+
+    def test_compressed_files_probed_with_ffprobe(self, tmp_path: Path) -> None:
+        """Non-WAV files go to ffprobe, one process each, results in order."""
+        from gossiptoon.audio import probe
+
+        wav = _write_tone(tmp_path / "a.wav", 0.5, sample_rate=8000)
+        mp3s = [tmp_path / "b.mp3", tmp_path / "c.mp3"]
+        for index, mp3 in enumerate(mp3s):
+            mp3.write_bytes(b"x" * (index + 1))
+
+        def fake_ffprobe(cmd, **kwargs):
+            return MagicMock(stdout="2.5\n" if cmd[-1].endswith("b.mp3") else "3.25\n")
+
+        with patch.object(probe.subprocess, "run", side_effect=fake_ffprobe) as run:
+            durations = AudioProcessor().get_audio_durations([mp3s[1], wav, mp3s[0], mp3s[1]])
+
+        assert durations == pytest.approx([3.25, 0.5, 2.5, 3.25])
+        assert run.call_count == 2
+        assert all(call.args[0][0] == "ffprobe" for call in run.call_args_list)
+
+    def test_missing_file_raises(self, tmp_path: Path) -> None:
+        """Probing a missing file is an audio error."""
+        from gossiptoon.core.exceptions import AudioGenerationError
+
+        with pytest.raises(AudioGenerationError):
+            AudioProcessor().get_audio_duration(tmp_path / "missing.wav")
+
+
+class TestStreamingTTS:
+    """Tests for writing streamed TTS audio incrementally."""
+
+    @pytest.fixture(autouse=True)
+    def empty_probe_cache(self, monkeypatch):
+        """Give each test an empty duration cache."""
+        from gossiptoon.audio import probe
+
+        monkeypatch.setattr(probe, "_durations", {})
+
+    def test_pcm_stream_written_and_measured(self, tmp_path: Path) -> None:
+        """PCM chunks split mid-sample produce a valid WAV with duration and levels."""
+        import math
+        import wave
+
+        import numpy as np
+
+        from gossiptoon.audio import probe
+        from gossiptoon.audio.streaming import AudioStreamFormat, StreamingAudioWriter
+
+        samples = np.full(24000, 8192, dtype="<i2")  # 0.25 full scale
+        samples[100] = -16384
+        data = samples.tobytes()
+        output = tmp_path / "chunk.wav"
+
+        with StreamingAudioWriter(output, AudioStreamFormat(container="pcm")) as writer:
+            for start in range(0, len(data), 999):
+                writer.write(data[start : start + 999])
+            result = writer.finish()
+
+        with wave.open(str(output), "rb") as wav_file:
+            assert wav_file.getnframes() == 24000
+            assert wav_file.readframes(24000) == data
+        assert result.duration_seconds == pytest.approx(1.0)
+        assert result.bytes_received == len(data)
+        assert result.peak_dbfs == pytest.approx(20 * math.log10(0.5))
+        assert result.rms_dbfs == pytest.approx(20 * math.log10(0.25), abs=0.01)
+        with patch.object(probe, "read_wav_duration") as read:
+            assert AudioProcessor().get_audio_duration(output) == pytest.approx(1.0)
+        read.assert_not_called()
+
+    def test_mp3_duration_from_frame_headers(self, tmp_path: Path) -> None:
+        """MP3 duration is counted from frame headers, across chunk boundaries."""
+        from gossiptoon.audio.streaming import AudioStreamFormat, StreamingAudioWriter
+
+        # ID3v2 tag, then 10 MPEG-1 Layer III frames (128 kbps, 44.1 kHz)
+        tag = b"ID3\x04\x00\x00\x00\x00\x00\x14" + b"\x00" * 20
+        frame = b"\xff\xfb\x90\x00" + b"\x00" * 413
+        data = tag + frame * 10
+
+        with StreamingAudioWriter(tmp_path / "chunk.mp3", AudioStreamFormat(container="mp3")) as w:
+            for start in range(0, len(data), 100):
+                w.write(data[start : start + 100])
+            result = w.finish()
+
+        assert (tmp_path / "chunk.mp3").read_bytes() == data
+        assert result.duration_seconds == pytest.approx(10 * 1152 / 44100)
+        assert result.rms_dbfs is None
+
+    def test_failed_stream_leaves_no_file(self, tmp_path: Path) -> None:
+        """A stream that breaks midway removes the partial file."""
+        from gossiptoon.audio.streaming import AudioStreamFormat, StreamingAudioWriter
+
+        output = tmp_path / "chunk.wav"
+        with pytest.raises(ConnectionError):
+            with StreamingAudioWriter(output, AudioStreamFormat(container="pcm")) as writer:
+                writer.write(b"\x00\x01" * 100)
+                raise ConnectionError("stream reset")
+
+        assert not output.exists()
+
+    @pytest.mark.asyncio
+    async def test_google_tts_streams_to_wav(self, tmp_path: Path, monkeypatch) -> None:
+        """Google TTS writes PCM from the streaming API chunk by chunk."""
+        import wave
+        from types import SimpleNamespace
+
+        from gossiptoon.audio.google_tts_client import GoogleTTSClient
+
+        def response(data: bytes) -> SimpleNamespace:
+            part = SimpleNamespace(inline_data=SimpleNamespace(data=data))
+            content = SimpleNamespace(parts=[part])
+            return SimpleNamespace(candidates=[SimpleNamespace(content=content)])
+
+        chunks = [b"\x01\x00" * 12000, b"\x02\x00" * 12000]
+
+        async def stream():
+            for chunk in chunks:
+                yield response(chunk)
+
+        genai_client = MagicMock()
+        genai_client.aio.models.generate_content_stream = AsyncMock(return_value=stream())
+        monkeypatch.setattr(
+            "gossiptoon.audio.google_tts_client.get_genai_client", lambda api_key: genai_client
+        )
+        monkeypatch.setattr(GoogleTTSClient, "_speech_config", lambda self, voice: None)
+
+        client = GoogleTTSClient(api_key="test_key")
+        output = await client.generate_speech("Hello there", "Kore", output_path=tmp_path / "a.mp3")
+
+        assert output == tmp_path / "a.wav"
+        with wave.open(str(output), "rb") as wav_file:
+            assert wav_file.getframerate() == 24000
+            assert wav_file.readframes(24000) == b"".join(chunks)
+        genai_client.aio.models.generate_content.assert_not_called()
+
+
+class TestSFXMixer:
+    """Tests for the vectorized SFX mixer."""
+
+    @pytest.fixture(autouse=True)
+    def empty_sfx_cache(self, monkeypatch):
+        """Give each test an empty decoded-SFX cache."""
+        from gossiptoon.audio import sfx_mixer
+
+        monkeypatch.setattr(sfx_mixer, "_sfx_buffers", {})
+
+    def test_mix_adds_sfx_at_offsets(self, tmp_path: Path) -> None:
+        """SFX are added at their offsets with gain; overruns are truncated."""
+        import numpy as np
+
+        from gossiptoon.audio.pcm import PCMAudio
+        from gossiptoon.audio.sfx_mixer import AudioSFXMixer
+
+        sfx_path = _write_tone(tmp_path / "bam.wav", 0.5, sample_rate=8000, amplitude=0.2)
+        sfx = PCMAudio.from_file(sfx_path).samples
+        master = PCMAudio(np.zeros((8000, 1), dtype=np.float32), 8000)
+        mixer = AudioSFXMixer(sfx_volume=0.7)
+
+        mixed = mixer.mix(master, [(sfx_path, 0.25), (sfx_path, 0.75), (sfx_path, 2.0)])
+
+        expected = np.zeros((8000, 1), dtype=np.float32)
+        expected[2000:6000] += mixer.sfx_gain * sfx
+        expected[6000:] += mixer.sfx_gain * sfx[:2000]
+        assert mixer.sfx_gain == pytest.approx(10 ** (-6 / 20))
+        np.testing.assert_allclose(mixed.samples, expected, atol=1e-6)
+        assert master.samples.max() == 0.0
+
+    def test_sfx_decoded_once_per_process(self, tmp_path: Path) -> None:
+        """Repeated mixes reuse the decoded SFX buffer."""
+        import numpy as np
+
+        from gossiptoon.audio.pcm import PCMAudio
+        from gossiptoon.audio.sfx_mixer import AudioSFXMixer
+
+        sfx_path = _write_tone(tmp_path / "bam.wav", 0.1, sample_rate=8000)
+        master = PCMAudio(np.zeros((8000, 1), dtype=np.float32), 8000)
+
+        with patch.object(PCMAudio, "from_file", wraps=PCMAudio.from_file) as decode:
+            for _ in range(3):
+                AudioSFXMixer().mix(master, [(sfx_path, 0.0), (sfx_path, 0.5)])
+
+        assert decode.call_count == 1
+
+    def test_limiter_keeps_peaks_below_full_scale(self, tmp_path: Path) -> None:
+        """Loud overlaps are limited instead of clipping; quiet audio is untouched."""
+        import numpy as np
+
+        from gossiptoon.audio.pcm import PCMAudio
+        from gossiptoon.audio.sfx_mixer import LIMITER_THRESHOLD, AudioSFXMixer
+
+        sfx_path = _write_tone(tmp_path / "bam.wav", 0.5, sample_rate=8000, amplitude=0.9)
+        master_samples = np.full((8000, 1), 0.3, dtype=np.float32)
+        master = PCMAudio(master_samples, 8000)
+
+        mixed = AudioSFXMixer(sfx_volume=1.0).mix(master, [(sfx_path, 0.5)])
+
+        assert np.abs(mixed.samples).max() < 1.0
+        assert np.abs(mixed.samples[4000:]).max() > LIMITER_THRESHOLD
+        np.testing.assert_array_equal(mixed.samples[:4000], master_samples[:4000])
+
+    def test_overlay_writes_lossless_output(self, tmp_path: Path) -> None:
+        """Mixing a WAV master produces a WAV next to it."""
+        from gossiptoon.audio.sfx_mixer import AudioSFXMixer
+
+        master_path = _write_tone(tmp_path / "master.wav", 1.0, sample_rate=8000, amplitude=0.1)
+        sfx_path = _write_tone(tmp_path / "bam.wav", 0.2, sample_rate=8000)
+
+        output = AudioSFXMixer().overlay_sfx(master_path, sfx_path, 0.5)
+
+        assert output == tmp_path / "master_sfx.wav"
+        assert output.read_bytes()[:4] == b"RIFF"
+
+
+class TestSFXLibrary:
+    """Tests for the memory-mapped SFX library."""
+
+    @pytest.fixture
+    def assets(self, tmp_path: Path) -> Path:
+        """SFX directory with two assets."""
+        base_dir = tmp_path / "sfx"
+        (base_dir / "action").mkdir(parents=True)
+        (base_dir / "tension").mkdir()
+        _write_tone(base_dir / "action" / "bam.wav", 0.5, sample_rate=8000, amplitude=0.5)
+        _write_tone(base_dir / "tension" / "hum.wav", 1.0, sample_rate=16000, amplitude=0.1)
+        return base_dir
+
+    def _library(self, tmp_path: Path, base_dir: Path):
+        from gossiptoon.audio.sfx_library import SFXLibrary
+
+        return SFXLibrary(
+            tmp_path / "cache",
+            base_dir=base_dir,
+            library={"BAM!": "action/bam.wav", "HUM": "tension/hum.wav", "GONE": "x/gone.wav"},
+        )
+
+    def test_index_records_metadata(self, tmp_path: Path, assets: Path) -> None:
+        """The index holds duration and levels for every existing asset."""
+        import math
+
+        library = self._library(tmp_path, assets)
+
+        entries = library.build_index()
+
+        assert set(entries) == {"action/bam.wav", "tension/hum.wav"}
+        bam = library.get_entry("bam!")
+        assert bam.duration_seconds == pytest.approx(0.5)
+        assert bam.sample_rate == 8000
+        assert bam.peak_dbfs == pytest.approx(20 * math.log10(0.5), abs=0.1)
+        assert bam.rms_dbfs == pytest.approx(20 * math.log10(0.5 / math.sqrt(2)), abs=0.1)
+        assert library.get_entry("GONE") is None
+        assert "action/bam.wav" in json.loads(library.index_path.read_text())["entries"]
+
+    def test_samples_memory_mapped_and_shared(self, tmp_path: Path, assets: Path) -> None:
+        """Decoded PCM is mapped from disk and not decoded again by a new instance."""
+        import numpy as np
+
+        from gossiptoon.audio.pcm import PCMAudio
+
+        bam = assets / "action" / "bam.wav"
+        first = self._library(tmp_path, assets).load_samples(bam, 16000, 2)
+
+        with patch.object(PCMAudio, "from_file", wraps=PCMAudio.from_file) as decode:
+            second = self._library(tmp_path, assets).load_samples(bam, 16000, 2)
+
+        assert decode.call_count == 0
+        assert isinstance(second, np.memmap)
+        assert second.shape[1] == 2
+        assert len(second) == pytest.approx(8000, abs=2)
+        np.testing.assert_array_equal(first, second)
+
+    def test_changed_asset_decoded_again(self, tmp_path: Path, assets: Path) -> None:
+        """Replacing an asset invalidates its index entry and PCM files."""
+        library = self._library(tmp_path, assets)
+        bam = assets / "action" / "bam.wav"
+        assert len(library.load_samples(bam, 8000, 1)) == 4000
+
+        _write_tone(bam, 0.25, sample_rate=8000)
+
+        assert len(self._library(tmp_path, assets).load_samples(bam, 8000, 1)) == 2000
+        assert library.get_entry("BAM!").duration_seconds == pytest.approx(0.25)
+
+    def test_files_outside_library_not_cached(self, tmp_path: Path, assets: Path) -> None:
+        """Paths outside the SFX directory are left to the caller."""
+        other = _write_tone(tmp_path / "other.wav", 0.1, sample_rate=8000)
+
+        assert self._library(tmp_path, assets).load_samples(other, 8000, 1) is None
+
+    def test_mixer_reads_from_library(self, tmp_path: Path, assets: Path) -> None:
+        """The mixer takes library assets from the mapped PCM."""
+        import numpy as np
+
+        from gossiptoon.audio.pcm import PCMAudio
+        from gossiptoon.audio.sfx_mixer import AudioSFXMixer
+
+        library = self._library(tmp_path, assets)
+        master = PCMAudio(np.zeros((16000, 1), dtype=np.float32), 16000)
+        mixer = AudioSFXMixer(sfx_volume=1.0, library=library)
+
+        with patch.object(library, "load_samples", wraps=library.load_samples) as load:
+            mixed = mixer.mix(master, [(assets / "tension" / "hum.wav", 0.0)])
+
+        load.assert_called_once()
+        assert mixed.samples.max() == pytest.approx(0.1, abs=1e-3)
+
+
 class TestAudioGenerator:
     """Tests for audio generator orchestrator."""
 
@@ -289,3 +968,584 @@ class TestAudioGenerator:
                         sample_script.get_all_scenes()
                     )
                     assert audio_project.total_duration > 0
+
+
+class TestConcurrentSynthesis:
+    """Tests for concurrent TTS synthesis with ordered Master Clock offsets."""
+
+    @pytest.fixture
+    def audio_config(self, tmp_path: Path, monkeypatch):
+        """Create a real configuration rooted in a temp directory."""
+        from gossiptoon.core.config import ConfigManager
+
+        monkeypatch.setenv("GOOGLE_API_KEY", "test_google_key")
+        monkeypatch.setenv("ELEVENLABS_API_KEY", "test_elevenlabs_key")
+        monkeypatch.setenv("OUTPUT_DIR", str(tmp_path / "outputs"))
+        return ConfigManager()
+
+    @pytest.fixture
+    def script(self):
+        """Create a lightweight script with legacy narration scenes."""
+        from types import SimpleNamespace
+
+        scenes = [
+            SimpleNamespace(
+                scene_id=f"scene_{i:02d}",
+                estimated_duration_seconds=2.0 + i,
+                emotion=EmotionTone.NEUTRAL,
+            )
+            for i in range(4)
+        ]
+        return SimpleNamespace(
+            script_id="script_001",
+            character_profiles=[],
+            get_all_scenes=lambda: scenes,
+        )
+
+    async def _run_project(self, generator: AudioGenerator, script) -> tuple:
+        """Generate a project with fake scene synthesis; returns (project, peak, finish order)."""
+        import asyncio
+
+        from gossiptoon.models.audio import AudioSegment
+
+        running = 0
+        peak = 0
+        finished = []
+        scenes = script.get_all_scenes()
+
+        async def fake_scene_audio(scene, voice_id, journal=None):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            # Earlier scenes finish last to prove ordering does not depend on timing
+            await asyncio.sleep(0.01 * (len(scenes) - scenes.index(scene)))
+            running -= 1
+            finished.append(scene.scene_id)
+            return AudioSegment(
+                scene_id=scene.scene_id,
+                file_path=Path(f"/fake/{scene.scene_id}.wav"),
+                duration_seconds=scene.estimated_duration_seconds,
+                emotion=scene.emotion,
+                voice_id=voice_id,
+            )
+
+        with patch.object(generator, "_generate_scene_audio", side_effect=fake_scene_audio):
+            with patch.object(
+                generator, "_create_master_audio", new_callable=AsyncMock
+            ) as mock_master:
+                mock_master.return_value = Path("/fake/master.wav")
+                with patch.object(generator, "_save_audio_project"):
+                    project = await generator.generate_audio_project(script)
+
+        return project, peak, finished
+
+    @pytest.mark.asyncio
+    async def test_concurrent_offsets_follow_script_order(
+        self, audio_config, script
+    ) -> None:
+        """Segments synthesize in parallel but are laid out in script order."""
+        generator = AudioGenerator(audio_config)
+
+        project, peak, finished = await self._run_project(generator, script)
+
+        scenes = script.get_all_scenes()
+        assert peak == len(scenes)
+        assert finished != [s.scene_id for s in scenes]
+        assert [seg.scene_id for seg in project.segments] == [s.scene_id for s in scenes]
+
+        # Each join overlaps the neighbours by the crossfade
+        crossfade = audio_config.audio.crossfade_ms / 1000
+        expected_offset = 0.0
+        for segment, scene in zip(project.segments, scenes):
+            assert segment.global_offset == pytest.approx(expected_offset)
+            expected_offset += scene.estimated_duration_seconds - crossfade
+        assert project.total_duration == pytest.approx(expected_offset + crossfade)
+
+    @pytest.mark.asyncio
+    async def test_serial_mode_matches_concurrent_offsets(
+        self, audio_config, script
+    ) -> None:
+        """Serial synthesis produces the same Master Clock as concurrent mode."""
+        concurrent_project, _, _ = await self._run_project(
+            AudioGenerator(audio_config), script
+        )
+
+        audio_config.audio.concurrent_synthesis = False
+        serial_project, peak, _ = await self._run_project(
+            AudioGenerator(audio_config), script
+        )
+
+        assert peak == 1
+        assert [s.global_offset for s in serial_project.segments] == [
+            s.global_offset for s in concurrent_project.segments
+        ]
+
+
+class TestMasterTimeline:
+    """Tests for placing segments on the crossfaded, tempo-changed master."""
+
+    def _segments(self, durations: list[float]) -> list:
+        from gossiptoon.models.audio import AudioSegment
+
+        return [
+            AudioSegment(
+                scene_id=f"scene_{i}",
+                file_path=Path(f"/fake/scene_{i}.wav"),
+                duration_seconds=duration,
+                emotion=EmotionTone.NEUTRAL,
+                voice_id="voice",
+                timestamps=[
+                    WordTimestamp(word="a", start=0.0, end=duration / 2, confidence=0.9),
+                    WordTimestamp(word="b", start=duration / 2, end=duration, confidence=0.9),
+                ],
+            )
+            for i, duration in enumerate(durations)
+        ]
+
+    def test_timeline_matches_rendered_master(self, tmp_path: Path) -> None:
+        """Offsets and total agree with PCMAudio.concatenate, including short clips."""
+        from gossiptoon.audio.pcm import PCMAudio
+        from gossiptoon.audio.timeline import MasterTimeline
+
+        durations = [1.0, 0.05, 2.0, 0.5]
+        clips = [
+            PCMAudio.from_file(_write_tone(tmp_path / f"{i}.wav", d, sample_rate=8000))
+            for i, d in enumerate(durations)
+        ]
+        master = PCMAudio.concatenate(clips, crossfade_seconds=0.1)
+
+        timeline = MasterTimeline(durations, crossfade_seconds=0.1)
+
+        assert timeline.starts == pytest.approx([0.0, 0.95, 0.95, 2.85])
+        assert timeline.total_duration == pytest.approx(master.duration_seconds)
+        assert sum(timeline.durations) == pytest.approx(timeline.total_duration)
+
+    def test_apply_rescales_segments_and_reports_drift(self) -> None:
+        """Offsets, durations and words move to master time; the report shows the shift."""
+        from gossiptoon.audio.timeline import MasterTimeline
+
+        segments = self._segments([2.0, 2.0, 4.0])
+
+        report = MasterTimeline.from_segments(
+            segments, crossfade_seconds=0.1, speed_factor=2.0
+        ).apply(segments)
+
+        assert [s.global_offset for s in segments] == pytest.approx([0.0, 0.95, 1.9])
+        assert [s.duration_seconds for s in segments] == pytest.approx([0.95, 0.95, 2.0])
+        assert [s.source_duration_seconds for s in segments] == [2.0, 2.0, 4.0]
+        assert [(w.start, w.end) for w in segments[2].timestamps] == [(0.0, 1.0), (1.0, 2.0)]
+        assert report.naive_duration == pytest.approx(8.0)
+        assert report.timeline_duration == pytest.approx(3.9)
+        assert report.max_drift_seconds == pytest.approx(4.0 - 1.9)
+        assert report.residual_seconds is None
+
+    def test_reapplying_starts_from_file_timing(self) -> None:
+        """A second placement (e.g. after regenerating a scene) does not compound."""
+        from gossiptoon.audio.timeline import MasterTimeline
+
+        segments = self._segments([2.0, 3.0])
+        MasterTimeline.from_segments(segments, 0.1, speed_factor=2.0).apply(segments)
+
+        MasterTimeline.from_segments(segments, 0.1, speed_factor=1.25).apply(segments)
+
+        assert [s.global_offset for s in segments] == pytest.approx([0.0, 1.9 / 1.25])
+        assert segments[1].timestamps[-1].end == pytest.approx(3.0 / 1.25)
+
+    @pytest.mark.asyncio
+    async def test_project_reports_measured_master(self, tmp_path: Path, monkeypatch) -> None:
+        """The rendered master's length is checked against the timeline."""
+        from gossiptoon.core.config import ConfigManager
+
+        monkeypatch.setenv("GOOGLE_API_KEY", "test_google_key")
+        monkeypatch.setenv("ELEVENLABS_API_KEY", "test_elevenlabs_key")
+        monkeypatch.setenv("OUTPUT_DIR", str(tmp_path / "outputs"))
+        generator = AudioGenerator(ConfigManager())
+        paths = [_write_tone(tmp_path / f"{i}.wav", d) for i, d in enumerate([1.0, 1.5])]
+        segments = self._segments([1.0, 1.5])
+        for segment, path in zip(segments, paths):
+            segment.file_path = path
+
+        master_path = await generator._create_master_audio(segments, "script")
+        report = generator._apply_master_timeline(segments, master_path)
+
+        assert report.timeline_duration == pytest.approx(2.4)
+        assert report.residual_seconds == pytest.approx(0.0, abs=0.01)
+
+
+class TestTTSCache:
+    """Tests for the content-addressed TTS cache."""
+
+    def _audio(self, tmp_path: Path, name: str, size: int = 100) -> Path:
+        path = tmp_path / name
+        path.write_bytes(b"x" * size)
+        return path
+
+    def test_key_depends_on_voice_style_model_and_provider(self) -> None:
+        """Every synthesis and timing input changes the cache key."""
+        from gossiptoon.audio.tts_cache import TTSCache
+
+        base = dict(
+            text="Hello",
+            voice_id="Kore",
+            style="calm",
+            model="m1",
+            provider="google",
+            timestamp_backend="whisper",
+            timestamp_model="base",
+        )
+        key = TTSCache.make_key(**base)
+
+        assert TTSCache.make_key(**base) == key
+        for field, value in [
+            ("text", "Hello!"),
+            ("voice_id", "Puck"),
+            ("style", "angry"),
+            ("model", "m2"),
+            ("provider", "elevenlabs"),
+            ("timestamp_backend", "energy"),
+            ("timestamp_model", "small"),
+        ]:
+            assert TTSCache.make_key(**{**base, field: value}) != key
+
+    def test_put_get_restore_roundtrip(self, tmp_path: Path) -> None:
+        """Cached entries keep audio, duration and timestamps."""
+        from gossiptoon.audio.tts_cache import TTSCache
+
+        cache = TTSCache(tmp_path / "cache", max_bytes=10_000)
+        timestamps = [WordTimestamp(word="Hello", start=0.0, end=0.4, confidence=0.9)]
+        cache.put("ab" * 32, self._audio(tmp_path, "chunk.wav"), 0.4, timestamps)
+
+        entry = cache.get("ab" * 32)
+        assert entry is not None
+        assert entry.duration_seconds == 0.4
+        assert entry.timestamps == timestamps
+
+        restored = cache.restore(entry, tmp_path / "project" / "chunk_01.wav")
+        assert restored.read_bytes() == b"x" * 100
+        assert cache.get("cd" * 32) is None
+
+    def test_lru_eviction_keeps_recently_used(self, tmp_path: Path) -> None:
+        """Least recently used entries are evicted once over the size limit."""
+        import os
+
+        from gossiptoon.audio.tts_cache import TTSCache
+
+        cache = TTSCache(tmp_path / "cache", max_bytes=10_000_000)
+        keys = [f"{i:02d}" * 32 for i in range(3)]
+        for i, key in enumerate(keys):
+            cache.put(key, self._audio(tmp_path, f"{i}.wav", size=600), 1.0, [])
+            # Space out LRU clocks deterministically
+            os.utime(cache._meta_path(key), (1000 + i, 1000 + i))
+
+        # Room for three and a half entries
+        cache.max_bytes = cache.size_bytes() * 7 // 6
+
+        cache.get(keys[0])  # now most recently used
+        cache.put("99" * 32, self._audio(tmp_path, "new.wav", size=600), 1.0, [])
+
+        assert cache.get(keys[0]) is not None
+        assert cache.get(keys[1]) is None
+        assert cache.get("99" * 32) is not None
+        assert cache.size_bytes() <= cache.max_bytes
+
+    @pytest.mark.asyncio
+    async def test_generator_reuses_cached_synthesis(self, tmp_path: Path, monkeypatch) -> None:
+        """Identical requests skip TTS and Whisper on the second run."""
+        from gossiptoon.core.config import ConfigManager
+
+        monkeypatch.setenv("GOOGLE_API_KEY", "test_google_key")
+        monkeypatch.setenv("ELEVENLABS_API_KEY", "test_elevenlabs_key")
+        monkeypatch.setenv("OUTPUT_DIR", str(tmp_path / "outputs"))
+        config = ConfigManager()
+        generator = AudioGenerator(config)
+
+        audio_file = self._audio(tmp_path, "tts.wav")
+        timestamps = [WordTimestamp(word="Hi", start=0.0, end=0.3, confidence=0.9)]
+
+        with patch.object(
+            generator.tts_client, "generate_speech", new_callable=AsyncMock
+        ) as mock_tts, patch.object(
+            generator.whisper, "extract_timestamps", new_callable=AsyncMock
+        ) as mock_whisper, patch.object(
+            generator.processor, "get_audio_duration", return_value=0.3
+        ):
+            mock_tts.return_value = audio_file
+            mock_whisper.return_value = timestamps
+
+            for chunk_id in ("chunk_a", "chunk_b"):
+                path, duration, words = await generator._synthesize(
+                    text="Hi",
+                    voice_id="Kore",
+                    output_path=config.audio_dir / f"{chunk_id}.wav",
+                    style_instruction="calm",
+                )
+
+        assert mock_tts.await_count == 1
+        assert mock_whisper.await_count == 1
+        assert path == config.audio_dir / "chunk_b.wav"
+        assert path.exists()
+        assert duration == 0.3
+        assert words == timestamps
+
+    @pytest.mark.asyncio
+    async def test_timestamps_use_text_as_spoken(self, tmp_path: Path, monkeypatch) -> None:
+        """Timestamp extraction aligns against the provider-ready text."""
+        from gossiptoon.core.config import ConfigManager
+
+        monkeypatch.setenv("GOOGLE_API_KEY", "test_google_key")
+        monkeypatch.setenv("ELEVENLABS_API_KEY", "test_elevenlabs_key")
+        monkeypatch.setenv("OUTPUT_DIR", str(tmp_path / "outputs"))
+        monkeypatch.setenv("TTS_CACHE_ENABLED", "false")
+        config = ConfigManager()
+        generator = AudioGenerator(config)
+
+        with patch.object(
+            generator.tts_client, "generate_speech", new_callable=AsyncMock
+        ) as mock_tts, patch.object(
+            generator.tts_client, "prepare_text", return_value="He owes me money"
+        ), patch.object(
+            generator.whisper, "extract_timestamps", new_callable=AsyncMock
+        ) as mock_whisper, patch.object(
+            generator.processor, "get_audio_duration", return_value=0.3
+        ):
+            mock_tts.return_value = self._audio(tmp_path, "tts.wav")
+            mock_whisper.return_value = []
+
+            await generator._synthesize(
+                text="(Whispering) He owes me money",
+                voice_id="Kore",
+                output_path=config.audio_dir / "chunk_a.wav",
+            )
+
+        assert mock_whisper.await_args.kwargs["text"] == "He owes me money"
+
+    @pytest.mark.asyncio
+    async def test_director_notes_reach_retry_wrapped_client(
+        self, tmp_path: Path, monkeypatch
+    ) -> None:
+        """Style instructions are detected through ``retry_with_backoff``."""
+        from gossiptoon.audio.google_tts_client import GoogleTTSClient
+        from gossiptoon.core.config import ConfigManager
+        from gossiptoon.models.audio import AudioChunk, AudioChunkType
+        from gossiptoon.utils.retry import retry_with_backoff
+
+        monkeypatch.setenv("GOOGLE_API_KEY", "test_google_key")
+        monkeypatch.setenv("ELEVENLABS_API_KEY", "test_elevenlabs_key")
+        monkeypatch.setenv("OUTPUT_DIR", str(tmp_path / "outputs"))
+        config = ConfigManager()
+        audio_file = self._audio(tmp_path, "tts.wav")
+        styles = []
+
+        class WrappedClient:
+            provider_name = "google"
+
+            def prepare_text(self, text: str) -> str:
+                return text
+
+            def get_model_name(self) -> str:
+                return "m1"
+
+            @retry_with_backoff(max_retries=1)
+            async def generate_speech(
+                self, text, voice_id=None, style_instruction=None, output_path=None
+            ):
+                styles.append(style_instruction)
+                return audio_file
+
+        google = AudioGenerator(config, tts_client=GoogleTTSClient(api_key="test_google_key"))
+        assert google._supports_style_instruction()
+
+        generator = AudioGenerator(config, tts_client=WrappedClient())
+
+        chunk = AudioChunk(
+            chunk_id="chunk_a",
+            chunk_type=AudioChunkType.NARRATION,
+            speaker_id="Narrator",
+            text="Hello",
+            director_notes="Calm voice with a gentle tone.",
+            estimated_duration=1.0,
+        )
+        with patch.object(
+            generator.whisper, "extract_timestamps", new_callable=AsyncMock, return_value=[]
+        ), patch.object(generator.processor, "get_audio_duration", return_value=0.3):
+            await generator._generate_chunk_audio(chunk, "scene_1", global_offset=0.0)
+
+        assert styles == ["Calm voice with a gentle tone."]
+
+    @pytest.mark.asyncio
+    async def test_regenerated_scene_is_timed_against_text_as_spoken(
+        self, tmp_path: Path, monkeypatch
+    ) -> None:
+        """Scene regeneration goes through the same synthesis path as generation."""
+        from gossiptoon.core.config import ConfigManager
+        from gossiptoon.models.audio import AudioProject, AudioSegment, DriftReport
+
+        monkeypatch.setenv("GOOGLE_API_KEY", "test_google_key")
+        monkeypatch.setenv("ELEVENLABS_API_KEY", "test_elevenlabs_key")
+        monkeypatch.setenv("OUTPUT_DIR", str(tmp_path / "outputs"))
+        monkeypatch.setenv("TTS_CACHE_ENABLED", "false")
+        config = ConfigManager()
+        generator = AudioGenerator(config)
+
+        project = AudioProject(
+            script_id="script_1",
+            segments=[
+                AudioSegment(
+                    scene_id="scene_1",
+                    file_path=self._audio(tmp_path, "old.wav"),
+                    duration_seconds=1.0,
+                    emotion=EmotionTone.NEUTRAL,
+                    voice_id="Kore",
+                )
+            ],
+            total_duration=1.0,
+            voice_id="Kore",
+        )
+        report = DriftReport(
+            crossfade_seconds=0.0, speed_factor=1.0, naive_duration=0.3, timeline_duration=0.3
+        )
+
+        with patch.object(
+            generator.tts_client, "generate_speech", new_callable=AsyncMock
+        ) as mock_tts, patch.object(
+            generator.tts_client, "prepare_text", return_value="He owes me money"
+        ), patch.object(
+            generator.whisper, "extract_timestamps", new_callable=AsyncMock
+        ) as mock_whisper, patch.object(
+            generator.processor, "get_audio_duration", return_value=0.3
+        ), patch.object(
+            generator, "_create_master_audio", new_callable=AsyncMock
+        ) as mock_master, patch.object(
+            generator, "_apply_master_timeline", return_value=report
+        ), patch.object(generator, "_save_audio_project"):
+            mock_tts.return_value = self._audio(tmp_path, "tts.wav")
+            mock_whisper.return_value = []
+            mock_master.return_value = tmp_path / "master.wav"
+
+            project = await generator.regenerate_scene_audio(
+                project, "scene_1", "(Whispering) He owes me money"
+            )
+
+        assert mock_whisper.await_args.kwargs["text"] == "He owes me money"
+        assert project.segments[0].duration_seconds == 0.3
+
+
+class TestSynthesisJournal:
+    """Tests for per-chunk progress journaling during audio generation."""
+
+    @pytest.mark.asyncio
+    async def test_journaled_chunks_are_not_resynthesized(
+        self, tmp_path: Path, monkeypatch
+    ) -> None:
+        """Finished chunks are reused from the journal; changed chunks are redone."""
+        from gossiptoon.core.config import ConfigManager
+        from gossiptoon.utils.journal import ItemJournal
+
+        monkeypatch.setenv("GOOGLE_API_KEY", "test_google_key")
+        monkeypatch.setenv("ELEVENLABS_API_KEY", "test_elevenlabs_key")
+        monkeypatch.setenv("OUTPUT_DIR", str(tmp_path / "outputs"))
+        monkeypatch.setenv("TTS_CACHE_ENABLED", "false")
+        config = ConfigManager()
+        generator = AudioGenerator(config)
+        journal = ItemJournal(tmp_path / "audio.journal.jsonl")
+
+        output_path = config.audio_dir / "chunk_a.wav"
+        output_path.write_bytes(b"x" * 100)
+        timestamps = [WordTimestamp(word="Hi", start=0.0, end=0.3, confidence=0.9)]
+
+        with patch.object(
+            generator.tts_client, "generate_speech", new_callable=AsyncMock
+        ) as mock_tts, patch.object(
+            generator.whisper, "extract_timestamps", new_callable=AsyncMock
+        ) as mock_whisper, patch.object(
+            generator.processor, "get_audio_duration", return_value=0.3
+        ):
+            mock_tts.return_value = output_path
+            mock_whisper.return_value = timestamps
+
+            for text in ("Hi", "Hi", "Hello"):
+                path, duration, words = await generator._synthesize(
+                    text=text,
+                    voice_id="Kore",
+                    output_path=output_path,
+                    style_instruction="calm",
+                    journal=journal,
+                )
+
+        assert generator.tts_cache is None
+        assert mock_tts.await_count == 2
+        assert path == output_path
+        assert duration == 0.3
+        assert words == timestamps
+        assert ItemJournal(journal.path).item_ids() == ["chunk_a"]
+
+
+class TestBatchedTimestamps:
+    """Tests for extracting all segment timestamps in one Whisper pass."""
+
+    @pytest.mark.asyncio
+    async def test_project_timestamps_extracted_in_one_pass(
+        self, tmp_path: Path, monkeypatch
+    ) -> None:
+        """New segments are timed by a single batched call after synthesis."""
+        from types import SimpleNamespace
+
+        from gossiptoon.core.config import ConfigManager
+        from gossiptoon.utils.journal import ItemJournal
+
+        monkeypatch.setenv("GOOGLE_API_KEY", "test_google_key")
+        monkeypatch.setenv("ELEVENLABS_API_KEY", "test_elevenlabs_key")
+        monkeypatch.setenv("OUTPUT_DIR", str(tmp_path / "outputs"))
+        monkeypatch.setenv("TTS_CACHE_ENABLED", "false")
+        config = ConfigManager()
+        generator = AudioGenerator(config)
+        journal = ItemJournal(tmp_path / "audio.journal.jsonl")
+
+        scenes = [
+            SimpleNamespace(
+                scene_id=f"scene_{i:02d}",
+                narration=f"Line {i}",
+                emotion=EmotionTone.NEUTRAL,
+            )
+            for i in range(3)
+        ]
+        script = SimpleNamespace(
+            script_id="script_001", character_profiles=[], get_all_scenes=lambda: scenes
+        )
+
+        async def fake_tts(text, voice_id, output_path, **kwargs):
+            output_path.write_bytes(text.encode())
+            return output_path
+
+        async def fake_batch(audio_paths, language="en", texts=None):
+            return [
+                [WordTimestamp(word=path.stem, start=0.0, end=0.5, confidence=0.9)]
+                for path in audio_paths
+            ]
+
+        with patch.object(
+            generator.tts_client, "generate_speech", side_effect=fake_tts
+        ), patch.object(
+            generator.whisper, "extract_timestamps", new_callable=AsyncMock
+        ) as mock_single, patch.object(
+            generator.whisper, "extract_timestamps_batch", side_effect=fake_batch
+        ) as mock_batch, patch.object(
+            generator.processor, "get_audio_duration", return_value=1.0
+        ), patch.object(
+            generator, "_create_master_audio", new_callable=AsyncMock
+        ) as mock_master, patch.object(
+            generator, "_save_audio_project"
+        ):
+            mock_master.return_value = tmp_path / "master.wav"
+            project = await generator.generate_audio_project(script, journal=journal)
+
+        mock_single.assert_not_awaited()
+        assert mock_batch.call_count == 1
+        for segment in project.segments:
+            assert [w.word for w in segment.timestamps] == [segment.file_path.stem]
+
+        # Each item is journaled untimed first, then with its timestamps
+        records = [json.loads(line) for line in journal.path.read_text().splitlines()]
+        assert [r["data"]["timestamps"] for r in records[:3]] == [None, None, None]
+        latest = {r["item_id"]: r["data"] for r in records}
+        assert all(data["timestamps"] for data in latest.values())
@@ -0,0 +1,111 @@
+"""Unit tests for parallel batch processing."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from gossiptoon.core.config import ConfigManager
+from gossiptoon.pipeline.batch import BatchProcessor
+from gossiptoon.pipeline.orchestrator import PipelineResult
+
+
+@pytest.fixture
+def config(tmp_path, monkeypatch) -> ConfigManager:
+    """Create a real configuration rooted in a temp directory."""
+    monkeypatch.setenv("GOOGLE_API_KEY", "test_google_key")
+    monkeypatch.setenv("ELEVENLABS_API_KEY", "test_elevenlabs_key")
+    monkeypatch.setenv("OUTPUT_DIR", str(tmp_path / "outputs"))
+    return ConfigManager()
+
+
+class FakeOrchestrator:
+    """Orchestrator stand-in that records concurrency."""
+
+    running = 0
+    peak = 0
+    configs: list[ConfigManager] = []
+
+    def __init__(self, config: ConfigManager) -> None:
+        self.config = config
+        FakeOrchestrator.configs.append(config)
+
+    async def run(self, story_url: str, project_id: str) -> PipelineResult:
+        FakeOrchestrator.running += 1
+        FakeOrchestrator.peak = max(FakeOrchestrator.peak, FakeOrchestrator.running)
+        await asyncio.sleep(0.01)
+        FakeOrchestrator.running -= 1
+
+        if "fail" in story_url:
+            return PipelineResult(project_id=project_id, success=False, error="boom")
+
+        video_project = MagicMock()
+        video_project.output_path = self.config.videos_dir / "out.mp4"
+        video_project.total_duration = 42.0
+        return PipelineResult(project_id=project_id, success=True, video_project=video_project)
+
+
+@pytest.fixture(autouse=True)
+def reset_fake_orchestrator():
+    """Reset shared counters between tests."""
+    FakeOrchestrator.running = 0
+    FakeOrchestrator.peak = 0
+    FakeOrchestrator.configs = []
+
+
+def test_for_job_isolates_output_dirs(config):
+    """Job-scoped configs do not leak output paths into each other."""
+    base_output = config.app.output_dir
+
+    job_a = config.for_job("project_a")
+    job_b = config.for_job("project_b")
+
+    assert job_a.app.output_dir.name == "project_a"
+    assert job_b.app.output_dir.name == "project_b"
+    assert job_a.audio_dir != job_b.audio_dir
+    assert config.app.output_dir == base_output
+
+
+@pytest.mark.asyncio
+async def test_process_batch_honors_max_parallel(config):
+    """No more than max_parallel jobs run at the same time."""
+    processor = BatchProcessor(config, max_parallel=3, orchestrator_factory=FakeOrchestrator)
+
+    result = await processor.process_batch([f"https://reddit.com/{i}" for i in range(10)])
+
+    assert result.total == 10
+    assert result.successful == 10
+    assert FakeOrchestrator.peak == 3
+
+
+@pytest.mark.asyncio
+async def test_process_batch_preserves_order_and_reports_progress(config):
+    """Results come back in input order and progress is reported per job."""
+    urls = ["https://reddit.com/a", "https://reddit.com/fail", "https://reddit.com/c"]
+    progress = []
+
+    processor = BatchProcessor(
+        config,
+        max_parallel=2,
+        orchestrator_factory=FakeOrchestrator,
+        progress_callback=lambda result, done, total: progress.append((done, total)),
+    )
+
+    result = await processor.process_batch(urls)
+
+    assert [r.url for r in result.results] == urls
+    assert [r.status for r in result.results] == ["success", "failed", "success"]
+    assert result.successful == 2
+    assert result.failed == 1
+    assert progress == [(1, 3), (2, 3), (3, 3)]
+
+    # Every job ran against its own config and project directory
+    project_ids = {r.project_id for r in result.results}
+    assert len(project_ids) == 3
+    assert {c.app.output_dir.name for c in FakeOrchestrator.configs} == project_ids
+
+
+def test_max_parallel_must_be_positive(config):
+    """Zero parallelism is rejected."""
+    with pytest.raises(ValueError):
+        BatchProcessor(config, max_parallel=0)
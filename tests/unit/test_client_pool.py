@@ -0,0 +1,99 @@
+"""Unit tests for pooled, async-native provider clients."""
+
+import threading
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from gossiptoon.agents.tools.reddit_search import RedditSearchTool
+from gossiptoon.models.visual import ImagePrompt
+from gossiptoon.utils import client_pool
+from gossiptoon.utils.client_pool import get_dedicated_executor, get_pooled_client
+from gossiptoon.visual.gemini_client import GeminiImageClient
+
+
+@pytest.fixture(autouse=True)
+def isolated_pool(monkeypatch):
+    """Give each test an empty client pool."""
+    monkeypatch.setattr(client_pool, "_clients", {})
+
+
+def test_pooled_client_created_once_per_key():
+    """Clients are shared per kind and credentials."""
+    factory = MagicMock(side_effect=lambda: object())
+
+    first = get_pooled_client("svc", "key-a", factory)
+    assert get_pooled_client("svc", "key-a", factory) is first
+    assert get_pooled_client("svc", "key-b", factory) is not first
+    assert factory.call_count == 2
+
+
+def test_dedicated_executor_is_single_threaded():
+    """A dedicated executor is shared and runs one task at a time."""
+    executor = get_dedicated_executor("test-sdk")
+
+    assert get_dedicated_executor("test-sdk") is executor
+    assert executor._max_workers == 1
+
+
+@pytest.mark.asyncio
+async def test_gemini_image_client_uses_async_api(tmp_path, monkeypatch):
+    """Image generation awaits the SDK's async API on the pooled client."""
+    response = SimpleNamespace(
+        parts=[SimpleNamespace(inline_data=SimpleNamespace(data=b"PNGDATA"))]
+    )
+    genai_client = MagicMock()
+    genai_client.aio.models.generate_content = AsyncMock(return_value=response)
+    monkeypatch.setattr(
+        "gossiptoon.visual.gemini_client.get_genai_client", lambda api_key: genai_client
+    )
+
+    client = GeminiImageClient(api_key="test_key")
+    prompt = ImagePrompt(scene_id="scene_01", base_prompt="A dramatic scene in a dimly lit office")
+    output = await client.generate_image(prompt, output_path=tmp_path / "img.png")
+
+    assert output.read_bytes() == b"PNGDATA"
+    genai_client.aio.models.generate_content.assert_awaited_once()
+    genai_client.models.generate_content.assert_not_called()
+
+
+def _submission(index: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=f"post{index}",
+        title=f"Post {index}",
+        selftext="x" * 200,
+        subreddit=SimpleNamespace(display_name="tifu"),
+        author="someone",
+        score=index * 100,
+        num_comments=10,
+        created_utc=datetime.now().timestamp(),
+        permalink=f"/r/tifu/{index}",
+        link_flair_text=None,
+        stickied=False,
+    )
+
+
+@pytest.mark.asyncio
+async def test_reddit_search_runs_praw_off_event_loop():
+    """PRAW calls run on the dedicated worker thread, not the event loop."""
+    loop_thread = threading.get_ident()
+    praw_threads = set()
+
+    def top(time_filter, limit):
+        praw_threads.add(threading.get_ident())
+        return [_submission(1), _submission(2)]
+
+    reddit = MagicMock()
+    reddit.subreddit.return_value = SimpleNamespace(top=top)
+
+    tool = RedditSearchTool(client_id="id", client_secret="secret")
+    tool._reddit = reddit
+
+    posts = await tool.search_multiple_subreddits(["tifu", "relationships"])
+
+    assert len(posts) == 4
+    assert posts[0].upvotes == 200
+    assert len(praw_threads) == 1
+    assert loop_thread not in praw_threads
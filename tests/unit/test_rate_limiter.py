@@ -0,0 +1,202 @@
+"""Unit tests for the provider-aware rate limiter."""
+
+import asyncio
+import time
+from contextlib import ExitStack
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from gossiptoon.utils import rate_limiter as rl
+from gossiptoon.utils.rate_limiter import (
+    LangChainRateLimiter,
+    RateLimiter,
+    TokenUsageCallback,
+    configure_rate_limits,
+    get_rate_limiter,
+    is_rate_limit_error,
+)
+
+
+@pytest.fixture(autouse=True)
+def isolated_registry(monkeypatch):
+    """Give each test its own limiter registry and a short window."""
+    monkeypatch.setattr(rl, "_registry", {})
+    monkeypatch.setattr(rl, "_settings", {k: dict(v) for k, v in rl._settings.items()})
+    monkeypatch.setattr(rl, "WINDOW_SECONDS", 0.2)
+
+
+@pytest.mark.asyncio
+async def test_rpm_limit_delays_excess_requests():
+    """Requests beyond the RPM budget wait for the window to roll over."""
+    limiter = RateLimiter("test", rpm=2)
+
+    start = time.monotonic()
+    for _ in range(3):
+        async with limiter.slot():
+            pass
+    elapsed = time.monotonic() - start
+
+    assert elapsed >= 0.18
+
+
+@pytest.mark.asyncio
+async def test_max_concurrent_caps_in_flight_requests():
+    """No more than max_concurrent requests hold a slot at once."""
+    limiter = RateLimiter("test", max_concurrent=2)
+    running = 0
+    peak = 0
+
+    async def call():
+        nonlocal running, peak
+        async with limiter.slot():
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+    await asyncio.gather(*(call() for _ in range(6)))
+
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_tpm_limit_waits_for_token_budget():
+    """Token usage is counted toward the TPM window."""
+    limiter = RateLimiter("test", tpm=100)
+
+    limiter.record_usage(90)
+    start = time.monotonic()
+    await limiter.wait_for_quota(tokens=50)
+
+    assert time.monotonic() - start >= 0.18
+
+
+def test_token_usage_callback_enforces_tpm():
+    """LLM usage reported on completion blocks requests over the TPM budget."""
+    from langchain_core.messages import AIMessage
+    from langchain_core.outputs import ChatGeneration, LLMResult
+
+    limiter = RateLimiter("test", tpm=100)
+    adapter = LangChainRateLimiter(limiter)
+    message = AIMessage(
+        content="ok",
+        usage_metadata={"input_tokens": 80, "output_tokens": 40, "total_tokens": 120},
+    )
+
+    assert adapter.acquire(blocking=False) is True
+    TokenUsageCallback(limiter).on_llm_end(
+        LLMResult(generations=[[ChatGeneration(message=message)]])
+    )
+
+    assert adapter.acquire(blocking=False) is False
+
+
+def test_rate_limited_backs_off_and_recovers():
+    """A 429 halves effective RPM and pauses; successes restore RPM."""
+    limiter = RateLimiter("test", rpm=10)
+
+    limiter.report_rate_limited(retry_after=0.5)
+    assert limiter.effective_rpm == 5
+    assert limiter._reserve(0) > 0  # cooling down
+
+    for _ in range(10):
+        limiter.report_success()
+    assert limiter.effective_rpm == 10
+
+
+def test_registry_shares_limiters_and_applies_overrides():
+    """Clients for the same provider/model share one limiter."""
+    configure_rate_limits({"google_tts:special-model": {"rpm": 3}})
+
+    default = get_rate_limiter("google_tts", "default-model")
+    special = get_rate_limiter("google_tts", "special-model")
+
+    assert get_rate_limiter("google_tts", "default-model") is default
+    assert default.rpm == rl.DEFAULT_RATE_LIMITS["google_tts"]["rpm"]
+    assert special.rpm == 3
+
+    # Reconfiguring updates limiters that already exist
+    configure_rate_limits({"google_tts": {"rpm": 7, "tpm": None, "max_concurrent": None}})
+    assert default.rpm == 7
+
+
+@pytest.mark.asyncio
+async def test_new_orchestrator_keeps_live_limits():
+    """A job starting mid-batch does not reset limits that other jobs hold."""
+    from gossiptoon.pipeline import orchestrator as orchestrator_module
+
+    config = MagicMock()
+    config.rate_limits = {"google_tts": {"rpm": 10, "tpm": None, "max_concurrent": 1}}
+
+    def build_orchestrator():
+        with ExitStack() as stack:
+            for name in (
+                "StoryFinderAgent", "SceneStructurerAgent", "ScriptWriterAgent",
+                "ScriptEvaluator", "VisualDetailerAgent", "EngagementWriter",
+                "AudioGenerator", "VisualDirector", "VideoAssembler", "CheckpointManager",
+            ):
+                stack.enter_context(patch.object(orchestrator_module, name))
+            return orchestrator_module.PipelineOrchestrator(config)
+
+    build_orchestrator()
+    limiter = get_rate_limiter("google_tts", "tts-model")
+
+    async with limiter.slot():
+        limiter.report_rate_limited(retry_after=0.01)
+        build_orchestrator()
+
+        # The held slot still counts and the learned slow-down survives
+        assert limiter.effective_rpm == 5
+        with pytest.raises(asyncio.TimeoutError):
+            async with asyncio.timeout(0.1):
+                async with limiter.slot():
+                    pass
+
+
+def test_zero_env_override_disables_limit(monkeypatch):
+    """A limit overridden with 0 or an empty value is turned off."""
+    from gossiptoon.core.config import ConfigManager
+
+    monkeypatch.setenv("RATE_LIMIT_GOOGLE_TTS_RPM", "0")
+    monkeypatch.setenv("RATE_LIMIT_GOOGLE_TTS_MAX_CONCURRENT", "")
+    monkeypatch.setenv("RATE_LIMIT_GEMINI_IMAGE_RPM", "3")
+
+    rate_limits = ConfigManager._load_rate_limits()
+
+    assert rate_limits["google_tts"].rpm is None
+    assert rate_limits["google_tts"].max_concurrent is None
+    assert rate_limits["gemini_image"].rpm == 3
+
+
+def test_configure_caps_adaptive_rpm():
+    """Changing RPM keeps a learned slow-down below the new limit."""
+    limiter = RateLimiter("test", rpm=10)
+    limiter.report_rate_limited(retry_after=0.01)
+
+    limiter.configure(rpm=10)
+    assert limiter.effective_rpm == 5
+    limiter.configure(rpm=4)
+    assert limiter.effective_rpm == 4
+
+
+def test_langchain_adapter_nonblocking_acquire():
+    """The LangChain adapter reports exhausted quota without blocking."""
+    adapter = LangChainRateLimiter(RateLimiter("test", rpm=1))
+
+    assert adapter.acquire(blocking=False) is True
+    assert adapter.acquire(blocking=False) is False
+
+
+class _StatusError(Exception):
+    def __init__(self, code: int) -> None:
+        super().__init__("request failed")
+        self.code = code
+
+
+def test_is_rate_limit_error():
+    """429 errors are recognized by status code or message."""
+    assert is_rate_limit_error(_StatusError(429))
+    assert is_rate_limit_error(Exception("429 RESOURCE_EXHAUSTED: quota exceeded"))
+    assert not is_rate_limit_error(_StatusError(500))
+    assert not is_rate_limit_error(ValueError("bad input"))
@@ -15,7 +15,7 @@ from unittest.mock import AsyncMock, MagicMock, Mock, patch
 import pytest
 
 from gossiptoon.core.config import ConfigManager
-from gossiptoon.core.exceptions import VideoAssemblyError
+from gossiptoon.core.exceptions import RetryExhaustedError, VideoAssemblyError
 from gossiptoon.models.audio import AudioProject, AudioSegment, WordTimestamp
 from gossiptoon.models.visual import ImagePrompt, VisualAsset, VisualProject
 from gossiptoon.video.assembler import VideoAssembler
@@ -58,6 +58,12 @@ def mock_config(temp_dirs):
     video_config.bitrate = "5M"
     video_config.ken_burns_enabled = True
     video_config.captions_enabled = True
+    video_config.prescale_images = False
+    video_config.parallel_render = False
+    video_config.render_workers = 0
+    video_config.effect_engine = "ffmpeg"
+    video_config.segment_cache_enabled = False
+    video_config.render_profile = "publish"
     config.video = video_config
 
     return config
@@ -456,6 +462,82 @@ def test_build_video_command(temp_dirs):
     assert len(command.inputs) > 0
 
 
+def test_build_segment_command(temp_dirs):
+    """Test segment clip command uses the single-pass encoder settings."""
+    builder = FFmpegBuilder(fps=30)
+
+    img_path = temp_dirs["images"] / "test.png"
+    img_path.write_bytes(b"fake_image")
+    clip_path = temp_dirs["videos"] / "segment_000.mp4"
+
+    command = builder.build_segment_command(
+        VideoSegment(image_path=img_path, duration=2.0, effects=[]),
+        clip_path,
+        threads=4,
+    )
+    cmd_list = command.to_list()
+
+    assert cmd_list[-1] == str(clip_path)
+    assert command.maps == ["[outv]"]
+    assert "-an" in cmd_list
+    assert cmd_list[cmd_list.index("-frames:v") + 1] == "60"
+    assert cmd_list[cmd_list.index("-threads") + 1] == "4"
+    assert "setpts" not in command.filter_complex
+
+    single = builder.build_video_command(
+        segments=[VideoSegment(image_path=img_path, duration=2.0, effects=[])],
+        master_audio=img_path,
+        output_file=temp_dirs["videos"] / "output.mp4",
+    )
+    encode = ["-c:v", "libx264", "-preset", "medium", "-crf", "23", "-pix_fmt", "yuv420p"]
+    assert command.output_options[: len(encode)] == encode
+    assert single.output_options[: len(encode)] == encode
+
+
+def test_build_segment_command_shifts_captions(temp_dirs):
+    """Test captions are drawn at the segment's place on the timeline."""
+    builder = FFmpegBuilder(fps=30)
+
+    img_path = temp_dirs["images"] / "test.png"
+    img_path.write_bytes(b"fake_image")
+    subtitles = temp_dirs["videos"] / "captions.ass"
+
+    command = builder.build_segment_command(
+        VideoSegment(image_path=img_path, duration=2.0, effects=[]),
+        temp_dirs["videos"] / "segment_001.mp4",
+        start_time=3.5,
+        subtitles_path=subtitles,
+    )
+
+    filters = command.filter_complex.split(";")
+    assert filters[-3] == "[v0]setpts=PTS+3.5/TB[v_timed]"
+    assert filters[-2].startswith("[v_timed]subtitles=")
+    assert filters[-1] == "[v_drawn]setpts=PTS-STARTPTS[outv]"
+
+
+def test_concat_list_and_mux_command(temp_dirs):
+    """Test the final pass joins clips by stream copy."""
+    builder = FFmpegBuilder()
+
+    clips = [temp_dirs["videos"] / "a.mp4", temp_dirs["videos"] / "it's.mp4"]
+    list_file = builder.write_concat_list(clips, temp_dirs["videos"] / "concat.txt")
+
+    lines = list_file.read_text().splitlines()
+    assert lines[0] == f"file '{clips[0].resolve()}'"
+    assert lines[1].endswith("it'\\''s.mp4'")
+
+    audio_path = temp_dirs["audio"] / "master.wav"
+    output_file = temp_dirs["videos"] / "output.mp4"
+    command = builder.build_mux_command(list_file, audio_path, output_file)
+    cmd_list = command.to_list()
+
+    assert cmd_list[cmd_list.index("-f") + 1] == "concat"
+    assert cmd_list[cmd_list.index("-c:v") + 1] == "copy"
+    assert command.maps == ["0:v", "1:a"]
+    assert command.filter_complex is None
+    assert cmd_list[-1] == str(output_file)
+
+
 def test_estimate_render_time(temp_dirs):
     """Test render time estimation."""
     builder = FFmpegBuilder()
@@ -516,6 +598,499 @@ async def test_assemble_video_mocked(mock_config, sample_visual_project, sample_
     assert assembler._execute_ffmpeg.called
 
 
+@pytest.mark.asyncio
+async def test_assemble_video_parallel(mock_config, sample_visual_project, sample_audio_project):
+    """Test parallel render: one clip per segment, then a stream-copy join."""
+    mock_config.video.parallel_render = True
+    mock_config.video.render_workers = 2
+    mock_config.video.captions_enabled = False
+    assembler = VideoAssembler(mock_config)
+
+    commands = []
+
+    async def mock_execute(command):
+        commands.append(command)
+        Path(command[-1]).write_bytes(b"fake_video")
+
+    assembler._execute_ffmpeg = AsyncMock(side_effect=mock_execute)
+
+    video_project = await assembler.assemble_video(
+        sample_visual_project,
+        sample_audio_project,
+        script=MagicMock(),
+    )
+
+    assert len(commands) == 3
+    assert all("-an" in command for command in commands[:2])
+    mux = commands[-1]
+    assert mux[mux.index("-c:v") + 1] == "copy"
+    assert video_project.output_path.exists()
+    assert video_project.metadata["render_mode"] == "parallel"
+    # Intermediate clips are removed after the join
+    assert not (mock_config.videos_dir / "test_script_segments").exists()
+
+
+@pytest.mark.asyncio
+async def test_assemble_video_parallel_cancels_siblings_on_failure(
+    mock_config, sample_visual_project, sample_audio_project
+):
+    """Test a failed segment stops the other renders before cleanup."""
+    mock_config.video.parallel_render = True
+    mock_config.video.render_workers = 2
+    mock_config.video.captions_enabled = False
+    assembler = VideoAssembler(mock_config)
+
+    cancelled = []
+
+    async def mock_execute(command):
+        if str(sample_visual_project.assets[0].image_path) in command:
+            await asyncio.sleep(0)
+            raise VideoAssemblyError("segment failed")
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.append(command)
+            raise
+
+    assembler._execute_ffmpeg = AsyncMock(side_effect=mock_execute)
+
+    with pytest.raises(VideoAssemblyError, match="segment failed"):
+        await assembler.assemble_video(
+            sample_visual_project, sample_audio_project, script=MagicMock()
+        )
+
+    assert len(cancelled) == 1
+    assert not (mock_config.videos_dir / "test_script_segments").exists()
+
+
+@pytest.mark.asyncio
+async def test_assemble_video_reuses_cached_segments(
+    mock_config, sample_visual_project, sample_audio_project, tmp_path
+):
+    """Test re-assembly only re-encodes segments whose image changed."""
+    mock_config.video.parallel_render = True
+    mock_config.video.render_workers = 2
+    mock_config.video.captions_enabled = False
+    mock_config.video.segment_cache_enabled = True
+    mock_config.video.segment_cache_max_mb = 100
+    mock_config.cache_dir = tmp_path / "cache"
+    assembler = VideoAssembler(mock_config)
+
+    commands = []
+
+    async def mock_execute(command):
+        commands.append(command)
+        Path(command[-1]).write_bytes(b"fake_video")
+
+    assembler._execute_ffmpeg = AsyncMock(side_effect=mock_execute)
+
+    await assembler.assemble_video(sample_visual_project, sample_audio_project, script=MagicMock())
+    assert len(commands) == 3
+
+    # Unchanged: only the final join runs
+    commands.clear()
+    await assembler.assemble_video(sample_visual_project, sample_audio_project, script=MagicMock())
+    assert len(commands) == 1
+    assert "concat" in commands[0]
+
+    # One image regenerated: one segment re-encoded
+    commands.clear()
+    sample_visual_project.assets[1].image_path.write_bytes(b"regenerated_image")
+    await assembler.assemble_video(sample_visual_project, sample_audio_project, script=MagicMock())
+    assert len(commands) == 2
+    assert str(sample_visual_project.assets[1].image_path) in commands[0]
+
+    # First scene retimed: the later segment is reused although it moved
+    commands.clear()
+    sample_audio_project.segments[0].duration_seconds = 4.0
+    await assembler.assemble_video(sample_visual_project, sample_audio_project, script=MagicMock())
+    assert len(commands) == 2
+    assert str(sample_visual_project.assets[0].image_path) in commands[0]
+
+
+def test_segment_cache_key(temp_dirs):
+    """Test the segment key covers image content, effects, timing and encoder."""
+    from gossiptoon.video.segment_cache import SegmentCache
+
+    img_path = temp_dirs["images"] / "key.png"
+    img_path.write_bytes(b"image_a")
+    effect = KenBurnsEffect(KenBurnsConfig(zoom_start=1.0, zoom_end=1.2))
+    encoder = FFmpegBuilder().video_encode_options()
+
+    def key(**overrides):
+        args = dict(
+            image_path=img_path,
+            effects=[effect],
+            frames=60,
+            fps=30,
+            width=1080,
+            height=1920,
+            encoder_options=encoder,
+        )
+        args.update(overrides)
+        return SegmentCache.make_key(**args)
+
+    base = key()
+    assert key() == base
+    assert key(frames=61) != base
+    assert key(effects=[KenBurnsEffect(KenBurnsConfig(zoom_end=1.3))]) != base
+    assert key(encoder_options=FFmpegBuilder().video_encode_options(crf=28)) != base
+    assert key(captions="Dialogue: 0,0:00:00.00,0:00:01.00,Default,,0,0,0,,Hi") != base
+
+    img_path.write_bytes(b"image_b")
+    assert key() != base
+
+
+def test_caption_window(temp_dirs):
+    """Test only events overlapping a segment take part in its key."""
+    from gossiptoon.video.segment_cache import caption_window
+
+    ass_path = temp_dirs["videos"] / "captions.ass"
+    ass_path.write_text(
+        "[Script Info]\n"
+        "Dialogue: 0,0:00:00.00,0:00:01.50,Default,,0,0,0,,first\n"
+        "Dialogue: 0,0:00:02.00,0:00:03.00,Default,,0,0,0,,second\n"
+        "Dialogue: 0,0:01:05.00,0:01:06.00,Default,,0,0,0,,later\n"
+    )
+
+    window = caption_window(ass_path, 1.0, 2.0)
+    assert "[Script Info]" in window
+    assert "first" in window
+    assert "second" not in window
+    assert "later" in caption_window(ass_path, 65.5, 70.0)
+    assert caption_window(None, 0.0, 1.0) == ""
+
+    # Event times are relative to the segment, so moving it keeps the key
+    shifted = temp_dirs["videos"] / "shifted.ass"
+    shifted.write_text(
+        "[Script Info]\n"
+        "Dialogue: 0,0:00:10.00,0:00:11.50,Default,,0,0,0,,first\n"
+    )
+    assert caption_window(shifted, 11.0, 12.0) == window
+
+
+def test_effect_input_scale():
+    """Test effects report how much larger than the output their input should be."""
+    from gossiptoon.core.constants import CameraEffectType
+    from gossiptoon.video.effects.camera import CameraEffect, CameraEffectConfig
+
+    zoom = KenBurnsEffect(KenBurnsConfig(zoom_start=1.3, zoom_end=1.0))
+    shake = CameraEffect(CameraEffectConfig(effect_type=CameraEffectType.SHAKE))
+    static = CameraEffect(CameraEffectConfig(effect_type=CameraEffectType.STATIC))
+
+    assert zoom.get_input_scale() == 1.3
+    assert shake.get_input_scale() == pytest.approx(1 / 0.9)
+    assert static.get_input_scale() == 1.0
+    assert CompositeEffect([zoom, shake]).get_input_scale() == 1.3
+
+
+def test_prepare_image_fits_and_pads(tmp_path):
+    """Test images are fitted to the target aspect ratio and padded with black."""
+    from PIL import Image
+
+    from gossiptoon.video.image_prep import prepare_image, prepared_size
+
+    assert prepared_size(1080, 1920) == (1080, 1920)
+    assert prepared_size(1080, 1920, 1.2) == (1296, 2304)
+    assert prepared_size(1080, 1920, 1 / 0.9) == (1200, 2134)
+
+    source = tmp_path / "square.png"
+    Image.new("RGB", (400, 400), (255, 0, 0)).save(source)
+    cache_dir = tmp_path / "prepared"
+
+    prepared = prepare_image(source, 108, 192, cache_dir)
+    with Image.open(prepared) as img:
+        assert img.size == (108, 192)
+        assert img.getpixel((54, 96)) == (255, 0, 0)
+        assert img.getpixel((54, 2)) == (0, 0, 0)
+
+    # Second call reuses the prepared file
+    mtime = prepared.stat().st_mtime_ns
+    assert prepare_image(source, 108, 192, cache_dir) == prepared
+    assert prepared.stat().st_mtime_ns == mtime
+
+
+def test_prepare_images_falls_back_to_original(tmp_path):
+    """Test an unreadable image is rendered from the original file."""
+    from gossiptoon.video.image_prep import prepare_images
+
+    broken = tmp_path / "broken.png"
+    broken.write_bytes(b"not an image")
+
+    assert prepare_images([(broken, 108, 192)], tmp_path / "prepared") == [broken]
+
+
+@pytest.mark.asyncio
+async def test_assemble_video_prescales_images(
+    mock_config, sample_visual_project, sample_audio_project
+):
+    """Test segments render from images sized for their Ken Burns zoom."""
+    from PIL import Image
+
+    for asset in sample_visual_project.assets:
+        Image.new("RGB", (540, 960), (0, 128, 255)).save(asset.image_path, format="PNG")
+    mock_config.video.prescale_images = True
+    assembler = VideoAssembler(mock_config)
+
+    commands = []
+
+    async def mock_execute(command):
+        commands.append(command)
+        Path(command[-1]).write_bytes(b"fake_video")
+
+    assembler._execute_ffmpeg = AsyncMock(side_effect=mock_execute)
+
+    await assembler.assemble_video(sample_visual_project, sample_audio_project, script=MagicMock())
+
+    inputs = [arg for arg in commands[0] if arg.endswith("_1296x2304.png")]
+    assert len(inputs) == 2
+    with Image.open(inputs[0]) as img:
+        assert img.size == (1296, 2304)
+
+
+def test_ken_burns_crop_windows_match_zoompan():
+    """Test native crop windows follow the zoompan zoom, easing and pan."""
+    effect = KenBurnsEffect(
+        KenBurnsConfig(zoom_start=1.0, zoom_end=1.2, ease_function="linear")
+    )
+    windows = effect.get_crop_windows(30, 1200, 2000, duration=1.0, fps=30)
+
+    assert windows.shape == (30, 4)
+    assert list(windows[0]) == pytest.approx([0, 0, 1200, 2000])
+    # on=15 of 30: zoom 1.1, centered
+    x, y, w, h = windows[15]
+    assert w == pytest.approx(1200 / 1.1)
+    assert h == pytest.approx(2000 / 1.1)
+    assert x == pytest.approx((1200 - w) / 2)
+    assert y == pytest.approx((2000 - h) / 2)
+
+    # Pan up starts below center and is clamped inside the image
+    pan = KenBurnsEffect(KenBurnsConfig(zoom_start=1.25, zoom_end=1.25, pan_direction="up"))
+    windows = pan.get_crop_windows(30, 1200, 2000, duration=1.0, fps=30)
+    assert windows[0][1] == pytest.approx(2000 - 2000 / 1.25)
+    assert (windows[:, 1] <= 2000 - windows[:, 3] + 1e-9).all()
+    assert windows[-1][1] < windows[0][1]
+
+
+def test_shake_crop_windows():
+    """Test native shake windows keep 90% of the frame inside the image."""
+    from gossiptoon.video.effects.camera import ShakeEffect
+
+    for speed in ("slow", "normal", "fast"):
+        windows = ShakeEffect(intensity=0.5, speed=speed).get_crop_windows(
+            60, 1200, 2134, duration=2.0, fps=30
+        )
+        assert windows.shape == (60, 4)
+        assert windows[:, 2] == pytest.approx(1080)
+        assert (windows[:, 0] >= 0).all()
+        assert (windows[:, 0] + windows[:, 2] <= 1200 + 1e-9).all()
+        assert len(set(windows[:, 0])) > 1
+
+    # Jitter is reproducible between renders
+    first = ShakeEffect(speed="fast").get_crop_windows(10, 1200, 2134, fps=30)
+    second = ShakeEffect(speed="fast").get_crop_windows(10, 1200, 2134, fps=30)
+    assert (first == second).all()
+
+
+def test_frame_renderer_frames(tmp_path):
+    """Test raw frames are rendered in order at the output size."""
+    from PIL import Image
+
+    from gossiptoon.video.frame_renderer import FrameRenderer
+
+    image_path = tmp_path / "scene.png"
+    pixels = Image.linear_gradient("L").resize((240, 400)).convert("RGB")
+    pixels.save(image_path)
+
+    renderer = FrameRenderer(120, 200, fps=10, workers=2)
+    zoom = KenBurnsEffect(KenBurnsConfig(zoom_start=1.0, zoom_end=1.5, ease_function="linear"))
+    segment = VideoSegment(image_path=image_path, duration=1.2, effects=[zoom])
+
+    assert renderer.supports(segment)
+    frames = list(renderer.iter_frames(segment))
+    assert len(frames) == 12
+    assert all(len(frame) == 120 * 200 * 3 for frame in frames)
+
+    expected = pixels.resize((120, 200), Image.BILINEAR).tobytes()
+    assert frames[0] == expected
+    assert frames[-1] != expected
+
+    # Chained effects fall back to FFmpeg filters
+    chained = VideoSegment(image_path=image_path, duration=1.0, effects=[zoom, zoom])
+    assert not renderer.supports(chained)
+
+
+def test_build_segment_command_raw_frames(temp_dirs):
+    """Test natively rendered segments are read from a rawvideo pipe."""
+    builder = FFmpegBuilder(fps=30)
+
+    img_path = temp_dirs["images"] / "test.png"
+    img_path.write_bytes(b"fake_image")
+
+    command = builder.build_segment_command(
+        VideoSegment(image_path=img_path, duration=2.0, effects=[]),
+        temp_dirs["videos"] / "segment_000.mp4",
+        raw_frames=True,
+    )
+    cmd_list = command.to_list()
+
+    assert cmd_list[cmd_list.index("-f") + 1] == "rawvideo"
+    assert cmd_list[cmd_list.index("-s") + 1] == "1080x1920"
+    assert cmd_list[cmd_list.index("-i") + 1] == "pipe:0"
+    assert str(img_path) not in cmd_list
+    assert cmd_list[cmd_list.index("-frames:v") + 1] == "60"
+
+
+@pytest.mark.asyncio
+async def test_assemble_video_numpy_engine(
+    mock_config, sample_visual_project, sample_audio_project
+):
+    """Test the numpy engine pipes rendered frames to the segment encoder."""
+    from PIL import Image
+
+    for asset in sample_visual_project.assets:
+        Image.new("RGB", (360, 640), (200, 50, 50)).save(asset.image_path, format="PNG")
+    mock_config.video.width = 720
+    mock_config.video.height = 1280
+    mock_config.video.parallel_render = True
+    mock_config.video.render_workers = 2
+    mock_config.video.captions_enabled = False
+    mock_config.video.effect_engine = "numpy"
+    assembler = VideoAssembler(mock_config)
+
+    piped = []
+
+    async def mock_pipe(command, frames):
+        piped.append(sum(len(frame) for frame in frames()) // (720 * 1280 * 3))
+        Path(command[-1]).write_bytes(b"fake_clip")
+
+    async def mock_execute(command):
+        Path(command[-1]).write_bytes(b"fake_video")
+
+    assembler._pipe_frames_to_ffmpeg = AsyncMock(side_effect=mock_pipe)
+    assembler._execute_ffmpeg = AsyncMock(side_effect=mock_execute)
+
+    video_project = await assembler.assemble_video(
+        sample_visual_project, sample_audio_project, script=MagicMock()
+    )
+
+    assert sorted(piped) == [75, 90]
+    assert assembler._execute_ffmpeg.call_count == 1  # Only the final join
+    assert video_project.output_path.exists()
+
+
+@pytest.mark.asyncio
+async def test_pipe_frames_reaps_process_when_rendering_fails(mock_config):
+    """A failing frame renderer kills and reaps the encoder process."""
+    import sys
+
+    assembler = VideoAssembler(mock_config)
+    spawned = []
+    create_subprocess_exec = asyncio.create_subprocess_exec
+
+    async def spawn(*args, **kwargs):
+        process = await create_subprocess_exec(*args, **kwargs)
+        spawned.append(process)
+        return process
+
+    def frames():
+        yield b"frame"
+        raise VideoAssemblyError("render failed")
+
+    command = [sys.executable, "-c", "import sys; sys.stdin.buffer.read()"]
+    with patch("asyncio.create_subprocess_exec", side_effect=spawn), patch(
+        "asyncio.sleep", new_callable=AsyncMock
+    ):
+        with pytest.raises(RetryExhaustedError):
+            await assembler._pipe_frames_to_ffmpeg(command, frames)
+
+    assert spawned
+    assert all(process.returncode is not None for process in spawned)
+
+
+def test_render_profiles():
+    """Test built-in render profiles resolve size and encoder settings."""
+    from gossiptoon.core.config import get_render_profile
+    from gossiptoon.core.exceptions import ConfigurationError
+
+    draft = get_render_profile("draft")
+    assert draft.output_size(1080, 1920) == (540, 960)
+    assert draft.encoder_options("medium") == {
+        "preset": "ultrafast",
+        "crf": 30,
+        "tune": "stillimage",
+    }
+    assert not draft.effects_enabled
+    assert draft.burn_subtitles
+    assert draft.threads == 4
+
+    assert get_render_profile("review").output_size(1080, 1920) == (720, 1280)
+    publish = get_render_profile("publish")
+    assert publish.output_size(1080, 1920) == (1080, 1920)
+    assert publish.encoder_options("slow") == {"preset": "slow", "crf": 23}
+
+    with pytest.raises(ConfigurationError):
+        get_render_profile("cinema")
+
+
+def test_video_encode_options_tune():
+    """Test the x264 tune is emitted only when set."""
+    builder = FFmpegBuilder()
+    options = builder.video_encode_options(preset="ultrafast", crf=30, tune="stillimage")
+    assert options[options.index("-tune") + 1] == "stillimage"
+    assert "-tune" not in builder.video_encode_options()
+    assert builder._custom_options(tune="stillimage", threads=2) == ["-threads", "2"]
+
+
+def test_review_profile_renders_camera_effects_at_profile_size(mock_config):
+    """Test camera effects render at the profile's size, not full resolution."""
+    from gossiptoon.core.constants import CameraEffectType
+
+    mock_config.video.use_ai_camera_effects = True
+    assembler = VideoAssembler(mock_config, profile="review")
+
+    for effect_type in (CameraEffectType.ZOOM_IN, CameraEffectType.SHAKE):
+        asset = MagicMock(scene_id="scene_1", camera_effect=effect_type)
+        (effect,) = assembler._create_segment_effects(asset)
+        filter_string = effect.get_filter_string("[0:v]", "[v0]", duration=2.0, fps=30)
+        assert "1080" not in filter_string
+        assert ("s=720x1280" in filter_string) or ("scale=720:1280" in filter_string)
+
+    # Effects stay valid below 720p
+    assert KenBurnsConfig(output_width=540, output_height=960).output_width == 540
+
+
+@pytest.mark.asyncio
+async def test_assemble_video_draft_profile(
+    mock_config, sample_visual_project, sample_audio_project
+):
+    """Test the draft profile renders small, fast, without effects."""
+    assembler = VideoAssembler(mock_config, profile="draft")
+    assert (assembler.width, assembler.height, assembler.fps) == (540, 960, 24)
+    assert assembler.encode_options["threads"] == 4
+
+    async def mock_execute(command):
+        Path(command[-1]).write_bytes(b"fake_video")
+
+    assembler._execute_ffmpeg = AsyncMock(side_effect=mock_execute)
+    assembler._generate_captions = AsyncMock(return_value=None)
+
+    video_project = await assembler.assemble_video(
+        sample_visual_project,
+        sample_audio_project,
+        script=MagicMock(),
+    )
+
+    command = assembler._execute_ffmpeg.call_args[0][0]
+    assert command[command.index("-preset") + 1] == "ultrafast"
+    assert command[command.index("-crf") + 1] == "30"
+    assert command[command.index("-tune") + 1] == "stillimage"
+    assert "zoompan" not in " ".join(command)
+    assert video_project.output_path.name == "test_script_draft.mp4"
+    assert video_project.render_config.resolution == "540x960"
+    assert video_project.metadata["render_profile"] == "draft"
+
+
 @pytest.mark.asyncio
 async def test_create_preview(mock_config, sample_visual_project, sample_audio_project):
     """Test preview creation."""
@@ -23,6 +23,7 @@ from gossiptoon.models.visual import (
     VisualAsset,
     VisualProject,
 )
+from gossiptoon.utils.journal import ItemJournal
 from gossiptoon.visual.base import ImageClient
 from gossiptoon.visual.character_bank import CharacterConsistencyBank
 from gossiptoon.visual.dalle_client import DALLEImageClient
@@ -476,7 +477,7 @@ async def test_gemini_client_initialization():
 
     assert client.api_key == "test_key"
     assert client.model == "imagen-3.0-generate-001"
-    assert client.get_model_name() == "imagen-3.0-generate-001"
+    assert client.get_model_name() == "gemini-2.5-flash-image"
     assert client.supports_i2i() is True
 
 
@@ -555,7 +556,7 @@ async def test_gemini_client_no_images_error(tmp_path):
 
     # Test that client can handle errors
     assert client.supports_i2i() is True
-    assert client.get_model_name() == "imagen-3.0-generate-001"
+    assert client.get_model_name() == "gemini-2.5-flash-image"
 
     # Test recommended params
     params = client.get_recommended_params()
@@ -893,3 +894,230 @@ async def test_full_visual_pipeline_integration(mock_config, sample_script, tmp_
         # Verify project saved
         project_file = mock_config.images_dir / "test_script_001_project.json"
         assert project_file.exists()
+
+
+# ============================================================================
+# ImageCache Tests
+# ============================================================================
+
+
+def _prompt(text: str = "A woman gasping in a kitchen") -> ImagePrompt:
+    return ImagePrompt(
+        scene_id="scene_01",
+        base_prompt=text,
+        style="webtoon",
+        aspect_ratio="9:16",
+        negative_prompt="text",
+    )
+
+
+def test_image_cache_key_inputs(tmp_path):
+    """Prompt, model, aspect ratio and reference bytes all change the key."""
+    from gossiptoon.visual.image_cache import ImageCache
+
+    ref_a = tmp_path / "a.png"
+    ref_b = tmp_path / "b.png"
+    ref_a.write_bytes(b"face-a")
+    ref_b.write_bytes(b"face-b")
+
+    key = ImageCache.make_key(_prompt(), "m1", "9:16", ref_a)
+
+    assert ImageCache.make_key(_prompt(), "m1", "9:16", ref_a) == key
+    assert ImageCache.make_key(_prompt("A man slamming a door in the hallway"), "m1", "9:16", ref_a) != key
+    assert ImageCache.make_key(_prompt(), "m2", "9:16", ref_a) != key
+    assert ImageCache.make_key(_prompt(), "m1", "1:1", ref_a) != key
+    assert ImageCache.make_key(_prompt(), "m1", "9:16", ref_b) != key
+
+
+def test_image_cache_hit_miss_stats(tmp_path, test_image_path):
+    """Hits copy the cached image; lookups never write, stats persist on flush."""
+    from gossiptoon.visual.image_cache import ImageCache
+
+    cache = ImageCache(tmp_path / "cache", max_bytes=1_000_000)
+
+    assert cache.get("k1", tmp_path / "out" / "miss.png") is None
+    assert list(cache.cache_dir.iterdir()) == []  # A miss writes nothing
+    cache.put("k1", test_image_path)
+    hit = cache.get("k1", tmp_path / "out" / "hit.png")
+
+    assert hit is not None
+    assert hit.read_bytes() == b"fake_image_data"
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+    assert cache.stats.hit_rate == 0.5
+    assert cache.flush_stats().hits == 1
+
+    reloaded = ImageCache(tmp_path / "cache", max_bytes=1_000_000)
+    assert reloaded.size_bytes() == len(b"fake_image_data")
+    assert reloaded.get("k1", tmp_path / "out" / "again.png") is not None
+    assert reloaded.flush_stats().hits == 2
+    assert reloaded.cumulative_stats().misses == 1
+
+
+def test_image_cache_counts_images_from_other_processes(tmp_path):
+    """Eviction sees images stored by another cache instance on the same directory."""
+    from gossiptoon.visual.image_cache import ImageCache
+
+    first = ImageCache(tmp_path / "cache", max_bytes=250)
+    second = ImageCache(tmp_path / "cache", max_bytes=250)
+    for cache, name in ((first, "a"), (second, "b"), (first, "c")):
+        image = tmp_path / f"{name}.png"
+        image.write_bytes(b"x" * 100)
+        cache.put(name, image)
+
+    assert first.size_bytes() <= 250
+    assert first.get("a", tmp_path / "a_out.png") is None
+
+
+def test_image_cache_lru_eviction(tmp_path):
+    """Least recently used images are evicted once over the size limit."""
+    from gossiptoon.visual.image_cache import ImageCache
+
+    cache = ImageCache(tmp_path / "cache", max_bytes=250)
+    for name in ("a", "b"):
+        image = tmp_path / f"{name}.png"
+        image.write_bytes(b"x" * 100)
+        cache.put(name, image)
+
+    cache.get("a", tmp_path / "touch.png")  # "b" is now least recently used
+    image = tmp_path / "c.png"
+    image.write_bytes(b"x" * 100)
+    cache.put("c", image)
+
+    assert cache.get("b", tmp_path / "b_out.png") is None
+    assert cache.get("a", tmp_path / "a_out.png") is not None
+    assert cache.stats.evictions == 1
+    assert not (cache.cache_dir / "b" / "b.png").exists()
+
+
+@pytest.mark.asyncio
+async def test_visual_director_serves_repeat_prompts_from_cache(mock_config, tmp_path):
+    """Identical image requests only reach the image client once."""
+    from gossiptoon.visual.image_cache import ImageCache
+
+    mock_client = MockImageClient()
+    director = VisualDirector(
+        config=mock_config,
+        image_client=mock_client,
+        image_cache=ImageCache(tmp_path / "cache", max_bytes=1_000_000),
+    )
+
+    with patch.object(mock_client, "generate_image", wraps=mock_client.generate_image) as spy:
+        first = await director._generate_image(_prompt(), tmp_path / "run1" / "scene_01.png")
+        second = await director._generate_image(_prompt(), tmp_path / "run2" / "scene_01.png")
+
+    assert spy.call_count == 1
+    assert first.read_bytes() == second.read_bytes() == b"mock_image"
+    assert director.image_cache.stats.hits == 1
+
+
+# ============================================================================
+# Concurrent Scene Generation Tests
+# ============================================================================
+
+
+@pytest.fixture
+def unvalidated_script(sample_script_scenes):
+    """Script with the sample scenes, skipping duration validation."""
+    acts = [
+        Act.model_construct(act_type=scene.act, target_duration_seconds=5.0, scenes=[scene])
+        for scene in sample_script_scenes
+    ]
+    return Script.model_construct(
+        script_id="test_script_001",
+        story_id="test_story_001",
+        title="Test Story",
+        acts=acts,
+        character_profiles=[],
+    )
+
+
+@pytest.fixture
+def sample_script_scenes():
+    """Five single-scene acts featuring John and Sarah."""
+    acts = [ActType.HOOK, ActType.BUILD, ActType.CRISIS, ActType.CLIMAX, ActType.RESOLUTION]
+    return [
+        Scene(
+            scene_id=f"scene_{i + 1}",
+            act=act,
+            order=0,
+            visual_description=f"John and Sarah argue in a crowded kitchen, moment number {i + 1}",
+            narration="Something dramatic happens right here",
+            emotion=EmotionTone.DRAMATIC,
+            characters_present=["John", "Sarah"],
+            estimated_duration_seconds=5.0,
+        )
+        for i, act in enumerate(acts)
+    ]
+
+
+class TrackingImageClient(MockImageClient):
+    """Image client that records concurrency and can fail selected scenes."""
+
+    def __init__(self, fail_scene_ids=()):
+        super().__init__()
+        self.fail_scene_ids = set(fail_scene_ids)
+        self.calls = []
+        self.running = 0
+        self.peak = 0
+
+    async def generate_image(self, prompt, reference_image=None, output_path=None):
+        import asyncio
+
+        self.calls.append(output_path.stem)
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        # Earlier scenes take longer so completion order differs from scene order
+        if output_path.stem.startswith("scene_"):
+            await asyncio.sleep(0.01 * (6 - int(output_path.stem.split("_")[1])))
+        else:
+            await asyncio.sleep(0.01)
+        self.running -= 1
+
+        if output_path.stem in self.fail_scene_ids:
+            raise ImageGenerationError(f"boom: {output_path.stem}")
+        return await super().generate_image(prompt, reference_image, output_path)
+
+
+@pytest.mark.asyncio
+async def test_visual_director_generates_scenes_concurrently(mock_config, unvalidated_script):
+    """Portraits finish before scenes; scenes run in parallel but keep scene order."""
+    client = TrackingImageClient()
+    director = VisualDirector(config=mock_config, image_client=client)
+
+    visual_project = await director.create_visual_project(unvalidated_script)
+
+    portrait_calls = [c for c in client.calls if "portrait" in c]
+    assert client.calls[: len(portrait_calls)] == portrait_calls
+    assert len(portrait_calls) == 2
+    assert client.peak > 1
+    assert [a.scene_id for a in visual_project.assets] == [
+        f"scene_{i}" for i in range(1, 6)
+    ]
+    assert not (mock_config.images_dir / "test_script_001_partial.jsonl").exists()
+
+
+@pytest.mark.asyncio
+async def test_visual_director_resumes_from_partial_progress(mock_config, unvalidated_script):
+    """A failed scene keeps finished scenes; the re-run only generates what's missing."""
+    failing = TrackingImageClient(fail_scene_ids={"scene_3"})
+    director = VisualDirector(config=mock_config, image_client=failing)
+
+    with pytest.raises(ImageGenerationError):
+        await director.create_visual_project(unvalidated_script)
+
+    partial_path = mock_config.images_dir / "test_script_001_partial.jsonl"
+    assert partial_path.exists()
+    assert ItemJournal(partial_path).item_ids() == [
+        "scene_1",
+        "scene_2",
+        "scene_4",
+        "scene_5",
+    ]
+
+    retry = TrackingImageClient()
+    director = VisualDirector(config=mock_config, image_client=retry)
+    visual_project = await director.create_visual_project(unvalidated_script)
+
+    assert [c for c in retry.calls if "portrait" not in c] == ["scene_3"]
+    assert len(visual_project.assets) == 5
+    assert not partial_path.exists()